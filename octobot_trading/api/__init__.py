@@ -34,9 +34,12 @@ from octobot_trading.api.symbol_data import (
     are_symbol_candles_initialized,
     get_candles_as_list,
     get_candle_as_list,
+    get_candles_matrix,
+    get_symbol_candles_matrix,
     has_symbol_klines,
     get_symbol_klines,
     get_symbol_candles_count,
+    get_symbol_candles_version,
     get_symbol_close_candles,
     get_symbol_open_candles,
     get_symbol_high_candles,
@@ -58,6 +61,7 @@ from octobot_trading.api.trades import (
     is_executed_trade,
     is_trade_after_or_at,
     get_total_paid_trading_fees,
+    get_realized_pnl,
     get_trade_exchange_name,
     parse_trade_type,
     trade_to_dict,
@@ -167,6 +171,7 @@ from octobot_trading.api.portfolio import (
     parse_decimal_portfolio,
     get_draw_down,
     get_coefficient_of_determination,
+    get_coefficient_of_determination_from_arrays,
     get_usd_like_symbol_from_symbols,
     get_usd_like_symbols_from_symbols,
     can_convert_symbol_to_usd_like,
@@ -240,9 +245,12 @@ __all__ = [
     "are_symbol_candles_initialized",
     "get_candles_as_list",
     "get_candle_as_list",
+    "get_candles_matrix",
+    "get_symbol_candles_matrix",
     "has_symbol_klines",
     "get_symbol_klines",
     "get_symbol_candles_count",
+    "get_symbol_candles_version",
     "get_symbol_close_candles",
     "get_symbol_open_candles",
     "get_symbol_high_candles",
@@ -262,6 +270,7 @@ __all__ = [
     "is_executed_trade",
     "is_trade_after_or_at",
     "get_total_paid_trading_fees",
+    "get_realized_pnl",
     "get_trade_exchange_name",
     "parse_trade_type",
     "trade_to_dict",
@@ -359,6 +368,7 @@ __all__ = [
     "refresh_real_trader_portfolio",
     "get_draw_down",
     "get_coefficient_of_determination",
+    "get_coefficient_of_determination_from_arrays",
     "get_usd_like_symbol_from_symbols",
     "get_usd_like_symbols_from_symbols",
     "can_convert_symbol_to_usd_like",
@@ -106,6 +106,15 @@ async def get_coefficient_of_determination(exchange_manager, use_high_instead_of
                                                                 use_high_instead_of_end_balance)
 
 
+def get_coefficient_of_determination_from_arrays(pnls, pnl_times, start_balance,
+                                                 candle_times=None, use_high_instead_of_end_balance=True) -> float:
+    return personal_data.get_coefficient_of_determination_from_arrays(
+        pnls, pnl_times, start_balance,
+        candle_times=candle_times,
+        use_high_instead_of_end_balance=use_high_instead_of_end_balance
+    )
+
+
 def get_usd_like_symbol_from_symbols(currency: str, symbols) -> str:
     return personal_data.ValueConverter.get_usd_like_symbol_from_symbols(currency, symbols)
 
@@ -16,6 +16,8 @@
 import decimal
 import typing
 
+import numpy as np
+
 import octobot_commons.enums
 
 import octobot_trading.enums
@@ -31,8 +33,12 @@ def get_symbol_candles_manager(symbol_data, time_frame) -> exchange_data.Candles
     return symbol_data.symbol_candles[octobot_commons.enums.TimeFrames(time_frame)]
 
 
-def get_symbol_historical_candles(symbol_data, time_frame, limit=-1) -> object:
-    return get_symbol_candles_manager(symbol_data, time_frame).get_symbol_prices(limit)
+def get_symbol_historical_candles(symbol_data, time_frame, limit=-1, as_view=False) -> object:
+    return get_symbol_candles_manager(symbol_data, time_frame).get_symbol_prices(limit, as_view=as_view)
+
+
+def get_symbol_candles_version(symbol_data, time_frame) -> int:
+    return get_symbol_candles_manager(symbol_data, time_frame).candles_version
 
 
 async def create_preloaded_candles_manager(preloaded_candles):
@@ -53,12 +59,21 @@ def are_symbol_candles_initialized(exchange_manager, symbol, time_frame) -> bool
 
 
 def get_candles_as_list(candles_arrays) -> list:
+    # use each candles array values: arrays might have different types and lengths
     return [
         exchange_data.get_candle_as_list(candles_arrays, index)
         for index in range(len(candles_arrays[0]))
     ]
 
 
+def get_candles_matrix(candles_arrays) -> np.ndarray:
+    return exchange_data.get_candles_matrix(candles_arrays)
+
+
+def get_symbol_candles_matrix(symbol_data, time_frame, limit=-1) -> np.ndarray:
+    return get_symbol_candles_manager(symbol_data, time_frame).get_candles_matrix(limit)
+
+
 def get_candle_as_list(candles_arrays, candle_index=0) -> list:
     return exchange_data.get_candle_as_list(candles_arrays, candle_index)
 
@@ -75,24 +90,34 @@ def get_symbol_candles_count(symbol_data, time_frame) -> int:
     return get_symbol_candles_manager(symbol_data, time_frame).get_symbol_candles_count()
 
 
-def get_symbol_close_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return exchange_data.get_symbol_close_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_close_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, as_view=False):
+    return exchange_data.get_symbol_close_candles(
+        symbol_data, time_frame, limit, include_in_construction, as_view=as_view
+    )
 
 
-def get_symbol_open_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return exchange_data.get_symbol_open_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_open_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, as_view=False):
+    return exchange_data.get_symbol_open_candles(
+        symbol_data, time_frame, limit, include_in_construction, as_view=as_view
+    )
 
 
-def get_symbol_high_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return exchange_data.get_symbol_high_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_high_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, as_view=False):
+    return exchange_data.get_symbol_high_candles(
+        symbol_data, time_frame, limit, include_in_construction, as_view=as_view
+    )
 
 
-def get_symbol_low_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return exchange_data.get_symbol_low_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_low_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, as_view=False):
+    return exchange_data.get_symbol_low_candles(
+        symbol_data, time_frame, limit, include_in_construction, as_view=as_view
+    )
 
 
-def get_symbol_volume_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return exchange_data.get_symbol_volume_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_volume_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, as_view=False):
+    return exchange_data.get_symbol_volume_candles(
+        symbol_data, time_frame, limit, include_in_construction, as_view=as_view
+    )
 
 
 def get_daily_base_and_quote_volume(symbol_data, reference_price: decimal.Decimal) -> (decimal.Decimal, decimal.Decimal):
@@ -139,8 +164,10 @@ def compute_base_and_quote_volume(
     return base_volume, quote_volume
 
 
-def get_symbol_time_candles(symbol_data, time_frame, limit=-1, include_in_construction=False):
-    return exchange_data.get_symbol_time_candles(symbol_data, time_frame, limit, include_in_construction)
+def get_symbol_time_candles(symbol_data, time_frame, limit=-1, include_in_construction=False, as_view=False):
+    return exchange_data.get_symbol_time_candles(
+        symbol_data, time_frame, limit, include_in_construction, as_view=as_view
+    )
 
 
 def create_new_candles_manager(candles=None, max_candles_count=None) -> exchange_data.CandlesManager:
@@ -84,6 +84,10 @@ def get_total_paid_trading_fees(exchange_manager) -> dict:
     return exchange_manager.exchange_personal_data.trades_manager.get_total_paid_fees()
 
 
+def get_realized_pnl(exchange_manager, symbol, since=None) -> decimal.Decimal:
+    return exchange_manager.exchange_personal_data.trades_manager.get_realized_pnl(symbol, since=since)
+
+
 def get_trade_exchange_name(trade) -> str:
     return trade.exchange_manager.get_exchange_name()
 
@@ -37,6 +37,8 @@ CURRENCY_DEFAULT_MAX_PRICE_DIGITS = 8
 ALLOW_SIMULATED_ORDERS_INSTANT_FILL = os_util.parse_boolean_environment_var(
     "ALLOW_SIMULATED_ORDERS_INSTANT_FILL", "False"
 )
+# call simulated orders price hit callbacks from one worker per symbol instead of waiting in one task per order
+ENABLE_PRICE_EVENTS_CALLBACKS = os_util.parse_boolean_environment_var("ENABLE_PRICE_EVENTS_CALLBACKS", "False")
 
 # Order creation
 ORDER_DATA_FETCHING_TIMEOUT = 5 * commons_constants.MINUTE_TO_SECONDS
@@ -51,6 +53,10 @@ MAX_PORTFOLIO_SYNC_ATTEMPTS = 1
 SYNC_ATTEMPTS_INTERVAL = 20
 SUB_PORTFOLIO_ALLOWED_MISSING_RATIO = decimal.Decimal("0.01")   # Allow 1% missing funds
 SUB_PORTFOLIO_ALLOWED_DELTA_RATIO = decimal.Decimal("0.05")   # Allow 5% delta compared to filled orders
+# when True, only currencies impacted by price or holdings updates are re-evaluated to update the portfolio value
+ENABLE_INCREMENTAL_PORTFOLIO_VALUATION = os_util.parse_boolean_environment_var(
+    "ENABLE_INCREMENTAL_PORTFOLIO_VALUATION", "False"
+)
 
 # Tentacles
 TRADING_MODE_REQUIRED_STRATEGIES = "required_strategies"
@@ -89,6 +95,10 @@ CCXT_WATCH_ORDER_BOOK_LIMIT = int(os.getenv("CCXT_WATCH_ORDER_BOOK_LIMIT", str(C
 CCXT_TIMEOUT_ON_EXIT_MS = 100
 THROTTLED_WS_UPDATES = float(os.getenv("THROTTLED_WS_UPDATES", "0.1"))  # avoid spamming CPU
 MAX_CANDLES_IN_RAM = int(os.getenv("MAX_CANDLES_IN_RAM", "3000"))    # max candles per CandlesManager
+# build REST updated candles of higher time frames from the shortest time frame candles instead of fetching them
+ENABLE_CANDLES_AGGREGATION = os_util.parse_boolean_environment_var("ENABLE_CANDLES_AGGREGATION", "False")
+# only store aggregated price levels sizes in order books
+ENABLE_COMPACT_L2_ORDER_BOOKS = os_util.parse_boolean_environment_var("ENABLE_COMPACT_L2_ORDER_BOOKS", "False")
 STORAGE_ORIGIN_VALUE = "origin_value"
 DISPLAY_TIME_FRAME = commons_enums.TimeFrames.ONE_HOUR
 DEFAULT_SUBACCOUNT_ID = "default_subaccount_id"
@@ -203,7 +213,14 @@ BALANCE_CHANNEL = "Balance"
 BALANCE_PROFITABILITY_CHANNEL = "BalanceProfitability"
 POSITIONS_CHANNEL = "Positions"
 INDIVIDUAL_ORDER_SYNC_TIMEOUT = 1 * commons_constants.MINUTE_TO_SECONDS
+# maximum number of simultaneous order creation requests when creating orders in batch
+MAX_CONCURRENT_ORDER_CREATIONS = int(os.getenv("MAX_CONCURRENT_ORDER_CREATIONS", "5"))
+# maximum number of symbols simultaneously processed when cancelling orders in batch
+MAX_CONCURRENT_ORDER_CANCELS = int(os.getenv("MAX_CONCURRENT_ORDER_CANCELS", "5"))
 MAX_TRADES_COUNT = int(os.getenv("MAX_TRADES_COUNT", "10000"))    # larger values can use a large part of ram
+# when True, trades removed from trades history when MAX_TRADES_COUNT is reached are kept in a compact trades archive
+ENABLE_TRADES_ARCHIVE = os_util.parse_boolean_environment_var("ENABLE_TRADES_ARCHIVE", "False")
+MAX_ARCHIVED_TRADES_COUNT = int(os.getenv("MAX_ARCHIVED_TRADES_COUNT", "1000000"))  # approx 41 bytes per trade
 
 # History
 DEFAULT_SAVED_HISTORICAL_TIMEFRAMES = [commons_enums.TimeFrames.ONE_DAY]
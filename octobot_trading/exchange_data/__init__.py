@@ -34,6 +34,8 @@ from octobot_trading.exchange_data import ohlcv
 from octobot_trading.exchange_data.ohlcv import (
     CandlesManager,
     PreloadedCandlesManager,
+    CandlesAggregator,
+    get_aggregated_time_frames,
     get_symbol_close_candles,
     get_symbol_open_candles,
     get_symbol_high_candles,
@@ -41,6 +43,7 @@ from octobot_trading.exchange_data.ohlcv import (
     get_symbol_volume_candles,
     get_symbol_time_candles,
     get_candle_as_list,
+    get_candles_matrix,
     OHLCVUpdaterSimulator,
     OHLCVProducer,
     OHLCVChannel,
@@ -54,6 +57,7 @@ from octobot_trading.exchange_data.order_book import (
     OrderBookTickerProducer,
     OrderBookTickerChannel,
     OrderBookManager,
+    L2OrderBookSide,
     OrderBookUpdaterSimulator,
 )
 from octobot_trading.exchange_data import prices
@@ -65,6 +69,7 @@ from octobot_trading.exchange_data.prices import (
     calculate_mark_price_from_recent_trade_prices,
     MarkPriceUpdater,
     PriceEventsManager,
+    RecentPricesWindow,
 )
 from octobot_trading.exchange_data import recent_trades
 from octobot_trading.exchange_data.recent_trades import (
@@ -153,6 +158,8 @@ __all__ = [
     "KlineUpdater",
     "CandlesManager",
     "PreloadedCandlesManager",
+    "CandlesAggregator",
+    "get_aggregated_time_frames",
     "get_symbol_close_candles",
     "get_symbol_open_candles",
     "get_symbol_high_candles",
@@ -160,6 +167,7 @@ __all__ = [
     "get_symbol_volume_candles",
     "get_symbol_time_candles",
     "get_candle_as_list",
+    "get_candles_matrix",
     "OHLCVUpdaterSimulator",
     "OHLCVProducer",
     "OHLCVChannel",
@@ -170,6 +178,7 @@ __all__ = [
     "OrderBookTickerProducer",
     "OrderBookTickerChannel",
     "OrderBookManager",
+    "L2OrderBookSide",
     "OrderBookUpdaterSimulator",
     "MarkPriceUpdaterSimulator",
     "MarkPriceProducer",
@@ -178,6 +187,7 @@ __all__ = [
     "calculate_mark_price_from_recent_trade_prices",
     "MarkPriceUpdater",
     "PriceEventsManager",
+    "RecentPricesWindow",
     "RecentTradeProducer",
     "RecentTradeChannel",
     "LiquidationsProducer",
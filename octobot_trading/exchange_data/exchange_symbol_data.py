@@ -19,6 +19,8 @@ import octobot_commons.tree as commons_tree
 import octobot_commons.enums as commons_enums
 import octobot_backtesting.api as backtesting_api
 
+import octobot_trading.constants as constants
+
 import octobot_trading.exchange_data.ohlcv.candles_manager as candles_manager
 import octobot_trading.exchange_data.ticker.ticker_manager as ticker_manager
 import octobot_trading.exchange_data.order_book.order_book_manager as order_book_manager
@@ -38,7 +40,9 @@ class ExchangeSymbolData:
         self.exchange_manager = exchange_manager
 
         self.price_events_manager = price_events_manager.PriceEventsManager()
-        self.order_book_manager = order_book_manager.OrderBookManager()
+        self.order_book_manager = order_book_manager.OrderBookManager(
+            compact_l2=constants.ENABLE_COMPACT_L2_ORDER_BOOKS
+        )
         self.prices_manager = prices_manager.PricesManager(self.exchange_manager, self.symbol)
         self.recent_trades_manager = recent_trades_manager.RecentTradesManager()
         self.ticker_manager = ticker_manager.TickerManager()
@@ -47,6 +51,8 @@ class ExchangeSymbolData:
 
         self.symbol_candles = {}
         self.symbol_klines = {}
+        # set when higher time frames candles are built from the shortest time frame ones
+        self.candles_aggregator = None
 
         self.logger = logging.get_logger(f"{self.__class__.__name__} - {self.symbol}")
 
@@ -128,12 +134,20 @@ class ExchangeSymbolData:
             )
         )
 
-    def handle_order_book_update(self, asks, bids):
+    def handle_order_book_update(self, asks, bids, sequence=None):
         trigger_init_event = not self.order_book_manager.order_book_initialized
-        self.order_book_manager.handle_new_books(asks, bids)
+        self.order_book_manager.handle_new_books(asks, bids, sequence=sequence)
         if trigger_init_event:
             self._set_initialized_event(commons_enums.InitializationEventExchangeTopics.ORDER_BOOK.value)
 
+    def handle_order_book_delta(self, asks, bids, sequence=None, first_sequence=None, checksum=None) -> bool:
+        """
+        :return: False when the order book has to be resynchronized using handle_order_book_update
+        """
+        return self.order_book_manager.handle_book_deltas(
+            asks, bids, sequence=sequence, first_sequence=first_sequence, checksum=checksum
+        )
+
     def handle_order_book_ticker_update(self, ask_quantity, ask_price, bid_quantity, bid_price):
         self.order_book_manager.order_book_ticker_update(ask_quantity, ask_price, bid_quantity, bid_price)
 
@@ -61,6 +61,10 @@ class KlineUpdater(kline_channel.KlineProducer):
                 started_time = time.time()
                 quick_sleep = False
                 for pair in self.channel.exchange_manager.exchange_config.traded_symbol_pairs:
+                    aggregated_kline = self._get_aggregated_kline(pair, time_frame)
+                    if aggregated_kline is not None:
+                        await self.push(time_frame, pair, aggregated_kline)
+                        continue
                     candle: list = await self.channel.exchange_manager.exchange.get_kline_price(pair, time_frame)
                     try:
                         candle = candle[0]
@@ -89,6 +93,17 @@ class KlineUpdater(kline_channel.KlineProducer):
                     f"Failed to update kline data in {time_frame} : {html_util.get_html_summary_if_relevant(e)}"
                 )
 
+    def _get_aggregated_kline(self, pair, time_frame):
+        # use candles aggregator when this time frame is built from shorter time frame candles
+        symbol_data = self.channel.exchange_manager.get_symbol_data(pair)
+        aggregator = symbol_data.candles_aggregator
+        if aggregator is None or time_frame not in aggregator.time_frames:
+            return None
+        try:
+            return aggregator.get_kline(time_frame, symbol_data.symbol_klines[aggregator.source_time_frame].kline)
+        except KeyError:
+            return None
+
     async def resume(self) -> None:
         await super().resume()
         if not self.is_running:
@@ -16,6 +16,7 @@
 
 from octobot_trading.exchange_data.ohlcv import candles_manager
 from octobot_trading.exchange_data.ohlcv import candles_adapter
+from octobot_trading.exchange_data.ohlcv import candles_aggregator
 from octobot_trading.exchange_data.ohlcv import channel
 
 from octobot_trading.exchange_data.ohlcv.candles_manager import (
@@ -24,6 +25,10 @@ from octobot_trading.exchange_data.ohlcv.candles_manager import (
 from octobot_trading.exchange_data.ohlcv.preloaded_candles_manager import (
     PreloadedCandlesManager,
 )
+from octobot_trading.exchange_data.ohlcv.candles_aggregator import (
+    CandlesAggregator,
+    get_aggregated_time_frames,
+)
 from octobot_trading.exchange_data.ohlcv.candles_adapter import (
     get_symbol_close_candles,
     get_symbol_open_candles,
@@ -32,6 +37,7 @@ from octobot_trading.exchange_data.ohlcv.candles_adapter import (
     get_symbol_volume_candles,
     get_symbol_time_candles,
     get_candle_as_list,
+    get_candles_matrix,
 )
 from octobot_trading.exchange_data.ohlcv.channel import (
     OHLCVUpdaterSimulator,
@@ -45,6 +51,8 @@ from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater import (
 __all__ = [
     "CandlesManager",
     "PreloadedCandlesManager",
+    "CandlesAggregator",
+    "get_aggregated_time_frames",
     "get_symbol_close_candles",
     "get_symbol_open_candles",
     "get_symbol_high_candles",
@@ -52,6 +60,7 @@ __all__ = [
     "get_symbol_volume_candles",
     "get_symbol_time_candles",
     "get_candle_as_list",
+    "get_candles_matrix",
     "OHLCVUpdaterSimulator",
     "OHLCVProducer",
     "OHLCVChannel",
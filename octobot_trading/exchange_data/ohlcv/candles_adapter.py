@@ -19,70 +19,70 @@ import octobot_commons.data_util as data_util
 import octobot_commons.enums as enums
 
 
-def get_symbol_close_candles(symbol_data, time_frame, limit, include_in_construction):
+def get_symbol_close_candles(symbol_data, time_frame, limit, include_in_construction, as_view=False):
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_close_candles(limit),
+            symbol_data.symbol_candles[tf].get_symbol_close_candles(limit, as_view=as_view),
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_CLOSE.value)
-    return symbol_data.symbol_candles[tf].get_symbol_close_candles(limit)
+    return symbol_data.symbol_candles[tf].get_symbol_close_candles(limit, as_view=as_view)
 
 
-def get_symbol_open_candles(symbol_data, time_frame, limit, include_in_construction):
+def get_symbol_open_candles(symbol_data, time_frame, limit, include_in_construction, as_view=False):
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_open_candles(limit),
+            symbol_data.symbol_candles[tf].get_symbol_open_candles(limit, as_view=as_view),
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_OPEN.value)
-    return symbol_data.symbol_candles[tf].get_symbol_open_candles(limit)
+    return symbol_data.symbol_candles[tf].get_symbol_open_candles(limit, as_view=as_view)
 
 
-def get_symbol_high_candles(symbol_data, time_frame, limit, include_in_construction):
+def get_symbol_high_candles(symbol_data, time_frame, limit, include_in_construction, as_view=False):
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_high_candles(limit),
+            symbol_data.symbol_candles[tf].get_symbol_high_candles(limit, as_view=as_view),
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_HIGH.value)
-    return symbol_data.symbol_candles[tf].get_symbol_high_candles(limit)
+    return symbol_data.symbol_candles[tf].get_symbol_high_candles(limit, as_view=as_view)
 
 
-def get_symbol_low_candles(symbol_data, time_frame, limit, include_in_construction):
+def get_symbol_low_candles(symbol_data, time_frame, limit, include_in_construction, as_view=False):
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_low_candles(limit),
+            symbol_data.symbol_candles[tf].get_symbol_low_candles(limit, as_view=as_view),
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_LOW.value)
-    return symbol_data.symbol_candles[tf].get_symbol_low_candles(limit)
+    return symbol_data.symbol_candles[tf].get_symbol_low_candles(limit, as_view=as_view)
 
 
-def get_symbol_volume_candles(symbol_data, time_frame, limit, include_in_construction):
+def get_symbol_volume_candles(symbol_data, time_frame, limit, include_in_construction, as_view=False):
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_volume_candles(limit),
+            symbol_data.symbol_candles[tf].get_symbol_volume_candles(limit, as_view=as_view),
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_VOL.value)
-    return symbol_data.symbol_candles[tf].get_symbol_volume_candles(limit)
+    return symbol_data.symbol_candles[tf].get_symbol_volume_candles(limit, as_view=as_view)
 
 
-def get_symbol_time_candles(symbol_data, time_frame, limit, include_in_construction):
+def get_symbol_time_candles(symbol_data, time_frame, limit, include_in_construction, as_view=False):
     tf = enums.TimeFrames(time_frame)
     if include_in_construction:
         return _add_in_construction_data(
-            symbol_data.symbol_candles[tf].get_symbol_time_candles(limit),
+            symbol_data.symbol_candles[tf].get_symbol_time_candles(limit, as_view=as_view),
             symbol_data,
             tf,
             enums.PriceIndexes.IND_PRICE_TIME.value)
-    return symbol_data.symbol_candles[tf].get_symbol_time_candles(limit)
+    return symbol_data.symbol_candles[tf].get_symbol_time_candles(limit, as_view=as_view)
 
 
 def get_candle_as_list(candle_arrays_dict: dict, candle_index: int) -> list:
@@ -96,6 +96,13 @@ def get_candle_as_list(candle_arrays_dict: dict, candle_index: int) -> list:
     return candle
 
 
+def get_candles_matrix(candle_arrays_dict: dict) -> np.ndarray:
+    return np.stack(
+        [candle_arrays_dict[price_index.value] for price_index in enums.PriceIndexes],
+        axis=1
+    ).astype(np.float64, copy=False)
+
+
 def _add_in_construction_data(candles, symbol_data, time_frame, data_type):
     try:
         return np.array(data_util.shift_value_array(candles,
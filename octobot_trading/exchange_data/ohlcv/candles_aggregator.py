@@ -0,0 +1,163 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import math
+
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as enums
+
+
+def get_time_frame_seconds(time_frame: enums.TimeFrames) -> int:
+    return enums.TimeFramesMinutes[time_frame] * commons_constants.MINUTE_TO_SECONDS
+
+
+def can_aggregate(source_time_frame: enums.TimeFrames, time_frame: enums.TimeFrames) -> bool:
+    """
+    :return: True when time_frame candles can be exactly built from source_time_frame candles: time_frame is
+    a multiple of source_time_frame and its candles are aligned on days (week and month candles are not)
+    """
+    source_seconds = get_time_frame_seconds(source_time_frame)
+    time_frame_seconds = get_time_frame_seconds(time_frame)
+    return (
+        time_frame_seconds > source_seconds
+        and time_frame_seconds % source_seconds == 0
+        and commons_constants.DAYS_TO_SECONDS % time_frame_seconds == 0
+    )
+
+
+def get_aggregated_time_frames(time_frames: list) -> (enums.TimeFrames, list):
+    """
+    :return: the shortest of the given time frames and the time frames that can be built from it
+    """
+    if not time_frames:
+        return None, []
+    source_time_frame = min(time_frames, key=get_time_frame_seconds)
+    return source_time_frame, [
+        time_frame
+        for time_frame in time_frames
+        if can_aggregate(source_time_frame, time_frame)
+    ]
+
+
+class CandlesAggregator:
+    """
+    Incrementally builds higher time frames candles from closed candles of a shorter (source) time frame
+    """
+    def __init__(self, source_time_frame: enums.TimeFrames, time_frames: list):
+        self.source_time_frame = source_time_frame
+        self.source_time_frame_seconds = get_time_frame_seconds(source_time_frame)
+        self.time_frames = [
+            time_frame
+            for time_frame in time_frames
+            if can_aggregate(source_time_frame, time_frame)
+        ]
+        self.last_source_candle_time = None
+        # time frame: aggregated candle in construction
+        self._candles = {time_frame: None for time_frame in self.time_frames}
+        # time frame: True when the candle in construction has been built from its first source candle
+        self._complete_candles = {time_frame: False for time_frame in self.time_frames}
+
+    def add_closed_candles(self, candles: list) -> list:
+        """
+        :param candles: closed source time frame candles, in time order
+        :return: the list of (time_frame, aggregated candle, is_complete) for each aggregated candle closed
+        by the given candles. Incomplete candles are missing some of their source candles.
+        """
+        closed_candles = []
+        for candle in candles:
+            closed_candles += self.add_closed_candle(candle)
+        return closed_candles
+
+    def add_closed_candle(self, candle: list) -> list:
+        """
+        :param candle: a closed source time frame candle, ignored when older than the last added candle
+        :return: the list of (time_frame, aggregated candle, is_complete) closed by this candle
+        """
+        candle_time = candle[enums.PriceIndexes.IND_PRICE_TIME.value]
+        if self.last_source_candle_time is not None and candle_time <= self.last_source_candle_time:
+            return []
+        # source candles are missing between the last added candle and this one
+        is_following_candle = self.last_source_candle_time is None \
+            or candle_time == self.last_source_candle_time + self.source_time_frame_seconds
+        self.last_source_candle_time = candle_time
+        closed_candles = []
+        for time_frame in self.time_frames:
+            time_frame_seconds = get_time_frame_seconds(time_frame)
+            candle_start_time = candle_time - candle_time % time_frame_seconds
+            current_candle = self._candles[time_frame]
+            if current_candle is not None \
+                    and current_candle[enums.PriceIndexes.IND_PRICE_TIME.value] != candle_start_time:
+                # missing source candles: the previous candle is over and is missing its last source candles
+                closed_candles.append((time_frame, current_candle, False))
+                current_candle = None
+            if current_candle is None:
+                current_candle = _init_candle(candle, candle_start_time)
+                self._complete_candles[time_frame] = candle_time == candle_start_time
+            else:
+                if not is_following_candle:
+                    # missing source candles in the middle of this candle
+                    self._complete_candles[time_frame] = False
+                _merge_candle(current_candle, candle)
+            if candle_time + self.source_time_frame_seconds == candle_start_time + time_frame_seconds:
+                # last source candle of this aggregated candle
+                closed_candles.append((time_frame, current_candle, self._complete_candles[time_frame]))
+                current_candle = None
+            self._candles[time_frame] = current_candle
+        return closed_candles
+
+    def get_kline(self, time_frame: enums.TimeFrames, source_kline: list):
+        """
+        :param source_kline: the source time frame candle in construction
+        :return: the time_frame candle in construction including source_kline or None when it can't be
+        completely built from added source candles
+        """
+        source_kline_time = source_kline[enums.PriceIndexes.IND_PRICE_TIME.value]
+        if self.last_source_candle_time is None \
+                or source_kline_time != self.last_source_candle_time + self.source_time_frame_seconds:
+            # source kline is not following added candles
+            return None
+        time_frame_seconds = get_time_frame_seconds(time_frame)
+        candle_start_time = source_kline_time - source_kline_time % time_frame_seconds
+        current_candle = self._candles[time_frame]
+        if current_candle is None or current_candle[enums.PriceIndexes.IND_PRICE_TIME.value] != candle_start_time:
+            return _init_candle(source_kline, candle_start_time) if source_kline_time == candle_start_time else None
+        if not self._complete_candles[time_frame]:
+            return None
+        kline = list(current_candle)
+        _merge_candle(kline, source_kline)
+        return kline
+
+
+def _init_candle(source_candle, candle_start_time):
+    candle = [math.nan] * len(enums.PriceIndexes)
+    candle[enums.PriceIndexes.IND_PRICE_TIME.value] = candle_start_time
+    candle[enums.PriceIndexes.IND_PRICE_OPEN.value] = source_candle[enums.PriceIndexes.IND_PRICE_OPEN.value]
+    candle[enums.PriceIndexes.IND_PRICE_HIGH.value] = source_candle[enums.PriceIndexes.IND_PRICE_HIGH.value]
+    candle[enums.PriceIndexes.IND_PRICE_LOW.value] = source_candle[enums.PriceIndexes.IND_PRICE_LOW.value]
+    candle[enums.PriceIndexes.IND_PRICE_CLOSE.value] = source_candle[enums.PriceIndexes.IND_PRICE_CLOSE.value]
+    candle[enums.PriceIndexes.IND_PRICE_VOL.value] = source_candle[enums.PriceIndexes.IND_PRICE_VOL.value]
+    return candle
+
+
+def _merge_candle(candle, source_candle):
+    candle[enums.PriceIndexes.IND_PRICE_HIGH.value] = max(
+        candle[enums.PriceIndexes.IND_PRICE_HIGH.value], source_candle[enums.PriceIndexes.IND_PRICE_HIGH.value]
+    )
+    candle[enums.PriceIndexes.IND_PRICE_LOW.value] = min(
+        candle[enums.PriceIndexes.IND_PRICE_LOW.value], source_candle[enums.PriceIndexes.IND_PRICE_LOW.value]
+    )
+    candle[enums.PriceIndexes.IND_PRICE_CLOSE.value] = source_candle[enums.PriceIndexes.IND_PRICE_CLOSE.value]
+    candle[enums.PriceIndexes.IND_PRICE_VOL.value] += source_candle[enums.PriceIndexes.IND_PRICE_VOL.value]
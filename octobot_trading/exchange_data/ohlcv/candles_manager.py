@@ -15,11 +15,11 @@
 #  License along with this library.
 import numpy as np
 
-import octobot_commons.data_util as data_util
 import octobot_commons.enums as enums
 import octobot_commons.logging as logging
 
 import octobot_trading.util as util
+import octobot_trading.exchange_data.ohlcv.candles_adapter as candles_adapter
 import octobot_trading.constants as constants
 
 
@@ -50,6 +50,15 @@ class CandlesManager(util.Initializable):
         self.volume_candles = None
 
         self.reached_max = False
+        # incremented on each candles change, views from get_symbol_*_candles(as_view=True) are valid until it changes
+        self.candles_version = 0
+
+        # circular buffer: one row per PriceIndexes, each candle is written at slot and slot + max_candles_count
+        # so that the max_candles_count values starting at _head_index are always the candles in time order
+        self._candles_buffer = None
+        self._head_index = 0
+        # candle time: buffer slot of this candle
+        self._slot_by_time = {}
         self._reset_candles()
 
     async def initialize_impl(self):
@@ -58,6 +67,7 @@ class CandlesManager(util.Initializable):
     def _reset_candles(self):
         self.candles_initialized = False
         self.reached_max = False
+        self.candles_version += 1
 
         self.close_candles_index = 0
         self.open_candles_index = 0
@@ -66,62 +76,61 @@ class CandlesManager(util.Initializable):
         self.time_candles_index = 0
         self.volume_candles_index = 0
 
-        self.close_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.open_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.high_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.low_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.time_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
-        self.volume_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
+        self._head_index = 0
+        self._slot_by_time = {}
+        self._candles_buffer = np.full(
+            (len(enums.PriceIndexes), 2 * self.max_candles_count), fill_value=np.nan, dtype=np.float64
+        )
+        self._update_candles_views()
 
     # getters
     def get_symbol_candles_count(self):
         return self.time_candles_index
 
-    def get_symbol_close_candles(self, limit=-1):
-        return self._extract_limited_data(self.close_candles, limit, max_limit=self.close_candles_index)
+    def get_symbol_close_candles(self, limit=-1, as_view=False):
+        return self._extract_limited_data(self.close_candles, limit, max_limit=self.close_candles_index,
+                                          as_view=as_view)
 
-    def get_symbol_open_candles(self, limit=-1):
-        return self._extract_limited_data(self.open_candles, limit, max_limit=self.open_candles_index)
+    def get_symbol_open_candles(self, limit=-1, as_view=False):
+        return self._extract_limited_data(self.open_candles, limit, max_limit=self.open_candles_index,
+                                          as_view=as_view)
 
-    def get_symbol_high_candles(self, limit=-1):
-        return self._extract_limited_data(self.high_candles, limit, max_limit=self.high_candles_index)
+    def get_symbol_high_candles(self, limit=-1, as_view=False):
+        return self._extract_limited_data(self.high_candles, limit, max_limit=self.high_candles_index,
+                                          as_view=as_view)
 
-    def get_symbol_low_candles(self, limit=-1):
-        return self._extract_limited_data(self.low_candles, limit, max_limit=self.low_candles_index)
+    def get_symbol_low_candles(self, limit=-1, as_view=False):
+        return self._extract_limited_data(self.low_candles, limit, max_limit=self.low_candles_index,
+                                          as_view=as_view)
 
-    def get_symbol_time_candles(self, limit=-1):
-        return self._extract_limited_data(self.time_candles, limit, max_limit=self.time_candles_index)
+    def get_symbol_time_candles(self, limit=-1, as_view=False):
+        return self._extract_limited_data(self.time_candles, limit, max_limit=self.time_candles_index,
+                                          as_view=as_view)
 
-    def get_symbol_volume_candles(self, limit=-1):
-        return self._extract_limited_data(self.volume_candles, limit, max_limit=self.volume_candles_index)
+    def get_symbol_volume_candles(self, limit=-1, as_view=False):
+        return self._extract_limited_data(self.volume_candles, limit, max_limit=self.volume_candles_index,
+                                          as_view=as_view)
 
-    def get_symbol_prices(self, limit=-1):
+    def get_symbol_prices(self, limit=-1, as_view=False):
         return {
-            enums.PriceIndexes.IND_PRICE_CLOSE.value: self.get_symbol_close_candles(limit),
-            enums.PriceIndexes.IND_PRICE_OPEN.value: self.get_symbol_open_candles(limit),
-            enums.PriceIndexes.IND_PRICE_HIGH.value: self.get_symbol_high_candles(limit),
-            enums.PriceIndexes.IND_PRICE_LOW.value: self.get_symbol_low_candles(limit),
-            enums.PriceIndexes.IND_PRICE_VOL.value: self.get_symbol_volume_candles(limit),
-            enums.PriceIndexes.IND_PRICE_TIME.value: self.get_symbol_time_candles(limit)
+            enums.PriceIndexes.IND_PRICE_CLOSE.value: self.get_symbol_close_candles(limit, as_view=as_view),
+            enums.PriceIndexes.IND_PRICE_OPEN.value: self.get_symbol_open_candles(limit, as_view=as_view),
+            enums.PriceIndexes.IND_PRICE_HIGH.value: self.get_symbol_high_candles(limit, as_view=as_view),
+            enums.PriceIndexes.IND_PRICE_LOW.value: self.get_symbol_low_candles(limit, as_view=as_view),
+            enums.PriceIndexes.IND_PRICE_VOL.value: self.get_symbol_volume_candles(limit, as_view=as_view),
+            enums.PriceIndexes.IND_PRICE_TIME.value: self.get_symbol_time_candles(limit, as_view=as_view)
         }
 
     def get_candles(self, limit=-1):
-        candles_size = self.close_candles_index if limit == -1 else limit
-        candles = [[]] * candles_size
-        iter_range = range(self.close_candles_index) if limit == -1 \
-            else range(self.close_candles_index-limit, self.close_candles_index)
-        candles_index = 0
-        for index in iter_range:
-            candle = [0] * len(enums.PriceIndexes)
-            candle[enums.PriceIndexes.IND_PRICE_CLOSE.value] = self.close_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_OPEN.value] = self.open_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_HIGH.value] = self.high_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_LOW.value] = self.low_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_VOL.value] = self.volume_candles[index]
-            candle[enums.PriceIndexes.IND_PRICE_TIME.value] = self.time_candles[index]
-            candles[candles_index] = candle
-            candles_index += 1
-        return candles
+        # keep numpy values as in candles arrays
+        return [list(candle) for candle in self.get_candles_matrix(limit)]
+
+    def get_candles_matrix(self, limit=-1) -> np.ndarray:
+        """
+        :return: a (candles count, len(PriceIndexes)) float64 matrix: one row per candle, columns being in
+        PriceIndexes order
+        """
+        return candles_adapter.get_candles_matrix(self.get_symbol_prices(limit, as_view=True))
 
     def replace_all_candles(self, all_candles_data):
         self._reset_candles()
@@ -130,14 +139,17 @@ class CandlesManager(util.Initializable):
 
     def upsert_candle(self, updated_candle):
         updated_candle_time = updated_candle[enums.PriceIndexes.IND_PRICE_TIME.value]
-        for index, candle_time in enumerate(self.time_candles):
-            if candle_time == updated_candle_time:
-                self.close_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_CLOSE.value]
-                self.open_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_OPEN.value]
-                self.high_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_HIGH.value]
-                self.low_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_LOW.value]
-                self.volume_candles[index] = updated_candle[enums.PriceIndexes.IND_PRICE_VOL.value]
-                return
+        # fast path: most updates are about the current candle
+        last_candle_index = self.time_candles_index if self.reached_max else self.time_candles_index - 1
+        if last_candle_index >= 0 and self.time_candles[last_candle_index] == updated_candle_time:
+            self._set_candle(last_candle_index, updated_candle)
+            return
+        try:
+            slot = self._slot_by_time[updated_candle_time]
+            self._set_candle((slot - self._head_index) % self.max_candles_count, updated_candle)
+            return
+        except KeyError:
+            pass
 
         # candle not in db, add it
         self.add_new_candle(updated_candle)
@@ -150,7 +162,7 @@ class CandlesManager(util.Initializable):
         """
         # check old candles
         for old_candle in candles_data[:-1]:
-            if old_candle[enums.PriceIndexes.IND_PRICE_TIME.value] not in self.time_candles:
+            if self._should_add_new_candle(old_candle[enums.PriceIndexes.IND_PRICE_TIME.value]):
                 self.add_new_candle(old_candle)
 
         try:
@@ -166,12 +178,7 @@ class CandlesManager(util.Initializable):
         if self._should_add_new_candle(new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value]):
             try:
                 self._check_max_candles()
-                self.close_candles[self.close_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_CLOSE.value]
-                self.open_candles[self.open_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_OPEN.value]
-                self.high_candles[self.high_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_HIGH.value]
-                self.low_candles[self.low_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_LOW.value]
-                self.time_candles[self.time_candles_index] = float(new_candle_data[enums.PriceIndexes.IND_PRICE_TIME.value])
-                self.volume_candles[self.volume_candles_index] = new_candle_data[enums.PriceIndexes.IND_PRICE_VOL.value]
+                self._set_candle(self.close_candles_index, new_candle_data)
                 self._inc_candle_index()
             except IndexError as e:
                 self.logger.error(f"Fail to add new candle {new_candle_data} : {e}")
@@ -184,16 +191,33 @@ class CandlesManager(util.Initializable):
         else:
             self.add_new_candle(new_candles_data)
 
+    def _set_candle(self, index, candle_data):
+        # index is the position of the candle in time ordered candles
+        slot = (self._head_index + index) % self.max_candles_count
+        values = [candle_data[price_index] for price_index in range(len(enums.PriceIndexes))]
+        values[enums.PriceIndexes.IND_PRICE_TIME.value] = float(values[enums.PriceIndexes.IND_PRICE_TIME.value])
+        self.candles_version += 1
+        self._slot_by_time.pop(self._candles_buffer[enums.PriceIndexes.IND_PRICE_TIME.value, slot], None)
+        self._candles_buffer[:, slot] = values
+        self._slot_by_time[values[enums.PriceIndexes.IND_PRICE_TIME.value]] = slot
+        self._candles_buffer[:, slot + self.max_candles_count] = values
+
+    def _update_candles_views(self):
+        candles = self._candles_buffer[:, self._head_index: self._head_index + self.max_candles_count]
+        self.close_candles = candles[enums.PriceIndexes.IND_PRICE_CLOSE.value]
+        self.open_candles = candles[enums.PriceIndexes.IND_PRICE_OPEN.value]
+        self.high_candles = candles[enums.PriceIndexes.IND_PRICE_HIGH.value]
+        self.low_candles = candles[enums.PriceIndexes.IND_PRICE_LOW.value]
+        self.time_candles = candles[enums.PriceIndexes.IND_PRICE_TIME.value]
+        self.volume_candles = candles[enums.PriceIndexes.IND_PRICE_VOL.value]
+
     def _change_current_candle(self):
-        self.close_candles = data_util.shift_value_array(self.close_candles, -1, np.nan, np.float64)
-        self.open_candles = data_util.shift_value_array(self.open_candles, -1, np.nan, np.float64)
-        self.high_candles = data_util.shift_value_array(self.high_candles, -1, np.nan, np.float64)
-        self.low_candles = data_util.shift_value_array(self.low_candles, -1, np.nan, np.float64)
-        self.volume_candles = data_util.shift_value_array(self.volume_candles, -1, np.nan, np.float64)
-        self.time_candles = data_util.shift_value_array(self.time_candles, -1, np.nan, np.float64)
+        # forget the oldest candle: its slot is now the one of the most recent candle
+        self._head_index = (self._head_index + 1) % self.max_candles_count
+        self._update_candles_views()
 
     def _should_add_new_candle(self, new_open_time):
-        return new_open_time not in self.time_candles
+        return new_open_time not in self._slot_by_time
 
     def _check_max_candles(self):
         if self.reached_max:
@@ -210,14 +234,23 @@ class CandlesManager(util.Initializable):
         else:
             self.reached_max = True
 
-    def _extract_limited_data(self, data, limit=-1, max_limit=-1):
+    def _extract_limited_data(self, data, limit=-1, max_limit=-1, as_view=False):
         max_handled_limit: int = self.max_candles_count if self.reached_max else max_limit
         if limit == -1:
             if max_limit == -1:
-                return np.array(data, dtype=np.float64)
-            return np.array(data[:max_handled_limit], dtype=np.float64)
+                return self._get_candles_data(data, as_view)
+            return self._get_candles_data(data[:max_handled_limit], as_view)
 
         if max_limit == -1:
-            return np.array(data[-min(limit, len(data)):], dtype=np.float64)
+            return self._get_candles_data(data[-min(limit, len(data)):], as_view)
         else:
-            return np.array(data[max(0, max_handled_limit - limit): max_handled_limit], dtype=np.float64)
+            return self._get_candles_data(data[max(0, max_handled_limit - limit): max_handled_limit], as_view)
+
+    @staticmethod
+    def _get_candles_data(data, as_view):
+        if as_view:
+            # read-only view on stored candles: no copy
+            view = data.view()
+            view.flags.writeable = False
+            return view
+        return np.array(data, dtype=np.float64)
@@ -26,6 +26,7 @@ import octobot_trading.errors as errors
 import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.exchange_data.ohlcv.channel.ohlcv as ohlcv_channel
+import octobot_trading.exchange_data.ohlcv.candles_aggregator as candles_aggregator
 import octobot_trading.exchanges as exchanges
 
 
@@ -47,6 +48,7 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
 
     OHLCV_INITIALIZATION_TIMEOUT = 60
     OHLCV_INITIALIZATION_RETRY_DELAY = 10
+    ENABLE_CANDLES_AGGREGATION = constants.ENABLE_CANDLES_AGGREGATION
 
     def __init__(self, channel):
         super().__init__(channel)
@@ -54,6 +56,9 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
         self.is_initialized = False
         self.initialized_candles_by_tf_by_symbol = {}
         self._logged_historical_candles_incompatibility = False
+        # when candles aggregation is enabled, aggregated time frames are built from source time frame candles
+        self.source_time_frame = None
+        self.aggregated_time_frames = []
 
     async def start(self):
         """
@@ -61,6 +66,7 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
         """
         if self.single_update_task and not self.single_update_task.done():
             await asyncio.wait_for(self.single_update_task, self.OHLCV_INITIALIZATION_TIMEOUT)
+        self._init_candles_aggregation()
         if not self.is_initialized:
             await self._initialize(False)
         if self.channel is not None:
@@ -72,6 +78,7 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
                     for time_frame in self._get_time_frames()
                     for pair in self._get_traded_pairs()
                     if self._should_maintain_candle(time_frame, pair)
+                    and time_frame not in self.aggregated_time_frames
                 ]
 
     def _get_traded_pairs(self):
@@ -80,6 +87,30 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
     def _get_time_frames(self):
         return self.channel.exchange_manager.exchange_config.available_time_frames
 
+    def _init_candles_aggregation(self):
+        self.source_time_frame, self.aggregated_time_frames = None, []
+        if not self.ENABLE_CANDLES_AGGREGATION:
+            return
+        # only aggregate candles that are not updated by websockets
+        maintained_time_frames = [
+            time_frame
+            for time_frame in self._get_time_frames()
+            if all(self._should_maintain_candle(time_frame, pair) for pair in self._get_traded_pairs())
+        ]
+        self.source_time_frame, self.aggregated_time_frames = \
+            candles_aggregator.get_aggregated_time_frames(maintained_time_frames)
+        if self.aggregated_time_frames:
+            self.logger.info(f"Building {[tf.value for tf in self.aggregated_time_frames]} candles from "
+                             f"{self.source_time_frame.value} candles")
+
+    def _get_candles_aggregator(self, pair) -> candles_aggregator.CandlesAggregator:
+        symbol_data = self.channel.exchange_manager.get_symbol_data(pair)
+        if symbol_data.candles_aggregator is None:
+            symbol_data.candles_aggregator = candles_aggregator.CandlesAggregator(
+                self.source_time_frame, self.aggregated_time_frames
+            )
+        return symbol_data.candles_aggregator
+
     def _should_maintain_candle(self, time_frame, pair):
         return not (
             exchanges.is_channel_managed_by_websocket(self.channel.exchange_manager, self.CHANNEL_NAME)
@@ -155,6 +186,9 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
             await self.channel.exchange_manager.get_symbol_data(pair) \
                 .handle_candles_update(time_frame, candles[:-1], replace_all=True, partial=False, upsert=False)
             self.logger.debug(f"Candle history loaded for {pair} on {time_frame}")
+            if self.aggregated_time_frames and time_frame is self.source_time_frame:
+                # initialize aggregated candles in construction
+                self._get_candles_aggregator(pair).add_closed_candles(candles[:-1])
             self._set_mark_price_from_candle(pair, candles[-1])
             return pair, time_frame, candles
         elif should_retry:
@@ -197,6 +231,40 @@ class OHLCVUpdater(ohlcv_channel.OHLCVProducer):
 
     async def _push_complete_candles(self, time_frame, pair, candles):
         await self.push(time_frame, pair, candles[:-1], partial=True)  # push only completed candles
+        if self.aggregated_time_frames and time_frame is self.source_time_frame:
+            await self._push_aggregated_candles(pair, candles[:-1])
+
+    async def _push_aggregated_candles(self, pair, closed_candles):
+        for time_frame, candle, is_complete in self._get_candles_aggregator(pair).add_closed_candles(closed_candles):
+            if not self.initialized_candles_by_tf_by_symbol.get(pair, {}).get(time_frame, False):
+                # will be pushed when initialized
+                continue
+            if is_complete:
+                await self.push(time_frame, pair, [candle], partial=True)
+            else:
+                # some source candles of this candle are missing: fetch it from the exchange
+                await self._fetch_and_push_closed_candles(
+                    time_frame, pair, candle[common_enums.PriceIndexes.IND_PRICE_TIME.value]
+                )
+
+    async def _fetch_and_push_closed_candles(self, time_frame, pair, last_closed_candle_time):
+        try:
+            candles: list = await self.channel.exchange_manager.exchange.get_symbol_prices(
+                pair,
+                time_frame,
+                limit=self.OHLCV_LIMIT)
+        except errors.FailedRequest as err:
+            self.logger.warning(
+                f"Impossible to fetch {time_frame.value} {pair} candles: {html_util.get_html_summary_if_relevant(err)}"
+            )
+            return
+        closed_candles = [
+            candle
+            for candle in candles or []
+            if candle[common_enums.PriceIndexes.IND_PRICE_TIME.value] <= last_closed_candle_time
+        ]
+        if closed_candles:
+            await self.push(time_frame, pair, closed_candles, partial=True)
 
     async def _ensure_candles_initialization(self, pair):
         init_coroutines = tuple(
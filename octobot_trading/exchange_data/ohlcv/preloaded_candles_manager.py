@@ -45,12 +45,14 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         return self.volume_candles
 
     def _set_all_candles(self, new_candles_data):
+        self.candles_version += 1
         self.close_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_CLOSE.value)
         self.open_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_OPEN.value)
         self.high_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_HIGH.value)
         self.low_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_LOW.value)
         self.time_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_TIME.value)
         self.volume_candles = self._get_candle_values_array(new_candles_data, enums.PriceIndexes.IND_PRICE_VOL.value)
+        self._sorted_time_candles = bool(np.all(self.time_candles[1:] >= self.time_candles[:-1]))
 
     def _get_candle_values_array(self, candles, key):
         return np.array([candle[key] for candle in candles], dtype=np.float64)
@@ -61,15 +63,28 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         # should be when handling preloaded candles.
 
         # return actual index + 1 as it is used as a select length
+        candle_time = candle[enums.PriceIndexes.IND_PRICE_TIME.value]
         select_index = 0 if self.time_candles_index == 0 else self.time_candles_index - 1
-        for delta_index, time_value in enumerate(self.time_candles[select_index:]):
-            if time_value == candle[enums.PriceIndexes.IND_PRICE_TIME.value]:
-                return self.time_candles_index + delta_index
+        # candles are usually pushed one after the other: first check the next and current candles
+        for index in (self.time_candles_index, select_index):
+            if index < len(self.time_candles) and self.time_candles[index] == candle_time:
+                return self.time_candles_index + index - select_index
+        index = self._find_candle_time_index(candle_time)
+        if index is None:
+            return commons_constants.DEFAULT_IGNORED_VALUE
+        if index >= select_index:
+            return self.time_candles_index + index - select_index
         # candle in past candles
-        for index, time_value in enumerate(self.time_candles[:select_index]):
-            if time_value == candle[enums.PriceIndexes.IND_PRICE_TIME.value]:
+        return index
+
+    def _find_candle_time_index(self, candle_time):
+        if self._sorted_time_candles:
+            index = int(np.searchsorted(self.time_candles, candle_time))
+            if index < len(self.time_candles) and self.time_candles[index] == candle_time:
                 return index
-        return commons_constants.DEFAULT_IGNORED_VALUE
+            return None
+        indexes = np.flatnonzero(self.time_candles == candle_time)
+        return int(indexes[0]) if len(indexes) else None
 
     def add_old_and_new_candles(self, candles_data):
         # candles are already loaded, just set indexes to the new candle
@@ -79,6 +94,7 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
                 f"Can't find candle at time: {candles_data[-1][enums.PriceIndexes.IND_PRICE_TIME.value]}"
             )
             return
+        self.candles_version += 1
         self.close_candles_index = current_index
         self.open_candles_index = current_index
         self.high_candles_index = current_index
@@ -86,22 +102,23 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         self.time_candles_index = current_index
         self.volume_candles_index = current_index
 
-    def _extract_limited_data(self, data, limit=-1, max_limit=-1):
+    def _extract_limited_data(self, data, limit=-1, max_limit=-1, as_view=False):
         if limit == -1:
             if max_limit == -1:
-                return data
-            return np.array(data[:max_limit], dtype=np.float64)
+                return self._get_candles_data(data, True) if as_view else data
+            return self._get_candles_data(data[:max_limit], as_view)
 
         if max_limit == -1:
-            return np.array(data[-min(limit, len(data)):], dtype=np.float64)
+            return self._get_candles_data(data[-min(limit, len(data)):], as_view)
         else:
-            return np.array(data[max(0, max_limit - limit): max_limit], dtype=np.float64)
+            return self._get_candles_data(data[max(0, max_limit - limit): max_limit], as_view)
 
     def add_new_candle(self, new_candle_data):
         self.logger.error("add_new_candle should not be called")
 
     def _reset_candles(self):
         self.candles_initialized = False
+        self.candles_version += 1
 
         self.close_candles_index = 0
         self.open_candles_index = 0
@@ -116,3 +133,4 @@ class PreloadedCandlesManager(candles_manager.CandlesManager):
         self.low_candles = np.ndarray((0,))
         self.time_candles = np.ndarray((0,))
         self.volume_candles = np.ndarray((0,))
+        self._sorted_time_candles = True
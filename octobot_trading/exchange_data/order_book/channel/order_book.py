@@ -18,18 +18,36 @@ import asyncio
 import async_channel.constants as constants
 
 import octobot_trading.exchange_channel as exchanges_channel
+import octobot_trading.constants as trading_constants
+import octobot_trading.enums as enums
 
 
 class OrderBookProducer(exchanges_channel.ExchangeChannelProducer):
-    async def push(self, symbol, asks, bids, update_order_book=True):
-        await self.perform(symbol, asks, bids, update_order_book)
+    def __init__(self, channel):
+        super().__init__(channel)
+        # symbol: deltas received while its order book is being resynchronized
+        self._buffered_deltas = {}
+        # symbol: in progress resynchronization task
+        self._resync_tasks = {}
 
-    async def perform(self, symbol, asks, bids, update_order_book):
+    async def push(self, symbol, asks, bids, update_order_book=True, sequence=None):
+        await self.perform(symbol, asks, bids, update_order_book, sequence=sequence)
+
+    async def push_deltas(self, symbol, asks, bids, sequence=None, first_sequence=None, checksum=None):
+        """
+        Apply the given price level deltas to the symbol order book and send the updated order book to consumers.
+        Resynchronize the order book from a snapshot when updates are missing or its checksum is invalid.
+        """
+        await self.perform_deltas(symbol, asks, bids, sequence, first_sequence, checksum)
+
+    async def perform(self, symbol, asks, bids, update_order_book, sequence=None):
         try:
             if self.channel.get_filtered_consumers(symbol=constants.CHANNEL_WILDCARD) or \
                     self.channel.get_filtered_consumers(symbol=symbol):
                 if update_order_book:
-                    self.channel.exchange_manager.get_symbol_data(symbol).handle_order_book_update(asks, bids)
+                    self.channel.exchange_manager.get_symbol_data(symbol).handle_order_book_update(
+                        asks, bids, sequence=sequence
+                    )
                 await self.send(cryptocurrency=self.channel.exchange_manager.exchange.
                                 get_pair_cryptocurrency(symbol),
                                 symbol=symbol,
@@ -40,6 +58,71 @@ class OrderBookProducer(exchanges_channel.ExchangeChannelProducer):
         except Exception as e:
             self.logger.exception(e, True, f"Exception when triggering update: {e}")
 
+    async def perform_deltas(self, symbol, asks, bids, sequence, first_sequence, checksum):
+        try:
+            if self.channel.get_filtered_consumers(symbol=constants.CHANNEL_WILDCARD) or \
+                    self.channel.get_filtered_consumers(symbol=symbol):
+                if symbol in self._buffered_deltas:
+                    # applied on the order book snapshot once fetched
+                    self._buffered_deltas[symbol].append((asks, bids, sequence, first_sequence, checksum))
+                elif self.channel.exchange_manager.get_symbol_data(symbol).handle_order_book_delta(
+                    asks, bids, sequence=sequence, first_sequence=first_sequence, checksum=checksum
+                ):
+                    await self.send_order_book(symbol)
+                else:
+                    # also apply the rejected deltas when they are more recent than the fetched snapshot
+                    self._buffered_deltas[symbol] = [(asks, bids, sequence, first_sequence, checksum)]
+                    self._resync_tasks[symbol] = asyncio.create_task(self.resync_order_book(symbol))
+        except asyncio.CancelledError:
+            self.logger.info("Update tasks cancelled.")
+        except Exception as e:
+            self.logger.exception(e, True, f"Exception when triggering update: {e}")
+
+    async def resync_order_book(self, symbol):
+        """
+        Reset the symbol order book from a fetched snapshot and apply the deltas received in the meantime.
+        When deltas are still missing, the next received delta triggers a new resynchronization.
+        """
+        self._buffered_deltas.setdefault(symbol, [])
+        try:
+            # fetch the full book depth: checksums are computed on more levels than the default limit
+            order_book = await self.channel.exchange_manager.exchange.get_order_book(
+                symbol, limit=trading_constants.CCXT_WATCH_ORDER_BOOK_LIMIT
+            )
+            symbol_data = self.channel.exchange_manager.get_symbol_data(symbol)
+            symbol_data.handle_order_book_update(
+                order_book[enums.ExchangeConstantsOrderBookInfoColumns.ASKS.value],
+                order_book[enums.ExchangeConstantsOrderBookInfoColumns.BIDS.value],
+                sequence=order_book.get(enums.ExchangeConstantsOrderBookInfoColumns.NONCE.value)
+            )
+            for asks, bids, sequence, first_sequence, checksum in self._buffered_deltas[symbol]:
+                if not symbol_data.handle_order_book_delta(
+                    asks, bids, sequence=sequence, first_sequence=first_sequence, checksum=checksum
+                ):
+                    return
+            await self.send_order_book(symbol)
+        except asyncio.CancelledError:
+            self.logger.info("Order book resynchronization cancelled.")
+        except Exception as e:
+            self.logger.exception(e, True, f"Exception when resynchronizing {symbol} order book: {e}")
+        finally:
+            self._buffered_deltas.pop(symbol, None)
+            self._resync_tasks.pop(symbol, None)
+
+    async def send_order_book(self, symbol):
+        asks, bids = self.channel.exchange_manager.get_symbol_data(symbol).order_book_manager.get_book_levels()
+        await self.send(cryptocurrency=self.channel.exchange_manager.exchange.get_pair_cryptocurrency(symbol),
+                        symbol=symbol,
+                        asks=asks,
+                        bids=bids)
+
+    async def stop(self):
+        for task in self._resync_tasks.values():
+            task.cancel()
+        self._resync_tasks.clear()
+        self._buffered_deltas.clear()
+        await super().stop()
+
     async def send(self, cryptocurrency, symbol, asks, bids):
         for consumer in self.channel.get_filtered_consumers(symbol=symbol):
             await consumer.queue.put({
@@ -0,0 +1,124 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+
+class L2OrderBookSide:
+    """
+    Order book side storing the aggregated size of each price level in contiguous arrays
+    sorted from the best to the worst price
+    """
+    def __init__(self, is_bid: bool):
+        self.is_bid = is_bid
+        self.prices = None
+        self.sizes = None
+        # prices sorted in ascending order (negative prices for bids), used to look for price levels
+        self._keys = None
+        self.reset()
+
+    def reset(self):
+        self.prices = np.empty(0, dtype=np.float64)
+        self.sizes = np.empty(0, dtype=np.float64)
+        self._keys = np.empty(0, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.prices)
+
+    def set_levels(self, price_size_list):
+        """
+        Replace every price level
+        :param price_size_list: the list of [price, size, (optional extra values)]
+        """
+        levels = _to_price_size_array(price_size_list)
+        levels = levels[levels[:, 1] > 0]
+        keys = -levels[:, 0] if self.is_bid else levels[:, 0]
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self.prices = levels[order, 0]
+        self.sizes = levels[order, 1]
+
+    def apply_deltas(self, price_size_list):
+        """
+        Update, add or remove (when size is 0) the given price levels, the last delta of a price is kept
+        :param price_size_list: the list of [price, size, (optional extra values)]
+        """
+        levels = _to_price_size_array(price_size_list)
+        if len(levels) == 0:
+            return
+        all_keys = -levels[:, 0] if self.is_bid else levels[:, 0]
+        # use reversed levels to keep the last delta of each price
+        keys, reversed_indexes = np.unique(all_keys[::-1], return_index=True)
+        prices = levels[::-1, 0][reversed_indexes]
+        sizes = levels[::-1, 1][reversed_indexes]
+        indexes = np.searchsorted(self._keys, keys)
+        if len(self._keys):
+            found = self._keys[np.minimum(indexes, len(self._keys) - 1)] == keys
+        else:
+            found = np.zeros(len(keys), dtype=bool)
+        removed = found & (sizes <= 0)
+        inserted = ~found & (sizes > 0)
+        updated = found & ~removed
+        self.sizes[indexes[updated]] = sizes[updated]
+        if removed.any():
+            kept = np.ones(len(self._keys), dtype=bool)
+            kept[indexes[removed]] = False
+            self._keys, self.prices, self.sizes = self._keys[kept], self.prices[kept], self.sizes[kept]
+        if inserted.any():
+            positions = np.searchsorted(self._keys, keys[inserted])
+            self._keys = np.insert(self._keys, positions, keys[inserted])
+            self.prices = np.insert(self.prices, positions, prices[inserted])
+            self.sizes = np.insert(self.sizes, positions, sizes[inserted])
+
+    def get_best(self) -> (float, float):
+        """
+        :return: the best price level (price, size), raises IndexError when empty
+        """
+        return self.prices[0], self.sizes[0]
+
+    def get_levels(self, limit=-1) -> (np.ndarray, np.ndarray):
+        """
+        :return: read-only views on the limit best levels prices and sizes
+        """
+        end = len(self.prices) if limit == -1 else limit
+        prices = self.prices[:end]
+        sizes = self.sizes[:end]
+        prices.flags.writeable = False
+        sizes.flags.writeable = False
+        return prices, sizes
+
+    def get_size(self, price):
+        """
+        :return: the size at the given price level or None when there is no such level
+        """
+        index = self._get_level_index(price)
+        return None if index is None else self.sizes[index]
+
+    def _get_level_index(self, price):
+        key = -float(price) if self.is_bid else float(price)
+        index = int(np.searchsorted(self._keys, key))
+        if index < len(self._keys) and self._keys[index] == key:
+            return index
+        return None
+
+
+def _to_price_size_array(price_size_list) -> np.ndarray:
+    if len(price_size_list) == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    try:
+        return np.array(price_size_list, dtype=np.float64)[:, :2]
+    except (ValueError, TypeError):
+        # levels of different lengths
+        return np.array([price_size[:2] for price_size in price_size_list], dtype=np.float64)
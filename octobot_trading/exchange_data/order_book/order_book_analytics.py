@@ -0,0 +1,72 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+
+def get_cumulative_levels(prices: np.ndarray, sizes: np.ndarray) -> (np.ndarray, np.ndarray):
+    """
+    :param prices: the levels prices, sorted from the best to the worst price
+    :param sizes: the levels sizes
+    :return: the cumulative sizes and cumulative notional values of the levels
+    """
+    return np.cumsum(sizes), np.cumsum(prices * sizes)
+
+
+def get_vwap(prices: np.ndarray, cumulative_sizes: np.ndarray, cumulative_notional: np.ndarray,
+             quantity: float) -> float:
+    """
+    :return: the average price paid to fill quantity from the best level, None when the levels are too thin
+    """
+    notional = _get_filled_notional(prices, cumulative_sizes, cumulative_notional, quantity)
+    return None if notional is None else notional / quantity
+
+
+def get_quantity_for_notional(prices: np.ndarray, cumulative_sizes: np.ndarray, cumulative_notional: np.ndarray,
+                              notional: float) -> float:
+    """
+    :return: the quantity filled when spending notional from the best level, None when the levels are too thin
+    """
+    if notional <= 0:
+        return 0
+    if not len(cumulative_notional) or cumulative_notional[-1] < notional:
+        return None
+    level_index = int(np.searchsorted(cumulative_notional, notional))
+    previous_size, previous_notional = _get_previous_totals(cumulative_sizes, cumulative_notional, level_index)
+    return float(previous_size + (notional - previous_notional) / prices[level_index])
+
+
+def get_imbalance(bid_sizes: np.ndarray, ask_sizes: np.ndarray) -> float:
+    """
+    :return: (bids volume - asks volume) / (bids volume + asks volume), between -1 and 1, None when empty
+    """
+    bids_volume = float(np.sum(bid_sizes))
+    asks_volume = float(np.sum(ask_sizes))
+    total_volume = bids_volume + asks_volume
+    return None if total_volume == 0 else (bids_volume - asks_volume) / total_volume
+
+
+def _get_filled_notional(prices, cumulative_sizes, cumulative_notional, quantity):
+    if quantity <= 0 or not len(cumulative_sizes) or cumulative_sizes[-1] < quantity:
+        return None
+    level_index = int(np.searchsorted(cumulative_sizes, quantity))
+    previous_size, previous_notional = _get_previous_totals(cumulative_sizes, cumulative_notional, level_index)
+    return float(previous_notional + (quantity - previous_size) * prices[level_index])
+
+
+def _get_previous_totals(cumulative_sizes, cumulative_notional, level_index):
+    if level_index == 0:
+        return 0, 0
+    return cumulative_sizes[level_index - 1], cumulative_notional[level_index - 1]
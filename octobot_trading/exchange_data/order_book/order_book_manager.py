@@ -13,28 +13,62 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import bisect
 import decimal
+import itertools
+import zlib
+
+import numpy as np
 import sortedcontainers
 
 import octobot_commons.logging as logging
 
 import octobot_trading.enums as enums
+import octobot_trading.errors as errors
 import octobot_trading.util as util
+import octobot_trading.exchange_data.order_book.l2_order_book_side as l2_order_book_side
+import octobot_trading.exchange_data.order_book.order_book_analytics as order_book_analytics
 from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC
 
-ORDER_ID_NOT_FOUND = -1
 INVALID_PARSED_VALUE = -1
+# index of the optional raw exchange price string in [price, size, raw price, raw size] levels
+RAW_PRICE_INDEX = 2
+RAW_SIZE_INDEX = 3
 
 
 class OrderBookManager(util.Initializable):
-    def __init__(self):
+    # number of best levels of each side used to compute order book checksums
+    CHECKSUM_DEPTH = 25
+
+    def __init__(self, compact_l2=False):
         super().__init__()
         self.logger = logging.get_logger(self.__class__.__name__)
         self.order_book_initialized = False
+        # when compact_l2 is True, only the aggregated size of each price level is stored in l2_asks and l2_bids
+        self.compact_l2 = compact_l2
         self.asks = sortedcontainers.SortedDict()
         self.bids = sortedcontainers.SortedDict()
+        # L3 order id: (price, add sequence) indexes
+        self._asks_orders_index = {}
+        self._bids_orders_index = {}
+        # price: increasing add sequences of the price level orders, only for levels with L3 order ids
+        self._asks_levels_sequences = {}
+        self._bids_levels_sequences = {}
+        self._orders_sequence = itertools.count()
+        self.l2_asks = l2_order_book_side.L2OrderBookSide(is_bid=False)
+        self.l2_bids = l2_order_book_side.L2OrderBookSide(is_bid=True)
+        # float price: "raw price:raw size" exchange strings of the levels used in checksums
+        self._asks_raw_levels = {}
+        self._bids_raw_levels = {}
         self.timestamp = 0
+        # exchange sequence number of the last applied snapshot or delta, None when unknown
+        self.sequence = None
+        # incremented on each order book change
+        self.book_version = 0
         self.ask_quantity, self.ask_price, self.bid_quantity, self.bid_price = 0, 0, 0, 0
+        # analytics computed on the book_version of _analytics_version
+        self._analytics_cache = {}
+        self._analytics_version = None
 
     async def initialize_impl(self):
         self.reset_order_book()
@@ -43,7 +77,17 @@ class OrderBookManager(util.Initializable):
         self.order_book_initialized = False
         self.asks.clear()
         self.bids.clear()
+        self._asks_orders_index.clear()
+        self._bids_orders_index.clear()
+        self._asks_levels_sequences.clear()
+        self._bids_levels_sequences.clear()
+        self.l2_asks.reset()
+        self.l2_bids.reset()
+        self._asks_raw_levels.clear()
+        self._bids_raw_levels.clear()
         self.timestamp = 0
+        self.sequence = None
+        self.book_version += 1
         self.ask_quantity, self.ask_price, self.bid_quantity, self.bid_price = 0, 0, 0, 0
 
     def order_book_ticker_update(self, ask_quantity, ask_price, bid_quantity, bid_price):
@@ -54,144 +98,378 @@ class OrderBookManager(util.Initializable):
         try:
             self.handle_new_books(asks=orders[ECOBIC.ASKS.value],
                                   bids=orders[ECOBIC.BIDS.value],
-                                  timestamp=orders[ECOBIC.TIMESTAMP.value])
+                                  timestamp=orders[ECOBIC.TIMESTAMP.value],
+                                  sequence=orders.get(ECOBIC.NONCE.value))
         except KeyError:
             self.logger.error("Failed to parse new order book")
 
-    def handle_new_books(self, asks, bids, timestamp=None):
+    def handle_new_books(self, asks, bids, timestamp=None, sequence=None):
         self.reset_order_book()
-        self.handle_book_adds(_convert_price_size_list_to_order(asks, enums.TradeOrderSide.SELL.value))
-        self.handle_book_adds(_convert_price_size_list_to_order(bids, enums.TradeOrderSide.BUY.value))
+        if self.compact_l2:
+            self.l2_asks.set_levels(asks)
+            self.l2_bids.set_levels(bids)
+        else:
+            self.handle_book_adds(_convert_price_size_list_to_order(asks, enums.TradeOrderSide.SELL.value))
+            self.handle_book_adds(_convert_price_size_list_to_order(bids, enums.TradeOrderSide.BUY.value))
+        _update_raw_levels(self._asks_raw_levels, asks)
+        _update_raw_levels(self._bids_raw_levels, bids)
         if timestamp:
             self.timestamp = timestamp
+        self.sequence = sequence
+        self.book_version += 1
         self.order_book_initialized = True
 
+    def handle_book_deltas(self, asks, bids, timestamp=None, sequence=None, first_sequence=None, checksum=None) -> bool:
+        """
+        Apply price level deltas: a level size is replaced by the delta size and removed when it is 0
+        :param asks: the updated asks [price, size, (optional) raw price, raw size] levels
+        :param bids: the updated bids [price, size, (optional) raw price, raw size] levels
+        :param timestamp: the update timestamp
+        :param sequence: the sequence number of the (last) update contained in these deltas
+        :param first_sequence: the sequence number of the first update contained in these deltas when
+        it covers multiple updates, defaults to sequence
+        :param checksum: the exchange checksum of the updated order book
+        :return: False when the order book has to be resynchronized from a snapshot, in which case it is reset
+        """
+        if not self.order_book_initialized:
+            return False
+        if sequence is not None and self.sequence is not None:
+            if sequence <= self.sequence:
+                # already applied
+                return True
+            if (sequence if first_sequence is None else first_sequence) > self.sequence + 1:
+                self.logger.debug(f"Missed order book updates after sequence {self.sequence}: resynchronizing")
+                self.reset_order_book()
+                return False
+        if self.compact_l2:
+            self.l2_asks.apply_deltas(asks)
+            self.l2_bids.apply_deltas(bids)
+        else:
+            _apply_level_deltas(self.asks, self._asks_levels_sequences, asks, enums.TradeOrderSide.SELL.value)
+            _apply_level_deltas(self.bids, self._bids_levels_sequences, bids, enums.TradeOrderSide.BUY.value)
+        _update_raw_levels(self._asks_raw_levels, asks)
+        _update_raw_levels(self._bids_raw_levels, bids)
+        self.book_version += 1
+        if timestamp:
+            self.timestamp = timestamp
+        if sequence is not None:
+            self.sequence = sequence
+        if checksum is not None and (checksum & 0xffffffff) != self.get_checksum():
+            self.logger.debug("Invalid order book checksum: resynchronizing")
+            self.reset_order_book()
+            return False
+        return True
+
+    def get_checksum(self) -> int:
+        """
+        :return: the CRC32 of the "bid_price:bid_size:ask_price:ask_size:..." string made of
+        the CHECKSUM_DEPTH best levels of each side, using the raw exchange strings of the levels when given
+        """
+        asks, bids = self._get_best_levels(self.CHECKSUM_DEPTH)
+        values = []
+        for bid, ask in itertools.zip_longest(bids, asks):
+            for level, raw_levels in ((bid, self._bids_raw_levels), (ask, self._asks_raw_levels)):
+                if level is not None:
+                    values.append(raw_levels.get(float(level[0])) or f"{level[0]}:{level[1]}")
+        return zlib.crc32(":".join(values).encode())
+
+    def _get_best_levels(self, depth) -> (list, list):
+        if self.compact_l2:
+            return tuple(
+                list(zip(*(levels.tolist() for levels in side.get_levels(depth))))
+                for side in (self.l2_asks, self.l2_bids)
+            )
+        return tuple(
+            [
+                (price, sum(order[ECOBIC.SIZE.value] for order in orders))
+                for price, orders in itertools.islice(items, depth)
+            ]
+            for items in (self.asks.items(), reversed(self.bids.items()))
+        )
+
     def handle_book_adds(self, orders):
+        self._ensure_orders_book()
         for order in orders:
             try:
                 self._handle_book_add(order)
             except KeyError as e:
                 self.logger.error(f"Error when adding order to order_book : {e}")
+        self.book_version += 1
 
     def handle_book_deletes(self, orders):
+        self._ensure_orders_book()
         for order in orders:
             try:
                 self._handle_book_delete(order)
             except KeyError as e:
                 self.logger.error(f"Error when deleting order from order_book : {e}")
+        self.book_version += 1
 
     def handle_book_updates(self, orders):
+        self._ensure_orders_book()
         for order in orders:
             try:
                 self._handle_book_update(order)
             except KeyError as e:
                 self.logger.error(f"Error when updating order in order_book : {e}")
+        self.book_version += 1
+
+    def get_book_levels(self) -> (list, list):
+        """
+        :return: the asks and bids [price, size] levels, from the best to the worst price
+        """
+        return tuple(
+            np.column_stack(self._get_side_levels(side)).tolist()
+            for side in (enums.TradeOrderSide.BUY, enums.TradeOrderSide.SELL)
+        )
+
+    def get_depth(self, side) -> (np.ndarray, np.ndarray):
+        """
+        :param side: the TradeOrderSide of the orders filled by the returned levels (asks for BUY orders)
+        :return: the read-only levels prices and cumulative sizes, from the best to the worst price
+        """
+        prices, _, cumulative_sizes, _ = self._get_side_analytics(side)
+        return prices, cumulative_sizes
+
+    def get_vwap(self, side, quantity) -> float:
+        """
+        :param side: the TradeOrderSide of the order to fill
+        :param quantity: the quantity to fill
+        :return: the average fill price of quantity, None when the order book is too thin
+        """
+        return self._get_cached_analytics(
+            ("vwap", side, quantity), self._compute_vwap, side, quantity
+        )
+
+    def get_price_impact(self, side, notional) -> float:
+        """
+        :param side: the TradeOrderSide of the order to fill
+        :param notional: the quote value to fill
+        :return: the relative distance between the best price and the average fill price of notional,
+        None when the order book is too thin
+        """
+        return self._get_cached_analytics(
+            ("price_impact", side, notional), self._compute_price_impact, side, notional
+        )
+
+    def get_spread(self) -> float:
+        """
+        :return: best ask price - best bid price, None when a side is empty
+        """
+        return self._get_cached_analytics(("spread", ), self._compute_spread)
+
+    def get_imbalance(self, depth=-1) -> float:
+        """
+        :param depth: the number of best levels of each side to consider, -1 for every level
+        :return: (bids volume - asks volume) / (bids volume + asks volume), None when the order book is empty
+        """
+        return self._get_cached_analytics(("imbalance", depth), self._compute_imbalance, depth)
+
+    def _get_cached_analytics(self, key, compute, *args):
+        if self._analytics_version != self.book_version:
+            self._analytics_cache.clear()
+            self._analytics_version = self.book_version
+        try:
+            return self._analytics_cache[key]
+        except KeyError:
+            value = self._analytics_cache[key] = compute(*args)
+            return value
+
+    def _get_side_analytics(self, side) -> tuple:
+        return self._get_cached_analytics(("levels", side), self._compute_side_analytics, side)
+
+    def _compute_side_analytics(self, side) -> tuple:
+        prices, sizes = self._get_side_levels(side)
+        cumulative_sizes, cumulative_notional = order_book_analytics.get_cumulative_levels(prices, sizes)
+        for values in (prices, sizes, cumulative_sizes, cumulative_notional):
+            values.flags.writeable = False
+        return prices, sizes, cumulative_sizes, cumulative_notional
+
+    def _get_side_levels(self, side, depth=-1) -> (np.ndarray, np.ndarray):
+        is_buy = side is enums.TradeOrderSide.BUY or side == enums.TradeOrderSide.BUY.value
+        if self.compact_l2:
+            prices, sizes = (self.l2_asks if is_buy else self.l2_bids).get_levels(depth)
+            return np.array(prices), np.array(sizes)
+        items = self.asks.items() if is_buy else reversed(self.bids.items())
+        if depth != -1:
+            items = itertools.islice(items, depth)
+        levels = [(price, sum(order[ECOBIC.SIZE.value] for order in orders)) for price, orders in items]
+        if not levels:
+            return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+        levels = np.array(levels, dtype=np.float64)
+        return levels[:, 0], levels[:, 1]
+
+    def _compute_vwap(self, side, quantity):
+        prices, _, cumulative_sizes, cumulative_notional = self._get_side_analytics(side)
+        return order_book_analytics.get_vwap(prices, cumulative_sizes, cumulative_notional, float(quantity))
+
+    def _compute_price_impact(self, side, notional):
+        prices, _, cumulative_sizes, cumulative_notional = self._get_side_analytics(side)
+        quantity = order_book_analytics.get_quantity_for_notional(
+            prices, cumulative_sizes, cumulative_notional, float(notional)
+        )
+        if not quantity:
+            return None
+        return abs(float(notional) / quantity - prices[0]) / prices[0]
+
+    def _compute_spread(self):
+        ask_prices = self._get_side_analytics(enums.TradeOrderSide.BUY)[0]
+        bid_prices = self._get_side_analytics(enums.TradeOrderSide.SELL)[0]
+        if not len(ask_prices) or not len(bid_prices):
+            return None
+        return float(ask_prices[0] - bid_prices[0])
+
+    def _compute_imbalance(self, depth):
+        return order_book_analytics.get_imbalance(
+            self._get_side_levels(enums.TradeOrderSide.SELL, depth)[1],
+            self._get_side_levels(enums.TradeOrderSide.BUY, depth)[1]
+        )
+
+    def _ensure_orders_book(self):
+        if self.compact_l2:
+            raise errors.NotSupported("Orders can't be handled by compact L2 order books")
 
     def _handle_book_add(self, order):
-        # Add buy side orders
-        if order[ECOBIC.SIDE.value] == enums.TradeOrderSide.BUY.value:
-            bids = self.get_bids(order[ECOBIC.PRICE.value])
-            if bids is None:
-                bids = [order]
-            else:
-                bids.append(order)
-            self._set_bids(order[ECOBIC.PRICE.value], bids)
-            return
-
-        # Add sell side orders
-        asks = self.get_asks(order[ECOBIC.PRICE.value])
-        if asks is None:
-            asks = [order]
+        book_side, orders_index, levels_sequences = self._get_book_side(order[ECOBIC.SIDE.value])
+        price = order[ECOBIC.PRICE.value]
+        order_id = order[ECOBIC.ORDER_ID.value]
+        if order_id is not None:
+            location = self._get_indexed_order_location(book_side, orders_index, levels_sequences, order_id)
+            if location is not None:
+                # order is already in book: replace it
+                self._remove_indexed_order(book_side, orders_index, levels_sequences, order_id, location)
+        orders = book_side.get(price, None)
+        if order_id is not None:
+            sequences = self._get_level_sequences(orders_index, levels_sequences, price, orders or [])
+            sequence = next(self._orders_sequence)
+            sequences.append(sequence)
+            orders_index[order_id] = (price, sequence)
+        if orders is None:
+            book_side[price] = [order]
         else:
-            asks.append(order)
-        self._set_asks(order[ECOBIC.PRICE.value], asks)
+            orders.append(order)
 
     def _handle_book_delete(self, order):
-        price = decimal.Decimal(order[ECOBIC.PRICE.value])
-
-        # Delete buy side orders
-        if order[ECOBIC.SIDE.value] == enums.TradeOrderSide.BUY.value:
-            bids = self.get_bids(price)
-            if bids is not None:
-                bids = [bid_order for bid_order in bids if
-                        bid_order[ECOBIC.ORDER_ID.value] != order[ECOBIC.ORDER_ID.value]]
-                if len(bids) > 0:
-                    self._set_bids(price, bids)
-                else:
-                    self._remove_bids(price)
-            return
-
-        # Delete sell side orders
-        asks = self.get_asks(price)
-        if asks is not None:
-            asks = [ask_order for ask_order in asks if
-                    ask_order[ECOBIC.ORDER_ID.value] != order[ECOBIC.ORDER_ID.value]]
-            if len(asks) > 0:
-                self._set_asks(price, asks)
-            else:
-                self._remove_asks(price)
+        book_side, orders_index, levels_sequences = self._get_book_side(order[ECOBIC.SIDE.value])
+        order_id = order[ECOBIC.ORDER_ID.value]
+        location = self._get_indexed_order_location(book_side, orders_index, levels_sequences, order_id)
+        if location is not None:
+            self._remove_indexed_order(book_side, orders_index, levels_sequences, order_id, location)
 
     def _handle_book_update(self, order):
-        size = decimal.Decimal(order.get(ECOBIC.SIZE.value, INVALID_PARSED_VALUE))
-        price = decimal.Decimal(order[ECOBIC.PRICE.value])
-
-        # Update buy side orders
-        if order[ECOBIC.SIDE.value] == enums.TradeOrderSide.BUY.value:
-            bids = self.get_bids(price)
-            order_index = _order_id_index(order[ECOBIC.ORDER_ID.value], bids)
-            if bids is None or order_index == ORDER_ID_NOT_FOUND:
-                return
-            if size != INVALID_PARSED_VALUE:
-                bids[order_index][ECOBIC.SIZE.value] = size
-            self._set_bids(price, bids)
-            return
-
-        # Update sell side orders
-        asks = self.get_asks(price)
-        order_index = _order_id_index(order[ECOBIC.ORDER_ID.value], asks)
-        if asks is None or order_index == ORDER_ID_NOT_FOUND:
+        size = order.get(ECOBIC.SIZE.value, INVALID_PARSED_VALUE)
+        book_side, orders_index, levels_sequences = self._get_book_side(order[ECOBIC.SIDE.value])
+        location = self._get_indexed_order_location(
+            book_side, orders_index, levels_sequences, order[ECOBIC.ORDER_ID.value]
+        )
+        if location is None or size == INVALID_PARSED_VALUE:
             return
-        if size != INVALID_PARSED_VALUE:
-            asks[order_index][ECOBIC.SIZE.value] = size
-        self._set_asks(price, asks)
-
-    def _set_asks(self, price, asks):
-        self.asks[price] = asks
-
-    def _set_bids(self, price, bids):
-        self.bids[price] = bids
-
-    def _remove_asks(self, price):
-        del self.asks[price]
-
-    def _remove_bids(self, price):
-        del self.bids[price]
+        price, position = location
+        book_side[price][position][ECOBIC.SIZE.value] = decimal.Decimal(size)
+
+    def _get_book_side(self, side) -> (sortedcontainers.SortedDict, dict, dict):
+        if side == enums.TradeOrderSide.BUY.value:
+            return self.bids, self._bids_orders_index, self._bids_levels_sequences
+        return self.asks, self._asks_orders_index, self._asks_levels_sequences
+
+    def _get_level_sequences(self, orders_index, levels_sequences, price, orders) -> list:
+        """
+        :return: the add sequences of orders, sequenced again in their current order when orders have been
+        added without order id or when the price level has been replaced (snapshot or deltas)
+        """
+        sequences = levels_sequences.get(price, None)
+        if sequences is None or len(sequences) != len(orders):
+            sequences = levels_sequences[price] = []
+            for order in orders:
+                sequence = next(self._orders_sequence)
+                sequences.append(sequence)
+                order_id = order[ECOBIC.ORDER_ID.value]
+                if order_id is not None and orders_index.get(order_id, (None, ))[0] == price:
+                    orders_index[order_id] = (price, sequence)
+        return sequences
+
+    def _get_indexed_order_location(self, book_side, orders_index, levels_sequences, order_id):
+        """
+        :return: the (price, position) of order_id in book_side or None when the order is not in book_side
+        """
+        try:
+            price, _ = orders_index[order_id]
+            orders = book_side[price]
+            sequences = self._get_level_sequences(orders_index, levels_sequences, price, orders)
+            # orders are kept in add sequence order: find the order position by bisection
+            sequence = orders_index[order_id][1]
+            position = bisect.bisect_left(sequences, sequence)
+            if position < len(orders) and sequences[position] == sequence \
+                    and orders[position][ECOBIC.ORDER_ID.value] == order_id:
+                return price, position
+        except KeyError:
+            pass
+        # price level has been replaced without this order (snapshot or deltas)
+        orders_index.pop(order_id, None)
+        return None
+
+    def _remove_indexed_order(self, book_side, orders_index, levels_sequences, order_id, location):
+        # keep the price level orders in their arrival (FIFO) order
+        price, position = location
+        orders_index.pop(order_id)
+        orders = book_side[price]
+        del orders[position]
+        if orders:
+            del levels_sequences[price][position]
+        else:
+            del book_side[price]
+            del levels_sequences[price]
 
     def get_ask(self):
+        if self.compact_l2:
+            return _get_l2_price_level(*self.l2_asks.get_best(), enums.TradeOrderSide.SELL.value)
         return self.asks.peekitem(0)
 
     def get_bid(self):
+        if self.compact_l2:
+            return _get_l2_price_level(*self.l2_bids.get_best(), enums.TradeOrderSide.BUY.value)
         return self.bids.peekitem(-1)
 
     def get_asks(self, price):
+        if self.compact_l2:
+            return _get_l2_price_level_orders(price, self.l2_asks.get_size(price), enums.TradeOrderSide.SELL.value)
         return self.asks.get(price, None)
 
     def get_bids(self, price):
+        if self.compact_l2:
+            return _get_l2_price_level_orders(price, self.l2_bids.get_size(price), enums.TradeOrderSide.BUY.value)
         return self.bids.get(price, None)
 
 
-def _order_id_index(order_id, order_list):
-    """
-    Return order id index in order list
-    :param order_id: the order id to search
-    :param order_list: the order list to check
-    :return: the order id index in order list if found else ORDER_ID_NOT_FOUND
-    """
-    if order_list is not None:
-        for index, order in enumerate(order_list):
-            if order[ECOBIC.ORDER_ID.value] == order_id:
-                return index
-    return ORDER_ID_NOT_FOUND
+def _get_l2_price_level(price, size, side):
+    return price, [_convert_price_size_to_order((price, size), side)]
+
+
+def _get_l2_price_level_orders(price, size, side):
+    return None if size is None else [_convert_price_size_to_order((price, size), side)]
+
+
+def _apply_level_deltas(book_side, levels_sequences, price_size_list, side):
+    for price_size in price_size_list:
+        # replaced or removed level: its L3 orders are gone
+        levels_sequences.pop(price_size[0], None)
+        if price_size[1] > 0:
+            book_side[price_size[0]] = [_convert_price_size_to_order(price_size, side)]
+        else:
+            book_side.pop(price_size[0], None)
+
+
+def _update_raw_levels(raw_levels, price_size_list):
+    if not raw_levels and not (price_size_list and len(price_size_list[0]) > RAW_SIZE_INDEX):
+        # levels without raw strings
+        return
+    for price_size in price_size_list:
+        price = float(price_size[0])
+        if len(price_size) > RAW_SIZE_INDEX and price_size[1] > 0:
+            raw_levels[price] = f"{price_size[RAW_PRICE_INDEX]}:{price_size[RAW_SIZE_INDEX]}"
+        else:
+            # removed level or level without raw strings
+            raw_levels.pop(price, None)
 
 
 def _convert_price_size_list_to_order(price_size_list, side):
@@ -17,6 +17,7 @@
 from octobot_trading.exchange_data.prices import channel
 from octobot_trading.exchange_data.prices import prices_manager
 from octobot_trading.exchange_data.prices import price_events_manager
+from octobot_trading.exchange_data.prices import recent_prices_window
 
 from octobot_trading.exchange_data.prices.channel import (
     MarkPriceUpdater,
@@ -31,6 +32,9 @@ from octobot_trading.exchange_data.prices.prices_manager import (
 from octobot_trading.exchange_data.prices.price_events_manager import (
     PriceEventsManager,
 )
+from octobot_trading.exchange_data.prices.recent_prices_window import (
+    RecentPricesWindow,
+)
 
 __all__ = [
     "MarkPriceUpdaterSimulator",
@@ -40,4 +44,5 @@ __all__ = [
     "calculate_mark_price_from_recent_trade_prices",
     "MarkPriceUpdater",
     "PriceEventsManager",
+    "RecentPricesWindow",
 ]
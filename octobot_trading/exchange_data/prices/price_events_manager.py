@@ -14,9 +14,15 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import asyncio
+import bisect
 import decimal
+import heapq
+
+import sortedcontainers
 
 import octobot_commons.logging as logging
+
+import octobot_trading.exchange_data.prices.recent_prices_window as recent_prices_window
 from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
 
 
@@ -30,17 +36,40 @@ class PriceEventsManager:
     The price event index from a price event tuple
     """
     PRICE_EVENT_INDEX = 2
-    PRICE_KEY = "price"
-    TIME_KEY = "time"
+    """
+    The sequence, timestamp and event indexes from a trigger key
+    """
+    TRIGGER_SEQUENCE_INDEX = 1
+    TRIGGER_TIMESTAMP_INDEX = 2
+    TRIGGER_EVENT_INDEX = 3
     MAX_LAST_RECENT_PRICES = 50
 
     def __init__(self):
         self.logger = logging.get_logger(self.__class__.__name__)
+        # (price, timestamp, event, trigger_above) price event tuples of each waiting event
         self.events = []
-        self._last_recent_prices = []
+        # event: [position in events, trigger key, trigger_above, is_pending] of each waiting event
+        self._events_index = {}
+        # (price, sequence, timestamp, event) trigger keys sorted by price, sequence keeps keys unique
+        self._above_triggers = sortedcontainers.SortedList()
+        self._below_triggers = sortedcontainers.SortedList()
+        # (timestamp, sequence, trigger key, trigger_above) of the events that are not yet in trigger lists:
+        # events are only added to trigger lists once a checked price is at least as recent as them
+        self._pending_triggers = []
+        self._pending_triggers_count = 0
+        self._trigger_sequence = 0
+        # event: awaitable callback to call when the event is set
+        self._event_callbacks = {}
+        # a single worker calls the callbacks of triggered events
+        self._callbacks_queue = asyncio.Queue()
+        self._callbacks_worker = None
+        self._last_recent_prices = recent_prices_window.RecentPricesWindow(self.MAX_LAST_RECENT_PRICES)
 
     def stop(self):
         self.reset()
+        if self._callbacks_worker is not None:
+            self._callbacks_worker.cancel()
+            self._callbacks_worker = None
 
     def reset(self):
         """
@@ -48,12 +77,17 @@ class PriceEventsManager:
         """
         self.clear_recent_prices()
         self.events.clear()
+        self._events_index.clear()
+        self._event_callbacks.clear()
+        self._above_triggers.clear()
+        self._below_triggers.clear()
+        self._pending_triggers.clear()
+        self._pending_triggers_count = 0
 
     def get_min_and_max_prices(self) -> (float, float):
         if len(self._last_recent_prices) < 2:
             raise IndexError("Not enough data")
-        prices = sorted([element[self.PRICE_KEY] for element in self._last_recent_prices])
-        return prices[0], prices[-1]
+        return self._last_recent_prices.get_min_and_max()
 
     def handle_recent_trades(self, recent_trades):
         """
@@ -62,15 +96,23 @@ class PriceEventsManager:
         """
         # reset recent prices on new recent trades
         self.clear_recent_prices()
+        if not recent_trades:
+            return
+        prices = []
+        timestamps = []
         for recent_trade in recent_trades:
-            price = decimal.Decimal(str(recent_trade[ECOC.PRICE.value]))
+            price = recent_trade[ECOC.PRICE.value]
+            if not isinstance(price, decimal.Decimal):
+                price = decimal.Decimal(str(price))
             timestamp = recent_trade[ECOC.TIMESTAMP.value]
-            try:
-                self._add_recent_price(price, timestamp)
-                for event_to_set in self._check_events(price, timestamp):
-                    self._remove_and_set_event(event_to_set)
-            except KeyError:
-                self.logger.error("Error when checking price events with recent trades data")
+            self._add_recent_price(price, timestamp)
+            prices.append(price)
+            timestamps.append(timestamp)
+        try:
+            for event_to_set in self._check_batch_events(prices, timestamps):
+                self._remove_and_set_event(event_to_set)
+        except KeyError:
+            self.logger.error("Error when checking price events with recent trades data")
 
     def handle_price(self, price, timestamp):
         """
@@ -83,21 +125,12 @@ class PriceEventsManager:
             self._remove_and_set_event(event_to_set)
 
     def clear_recent_prices(self):
-        self._last_recent_prices = []
+        self._last_recent_prices.clear()
 
     def _add_recent_price(self, price, timestamp):
-        self._last_recent_prices.append({
-            self.PRICE_KEY: price,
-            self.TIME_KEY: timestamp
-        })
-        self._ensure_last_prices_length()
-
-    def _ensure_last_prices_length(self):
-        if len(self._last_recent_prices) > self.MAX_LAST_RECENT_PRICES:
-            # only take the most recent prices
-            self._last_recent_prices = self._last_recent_prices[self.MAX_LAST_RECENT_PRICES // 2:]
+        self._last_recent_prices.add(price, timestamp)
 
-    def new_event(self, price, timestamp, trigger_above, allow_instant_fill=True):
+    def new_event(self, price, timestamp, trigger_above, allow_instant_fill=True, callback=None):
         """
         Create a new event at price and timestamp.
         This event can already be set should it be instantly triggered.
@@ -106,6 +139,8 @@ class PriceEventsManager:
         :param timestamp: the timestamp to wait for
         :param trigger_above: True if waiting for an upper price
         :param allow_instant_fill: True if recent prices should be checked to fill this event
+        :param callback: awaitable to call from the callbacks worker when the event is set later on,
+        it is not called when the event is instantly set
         :return: the price event
         """
         price_event_tuple = _new_price_event(price, timestamp, trigger_above)
@@ -114,7 +149,9 @@ class PriceEventsManager:
             price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX].set()
         else:
             # this event will be set when conditions are met
-            self.events.append(price_event_tuple)
+            self._add_event(*price_event_tuple)
+            if callback is not None:
+                self._event_callbacks[price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]] = callback
         return price_event_tuple[PriceEventsManager.PRICE_EVENT_INDEX]
 
     def _is_triggered_by_last_recent_prices(self, price, timestamp, trigger_above):
@@ -125,14 +162,7 @@ class PriceEventsManager:
         :param trigger_above: True if waiting for an upper price
         :return: True if it would be triggered
         """
-        for recent_price in self._last_recent_prices:
-            trade_price = recent_price[self.PRICE_KEY]
-            if timestamp <= recent_price[self.TIME_KEY] and (
-                (trigger_above and price <= trade_price) or
-                (not trigger_above and price >= trade_price)
-            ):
-                return True
-        return False
+        return self._last_recent_prices.is_reached(price, timestamp, trigger_above)
 
     def remove_event(self, event_to_remove):
         """
@@ -143,39 +173,169 @@ class PriceEventsManager:
 
     def _remove_and_set_event(self, event_to_set):
         """
-        Set the event and remove it from event list
+        Set the event, remove it from event list and dispatch its callback if any
         :param event_to_set: the event to set
-        :return: the event index removed from event list
         """
         event_to_set.set()
-        return self._remove_event(event_to_set)
+        callback = self._event_callbacks.pop(event_to_set, None)
+        self._remove_event(event_to_set)
+        if callback is not None:
+            self.dispatch_callback(callback)
+
+    def dispatch_callback(self, callback):
+        """
+        Call the given awaitable callback from the callbacks worker
+        :param callback: the callback to call
+        """
+        self._callbacks_queue.put_nowait(callback)
+        if self._callbacks_worker is None or self._callbacks_worker.done():
+            self._callbacks_worker = asyncio.create_task(self._call_callbacks())
+
+    async def _call_callbacks(self):
+        while True:
+            callback = await self._callbacks_queue.get()
+            try:
+                await callback()
+            except Exception as e:
+                self.logger.exception(e, True, f"Error when calling price event callback: {e}")
+
+    def _add_event(self, price, timestamp, event, trigger_above):
+        """
+        Add the event to events, it will be indexed in the trigger list of its direction once its timestamp is reached
+        """
+        trigger_key = (price, self._trigger_sequence, timestamp, event)
+        heapq.heappush(self._pending_triggers, (timestamp, self._trigger_sequence, trigger_key, trigger_above))
+        self._pending_triggers_count += 1
+        self._trigger_sequence += 1
+        self._events_index[event] = [len(self.events), trigger_key, trigger_above, True]
+        self.events.append((price, timestamp, event, trigger_above))
 
     def _remove_event(self, event_to_remove):
         """
-        Remove the event from events list
+        Remove the event from events and its trigger list
         :param event_to_remove: the event to remove
         """
-        for price_event_data in self.events:
-            if event_to_remove in price_event_data:
-                return self.events.remove(price_event_data)
+        self._event_callbacks.pop(event_to_remove, None)
+        try:
+            position, trigger_key, trigger_above, is_pending = self._events_index.pop(event_to_remove)
+        except KeyError:
+            return
+        # events order is not meaningful (triggered events are ordered by sequence): move the last event
+        # to the removed event position
+        last_price_event = self.events.pop()
+        if position < len(self.events):
+            self.events[position] = last_price_event
+            self._events_index[last_price_event[self.PRICE_EVENT_INDEX]][0] = position
+        if is_pending:
+            # lazily removed from _pending_triggers
+            self._pending_triggers_count -= 1
+            if len(self._pending_triggers) > 2 * self._pending_triggers_count:
+                self._pending_triggers = [
+                    pending_trigger
+                    for pending_trigger in self._pending_triggers
+                    if pending_trigger[2][self.TRIGGER_EVENT_INDEX] in self._events_index
+                ]
+                heapq.heapify(self._pending_triggers)
+        else:
+            (self._above_triggers if trigger_above else self._below_triggers).remove(trigger_key)
+
+    def _add_reached_pending_triggers(self, timestamp):
+        """
+        Add the pending events with a timestamp lower or equal to timestamp to their trigger list
+        """
+        while self._pending_triggers and self._pending_triggers[0][0] <= timestamp:
+            _, _, trigger_key, trigger_above = heapq.heappop(self._pending_triggers)
+            event_index = self._events_index.get(trigger_key[self.TRIGGER_EVENT_INDEX])
+            if event_index is None:
+                # removed event
+                continue
+            # not pending anymore
+            event_index[3] = False
+            self._pending_triggers_count -= 1
+            (self._above_triggers if trigger_above else self._below_triggers).add(trigger_key)
 
     def _check_events(self, price, timestamp):
         """
-        Check for each price, timestamp pair event if it should be triggered
+        Check for each price, timestamp pair event if it should be triggered.
+        Only the prefix of each trigger list matching price is checked.
         :param price: the price used to check
         :param timestamp: the timestamp used to check
-        :return: the event list that match
+        :return: the event list that match, in events creation order
         """
+        self._add_reached_pending_triggers(timestamp)
         return [
-            event
-            for event_price, event_timestamp, event, trigger_above in self.events
-            if event_timestamp <= timestamp and
-            (
-                (trigger_above and event_price <= price) or
-                (not trigger_above and event_price >= price)
+            trigger_key[self.TRIGGER_EVENT_INDEX]
+            for trigger_key in sorted(
+                (
+                    trigger_key
+                    for trigger_keys in (
+                        # trigger above events with a price lower or equal to price
+                        self._above_triggers.irange(maximum=(price, float("inf"))),
+                        # trigger below events with a price higher or equal to price
+                        self._below_triggers.irange(minimum=(price, -1)),
+                    )
+                    for trigger_key in trigger_keys
+                    if trigger_key[self.TRIGGER_TIMESTAMP_INDEX] <= timestamp
+                ),
+                key=lambda trigger_key: trigger_key[self.TRIGGER_SEQUENCE_INDEX]
             )
         ]
 
+    def _check_batch_events(self, prices, timestamps):
+        """
+        Check in a single pass which events would be triggered by any of the given price, timestamp pairs
+        :param prices: the prices used to check
+        :param timestamps: the timestamps of each price
+        :return: the event list that match, in the order checking each price one after the other would set them:
+        by triggering price and then by events creation order
+        """
+        self._add_reached_pending_triggers(max(timestamps))
+        batch_size = len(prices)
+        sorted_indexes = sorted(range(batch_size), key=timestamps.__getitem__)
+        sorted_timestamps = [timestamps[index] for index in sorted_indexes]
+        # highest and lowest prices from each timestamp
+        max_prices = [None] * batch_size
+        min_prices = [None] * batch_size
+        max_price = min_price = prices[sorted_indexes[-1]]
+        for position in range(batch_size - 1, -1, -1):
+            price = prices[sorted_indexes[position]]
+            max_price = max(max_price, price)
+            min_price = min(min_price, price)
+            max_prices[position] = max_price
+            min_prices[position] = min_price
+        # (triggering price index, sequence, event) of each triggered event
+        triggered_events = []
+        # trigger above events with a price lower or equal to the batch highest price
+        for event_price, sequence, event_timestamp, event in self._above_triggers.irange(
+            maximum=(max_price, float("inf"))
+        ):
+            position = bisect.bisect_left(sorted_timestamps, event_timestamp)
+            if position < batch_size and max_prices[position] >= event_price:
+                triggered_events.append((
+                    next(
+                        index
+                        for index in range(batch_size)
+                        if timestamps[index] >= event_timestamp and prices[index] >= event_price
+                    ),
+                    sequence,
+                    event
+                ))
+        # trigger below events with a price higher or equal to the batch lowest price
+        for event_price, sequence, event_timestamp, event in self._below_triggers.irange(minimum=(min_price, -1)):
+            position = bisect.bisect_left(sorted_timestamps, event_timestamp)
+            if position < batch_size and min_prices[position] <= event_price:
+                triggered_events.append((
+                    next(
+                        index
+                        for index in range(batch_size)
+                        if timestamps[index] >= event_timestamp and prices[index] <= event_price
+                    ),
+                    sequence,
+                    event
+                ))
+        triggered_events.sort(key=lambda triggered_event: triggered_event[:2])
+        return [event for _, _, event in triggered_events]
+
 
 def _new_price_event(price, timestamp, trigger_above):
     """
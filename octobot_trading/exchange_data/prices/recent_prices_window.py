@@ -0,0 +1,84 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+
+
+class RecentPricesWindow:
+    """
+    Fixed size window of the most recent (price, time) pairs keeping track of its lowest and highest prices
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        # ring buffer of (price, time)
+        self.prices = collections.deque(maxlen=max_size)
+        # (position, price, time) with decreasing prices for max and increasing prices for min:
+        # the first element is the window extremum, each next one is the extremum of the following prices
+        self._max_prices = collections.deque()
+        self._min_prices = collections.deque()
+        self._added_count = 0
+        # False when a price is older than a previous one
+        self._ordered_times = True
+
+    def __len__(self):
+        return len(self.prices)
+
+    def clear(self):
+        self.prices.clear()
+        self._max_prices.clear()
+        self._min_prices.clear()
+        self._added_count = 0
+        self._ordered_times = True
+
+    def add(self, price, time):
+        if self.prices and time < self.prices[-1][1]:
+            self._ordered_times = False
+        self.prices.append((price, time))
+        position = self._added_count
+        self._added_count += 1
+        while self._max_prices and self._max_prices[-1][1] <= price:
+            self._max_prices.pop()
+        self._max_prices.append((position, price, time))
+        while self._min_prices and self._min_prices[-1][1] >= price:
+            self._min_prices.pop()
+        self._min_prices.append((position, price, time))
+        # drop extremums that left the window
+        first_position = self._added_count - self.max_size
+        for extremums in (self._max_prices, self._min_prices):
+            if extremums[0][0] < first_position:
+                extremums.popleft()
+
+    def get_min_and_max(self) -> tuple:
+        """
+        :return: the lowest and highest prices of the window, raises IndexError when empty
+        """
+        return self._min_prices[0][1], self._max_prices[0][1]
+
+    def is_reached(self, price, time, above) -> bool:
+        """
+        :return: True when a price at or after time is higher (when above) or lower (otherwise)
+        or equal to price
+        """
+        if not self._ordered_times:
+            return any(
+                recent_time >= time and (recent_price >= price if above else recent_price <= price)
+                for recent_price, recent_time in self.prices
+            )
+        # times are ordered: prices at or after time are the window suffix starting from the first of those
+        # prices, its extremum is the first extremum at or after time
+        for _, extremum, extremum_time in (self._max_prices if above else self._min_prices):
+            if extremum_time >= time:
+                return extremum >= price if above else extremum <= price
+        return False
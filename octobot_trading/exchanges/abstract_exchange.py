@@ -97,6 +97,7 @@ class AbstractExchange(tentacles_management.AbstractTentacle):
         self.is_unreachable = False
 
         self._creating_exchange_order_descriptions = set()
+        self._creating_orders_count_by_symbol = {}
 
         if exchange_config_by_exchange and self.get_name() in exchange_config_by_exchange:
             self.tentacle_config = exchange_config_by_exchange[self.get_name()]
@@ -349,6 +350,37 @@ class AbstractExchange(tentacles_management.AbstractTentacle):
         """
         raise NotImplementedError("cancel_order is not implemented")
 
+    async def cancel_orders(self, exchange_order_ids: list, symbol: str, **kwargs: dict) -> list:
+        """
+        Cancel orders of the same symbol on the exchange in a single request
+        :param exchange_order_ids: the orders ids on exchange
+        :param symbol: the orders symbol
+        :return: the status of each order after the cancel request
+        """
+        raise NotImplementedError("cancel_orders is not implemented")
+
+    async def resolve_unknown_cancel_statuses(self, exchange_order_ids: list, symbol: str, statuses: list) -> list:
+        """
+        Look up orders of UNKNOWN status after a cancel request in a single open orders fetch
+        :param exchange_order_ids: the orders ids on exchange
+        :param symbol: the orders symbol
+        :param statuses: the status of each order after the cancel request
+        :return: the statuses where UNKNOWN orders that are still open are being cancelled, others remain UNKNOWN
+        as they can be cancelled or filled
+        """
+        if enums.OrderStatus.UNKNOWN not in statuses:
+            return statuses
+        open_order_ids = set(
+            order.get(enums.ExchangeConstantsOrderColumns.EXCHANGE_ID.value)
+            for order in await self.get_open_orders(symbol=symbol)
+        )
+        return [
+            enums.OrderStatus.PENDING_CANCEL
+            if status is enums.OrderStatus.UNKNOWN and exchange_order_id in open_order_ids
+            else status
+            for exchange_order_id, status in zip(exchange_order_ids, statuses)
+        ]
+
     async def create_order(self, order_type: enums.TraderOrderType, symbol: str, quantity: decimal.Decimal,
                            price: decimal.Decimal = None, stop_price: decimal.Decimal = None,
                            side: enums.TradeOrderSide = None, current_price: decimal.Decimal = None,
@@ -368,6 +400,18 @@ class AbstractExchange(tentacles_management.AbstractTentacle):
         """
         raise NotImplementedError("create_order is not implemented")
 
+    def supports_bulk_order_creation(self) -> bool:
+        """
+        :return: True when create_orders can be used to create multiple orders in one request
+        """
+        return False
+
+    def supports_bulk_order_cancellation(self) -> bool:
+        """
+        :return: True when cancel_orders can be used to cancel multiple orders in one request
+        """
+        return False
+
     def get_order_additional_params(self, order) -> dict:
         """
         Returns a dict with exchange specific additional parameters to set before sending the order
@@ -740,12 +784,23 @@ class AbstractExchange(tentacles_management.AbstractTentacle):
         desc = self._get_order_description(side, symbol, quantity, price)
         try:
             self._creating_exchange_order_descriptions.add(desc)
+            self._creating_orders_count_by_symbol[symbol] = self._creating_orders_count_by_symbol.get(symbol, 0) + 1
             yield
         finally:
             try:
                 self._creating_exchange_order_descriptions.remove(desc)
             except KeyError:
                 self.logger.error(f"Failed to remove {desc} from exchange order descriptions")
+            if self._creating_orders_count_by_symbol[symbol] > 1:
+                self._creating_orders_count_by_symbol[symbol] -= 1
+            else:
+                self._creating_orders_count_by_symbol.pop(symbol)
+
+    def is_creating_symbol_orders(self, symbol: str) -> bool:
+        """
+        :return: True when an order creation request of the given symbol is in progress
+        """
+        return symbol in self._creating_orders_count_by_symbol
 
     def is_creating_order(
         self, order: dict, symbol: str
@@ -573,6 +573,30 @@ class CCXTConnector(abstract_exchange.AbstractExchange):
             symbol=symbol, quantity=quantity
         )
 
+    def supports_bulk_order_creation(self) -> bool:
+        return bool(self.client.has.get("createOrders"))
+
+    @ccxt_client_util.converted_ccxt_common_errors
+    async def create_orders(self, orders: list, params=None) -> list:
+        """
+        :param orders: ccxt createOrders orders: dicts of symbol, type, side, amount, price and params
+        :return: the created order of each order, None for orders that are refused by the exchange
+        """
+        created_orders = []
+        for order, created_order in zip(orders, await self.client.create_orders(orders, params=params or {})):
+            if (
+                created_order.get(ecoc.ID.value) is None
+                or created_order.get(ecoc.STATUS.value) == enums.OrderStatus.REJECTED.value
+            ):
+                self.logger.error(f"Order refused by exchange: {created_order.get('info', created_order)}. "
+                                  f"Order: {order}")
+                created_orders.append(None)
+            else:
+                created_orders.append(
+                    self.adapter.adapt_order(created_order, symbol=order["symbol"], quantity=order["amount"])
+                )
+        return created_orders
+
     @ccxt_client_util.converted_ccxt_common_errors
     async def create_market_sell_order(self, symbol, quantity, price=None, params=None) -> dict:
         return self.adapter.adapt_order(
@@ -751,6 +775,39 @@ class CCXTConnector(abstract_exchange.AbstractExchange):
                 f"({e.__class__.__name__})")
             raise e
 
+    def supports_bulk_order_cancellation(self) -> bool:
+        return bool(self.client.has.get("cancelOrders"))
+
+    @ccxt_client_util.converted_ccxt_common_errors
+    async def cancel_orders(self, exchange_order_ids: list, symbol: str, **kwargs: dict) -> list:
+        """
+        :param exchange_order_ids: ids of the orders to cancel, all orders should be from the given symbol
+        :return: the status of each order after the cancel request, UNKNOWN when the cancel response does not
+        include the order status
+        """
+        try:
+            with self.error_describer():
+                cancelled_orders = await self.client.cancel_orders(exchange_order_ids, symbol=symbol, params=kwargs)
+        except (ccxt.NotSupported, octobot_trading.errors.NotSupported) as e:
+            raise octobot_trading.errors.NotSupported(
+                html_util.get_html_summary_if_relevant(e)
+            ) from e
+        statuses_by_id = {}
+        for cancelled_order in cancelled_orders if isinstance(cancelled_orders, list) else []:
+            if (
+                isinstance(cancelled_order, dict)
+                and cancelled_order.get(ecoc.ID.value) is not None
+                and cancelled_order.get(ecoc.STATUS.value) is not None
+            ):
+                statuses_by_id[cancelled_order[ecoc.ID.value]] = (
+                    enums.OrderStatus.CANCELED if personal_data.parse_is_cancelled(cancelled_order)
+                    else enums.OrderStatus.PENDING_CANCEL
+                )
+        return [
+            statuses_by_id.get(exchange_order_id, enums.OrderStatus.UNKNOWN)
+            for exchange_order_id in exchange_order_ids
+        ]
+
     @ccxt_client_util.converted_ccxt_common_errors
     async def get_positions(self, symbols=None, **kwargs: dict) -> list:
         try:
@@ -15,6 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
+import asyncio
 import decimal
 import typing
 
@@ -264,6 +265,103 @@ class Trader(util.Initializable):
         await self.exchange_manager.exchange_personal_data.handle_portfolio_and_position_update_from_order(order)
         return changed
 
+    async def create_orders(
+        self, orders: list, params: dict = None, wait_for_creation=True, raise_all_creation_error=False,
+        creation_timeout=octobot_trading.constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT
+    ) -> list:
+        """
+        Create new orders from OrderFactory created orders as in create_order.
+        On exchanges supporting it, limit orders are sent in bulk creation requests. Other orders are created
+        concurrently, at most MAX_CONCURRENT_ORDER_CREATIONS requests at a time.
+        :param orders: Orders to create
+        :param params: Additional parameters to give to each order upon creation (used in real trading only)
+        :param wait_for_creation: when True, always make sure each order is completely created before returning.
+        :param raise_all_creation_error: when True, will raise creation errors when possible
+        (instead of using None as created order)
+        :param creation_timeout: time before raising a timeout error when waiting for an order creation
+        :return: The created order instances, None for each order that could not be created. Errors that
+        require actions to fix the situation are raised once every order creation has been processed
+        """
+        created_orders = [None] * len(orders)
+        raised_errors = []
+        requests_limiter = asyncio.Semaphore(octobot_trading.constants.MAX_CONCURRENT_ORDER_CREATIONS)
+
+        async def _create_order(index):
+            async with requests_limiter:
+                try:
+                    created_orders[index] = await self.create_order(
+                        orders[index], params=params, wait_for_creation=wait_for_creation,
+                        raise_all_creation_error=raise_all_creation_error, creation_timeout=creation_timeout
+                    )
+                except Exception as err:
+                    raised_errors.append(err)
+
+        async def _bulk_create_orders(indexes):
+            async with requests_limiter:
+                bulk_orders = [orders[index] for index in indexes]
+                try:
+                    for order in bulk_orders:
+                        self.logger.info(f"Creating order: {order}")
+                    for index, created_order in zip(indexes, await self._create_new_orders(
+                        bulk_orders, params or {}, wait_for_creation=wait_for_creation,
+                        creation_timeout=creation_timeout
+                    )):
+                        created_orders[index] = created_order
+                except (
+                    errors.MissingFunds, errors.AuthenticationError,
+                    errors.ExchangeCompliancyError, errors.OrderCreationError
+                ) as err:
+                    # forward errors that require actions to fix the situation
+                    raised_errors.append(err)
+                except Exception as err:
+                    if raise_all_creation_error:
+                        raised_errors.append(err)
+                    else:
+                        self.logger.exception(
+                            err, True, f"Unexpected error when creating orders: {err}. Orders: {bulk_orders}"
+                        )
+
+        if self.simulate:
+            # no exchange request to wait for: create orders one after the other
+            for index in range(len(orders)):
+                await _create_order(index)
+        else:
+            bulk_batches = self._get_bulk_creation_batches(orders)
+            bulk_indexes = set(index for batch in bulk_batches for index in batch)
+            await asyncio.gather(
+                *(
+                    _bulk_create_orders(batch)
+                    for batch in bulk_batches
+                ),
+                *(
+                    _create_order(index)
+                    for index in range(len(orders))
+                    if index not in bulk_indexes
+                )
+            )
+        if raised_errors:
+            raise raised_errors[0]
+        return created_orders
+
+    def _get_bulk_creation_batches(self, orders) -> list:
+        """
+        :return: the indexes of the orders to create in each bulk creation request, batches are split by symbol
+        """
+        if len(orders) < 2 or not self.exchange_manager.exchange.supports_bulk_order_creation():
+            return []
+        indexes_by_symbol = {}
+        for index, order in enumerate(orders):
+            if order.order_type in (enums.TraderOrderType.BUY_LIMIT, enums.TraderOrderType.SELL_LIMIT) \
+                    and not order.is_self_managed():
+                indexes_by_symbol.setdefault(order.symbol, []).append(index)
+        bulk_size = self.exchange_manager.exchange.MAX_ORDERS_PER_BULK_CREATION
+        return [
+            indexes[start_index:start_index + bulk_size]
+            for indexes in indexes_by_symbol.values()
+            if len(indexes) > 1
+            for start_index in range(0, len(indexes), bulk_size)
+        ]
+
     async def _create_new_order(self, new_order, params: dict,
                                 wait_for_creation=True,
                                 creation_timeout=octobot_trading.constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT) -> object:
@@ -274,9 +372,6 @@ class Trader(util.Initializable):
         updated_order = new_order
         is_pending_creation = False
         if not self.simulate and not new_order.is_self_managed():
-            order_params = self.exchange_manager.exchange.get_order_additional_params(new_order)
-            order_params.update(new_order.exchange_creation_params)
-            order_params.update(params)
             created_order = await self.exchange_manager.exchange.create_order(
                 order_type=new_order.order_type,
                 symbol=new_order.symbol,
@@ -286,40 +381,95 @@ class Trader(util.Initializable):
                 side=new_order.side,
                 current_price=new_order.created_last_price,
                 reduce_only=new_order.reduce_only,
-                params=order_params
+                params=self._get_exchange_order_params(new_order, params)
             )
             if created_order is None:
                 return None
-            self.logger.debug(f"Successfully created order on {self.exchange_manager.exchange_name}: {created_order}")
+            updated_order, is_pending_creation = self._get_created_order_instance(new_order, created_order)
+        return await self._initialize_created_order(
+            updated_order, is_pending_creation, wait_for_creation, creation_timeout
+        )
+
+    async def _create_new_orders(self, new_orders, params: dict,
+                                 wait_for_creation=True,
+                                 creation_timeout=octobot_trading.constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT) -> list:
+        """
+        Creates real exchange managed limit orders of the same symbol in one bulk request.
+        Portfolio will be updated by each created order state after order will be initialized
+        :return: the created orders, None for each order that was refused by the exchange
+        """
+        created_orders = await self.exchange_manager.exchange.create_orders([
+            {
+                "order_type": new_order.order_type,
+                "symbol": new_order.symbol,
+                "quantity": new_order.origin_quantity,
+                "price": new_order.origin_price,
+                "side": new_order.side,
+                "current_price": new_order.created_last_price,
+                "reduce_only": new_order.reduce_only,
+                "params": self._get_exchange_order_params(new_order, params),
+            }
+            for new_order in new_orders
+        ])
+        updated_orders = [None] * len(new_orders)
+        initialized_indexes = []
+        initializations = []
+        for index, (new_order, created_order) in enumerate(zip(new_orders, created_orders)):
+            if created_order is None:
+                self.logger.warning(f"Order not created on {self.exchange_manager.exchange_name} "
+                                    f"(failed attempt to create: {new_order}). This is likely due to "
+                                    f"the order being refused by the exchange.")
+                continue
+            initialized_indexes.append(index)
+            initializations.append(self._initialize_created_order(
+                *self._get_created_order_instance(new_order, created_order), wait_for_creation, creation_timeout
+            ))
+        for index, updated_order in zip(initialized_indexes, await asyncio.gather(*initializations)):
+            updated_orders[index] = updated_order
+        return updated_orders
+
+    def _get_exchange_order_params(self, new_order, params: dict) -> dict:
+        order_params = self.exchange_manager.exchange.get_order_additional_params(new_order)
+        order_params.update(new_order.exchange_creation_params)
+        order_params.update(params)
+        return order_params
 
-            # get real order from exchange
-            updated_order = order_factory.create_order_instance_from_raw(
-                self, created_order, force_open_or_pending_creation=True, has_just_been_created=True
+    def _get_created_order_instance(self, new_order, created_order: dict) -> tuple:
+        """
+        :return: the order instance created from the exchange created_order and True if it is pending creation
+        """
+        self.logger.debug(f"Successfully created order on {self.exchange_manager.exchange_name}: {created_order}")
+
+        # get real order from exchange
+        updated_order = order_factory.create_order_instance_from_raw(
+            self, created_order, force_open_or_pending_creation=True, has_just_been_created=True
+        )
+        is_pending_creation = updated_order.status == enums.OrderStatus.PENDING_CREATION
+
+        # rebind local elements to new order instance
+        if new_order.order_group:
+            updated_order.add_to_order_group(new_order.order_group)
+        updated_order.order_id = new_order.order_id
+        updated_order.tag = new_order.tag
+        updated_order.chained_orders = new_order.chained_orders
+        for chained_order in new_order.chained_orders:
+            chained_order.triggered_by = updated_order
+        updated_order.triggered_by = new_order.triggered_by
+        updated_order.has_been_bundled = new_order.has_been_bundled
+        updated_order.exchange_creation_params = new_order.exchange_creation_params
+        updated_order.is_waiting_for_chained_trigger = new_order.is_waiting_for_chained_trigger
+        updated_order.associated_entry_ids = new_order.associated_entry_ids
+        updated_order.update_with_triggering_order_fees = new_order.update_with_triggering_order_fees
+        updated_order.trailing_profile = new_order.trailing_profile
+
+        if is_pending_creation:
+            # register order as pending order, it will then be added to live orders in order manager once open
+            self.exchange_manager.exchange_personal_data.orders_manager.register_pending_creation_order(
+                updated_order
             )
-            is_pending_creation = updated_order.status == enums.OrderStatus.PENDING_CREATION
-
-            # rebind local elements to new order instance
-            if new_order.order_group:
-                updated_order.add_to_order_group(new_order.order_group)
-            updated_order.order_id = new_order.order_id
-            updated_order.tag = new_order.tag
-            updated_order.chained_orders = new_order.chained_orders
-            for chained_order in new_order.chained_orders:
-                chained_order.triggered_by = updated_order
-            updated_order.triggered_by = new_order.triggered_by
-            updated_order.has_been_bundled = new_order.has_been_bundled
-            updated_order.exchange_creation_params = new_order.exchange_creation_params
-            updated_order.is_waiting_for_chained_trigger = new_order.is_waiting_for_chained_trigger
-            updated_order.associated_entry_ids = new_order.associated_entry_ids
-            updated_order.update_with_triggering_order_fees = new_order.update_with_triggering_order_fees
-            updated_order.trailing_profile = new_order.trailing_profile
-
-            if is_pending_creation:
-                # register order as pending order, it will then be added to live orders in order manager once open
-                self.exchange_manager.exchange_personal_data.orders_manager.register_pending_creation_order(
-                    updated_order
-                )
+        return updated_order, is_pending_creation
 
+    async def _initialize_created_order(self, updated_order, is_pending_creation, wait_for_creation, creation_timeout):
         await updated_order.initialize()
         if is_pending_creation and wait_for_creation \
                 and updated_order.state is not None and updated_order.state.is_pending()\
@@ -478,15 +628,7 @@ class Trader(util.Initializable):
                 f"it impossible to handle this the issue. Please report it if you see it. "
                 f"Order: {order}"
             ) from err
-        # trigger forced refresh to get an update of the order
-        if order.state.is_refreshing():
-            await order.state.wait_for_next_state(cancelling_timeout)
-        else:
-            previous_status = order.status
-            await order.state.synchronize(force_synchronization=True)
-            if previous_status != order.status:
-                # status changed: wait for state change
-                await order.state.wait_for_next_state(cancelling_timeout)
+        await self._synchronize_order(order, cancelling_timeout)
         if order.is_cancelled():
             self.logger.debug(f"Tried to cancel an already cancelled order. Order: {order}")
             return True
@@ -514,6 +656,17 @@ class Trader(util.Initializable):
                 f"Can't cancel order and unknown post sync order state for order: {order}."
             ) from err
 
+    async def _synchronize_order(self, order, timeout):
+        # trigger forced refresh to get an update of the order
+        if order.state.is_refreshing():
+            await order.state.wait_for_next_state(timeout)
+        else:
+            previous_status = order.status
+            await order.state.synchronize(force_synchronization=True)
+            if previous_status != order.status:
+                # status changed: wait for state change
+                await order.state.wait_for_next_state(timeout)
+
     async def cancel_all_orders(
         self,
         symbol: str,
@@ -566,6 +719,198 @@ class Trader(util.Initializable):
         self.logger.info(f"Cancelling of all {len(orders_to_cancel)} {symbol} orders complete")
         return success
 
+    async def cancel_orders(
+        self, orders: list, emit_trading_signals=False, wait_for_cancelling=True,
+        cancelling_timeout=octobot_trading.constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT
+    ) -> (bool, list):
+        """
+        Cancels the given orders. Orders are grouped by symbol and each symbol is handled by cancel_symbol_orders.
+        Symbols are processed concurrently, at most MAX_CONCURRENT_ORDER_CANCELS at a time.
+        :param orders: Orders to cancel
+        :param emit_trading_signals: when true, trading signals will be emitted
+        :param wait_for_cancelling: when True, always make sure the order is completely cancelled before returning.
+        :param cancelling_timeout: time before raising a timeout error when waiting for an order cancel
+        :return: (True, orders): True if all orders got cancelled, False if an error occurred and the list of
+        cancelled orders
+        """
+        orders_by_symbol = {}
+        for order in orders:
+            orders_by_symbol.setdefault(order.symbol, []).append(order)
+        results_by_symbol = {}
+        requests_limiter = asyncio.Semaphore(octobot_trading.constants.MAX_CONCURRENT_ORDER_CANCELS)
+
+        async def _cancel_symbol_orders(symbol):
+            async with requests_limiter:
+                async with signals.remote_signal_publisher(self.exchange_manager, symbol, emit_trading_signals):
+                    results_by_symbol[symbol] = await signals.cancel_orders(
+                        self.exchange_manager,
+                        emit_trading_signals and signals.should_emit_trading_signal(self.exchange_manager),
+                        symbol,
+                        orders_by_symbol[symbol],
+                        wait_for_cancelling=wait_for_cancelling,
+                        cancelling_timeout=cancelling_timeout,
+                    )
+
+        if self.simulate:
+            # no exchange request to wait for: cancel orders one symbol after the other
+            for symbol in orders_by_symbol:
+                await _cancel_symbol_orders(symbol)
+        else:
+            await asyncio.gather(*(_cancel_symbol_orders(symbol) for symbol in orders_by_symbol))
+        all_cancelled = True
+        cancelled_orders = []
+        for symbol in orders_by_symbol:
+            symbol_all_cancelled, symbol_cancelled_orders = results_by_symbol.get(symbol, (False, []))
+            all_cancelled = symbol_all_cancelled and all_cancelled
+            cancelled_orders.extend(symbol_cancelled_orders)
+        return all_cancelled, cancelled_orders
+
+    async def cancel_symbol_orders(
+        self, symbol: str, orders: list, wait_for_cancelling=True,
+        cancelling_timeout=octobot_trading.constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT
+    ) -> (bool, list):
+        """
+        Cancels the given orders of the same symbol.
+        On real exchanges, ungrouped orders are cancelled in a single request: cancel_all_orders is used when every
+        open order of the symbol is targeted and no order of the symbol is being created, cancel_orders otherwise
+        when supported by the exchange. Cancelled
+        orders are then updated in one pass, orders which cancel status is unknown are synchronized with the
+        exchange. Other orders, or every order when the bulk request fails, are cancelled one by one using
+        cancel_order.
+        :param symbol: The symbol of the orders to cancel
+        :param orders: Orders to cancel
+        :param wait_for_cancelling: when True, always make sure the order is completely cancelled before returning.
+        :param cancelling_timeout: time before raising a timeout error when waiting for an order cancel
+        :return: (True, orders): True if all orders got cancelled, False if an error occurred and the list of
+        cancelled orders
+        """
+        all_cancelled = True
+        cancelled_orders = []
+        bulk_orders = self._get_bulk_cancellable_orders(symbol, orders)
+        bulk_cancelled_orders = await self._bulk_cancel_orders(
+            symbol, bulk_orders, wait_for_cancelling, cancelling_timeout
+        ) if bulk_orders else None
+        if bulk_cancelled_orders is None:
+            bulk_orders = []
+        else:
+            cancelled_orders.extend(bulk_cancelled_orders)
+        for order in orders:
+            if order in bulk_orders:
+                if order not in bulk_cancelled_orders:
+                    self.logger.warning(f"Skipping order cancel: order is not open on exchange anymore. "
+                                        f"Order: {order}")
+                    all_cancelled = False
+                continue
+            if order.is_cancelled() or order.is_closed():
+                # already cancelled from an order group
+                continue
+            try:
+                if await self.cancel_order(
+                    order, wait_for_cancelling=wait_for_cancelling, cancelling_timeout=cancelling_timeout
+                ):
+                    cancelled_orders.append(order)
+                else:
+                    all_cancelled = False
+            except (errors.OrderCancelError, errors.UnexpectedExchangeSideOrderStateError) as err:
+                self.logger.warning(f"Skipping order cancel: {err} ({err.__class__.__name__})")
+                all_cancelled = False
+        return all_cancelled, cancelled_orders
+
+    def _get_bulk_cancellable_orders(self, symbol: str, orders: list) -> list:
+        if self.simulate:
+            return []
+        bulk_orders = [
+            order
+            for order in orders
+            # grouped orders are cancelled one by one for their group to handle other orders of the group
+            if order.symbol == symbol and order.is_open() and order.order_group is None
+            and not order.is_self_managed() and not order.is_waiting_for_chained_trigger
+        ]
+        return bulk_orders if len(bulk_orders) > 1 else []
+
+    async def _bulk_cancel_orders(
+        self, symbol: str, orders: list, wait_for_cancelling: bool, cancelling_timeout: float
+    ) -> typing.Optional[list]:
+        """
+        :return: the cancelled orders or None when orders could not be cancelled in bulk. Orders which status
+        is unknown after the cancel request are synchronized with the exchange and are only returned when cancelled
+        """
+        orders_manager = self.exchange_manager.exchange_personal_data.orders_manager
+        targeted_order_ids = set(order.order_id for order in orders)
+        # cancel_all_orders would also cancel orders that are being created
+        cancel_all = not (
+            self.exchange_manager.exchange.is_creating_symbol_orders(symbol)
+            or any(order.symbol == symbol for order in orders_manager.pending_creation_orders)
+        ) and all(
+            order.order_id in targeted_order_ids
+            for order in orders_manager.get_open_orders(symbol=symbol)
+            if not order.is_self_managed()
+        )
+        if not cancel_all and not self.exchange_manager.exchange.supports_bulk_order_cancellation():
+            return None
+        self.logger.info(f"Cancelling {len(orders)} {symbol} orders in bulk")
+        statuses = None
+        locked_orders = []
+        try:
+            for order in orders:
+                await order.lock.acquire()
+                locked_orders.append(order)
+            if cancel_all:
+                try:
+                    await self.exchange_manager.exchange.cancel_all_orders(symbol)
+                    # orders might have been filled before being cancelled
+                    exchange_order_ids = [order.exchange_order_id for order in orders]
+                    statuses = await self.exchange_manager.exchange.resolve_unknown_cancel_statuses(
+                        exchange_order_ids, symbol, [octobot_trading.enums.OrderStatus.UNKNOWN] * len(orders)
+                    )
+                except errors.NotSupported:
+                    self.logger.debug(
+                        f"cancel_all_orders is not supported on {self.exchange_manager.exchange_name}"
+                    )
+            if statuses is None and self.exchange_manager.exchange.supports_bulk_order_cancellation():
+                statuses = await self.exchange_manager.exchange.cancel_orders(
+                    [order.exchange_order_id for order in orders], symbol
+                )
+        except Exception as err:
+            self.logger.exception(err, True, f"Failed to cancel {symbol} orders in bulk: {err}")
+            return None
+        finally:
+            for order in locked_orders:
+                order.lock.release()
+        if statuses is None:
+            return None
+        # reconcile orders in one pass
+        unknown_status_orders = []
+        for order, status in zip(orders, statuses):
+            if status is octobot_trading.enums.OrderStatus.UNKNOWN:
+                # order is not open anymore but might be filled instead of cancelled
+                unknown_status_orders.append(order)
+                continue
+            order.status = status
+            await order.on_cancel(
+                force_cancel=status is octobot_trading.enums.OrderStatus.CANCELED, is_from_exchange_data=False
+            )
+        if unknown_status_orders:
+            self.logger.info(f"Synchronizing {len(unknown_status_orders)} {symbol} orders of unknown cancel status")
+            await asyncio.gather(*(
+                self._synchronize_order(order, cancelling_timeout)
+                for order in unknown_status_orders
+                if order.state is not None
+            ))
+        if wait_for_cancelling:
+            await asyncio.gather(*(
+                self._wait_for_order_cancel(order, cancelling_timeout)
+                for order in orders
+                if order.state is not None and order.state.is_pending()
+            ))
+        self.logger.info(f"Cancelling of {len(orders)} {symbol} orders in bulk complete")
+        return [
+            order
+            for order, status in zip(orders, statuses)
+            if status is not octobot_trading.enums.OrderStatus.UNKNOWN or order.is_cancelled()
+            or order.is_cancelling()
+        ]
+
     async def _wait_for_order_cancel(self, order, cancelling_timeout):
         self.logger.debug(f"Waiting for order cancelling, order: {order}")
         await order.state.wait_for_terminate(cancelling_timeout)
@@ -613,27 +958,26 @@ class Trader(util.Initializable):
         :return: (True, orders): True if all orders got cancelled, False if an error occurred and the list of
         cancelled orders
         """
-        all_cancelled = True
-        cancelled_orders = []
-        for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders(since=since, until=until):
-            if order.symbol == symbol and \
-                    (side is None or order.side is side) and \
-                    not (order.is_cancelled() or order.is_closed()) and \
-                    (cancel_loaded_orders or order.is_from_this_octobot):
-                try:
-                    async with signals.remote_signal_publisher(self.exchange_manager, order.symbol, emit_trading_signals):
-                        cancelled = await signals.cancel_order(
-                            self.exchange_manager,
-                            emit_trading_signals and signals.should_emit_trading_signal(self.exchange_manager),
-                            order,
-                            wait_for_cancelling=wait_for_cancelling,
-                            cancelling_timeout=cancelling_timeout, )
-                    if cancelled:
-                        cancelled_orders.append(order)
-                    all_cancelled = cancelled and all_cancelled
-                except (errors.OrderCancelError, errors.UnexpectedExchangeSideOrderStateError) as err:
-                    self.logger.warning(f"Skipping order cancel: {err} ({err.__class__.__name__})")
-        return all_cancelled, cancelled_orders
+        return await self.cancel_orders(
+            self._get_orders_to_cancel(symbol, cancel_loaded_orders, side, since, until),
+            emit_trading_signals=emit_trading_signals,
+            wait_for_cancelling=wait_for_cancelling,
+            cancelling_timeout=cancelling_timeout,
+        )
+
+    def _get_orders_to_cancel(
+        self, symbol, cancel_loaded_orders, side,
+        since=octobot_trading.constants.NO_DATA_LIMIT, until=octobot_trading.constants.NO_DATA_LIMIT
+    ) -> list:
+        return [
+            order
+            for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders(
+                symbol=symbol, since=since, until=until
+            )
+            if (side is None or order.side is side)
+            and not (order.is_cancelled() or order.is_closed())
+            and (cancel_loaded_orders or order.is_from_this_octobot)
+        ]
 
     async def cancel_all_open_orders_with_currency(
         self, currency, emit_trading_signals=False,
@@ -649,15 +993,17 @@ class Trader(util.Initializable):
         :param cancelling_timeout: time before raising a timeout error when waiting for an order cancel
         :return: True if all orders got cancelled, False if an error occurred
         """
-        all_cancelled = True
-        symbols = util.get_pairs(self.config, currency, enabled_only=True)
-        if symbols:
-            for symbol in symbols:
-                all_cancelled = (await self.cancel_open_orders(symbol, emit_trading_signals=emit_trading_signals,
-                                                               wait_for_cancelling=wait_for_cancelling,
-                                                               cancelling_timeout=cancelling_timeout))[0] \
-                                and all_cancelled
-        return all_cancelled
+        orders_to_cancel = [
+            order
+            for symbol in util.get_pairs(self.config, currency, enabled_only=True)
+            for order in self._get_orders_to_cancel(symbol, True, None)
+        ]
+        return (await self.cancel_orders(
+            orders_to_cancel,
+            emit_trading_signals=emit_trading_signals,
+            wait_for_cancelling=wait_for_cancelling,
+            cancelling_timeout=cancelling_timeout,
+        ))[0]
 
     async def cancel_all_open_orders(
             self, emit_trading_signals=False,
@@ -671,23 +1017,16 @@ class Trader(util.Initializable):
         :param cancelling_timeout: time before raising a timeout error when waiting for an order cancel
         :return: True if all orders got cancelled, False if an error occurred
         """
-        all_cancelled = True
-        for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders():
-            if not order.is_cancelled():
-                try:
-                    async with signals.remote_signal_publisher(
-                            self.exchange_manager, order.symbol, emit_trading_signals
-                    ):
-                        all_cancelled = await signals.cancel_order(
-                            self.exchange_manager,
-                            emit_trading_signals and signals.should_emit_trading_signal(self.exchange_manager),
-                            order,
-                            wait_for_cancelling=wait_for_cancelling,
-                            cancelling_timeout=cancelling_timeout, ) and all_cancelled
-                except (errors.OrderCancelError, errors.UnexpectedExchangeSideOrderStateError) as err:
-                    self.logger.warning(f"Skipping order cancel: {err} ({err.__class__.__name__})")
-                    all_cancelled = False
-        return all_cancelled
+        return (await self.cancel_orders(
+            [
+                order
+                for order in self.exchange_manager.exchange_personal_data.orders_manager.get_open_orders()
+                if not order.is_cancelled()
+            ],
+            emit_trading_signals=emit_trading_signals,
+            wait_for_cancelling=wait_for_cancelling,
+            cancelling_timeout=cancelling_timeout,
+        ))[0]
 
     async def _sell_everything(self, symbol, inverted, timeout=None):
         created_orders = []
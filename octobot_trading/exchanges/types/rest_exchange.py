@@ -34,6 +34,7 @@ import octobot_trading.constants as constants
 import octobot_trading.errors as errors
 import octobot_trading.exchanges.util as exchanges_util
 import octobot_trading.exchanges.connectors.ccxt.ccxt_connector as ccxt_connector
+import octobot_trading.exchanges.connectors.ccxt.enums as ccxt_enums
 from octobot_trading.enums import ExchangeConstantsOrderColumns as ecoc
 import octobot_trading.exchanges.abstract_exchange as abstract_exchange
 import octobot_trading.exchange_data.contracts as contracts
@@ -110,6 +111,13 @@ class RestExchange(abstract_exchange.AbstractExchange):
     SUPPORTS_CUSTOM_LIMIT_ORDER_BOOK_FETCH = False
     # Set False when the leverage value is set via something else that a set_leverage api (from orders for example)
     UPDATE_LEVERAGE_FROM_API = True
+    # Set True when bulk order creation should be used when supported by the exchange connector.
+    # Ignored when order creation methods are overridden: orders are then created one by one
+    SUPPORTS_BULK_ORDER_CREATION = False
+    # maximum number of orders sent in a single bulk order creation request
+    MAX_ORDERS_PER_BULK_CREATION = 5
+    # Set False when bulk order cancellation should not be used even when supported by the exchange connector
+    SUPPORTS_BULK_ORDER_CANCELLATION = True
 
     # text content of errors due to orders not found errors
     EXCHANGE_ORDER_NOT_FOUND_ERRORS: typing.List[typing.Iterable[str]] = []
@@ -207,6 +215,67 @@ class RestExchange(abstract_exchange.AbstractExchange):
                 return await self._verify_order(created_order, order_type, symbol, price, side)
         return None
 
+    def supports_bulk_order_creation(self) -> bool:
+        return (
+            self.SUPPORTS_BULK_ORDER_CREATION
+            and not self._has_custom_limit_order_creation()
+            and self.connector.supports_bulk_order_creation()
+        )
+
+    def _has_custom_limit_order_creation(self) -> bool:
+        # bulk creation bypasses these methods: keep creating orders one by one when they are overridden
+        return any(
+            getattr(type(self), method_name) is not getattr(RestExchange, method_name)
+            for method_name in (
+                "_create_order_with_retry", "_create_specific_order",
+                "_create_limit_buy_order", "_create_limit_sell_order",
+            )
+        )
+
+    async def create_orders(self, orders_details: list) -> list:
+        """
+        Creates limit orders of the same symbol in a single request
+        :param orders_details: dicts of order_type, symbol, quantity, price, side, current_price, reduce_only
+        and params of each order
+        :return: the created order dict of each order, None for orders that are refused by the exchange
+        """
+        symbol = orders_details[0]["symbol"]
+        if any(details["symbol"] != symbol for details in orders_details):
+            raise ValueError(f"Bulk created orders should all be on the same symbol. Orders: {orders_details}")
+        order_types = [details["order_type"] for details in orders_details]
+        quantities = [details["quantity"] for details in orders_details]
+        prices = [details["price"] for details in orders_details]
+        async with self._order_operation(order_types, symbol, quantities, prices, None):
+            with contextlib.ExitStack() as stack:
+                for details in orders_details:
+                    stack.enter_context(self.creating_order(
+                        details["side"], details["symbol"], details["quantity"], details["price"]
+                    ))
+                created_orders = await self._create_with_retry(
+                    lambda: self.connector.create_orders([
+                        {
+                            "symbol": details["symbol"],
+                            "type": orders.get_trade_order_type(details["order_type"]).value,
+                            "side": details["side"].value,
+                            "amount": float(details["quantity"]),
+                            "price": float(details["price"]),
+                            "params": self._get_order_creation_params(
+                                details["reduce_only"], dict(details["params"] or {})
+                            ),
+                        }
+                        for details in orders_details
+                    ]),
+                    order_types, symbol, quantities, prices, None
+                )
+                self.logger.debug(f"Created orders: {created_orders}")
+                return list(await asyncio.gather(*(
+                    self._verify_order(
+                        created_order, details["order_type"], details["symbol"], details["price"], details["side"]
+                    )
+                    for created_order, details in zip(created_orders, orders_details)
+                )))
+        return [None] * len(orders_details)
+
     async def edit_order(self, exchange_order_id: str, order_type: enums.TraderOrderType, symbol: str,
                          quantity: decimal.Decimal, price: decimal.Decimal,
                          stop_price: decimal.Decimal = None, side: enums.TradeOrderSide = None,
@@ -343,11 +412,21 @@ class RestExchange(abstract_exchange.AbstractExchange):
                                        side: enums.TradeOrderSide,
                                        current_price: decimal.Decimal,
                                        reduce_only: bool, params) -> dict:
+        return await self._create_with_retry(
+            lambda: self._create_specific_order(order_type, symbol, quantity, price=price,
+                                                stop_price=stop_price, side=side,
+                                                current_price=current_price,
+                                                reduce_only=reduce_only, params=params),
+            order_type, symbol, quantity, price, stop_price
+        )
+
+    async def _create_with_retry(self, create, order_type, symbol, quantity, price, stop_price):
+        """
+        :param create: coroutine function sending the creation request(s)
+        :return: the result of create, called again once markets are reloaded when orders are refused
+        """
         try:
-            return await self._create_specific_order(order_type, symbol, quantity, price=price,
-                                                     stop_price=stop_price, side=side,
-                                                     current_price=current_price,
-                                                     reduce_only=reduce_only, params=params)
+            return await create()
         except ccxt.PermissionDenied as err:
             if self.is_exchange_account_traded_symbol_permission_error(err):
                 # exchange won't let this order create: raise
@@ -380,10 +459,13 @@ class RestExchange(abstract_exchange.AbstractExchange):
             )
             await self.connector.load_symbol_markets(reload=True, market_filter=self.exchange_manager.market_filter)
             # retry order creation with updated markets (ccxt will use the updated market values)
-            return await self._create_specific_order(order_type, symbol, quantity, price=price,
-                                                     stop_price=stop_price, side=side,
-                                                     current_price=current_price, reduce_only=reduce_only,
-                                                     params=params)
+            return await create()
+
+    def _get_order_creation_params(self, reduce_only: bool, params: dict) -> dict:
+        params.update(self.exchange_manager.exchange_backend.get_orders_parameters(None))
+        if reduce_only:
+            params[ccxt_enums.ExchangeOrderCCXTColumns.REDUCE_ONLY.value] = True
+        return params
 
     def _ensure_order_details_completeness(self, order, order_required_fields=None, order_non_empty_fields=None):
         if order_required_fields is None:
@@ -403,8 +485,7 @@ class RestExchange(abstract_exchange.AbstractExchange):
         float_stop_price = stop_price if stop_price is None else float(stop_price)
         float_current_price = current_price if current_price is None else float(current_price)
         side = None if side is None else side.value
-        params = {} if params is None else params
-        params.update(self.exchange_manager.exchange_backend.get_orders_parameters(None))
+        params = self._get_order_creation_params(reduce_only, {} if params is None else params)
         if order_type == enums.TraderOrderType.BUY_MARKET:
             created_order = await self._create_market_buy_order(symbol, float_quantity, price=float_price,
                                                                 reduce_only=reduce_only, params=params)
@@ -719,6 +800,20 @@ class RestExchange(abstract_exchange.AbstractExchange):
     ) -> enums.OrderStatus:
         return await self.connector.cancel_order(exchange_order_id, symbol, order_type, **kwargs)
 
+    def supports_bulk_order_cancellation(self) -> bool:
+        return self.SUPPORTS_BULK_ORDER_CANCELLATION and self.connector.supports_bulk_order_cancellation()
+
+    async def cancel_orders(self, exchange_order_ids: list, symbol: str, **kwargs: dict) -> list:
+        """
+        :param exchange_order_ids: ids of the orders to cancel, all orders should be from the given symbol
+        :return: the status of each order after the cancel request. Orders which status is not in the cancel
+        response are looked up in a single open orders fetch: orders that are still open are being cancelled,
+        others remain UNKNOWN as they can be cancelled or filled
+        """
+        return await self.resolve_unknown_cancel_statuses(
+            exchange_order_ids, symbol, await self.connector.cancel_orders(exchange_order_ids, symbol, **kwargs)
+        )
+
     def get_trade_fee(self, symbol: str, order_type: enums.TraderOrderType, quantity, price, taker_or_maker):
         return self.connector.get_trade_fee(symbol, order_type, quantity, price, taker_or_maker)
 
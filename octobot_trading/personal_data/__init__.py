@@ -102,6 +102,8 @@ from octobot_trading.personal_data.orders import (
     create_order_from_order_storage_details,
     OrdersProducer,
     OrdersChannel,
+    OrdersIndex,
+    IndexedOrders,
     OrdersManager,
     OrdersUpdaterSimulator,
     CloseOrderState,
@@ -135,6 +137,8 @@ from octobot_trading.personal_data.portfolios import (
     BalanceProfitabilityUpdater,
     PortfolioProfitability,
     Portfolio,
+    PortfolioChanges,
+    PortfolioAssets,
     BalanceProducer,
     BalanceChannel,
     BalanceProfitabilityProducer,
@@ -142,6 +146,8 @@ from octobot_trading.personal_data.portfolios import (
     SubPortfolio,
     PortfolioManager,
     ValueConverter,
+    LastPricesByTradingPair,
+    MissingCurrencyData,
     PortfolioValueHolder,
     FuturePortfolio,
     MarginPortfolio,
@@ -158,6 +164,9 @@ from octobot_trading.personal_data.portfolios import (
     create_historical_asset_value_from_dict_like_object,
     get_draw_down,
     get_coefficient_of_determination,
+    get_transactions_pnl_and_times,
+    get_coefficient_of_determination_curves,
+    get_coefficient_of_determination_from_arrays,
     get_asset_price_from_converter_or_tickers,
     resolve_sub_portfolios,
     get_portfolio_filled_orders_deltas,
@@ -192,7 +201,10 @@ from octobot_trading.personal_data.positions import (
 )
 from octobot_trading.personal_data import trades
 from octobot_trading.personal_data.trades import (
+    TradesIndex,
+    IndexedTrades,
     TradesManager,
+    TradesArchive,
     TradesProducer,
     TradesChannel,
     create_trade_instance_from_raw,
@@ -209,6 +221,7 @@ from octobot_trading.personal_data import transactions
 from octobot_trading.personal_data.transactions import (
     TransactionsManager,
     Transaction,
+    EquityCurveTracker,
     BlockchainTransaction,
     FeeTransaction,
     RealisedPnlTransaction,
@@ -340,6 +353,8 @@ __all__ = [
     "create_order_from_order_storage_details",
     "OrdersProducer",
     "OrdersChannel",
+    "OrdersIndex",
+    "IndexedOrders",
     "OrdersManager",
     "OrdersUpdaterSimulator",
     "CloseOrderState",
@@ -372,6 +387,8 @@ __all__ = [
     "BalanceProfitabilityUpdater",
     "PortfolioProfitability",
     "Portfolio",
+    "PortfolioChanges",
+    "PortfolioAssets",
     "BalanceProducer",
     "BalanceChannel",
     "BalanceProfitabilityProducer",
@@ -379,6 +396,8 @@ __all__ = [
     "SubPortfolio",
     "PortfolioManager",
     "ValueConverter",
+    "LastPricesByTradingPair",
+    "MissingCurrencyData",
     "PortfolioValueHolder",
     "FuturePortfolio",
     "MarginPortfolio",
@@ -394,6 +413,9 @@ __all__ = [
     "portfolio_to_float",
     "create_historical_asset_value_from_dict_like_object",
     "get_draw_down",
+    "get_transactions_pnl_and_times",
+    "get_coefficient_of_determination_curves",
+    "get_coefficient_of_determination_from_arrays",
     "create_historical_asset_value_from_dict_like_object",
     "HistoricalAssetValue",
     "HistoricalPortfolioValueManager",
@@ -417,7 +439,10 @@ __all__ = [
     "parse_position_side",
     "parse_position_margin_type",
     "parse_position_mode",
+    "TradesIndex",
+    "IndexedTrades",
     "TradesManager",
+    "TradesArchive",
     "TradesProducer",
     "TradesChannel",
     "create_trade_instance_from_raw",
@@ -438,6 +463,7 @@ __all__ = [
     "TraderOrderTypeClasses",
     "TraderPositionTypeClasses",
     "TransactionsManager",
+    "EquityCurveTracker",
     "Transaction",
     "BlockchainTransaction",
     "FeeTransaction",
@@ -78,6 +78,11 @@ from octobot_trading.personal_data.orders.channel import (
     OrdersUpdater,
     OrdersUpdaterSimulator,
 )
+from octobot_trading.personal_data.orders import orders_index
+from octobot_trading.personal_data.orders.orders_index import (
+    OrdersIndex,
+    IndexedOrders,
+)
 from octobot_trading.personal_data.orders import orders_manager
 from octobot_trading.personal_data.orders.orders_manager import (
     OrdersManager,
@@ -237,6 +242,8 @@ __all__ = [
     "create_order_from_order_storage_details",
     "OrdersProducer",
     "OrdersChannel",
+    "OrdersIndex",
+    "IndexedOrders",
     "OrdersManager",
     "OrdersUpdaterSimulator",
     "CloseOrderState",
@@ -39,17 +39,34 @@ class Order(util.Initializable):
     """
     CHECK_ORDER_STATUS_AFTER_INIT_DELAY = 2
     SUPPORTS_GROUPING = True    # False when orders of this type can't be grouped
+    # base attributes are slotted: orders are created by the thousands in grid and DCA strategies
+    __slots__ = (
+        "trader", "exchange_manager", "_lock", "is_synchronized_with_exchange", "is_from_this_octobot", "simulated",
+        "logger_name", "orders_index", "_status", "_symbol", "_exchange_order_id", "_tag", "_order_group",
+        "order_id", "currency", "market", "quantity_currency", "taker_or_maker", "timestamp", "side",
+        "trigger_above", "associated_entry_ids", "broker_applied", "creation_time", "origin_price",
+        "created_last_price", "origin_quantity", "origin_stop_price", "order_type", "exchange_order_type",
+        "filled_quantity", "filled_price", "fee", "fees_currency_side", "total_cost", "order_profitability",
+        "executed_time", "canceled_time", "trailing_profile", "state", "reduce_only", "close_position",
+        "position_side", "_chained_orders", "triggered_by", "update_with_triggering_order_fees", "has_been_bundled",
+        "is_waiting_for_chained_trigger", "on_filled_artificial_order", "_exchange_creation_params",
+        "_trader_creation_kwargs",
+    )
 
     def __init__(self, trader, side=None):
         super().__init__()
         self.trader: octobot_trading.exchanges.traders.trader.Trader = trader
         self.exchange_manager = trader.exchange_manager
-        self.lock = asyncio.Lock()
+        # created on first use, see lock
+        self._lock = None
         self.is_synchronized_with_exchange = False
         self.is_from_this_octobot = True
         self.simulated = trader.simulate
 
         self.logger_name = None
+        # OrdersIndex of the orders manager holding this order, notified when an indexed attribute changes
+        self.orders_index = None
+        self._status = self._symbol = self._exchange_order_id = self._tag = self._order_group = None
         self.order_id = order_util.generate_order_id()        # used id; kept through instances and trading signals
         self.exchange_order_id = trader.parse_order_id(None)  # given by the exchange, local to the user account
         self.status = enums.OrderStatus.OPEN
@@ -107,7 +124,7 @@ class Order(util.Initializable):
 
         # Chained orders attributes
         # other orders (as any Order) that should be created when this order is filled
-        self.chained_orders = []
+        self._chained_orders = None
         # order that triggered this order creation (when created as a chained order)
         self.triggered_by = None
         # if True this orders quantity will be reduced according to the triggering order's paid fees
@@ -122,9 +139,95 @@ class Order(util.Initializable):
 
         # Params given to the exchange request when this order is created. Include any exchange specific param here.
         # All params and values in those will be ignored in simulated orders
-        self.exchange_creation_params = {}
+        self._exchange_creation_params = None
         # kwargs given to trader.create_order() when this order should be created later on
-        self.trader_creation_kwargs = {}
+        self._trader_creation_kwargs = None
+
+    @property
+    def lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    @property
+    def chained_orders(self) -> list:
+        if self._chained_orders is None:
+            self._chained_orders = []
+        return self._chained_orders
+
+    @chained_orders.setter
+    def chained_orders(self, chained_orders):
+        self._chained_orders = chained_orders
+
+    @property
+    def exchange_creation_params(self) -> dict:
+        if self._exchange_creation_params is None:
+            self._exchange_creation_params = {}
+        return self._exchange_creation_params
+
+    @exchange_creation_params.setter
+    def exchange_creation_params(self, exchange_creation_params):
+        self._exchange_creation_params = exchange_creation_params
+
+    @property
+    def trader_creation_kwargs(self) -> dict:
+        if self._trader_creation_kwargs is None:
+            self._trader_creation_kwargs = {}
+        return self._trader_creation_kwargs
+
+    @trader_creation_kwargs.setter
+    def trader_creation_kwargs(self, trader_creation_kwargs):
+        self._trader_creation_kwargs = trader_creation_kwargs
+
+    @property
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, status):
+        if self.orders_index is not None:
+            self.orders_index.update(self, "status", self._status, status)
+        self._status = status
+
+    @property
+    def symbol(self):
+        return self._symbol
+
+    @symbol.setter
+    def symbol(self, symbol):
+        if self.orders_index is not None:
+            self.orders_index.update(self, "symbol", self._symbol, symbol)
+        self._symbol = symbol
+
+    @property
+    def exchange_order_id(self):
+        return self._exchange_order_id
+
+    @exchange_order_id.setter
+    def exchange_order_id(self, exchange_order_id):
+        if self.orders_index is not None:
+            self.orders_index.update(self, "exchange_order_id", self._exchange_order_id, exchange_order_id)
+        self._exchange_order_id = exchange_order_id
+
+    @property
+    def tag(self):
+        return self._tag
+
+    @tag.setter
+    def tag(self, tag):
+        if self.orders_index is not None:
+            self.orders_index.update(self, "tag", self._tag, tag)
+        self._tag = tag
+
+    @property
+    def order_group(self):
+        return self._order_group
+
+    @order_group.setter
+    def order_group(self, order_group):
+        if self.orders_index is not None:
+            self.orders_index.update(self, "order_group", self._order_group, order_group)
+        self._order_group = order_group
 
     @classmethod
     def get_name(cls):
@@ -485,7 +588,7 @@ class Order(util.Initializable):
         """
         if enable_associated_orders_creation:
             await self._trigger_chained_orders(enable_associated_orders_creation)
-        elif self.chained_orders:
+        elif self._chained_orders:
             logging.get_logger(self.get_logger_name()).info(
                 f"Skipped chained orders creation for {len(self.chained_orders)} chained orders: "
                 f"enable_associated_orders_creation is {enable_associated_orders_creation}"
@@ -926,7 +1029,7 @@ class Order(util.Initializable):
             self.state.clear()
         self.trader = None
         self.exchange_manager = None
-        self.trader_creation_kwargs = {}
+        self._trader_creation_kwargs = None
 
     def is_cleared(self):
         return self.exchange_manager is None
@@ -0,0 +1,203 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import typing
+
+STATUS = "status"
+SYMBOL = "symbol"
+EXCHANGE_ORDER_ID = "exchange_order_id"
+TAG = "tag"
+ORDER_GROUP = "order_group"
+INDEXED_ATTRIBUTES = (STATUS, SYMBOL, EXCHANGE_ORDER_ID, TAG, ORDER_GROUP)
+
+
+class OrdersIndex:
+    """
+    Incremental secondary indexes of the orders registered in an OrdersManager.
+    Each indexed attribute maps its values to a bucket of orders sorted by registration
+    order. Registered orders notify their attributes changes through update().
+    """
+
+    def __init__(self):
+        self._sequence = 0
+        # order -> registration sequence, used to keep buckets in orders manager order
+        self._sequences: dict = {}
+        self._indexes: dict[str, dict[typing.Hashable, dict]] = {
+            attribute: {}
+            for attribute in INDEXED_ATTRIBUTES
+        }
+        self._unsorted_buckets: set[tuple[str, typing.Hashable]] = set()
+
+    def add(self, order):
+        """
+        Registers the given order and binds it to this index to be notified of its indexed attributes changes
+        """
+        if order in self._sequences:
+            self.remove(order)
+        self._sequence += 1
+        self._register(order, self._sequence)
+
+    def replace(self, previous_order, order):
+        """
+        Registers the given order in place of previous_order, at its registration order
+        """
+        sequence = self._sequences.get(previous_order)
+        if sequence is None:
+            self.add(order)
+            return
+        self.remove(previous_order)
+        if order in self._sequences:
+            self.remove(order)
+        self._register(order, sequence)
+
+    def remove(self, order):
+        sequence = self._sequences.pop(order, None)
+        if sequence is None:
+            return
+        for attribute in INDEXED_ATTRIBUTES:
+            self._remove_from_bucket(attribute, _get_key(attribute, getattr(order, attribute)), order)
+        if order.orders_index is self:
+            order.orders_index = None
+
+    def update(self, order, attribute, previous_value, new_value):
+        """
+        Called by orders before changing one of their indexed attributes
+        """
+        sequence = self._sequences.get(order)
+        if sequence is None:
+            return
+        previous_key = _get_key(attribute, previous_value)
+        new_key = _get_key(attribute, new_value)
+        if previous_key == new_key:
+            return
+        self._remove_from_bucket(attribute, previous_key, order)
+        self._add_to_bucket(attribute, new_key, order, sequence)
+
+    def get_orders(self, attribute, key) -> list:
+        """
+        :param key: the indexed value: the attribute value or the group name for ORDER_GROUP
+        :return: the registered orders indexed under key, in registration order
+        """
+        return list(self._get_bucket(attribute, key))
+
+    def get_first_order(self, attribute, key):
+        """
+        :return: the first registered order indexed under key, raises KeyError if none
+        """
+        for order in self._get_bucket(attribute, key):
+            return order
+        raise KeyError(key)
+
+    def count(self, attribute, key) -> int:
+        return len(self._indexes[attribute].get(key, ()))
+
+    def clear(self):
+        for order in self._sequences:
+            if order.orders_index is self:
+                order.orders_index = None
+        self._sequences = {}
+        for index in self._indexes.values():
+            index.clear()
+        self._unsorted_buckets.clear()
+
+    def _register(self, order, sequence):
+        self._sequences[order] = sequence
+        for attribute in INDEXED_ATTRIBUTES:
+            self._add_to_bucket(attribute, _get_key(attribute, getattr(order, attribute)), order, sequence)
+        order.orders_index = self
+
+    def _get_bucket(self, attribute, key) -> dict:
+        index = self._indexes[attribute]
+        bucket = index.get(key)
+        if bucket is None:
+            return {}
+        if (attribute, key) in self._unsorted_buckets:
+            # an order moved back into this bucket: restore registration order once, on read
+            bucket = dict(sorted(bucket.items(), key=lambda item: item[1]))
+            index[key] = bucket
+            self._unsorted_buckets.discard((attribute, key))
+        return bucket
+
+    def _add_to_bucket(self, attribute, key, order, sequence):
+        index = self._indexes[attribute]
+        try:
+            bucket = index[key]
+        except KeyError:
+            bucket = index[key] = {}
+        if bucket and next(reversed(bucket.values())) > sequence:
+            self._unsorted_buckets.add((attribute, key))
+        bucket[order] = sequence
+
+    def _remove_from_bucket(self, attribute, key, order):
+        index = self._indexes[attribute]
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        bucket.pop(order, None)
+        if not bucket:
+            index.pop(key, None)
+            self._unsorted_buckets.discard((attribute, key))
+
+
+class IndexedOrders(collections.OrderedDict):
+    """
+    Order id: order mapping keeping its OrdersIndex in sync with its content
+    """
+
+    def __init__(self, orders_index=None, *args, **kwargs):
+        self.orders_index = OrdersIndex() if orders_index is None else orders_index
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, order_id, order):
+        previous_order = self.get(order_id)
+        # an existing order id keeps its position: keep its registration order in the index
+        super().__setitem__(order_id, order)
+        if previous_order is None:
+            self.orders_index.add(order)
+        elif previous_order is not order:
+            self.orders_index.replace(previous_order, order)
+
+    def __delitem__(self, order_id):
+        order = self[order_id]
+        super().__delitem__(order_id)
+        self.orders_index.remove(order)
+
+    def pop(self, order_id, *default):
+        if order_id not in self:
+            if default:
+                return default[0]
+            raise KeyError(order_id)
+        order = self[order_id]
+        del self[order_id]
+        return order
+
+    def popitem(self, last=True):
+        order_id, order = super().popitem(last=last)
+        self.orders_index.remove(order)
+        return order_id, order
+
+    def clear(self):
+        super().clear()
+        self.orders_index.clear()
+
+    def __reduce__(self):
+        return self.__class__, (None, list(self.items()))
+
+
+def _get_key(attribute, value):
+    if attribute == ORDER_GROUP:
+        return None if value is None else value.name
+    return value
@@ -28,6 +28,7 @@ import octobot_trading.personal_data.orders.order as order_class
 import octobot_trading.personal_data.orders.order_factory as order_factory
 import octobot_trading.personal_data.orders.order_util as order_util
 import octobot_trading.personal_data.orders.order_group as order_group_import
+import octobot_trading.personal_data.orders.orders_index as orders_index
 
 
 class OrdersManager(util.Initializable):
@@ -39,7 +40,9 @@ class OrdersManager(util.Initializable):
         self.trader = trader
         self.orders_initialized = False
         self.enable_order_auto_synchronization = True
-        self.orders: collections.OrderedDict[str, order_class.Order] = collections.OrderedDict()
+        # status, symbol, exchange_order_id, tag and group name indexes of self.orders
+        self.orders_index: orders_index.OrdersIndex = orders_index.OrdersIndex()
+        self._orders: orders_index.IndexedOrders = orders_index.IndexedOrders(self.orders_index)
         self.order_groups: dict[str, order_group_import.OrderGroup] = {}
         # orders that are expected from exchange but have not yet been fetched: will be removed when fetched
         self.pending_creation_orders: list[order_class.Order] = []
@@ -49,6 +52,16 @@ class OrdersManager(util.Initializable):
     async def initialize_impl(self):
         self._reset_orders()
 
+    @property
+    def orders(self) -> collections.OrderedDict[str, order_class.Order]:
+        return self._orders
+
+    @orders.setter
+    def orders(self, orders):
+        # keep orders_index in sync with the new orders
+        self.orders_index.clear()
+        self._orders = orders_index.IndexedOrders(self.orders_index, orders)
+
     def get_all_orders(
         self, symbol=None, since=constants.NO_DATA_LIMIT, 
         until=constants.NO_DATA_LIMIT, limit=constants.NO_DATA_LIMIT, tag=None):
@@ -83,18 +96,13 @@ class OrdersManager(util.Initializable):
 
     def get_order(self, order_id, exchange_order_id=None):
         if order_id is None:
-            for order in self.orders.values():
-                if order.exchange_order_id == exchange_order_id:
-                    return order
-            raise KeyError(exchange_order_id)
+            return self.orders_index.get_first_order(orders_index.EXCHANGE_ORDER_ID, exchange_order_id)
         return self.orders[order_id]
 
     def get_order_from_group(self, group_name):
-        return [
-            order
-            for order in self.orders.values()
-            if order.order_group is not None and order.order_group.name == group_name
-        ]
+        if group_name is None:
+            return []
+        return self.orders_index.get_orders(orders_index.ORDER_GROUP, group_name)
 
     def get_or_create_group(self, group_type, group_name):
         """
@@ -202,12 +210,8 @@ class OrdersManager(util.Initializable):
 
     def has_order(self, order_id, exchange_order_id=None) -> bool:
         if order_id is None:
-            try:
-                self.get_order(None, exchange_order_id=exchange_order_id)
-                return True
-            except KeyError:
-                return False
-        return order_id in set(self.orders.keys())
+            return self.orders_index.count(orders_index.EXCHANGE_ORDER_ID, exchange_order_id) > 0
+        return order_id in self.orders
 
     def remove_order_instance(self, order):
         if self.has_order(order.order_id):
@@ -253,7 +257,7 @@ class OrdersManager(util.Initializable):
         until=constants.NO_DATA_LIMIT, limit=constants.NO_DATA_LIMIT, tag=None):
         orders = [
             order
-            for order in self.orders.values()
+            for order in self._get_selection_candidates(state, symbol, tag)
             if (
                     (state is None or order.status == state) and
                     (symbol is None or (symbol and order.symbol == symbol)) and
@@ -264,6 +268,20 @@ class OrdersManager(util.Initializable):
         ]
         return orders if limit == constants.NO_DATA_LIMIT else orders[0:limit]
 
+    def _get_selection_candidates(self, state, symbol, tag):
+        # only go through the orders of the smallest matching index bucket
+        selectors = [
+            (attribute, value)
+            for attribute, value in (
+                (orders_index.STATUS, state), (orders_index.SYMBOL, symbol), (orders_index.TAG, tag)
+            )
+            if value is not None
+        ]
+        if not selectors:
+            return self.orders.values()
+        attribute, value = min(selectors, key=lambda selector: self.orders_index.count(*selector))
+        return self.orders_index.get_orders(attribute, value)
+
     def _remove_oldest_orders(self, nb_to_remove):
         for _ in range(nb_to_remove):
             self.orders.popitem(last=False)
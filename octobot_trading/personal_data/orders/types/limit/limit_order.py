@@ -22,12 +22,16 @@ import octobot_trading.personal_data.orders.decimal_order_adapter as decimal_ord
 
 
 class LimitOrder(order_class.Order):
+    __slots__ = ("limit_price_hit_event", "wait_for_hit_event_task", "allow_instant_fill", "use_price_events_callbacks")
+
     def __init__(self, trader, side=enums.TradeOrderSide.BUY):
         super().__init__(trader, side)
         self.limit_price_hit_event = None
         self.wait_for_hit_event_task = None
         self.trigger_above = self.side is enums.TradeOrderSide.SELL
         self.allow_instant_fill = constants.ALLOW_SIMULATED_ORDERS_INSTANT_FILL
+        # when True, on_fill is called by the price events manager instead of a wait_for_price_hit task
+        self.use_price_events_callbacks = constants.ENABLE_PRICE_EVENTS_CALLBACKS
 
     async def update_price_if_outdated(self):
         # price is outdated if it would trigger and instantly filled order with more than the allowed tolerance
@@ -81,9 +85,16 @@ class LimitOrder(order_class.Order):
     def _create_hit_event(self, price_time):
         self.limit_price_hit_event = self.exchange_manager.exchange_symbols_data.\
             get_exchange_symbol_data(self.symbol).price_events_manager.\
-            new_event(self.origin_price, price_time, self.trigger_above, self.allow_instant_fill)
+            new_event(self.origin_price, price_time, self.trigger_above, self.allow_instant_fill,
+                      callback=self.on_fill if self.use_price_events_callbacks else None)
 
     def _create_hit_task(self):
+        if self.use_price_events_callbacks:
+            if self.limit_price_hit_event.is_set():
+                # instantly set events have no callback
+                self.exchange_manager.exchange_symbols_data.get_exchange_symbol_data(self.symbol).\
+                    price_events_manager.dispatch_callback(self.on_fill)
+            return
         self.wait_for_hit_event_task = asyncio.create_task(self.wait_for_price_hit())
 
     def _reset_events(self, price_time):
@@ -36,6 +36,8 @@ class TrailingStopOrder(order_class.Order):
         self.wait_for_price_hit_event_task = None
         self.trailing_percent = trailing_percent
         self.allow_instant_fill = constants.ALLOW_SIMULATED_ORDERS_INSTANT_FILL
+        # when True, price hit callbacks are called by the price events manager instead of waiting tasks
+        self.use_price_events_callbacks = constants.ENABLE_PRICE_EVENTS_CALLBACKS
 
     async def update_order_status(self, force_refresh=False):
         if not self.trader.simulate and (not self.is_synchronized_with_exchange or force_refresh):
@@ -74,12 +76,13 @@ class TrailingStopOrder(order_class.Order):
         if self.trailing_stop_price_hit_event is None:
             self.trailing_stop_price_hit_event = price_events_manager.new_event(
                 self._calculate_stop_price(new_price), new_price_time,
-                self.side is enums.TradeOrderSide.BUY, self.allow_instant_fill)
+                self.side is enums.TradeOrderSide.BUY, self.allow_instant_fill,
+                callback=self.on_fill if self.use_price_events_callbacks else None)
         if self.trailing_price_hit_event is None:
             # don't allow instant fill since this event should only be triggered by next recent trades and prices
-            self.trailing_price_hit_event = price_events_manager.new_event(new_price, new_price_time,
-                                                                           self.side is enums.TradeOrderSide.SELL,
-                                                                           allow_instant_fill=False)
+            self.trailing_price_hit_event = price_events_manager.new_event(
+                new_price, new_price_time, self.side is enums.TradeOrderSide.SELL, allow_instant_fill=False,
+                callback=self._on_price_hit if self.use_price_events_callbacks else None)
 
     def _calculate_stop_price(self, new_price):
         """
@@ -100,14 +103,14 @@ class TrailingStopOrder(order_class.Order):
         if self.wait_for_price_hit_event_task is None and self.trailing_price_hit_event is not None:
             if self.trailing_price_hit_event.is_set():
                 await self._on_price_hit()
-            else:
+            elif not self.use_price_events_callbacks:
                 self.wait_for_price_hit_event_task = asyncio.create_task(
                     _wait_for_price_hit(self.trailing_price_hit_event, self._on_price_hit))
 
         if self.wait_for_stop_price_hit_event_task is None and self.trailing_stop_price_hit_event is not None:
             if self.trailing_stop_price_hit_event.is_set():
                 await self.on_fill()
-            else:
+            elif not self.use_price_events_callbacks:
                 self.wait_for_stop_price_hit_event_task = asyncio.create_task(
                     _wait_for_price_hit(self.trailing_stop_price_hit_event, self.on_fill))
 
@@ -141,6 +144,9 @@ class TrailingStopOrder(order_class.Order):
         """
         Is called when the trailing price is hit
         """
+        if self.trailing_price_hit_event is None or not self.trailing_price_hit_event.is_set():
+            # this price hit has already been handled: events have been reset since then
+            return
         prices_manager = self.exchange_manager.exchange_symbols_data. \
             get_exchange_symbol_data(self.symbol).prices_manager
         logging.get_logger(self.get_logger_name()).debug(f"New price hit {prices_manager.mark_price}, "
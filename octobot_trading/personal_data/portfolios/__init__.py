@@ -29,6 +29,8 @@ from octobot_trading.personal_data.portfolios.channel import (
 from octobot_trading.personal_data.portfolios import portfolio
 from octobot_trading.personal_data.portfolios.portfolio import (
     Portfolio,
+    PortfolioChanges,
+    PortfolioAssets,
 )
 from octobot_trading.personal_data.portfolios import asset
 from octobot_trading.personal_data.portfolios.asset import (
@@ -60,6 +62,8 @@ from octobot_trading.personal_data.portfolios.portfolio_manager import (
 )
 from octobot_trading.personal_data.portfolios.value_converter import (
     ValueConverter,
+    LastPricesByTradingPair,
+    MissingCurrencyData,
 )
 from octobot_trading.personal_data.portfolios.portfolio_value_holder import (
     PortfolioValueHolder,
@@ -82,6 +86,9 @@ from octobot_trading.personal_data.portfolios.portfolio_util import (
     portfolio_to_float,
     get_draw_down,
     get_coefficient_of_determination,
+    get_transactions_pnl_and_times,
+    get_coefficient_of_determination_curves,
+    get_coefficient_of_determination_from_arrays,
     get_asset_price_from_converter_or_tickers,
     resolve_sub_portfolios,
     get_portfolio_filled_orders_deltas,
@@ -103,6 +110,8 @@ __all__ = [
     "BalanceProfitabilityUpdater",
     "PortfolioProfitability",
     "Portfolio",
+    "PortfolioChanges",
+    "PortfolioAssets",
     "Asset",
     "BalanceProducer",
     "BalanceChannel",
@@ -111,6 +120,8 @@ __all__ = [
     "SubPortfolio",
     "PortfolioManager",
     "ValueConverter",
+    "LastPricesByTradingPair",
+    "MissingCurrencyData",
     "PortfolioValueHolder",
     "FuturePortfolio",
     "MarginPortfolio",
@@ -125,6 +136,9 @@ __all__ = [
     "portfolio_to_float",
     "get_draw_down",
     "get_coefficient_of_determination",
+    "get_transactions_pnl_and_times",
+    "get_coefficient_of_determination_curves",
+    "get_coefficient_of_determination_from_arrays",
     "get_asset_price_from_converter_or_tickers",
     "resolve_sub_portfolios",
     "get_portfolio_filled_orders_deltas",
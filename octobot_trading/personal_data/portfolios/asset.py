@@ -25,11 +25,24 @@ import octobot_trading.errors as errors
 
 class Asset:
     def __init__(self, name, available, total):
+        # PortfolioChanges of the portfolio holding this asset, notified when its total changes
+        self.portfolio_changes = None
         self.name = name
 
         self.available = available
+        self._total = None
         self.total = total
 
+    @property
+    def total(self):
+        return self._total
+
+    @total.setter
+    def total(self, total):
+        if self.portfolio_changes is not None:
+            self.portfolio_changes.on_total_update(self.name)
+        self._total = total
+
     def __str__(self):
         return f"{self.__class__.__name__}: {self.name} | " \
                f"Available: {float(self.available)} | " \
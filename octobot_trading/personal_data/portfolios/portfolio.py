@@ -42,9 +42,21 @@ class Portfolio:
         self.logger = logging.get_logger(
             f"{self.__class__.__name__}{'Simulator' if is_simulated else ''}[{exchange_name}]")
         self.lock = asyncio_tools.RLock()
-        self.portfolio = None
+        # notified of assets changes
+        self.changes = PortfolioChanges()
+        self._portfolio = None
         self.reset()
 
+    @property
+    def portfolio(self):
+        return self._portfolio
+
+    @portfolio.setter
+    def portfolio(self, portfolio):
+        # keep assets changes notifications in sync with the new assets
+        self.changes.on_currencies_update()
+        self._portfolio = None if portfolio is None else PortfolioAssets(self.changes, portfolio)
+
     def __copy__(self):
         """
         Copy the portfolio instance
@@ -328,3 +340,96 @@ def _parse_raw_currency_balance(raw_currency_balance):
             raw_currency_balance.get(constants.CONFIG_PORTFOLIO_TOTAL,
                                      raw_currency_balance.get(common_constants.PORTFOLIO_TOTAL,
                                                               constants.ZERO)) or constants.ZERO)
+
+
+class PortfolioChanges:
+    """
+    Portfolio assets changes, notified by PortfolioAssets and their assets
+    """
+
+    def __init__(self):
+        # incremented each time currencies are added to or removed from the portfolio
+        self.currencies_version = 0
+        # currencies which total changed since the last pop_updated_currencies call
+        self._updated_currencies = set()
+
+    def on_currencies_update(self):
+        self.currencies_version += 1
+
+    def on_total_update(self, currency):
+        self._updated_currencies.add(currency)
+
+    def pop_updated_currencies(self) -> set:
+        """
+        :return: the currencies which total changed since the last call
+        """
+        updated_currencies = self._updated_currencies
+        self._updated_currencies = set()
+        return updated_currencies
+
+    def __deepcopy__(self, memo):
+        # copied assets are not part of the portfolio
+        return None
+
+
+class PortfolioAssets(dict):
+    """
+    Currency: asset mapping binding its assets to changes and notifying it of currencies and assets updates
+    """
+
+    def __init__(self, changes, *args, **kwargs):
+        super().__init__()
+        self.changes = changes
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, currency, asset):
+        previous_asset = self.get(currency)
+        if previous_asset is None:
+            self.changes.on_currencies_update()
+        elif previous_asset is not asset:
+            self._unbind(previous_asset)
+            self.changes.on_total_update(currency)
+        asset.portfolio_changes = self.changes
+        super().__setitem__(currency, asset)
+
+    def __delitem__(self, currency):
+        self._unbind(self[currency])
+        super().__delitem__(currency)
+        self.changes.on_currencies_update()
+
+    def setdefault(self, currency, default=None):
+        if currency not in self:
+            self[currency] = default
+        return self[currency]
+
+    def update(self, *args, **kwargs):
+        for currency, asset in dict(*args, **kwargs).items():
+            self[currency] = asset
+
+    def pop(self, currency, *default):
+        if currency not in self:
+            if default:
+                return default[0]
+            raise KeyError(currency)
+        asset = self[currency]
+        del self[currency]
+        return asset
+
+    def popitem(self):
+        currency, asset = super().popitem()
+        self._unbind(asset)
+        self.changes.on_currencies_update()
+        return currency, asset
+
+    def clear(self):
+        for asset in self.values():
+            self._unbind(asset)
+        super().clear()
+        self.changes.on_currencies_update()
+
+    def _unbind(self, asset):
+        if asset.portfolio_changes is self.changes:
+            asset.portfolio_changes = None
+
+    def __reduce__(self):
+        return dict, (dict(self), )
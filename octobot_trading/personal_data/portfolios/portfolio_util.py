@@ -115,86 +115,114 @@ def get_draw_down(exchange_manager):
                 return constants.ZERO
             origin_value = exchange_manager.exchange_personal_data.portfolio_manager.portfolio_value_holder \
                 .origin_portfolio.portfolio[value_currency].total
-            portfolio_history = [origin_value]
-            for transaction in exchange_manager.exchange_personal_data.transactions_manager.transactions.values():
-                current_pnl = transaction.quantity if hasattr(transaction, "quantity") else transaction.realised_pnl
-                portfolio_history.append(portfolio_history[-1] + current_pnl)
-
-                current_draw_down = constants.ONE_HUNDRED - \
-                    (portfolio_history[-1] / (max(portfolio_history) / constants.ONE_HUNDRED))
-
-                draw_down = current_draw_down if current_draw_down > draw_down else draw_down
+            draw_down = exchange_manager.exchange_personal_data.transactions_manager.get_equity_curve_tracker(
+                origin_value
+            ).max_draw_down
         except Exception as e:
             commons_logging.get_logger(__name__).warning(f"Error when computing draw down: {e}")
     return draw_down
 
 
+def get_transactions_pnl_and_times(transactions) -> (numpy.ndarray, numpy.ndarray):
+    """
+    :param transactions: transactions or transactions dicts
+    :return: the float arrays of the realized pnl and time of each transaction with a pnl
+    """
+    pnls = []
+    pnl_times = []
+    for transaction in transactions:
+        if hasattr(transaction, "quantity"):
+            pnls.append(float(transaction.quantity))
+            pnl_times.append(transaction.creation_time)
+        elif hasattr(transaction, 'realised_pnl'):
+            pnls.append(float(transaction.realised_pnl))
+            pnl_times.append(transaction.creation_time)
+        elif isinstance(transaction, dict):
+            if transaction["quantity"]:
+                pnls.append(transaction["quantity"])
+                pnl_times.append(transaction["x"])
+            elif transaction['realised_pnl']:
+                pnls.append(transaction['realised_pnl'])
+                pnl_times.append(transaction["x"])
+    return numpy.array(pnls, dtype=numpy.float64), numpy.array(pnl_times, dtype=numpy.float64)
+
+
+def get_coefficient_of_determination_curves(pnls, pnl_times, start_balance,
+                                            candle_times=None,
+                                            use_high_instead_of_end_balance=True):
+    """
+    Compute the realized balance history and the best case (exponential growth) balance history
+    :param pnls: the realized pnl array
+    :param pnl_times: the realized pnl times array, in chronological order
+    :param start_balance: the balance before the first pnl
+    :param candle_times: when given, balances are computed at each candle time instead of after each pnl
+    :param use_high_instead_of_end_balance: best case exponential growth based on end balance or highest balance
+    :return: the best case balances, the balances and their times arrays or None, None, None
+    when the end balance is lower than start_balance
+    """
+    balance_history = numpy.cumsum(numpy.concatenate(([start_balance], pnls)))
+    if candle_times is None:
+        # trade to trade basis
+        history_times = numpy.concatenate((pnl_times[:1], pnl_times))
+    else:
+        # candle to candle basis: balance including every pnl up to each candle time
+        history_times = numpy.asarray(candle_times, dtype=numpy.float64)
+        balance_history = balance_history[numpy.searchsorted(pnl_times, history_times, side="right")]
+    end_balance = balance_history[-1]
+    if start_balance > end_balance:
+        # if we end up with a negative balance we can't compute this
+        return None, None, None
+    end_value = balance_history.max() if use_high_instead_of_end_balance else end_balance
+
+    # calculate best case data (exponential growth)
+    start_time = history_times[0]
+    end_time = history_times[-1]
+    pw = 15
+    A = numpy.exp(numpy.log(start_balance / end_value) / pw)
+    a = (start_time - end_time * A) / (A - 1)
+    b = start_balance / (start_time + a) ** pw
+    linear_growth = numpy.linspace(start_time, end_time, len(balance_history))
+    best_case = ((linear_growth + a) ** pw) * b
+    return best_case, balance_history, history_times
+
+
+def get_coefficient_of_determination_from_arrays(pnls, pnl_times, start_balance,
+                                                 candle_times=None,
+                                                 use_high_instead_of_end_balance=True) -> float:
+    """
+    Calculates the coefficient of determination (R squared) of the balance history compared to the best case
+    growth from realized pnl arrays, see get_coefficient_of_determination_curves for parameters
+    :return: the coefficient of determination or 0 when it can't be computed
+    """
+    if not len(pnls):
+        return 0
+    best_case, balance_history, _ = get_coefficient_of_determination_curves(
+        pnls, pnl_times, start_balance,
+        candle_times=candle_times,
+        use_high_instead_of_end_balance=use_high_instead_of_end_balance
+    )
+    if best_case is None:
+        return 0
+    return numpy.corrcoef(best_case, balance_history)[0, 1] ** 2
+
+
 async def get_coefficient_of_determination_data(transactions, start_balance,
                                                 use_high_instead_of_end_balance=True,
-                                                x_as_trade_count=True):
-    if transactions:
-        # get realized portfolio history
-
-        pnl_history = [start_balance]
-        pnl_history_times = []
-        for transaction in transactions:
-            current_pnl = None
-            if hasattr(transaction, "quantity"):
-                current_pnl = float(transaction.quantity)
-                pnl_history_times.append(transaction.creation_time)
-            elif hasattr(transaction, 'realised_pnl'):
-                current_pnl = float(transaction.realised_pnl)
-                pnl_history_times.append(transaction.creation_time)
-            elif isinstance(transaction, dict):
-                if transaction["quantity"]:
-                    current_pnl = transaction["quantity"]
-                    pnl_history_times.append(transaction["x"])
-                elif transaction['realised_pnl']:
-                    current_pnl = transaction['realised_pnl']
-                    pnl_history_times.append(transaction["x"])
-
-            if current_pnl is not None:
-                pnl_history.append(pnl_history[-1] + current_pnl)
-
-        if pnl_history_times:
-
-            pnl_history_for_every_candle = None
-            # either use trade to trade basis or candle to candle basis
-            if x_as_trade_count is True:
-                start_time = pnl_history_times[0]
-                pnl_history_times.insert(0, start_time)
-                end_time = pnl_history_times[-1]
-                data_length = len(pnl_history)
-
-            else:  # calculate pnl history for every candle
-                raise NotImplementedError("x_as_trade_count=False is not implemented")
-            # calculate best case data (exponential growth)
-            end_balance = pnl_history[-1]
-
-            if start_balance > end_balance:
-                # if we end up with a negative balance we can't compute this
-                return None, None, None, None, None
-
-            if use_high_instead_of_end_balance:
-                end_value = max(pnl_history)
-            else:  # use the end balance
-                end_value = end_balance
-
-            def get_ideal_value(linear_growth, adj1, adj2):
-                return ((linear_growth + adj1) ** pw) * adj2
-
-            x = [start_time, end_time]
-            y = [start_balance, end_value]
-
-            pw = 15
-            A = numpy.exp(numpy.log(y[0] / y[1]) / pw)
-            a = (x[0] - x[1] * A) / (A - 1)
-            b = y[0] / (x[0] + a) ** pw
-
-            linear_growth = numpy.linspace(start_time, end_time, data_length)
-            best_case = get_ideal_value(linear_growth, a, b)
-            pnl_data = pnl_history_for_every_candle or pnl_history
-            return list(best_case), pnl_data, start_balance, end_balance, pnl_history_times
+                                                x_as_trade_count=True,
+                                                candle_times=None):
+    pnls, pnl_times = get_transactions_pnl_and_times(transactions)
+    if len(pnl_times):
+        # either use trade to trade basis or candle to candle basis
+        if not x_as_trade_count and candle_times is None:
+            raise ValueError("candle_times is required when x_as_trade_count is False")
+        best_case, balance_history, history_times = get_coefficient_of_determination_curves(
+            pnls, pnl_times, start_balance,
+            candle_times=None if x_as_trade_count else candle_times,
+            use_high_instead_of_end_balance=use_high_instead_of_end_balance
+        )
+        if best_case is not None:
+            pnl_data = balance_history.tolist()
+            return list(best_case), pnl_data, start_balance, pnl_data[-1], history_times.tolist()
     return None, None, None, None, None
 
 
@@ -205,7 +233,6 @@ async def get_coefficient_of_determination(exchange_manager, use_high_instead_of
     Return 0 if we end up with less money that we had to begin with
     :param use_high_instead_of_end_balance: best case exponential growth based on end balance or highest balance
     """
-    coefficient_of_determination = 0
     if exchange_manager.exchange_personal_data.portfolio_manager is None or \
             exchange_manager.exchange_personal_data.portfolio_manager.portfolio_value_holder.origin_portfolio is None:
         return 0
@@ -215,19 +242,12 @@ async def get_coefficient_of_determination(exchange_manager, use_high_instead_of
     )
     start_balance = origin_portfolio[
         exchange_manager.exchange_personal_data.portfolio_manager.reference_market][commons_constants.PORTFOLIO_TOTAL]
-
-    best_case, pnl_data, start_balance, _, _ \
-        = await get_coefficient_of_determination_data(transactions=exchange_manager.exchange_personal_data.
-                                                      transactions_manager.transactions.values(),
-                                                      start_balance=start_balance,
-                                                      use_high_instead_of_end_balance=use_high_instead_of_end_balance)
-
-    if pnl_data:
-        # calculate r²
-        corr_matrix = numpy.corrcoef(best_case, pnl_data)
-        corr = corr_matrix[0, 1]
-        coefficient_of_determination = corr ** 2
-
+    pnls, pnl_times = get_transactions_pnl_and_times(
+        exchange_manager.exchange_personal_data.transactions_manager.transactions.values()
+    )
+    coefficient_of_determination = get_coefficient_of_determination_from_arrays(
+        pnls, pnl_times, start_balance, use_high_instead_of_end_balance=use_high_instead_of_end_balance
+    )
     return round(coefficient_of_determination, 3)
 
 
@@ -29,12 +29,14 @@ class PortfolioValueHolder:
     """
     PortfolioValueHolder calculates the current and the origin portfolio value in reference market for each updates
     """
+    ENABLE_INCREMENTAL_PORTFOLIO_VALUATION = constants.ENABLE_INCREMENTAL_PORTFOLIO_VALUATION
 
     def __init__(self, portfolio_manager):
         self.portfolio_manager = portfolio_manager
         self.logger = logging.get_logger(f"{self.__class__.__name__}"
                                          f"[{self.portfolio_manager.exchange_manager.exchange_name}]")
         self.value_converter = value_converter.ValueConverter(self.portfolio_manager)
+        self.value_converter.track_updated_price_symbols = self.ENABLE_INCREMENTAL_PORTFOLIO_VALUATION
 
         self.portfolio_origin_value = constants.ZERO
         self.portfolio_current_value = constants.ZERO
@@ -46,6 +48,11 @@ class PortfolioValueHolder:
         self.origin_crypto_currencies_values = {}
         self.current_crypto_currencies_values = {}
 
+        # incremental valuation: value of each currency of the current portfolio
+        self._currencies_holdings_values = {}
+        self._valued_portfolio = None
+        self._incremental_valuation_key = None
+
     def reset_portfolio_values(self):
         self.portfolio_origin_value = constants.ZERO
         self.portfolio_current_value = constants.ZERO
@@ -55,6 +62,8 @@ class PortfolioValueHolder:
         self.origin_crypto_currencies_values = {}
         self.current_crypto_currencies_values = {}
 
+        self._reset_incremental_valuation()
+
     def update_origin_crypto_currencies_values(self, symbol, mark_price):
         """
         Update origin cryptocurrencies value
@@ -192,6 +201,8 @@ class PortfolioValueHolder:
             self.current_crypto_currencies_values.update(
                 self._evaluate_config_crypto_currencies_and_portfolio_values(self.origin_portfolio.portfolio)
             )
+            # currencies values changed: currencies holdings values are outdated
+            self._incremental_valuation_key = None
         return self._update_portfolio_current_value(
             self.origin_portfolio.portfolio, currencies_values=self.current_crypto_currencies_values
         )
@@ -255,8 +266,86 @@ class PortfolioValueHolder:
         """
         Update the portfolio current value with the current portfolio instance
         """
-        self.portfolio_current_value = self._update_portfolio_current_value(
-            self.portfolio_manager.portfolio.portfolio)
+        if not self.ENABLE_INCREMENTAL_PORTFOLIO_VALUATION:
+            self.portfolio_current_value = self._update_portfolio_current_value(
+                self.portfolio_manager.portfolio.portfolio)
+            return
+        portfolio = self.portfolio_manager.portfolio.portfolio
+        updated_price_symbols = self.value_converter.pop_updated_price_symbols()
+        updated_holdings_currencies = self.portfolio_manager.portfolio.changes.pop_updated_currencies()
+        if portfolio is self._valued_portfolio \
+           and self._incremental_valuation_key == self._get_incremental_valuation_key():
+            self._update_portfolio_current_value_incrementally(
+                portfolio, updated_price_symbols, updated_holdings_currencies
+            )
+        else:
+            self.portfolio_current_value = self._update_portfolio_current_value(portfolio)
+            self._init_incremental_valuation(portfolio)
+
+    def _get_incremental_valuation_key(self):
+        """
+        :return: the key identifying the conversion elements that require a full portfolio valuation when changed:
+        the pairs used to convert values, the currencies without price data and the portfolio currencies
+        """
+        return (
+            self.value_converter.refresh_pairs_version(),
+            self.value_converter.missing_currency_data_version,
+            self.portfolio_manager.portfolio.changes.currencies_version,
+        )
+
+    def _init_incremental_valuation(self, portfolio):
+        """
+        Store each currency value from current_crypto_currencies_values as a base for the next incremental updates
+        """
+        self._currencies_holdings_values = {
+            currency: self._get_incremental_currency_value(portfolio, currency)
+            for currency in portfolio
+        }
+        self._valued_portfolio = portfolio
+        self._incremental_valuation_key = self._get_incremental_valuation_key()
+
+    def _update_portfolio_current_value_incrementally(
+        self, portfolio, updated_price_symbols, updated_holdings_currencies
+    ):
+        """
+        Update the value of the currencies which price or holdings changed and apply the
+        value delta to portfolio_current_value
+        :param portfolio: the current portfolio
+        :param updated_price_symbols: symbols which price changed since the last update
+        :param updated_holdings_currencies: currencies which holdings changed since the last update
+        """
+        updated_currencies = self.value_converter.get_currencies_valued_with(
+            updated_price_symbols, self.portfolio_manager.reference_market
+        )
+        updated_currencies.update(updated_holdings_currencies)
+        for currency in updated_currencies:
+            if currency in self.current_crypto_currencies_values or (
+                currency in portfolio and self._should_currency_be_considered(currency, portfolio, False)
+            ):
+                try:
+                    self.current_crypto_currencies_values[currency] = \
+                        self.value_converter.evaluate_value(currency, constants.ONE)
+                except errors.MissingPriceDataError:
+                    pass
+            if currency not in portfolio:
+                continue
+            value = self._get_incremental_currency_value(portfolio, currency)
+            self.portfolio_current_value += value - self._currencies_holdings_values.get(currency, constants.ZERO)
+            self._currencies_holdings_values[currency] = value
+        if len(self.current_crypto_currencies_values) > len(self.origin_crypto_currencies_values):
+            # add any missing value to origin_crypto_currencies_values (can happen with indirect valuations)
+            self._fill_currencies_values(self.origin_crypto_currencies_values)
+
+    def _get_incremental_currency_value(self, portfolio, currency):
+        if currency in self.value_converter.missing_currency_data_in_exchange:
+            # same as _evaluate_portfolio_value
+            return constants.ZERO
+        return self._get_currency_value(portfolio, currency, self.current_crypto_currencies_values)
+
+    def _reset_incremental_valuation(self):
+        self._currencies_holdings_values = {}
+        self._valued_portfolio = None
+        self._incremental_valuation_key = None
 
     def _recompute_origin_portfolio_initial_value(self):
         """
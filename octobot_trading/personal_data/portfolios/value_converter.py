@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import asyncio
+import collections
 import decimal
 
 import octobot_commons.logging as logging
@@ -38,23 +39,114 @@ class ValueConverter:
         self.logger = logging.get_logger(f"{self.__class__.__name__}"
                                          f"[{self.portfolio_manager.exchange_manager.exchange_name}]")
 
-        self.last_prices_by_trading_pair = {}
+        # incremented each time pairs are added to or removed from the pairs used to convert values
+        self.pairs_version = 0
+        self._last_prices_by_trading_pair = LastPricesByTradingPair(self._on_pairs_update)
 
         self.initializing_symbol_prices = set()
         self.initializing_symbol_prices_pairs = set()
 
         # set of currencies for which the current exchange is not providing any suitable price data
-        self.missing_currency_data_in_exchange = set()
+        # incremented each time currencies are added to or removed from missing_currency_data_in_exchange
+        self.missing_currency_data_version = 0
+        self._missing_currency_data_in_exchange = MissingCurrencyData(self._on_missing_currency_data_update)
 
         # internal price conversion elements
         self._price_bridge_by_symbol = {}
+        # {(base, quote): {(currency, target)}} of the saved price bridges using each pair
+        self._bridged_currencies_by_pair = {}
         self._missing_price_bridges = set()
+        # currencies graph built from available pairs, used to find price bridges
+        self._assets_graph = {}
+        self._assets_graph_version = None
+        self._graph_traded_symbol_pairs = None
+        self._pending_price_symbols = set()
+        self._parsed_pairs = {}
+        # last_prices_by_trading_pair symbols by (base, quote), used to find prices regardless of symbols extra data
+        self._last_price_symbol_by_base_and_quote = {}
+        # pairs_version of the indexed last_prices_by_trading_pair symbols
+        self._last_price_symbols_version = None
+        # symbols which prices have been updated since the last pop_updated_price_symbols call
+        self.track_updated_price_symbols = False
+        self._updated_price_symbols = set()
+
+    @property
+    def last_prices_by_trading_pair(self):
+        return self._last_prices_by_trading_pair
+
+    @last_prices_by_trading_pair.setter
+    def last_prices_by_trading_pair(self, last_prices_by_trading_pair):
+        self._last_prices_by_trading_pair = LastPricesByTradingPair(
+            self._on_pairs_update, last_prices_by_trading_pair
+        )
+        self._on_pairs_update()
+
+    def _on_pairs_update(self):
+        self.pairs_version += 1
+
+    @property
+    def missing_currency_data_in_exchange(self):
+        return self._missing_currency_data_in_exchange
+
+    @missing_currency_data_in_exchange.setter
+    def missing_currency_data_in_exchange(self, missing_currency_data_in_exchange):
+        self._missing_currency_data_in_exchange = MissingCurrencyData(
+            self._on_missing_currency_data_update, missing_currency_data_in_exchange
+        )
+        self._on_missing_currency_data_update()
+
+    def _on_missing_currency_data_update(self):
+        self.missing_currency_data_version += 1
+
+    def refresh_pairs_version(self) -> int:
+        """
+        :return: pairs_version, after incrementing it when traded pairs changed since the last call
+        """
+        traded_symbol_pairs = self.portfolio_manager.exchange_manager.exchange_config.traded_symbol_pairs
+        if traded_symbol_pairs != self._graph_traded_symbol_pairs:
+            self._graph_traded_symbol_pairs = list(traded_symbol_pairs)
+            self._on_pairs_update()
+        return self.pairs_version
 
     def update_last_price(self, symbol, price):
         if symbol not in self.last_prices_by_trading_pair:
+            is_indexed = self._last_price_symbols_version == self.pairs_version
             self.reset_missing_price_bridges()
             self.logger.debug(f"Initialized last price for {symbol}")
-        self.last_prices_by_trading_pair[symbol] = price
+            self.last_prices_by_trading_pair[symbol] = price
+            if is_indexed:
+                self._index_last_price_symbol(symbol)
+        else:
+            self.last_prices_by_trading_pair[symbol] = price
+        if self.track_updated_price_symbols:
+            self._updated_price_symbols.add(symbol)
+
+    def pop_updated_price_symbols(self) -> set:
+        """
+        :return: the symbols which prices have been updated since the last call, requires
+        track_updated_price_symbols to be True
+        """
+        updated_price_symbols = self._updated_price_symbols
+        self._updated_price_symbols = set()
+        return updated_price_symbols
+
+    def get_currencies_valued_with(self, symbols, target) -> set:
+        """
+        :return: the currencies which value in target depends on the given symbols prices: their base and quote
+        and the currencies using them in a saved price bridge to target
+        """
+        currencies = set()
+        for symbol in symbols:
+            base, quote = self._get_base_and_quote(symbol)
+            currencies.add(base)
+            currencies.add(quote)
+            for pair in ((base, quote), (quote, base)):
+                currencies.update(
+                    currency
+                    for currency, bridge_target in self._bridged_currencies_by_pair.get(pair, ())
+                    if bridge_target == target
+                )
+        return currencies
 
     def evaluate_value(self, currency, quantity, raise_error=True, target_currency=None, init_price_fetchers=True):
         """
@@ -125,6 +217,9 @@ class ValueConverter:
         """
         if currency_value > constants.ZERO and currency in self.initializing_symbol_prices:
             self.initializing_symbol_prices.remove(currency)
+            if not self.initializing_symbol_prices:
+                # initializing pairs are not used anymore
+                self._on_pairs_update()
         return currency_value
 
     def _try_get_value_of_currency(self, currency, quantity, target_currency, raise_error, init_price_fetchers):
@@ -202,6 +297,7 @@ class ValueConverter:
             self._ask_ticker_data_for_currency(new_symbols_to_add)
             self.initializing_symbol_prices.add(currency)
             self.initializing_symbol_prices_pairs.update(new_symbols_to_add)
+            self._on_pairs_update()
 
     def _ask_ticker_data_for_currency(self, symbols_to_add):
         """
@@ -256,7 +352,7 @@ class ValueConverter:
     ) -> decimal.Decimal:
         # settlement_asset needs to be handled to add support for futures
 
-        # try with two pairs
+        # use the shortest bridge of priced pairs
         # for example:
         # currency: ETH - ref market: USDT
         # ETH/USDT is not available. ETH/BTC and BTC/USDT are available though.
@@ -269,76 +365,83 @@ class ValueConverter:
             if self.is_missing_price_bridge(currency, target):
                 return None
             # try to find a bridge
-        if len(base_bridge) > self.MAX_PRICE_BRIDGE_DEPTH:
-            self._save_missing_price_bridge(currency, target)
-            return None
-        part_1_base = currency
-        part_2_quote = target
-        # look into available symbols to find pair bridges
-        for bridge_part_1_symbol in self._get_priced_pairs():
-            parsed_bridge_part_1_symbol = symbol_util.parse_symbol(bridge_part_1_symbol)
-            if (parsed_bridge_part_1_symbol.base, parsed_bridge_part_1_symbol.quote) in base_bridge\
-               or (parsed_bridge_part_1_symbol.quote, parsed_bridge_part_1_symbol.base) in base_bridge:
-                # avoid looping in symbols
-                continue
-            # part 1: check if bridge_part_1_symbol can be used as part 1 of the bridge
-            is_inverse_part_1 = False
-            if part_1_base == parsed_bridge_part_1_symbol.quote:
-                is_inverse_part_1 = True
-            elif part_1_base != parsed_bridge_part_1_symbol.base:
-                continue
-            part_1_quote = parsed_bridge_part_1_symbol.quote
-            if is_inverse_part_1:
-                part_1_quote = parsed_bridge_part_1_symbol.base
-                part_1_base = parsed_bridge_part_1_symbol.quote
-            try:
-                bridge_part_1_value = self.convert_currency_value_using_last_prices(
-                    quantity, part_1_base, part_1_quote
-                )
-                # check that bridge_part_1_value is really set
-                if not bridge_part_1_value:
-                    continue
-            except errors.MissingPriceDataError:
-                # first pair might not be initialized or is not available at all
-                # make sure it's not just initializing
-                self._ensure_no_pending_symbol_price(part_1_base, part_1_quote)
-                # try with other pairs
-                continue
-            # part 2: bridge part 1 is found and valued, try to get a compatible second part
-            # case 1: 2 parts bridge
+        max_bridge_size = self.MAX_PRICE_BRIDGE_DEPTH + 2 - len(base_bridge)
+        # avoid looping in symbols
+        excluded_pairs = set(base_bridge).union((quote, base) for base, quote in base_bridge)
+        bridges = self._get_price_bridges_to(target, self._is_priced_pair, max_bridge_size, excluded_pairs)
+        if bridge := bridges.get(currency):
             try:
-                bridge_part_2_value = self.convert_currency_value_using_last_prices(
-                    constants.ONE,
-                    part_1_quote,
-                    part_2_quote,
-                )
-                if bridge_part_2_value:
-                    self._remove_from_missing_currency_data(currency)
-                    local_bridge = [(part_1_base, part_1_quote), (part_1_quote, part_2_quote)]
-                    self._save_price_bridge(currency, target, local_bridge)
-                    return bridge_part_1_value * bridge_part_2_value
+                value = quantity
+                for base, quote in bridge:
+                    value = self.convert_currency_value_using_last_prices(value, base, quote)
+                self._remove_from_missing_currency_data(currency)
+                for bridged_currency, price_bridge in (
+                    bridges.items() if not base_bridge else ((currency, bridge), )
+                ):
+                    if len(price_bridge) > 1:
+                        # also save other currencies bridges: they are the shortest ones as well
+                        self._save_price_bridge(bridged_currency, target, price_bridge)
+                return value
             except errors.MissingPriceDataError:
-                # conversion pairs might not be initialized or is not available at all
-                self._ensure_no_pending_symbol_price(part_1_quote, part_2_quote)
-                # otherwise continue with other pairs
-            bridge = base_bridge + [(part_1_base, part_1_quote)]
-            # case 2: X parts bridge
-            nested_value = self.try_convert_currency_value_using_multiple_pairs(
-                part_1_quote, target, constants.ONE, bridge
-            )
-            if nested_value:
-                try:
-                    extended_bridge = [(part_1_base, part_1_quote)] \
-                        + self.get_saved_price_conversion_bridge(part_1_quote, target)
-                    self._save_price_bridge(currency, target, extended_bridge)
-                except KeyError:
-                    # should not happen, however if it does, do not crash
-                    pass
-                return bridge_part_1_value * nested_value
+                # price data is not usable: consider bridge as missing
+                pass
+        elif currency != target and currency in self._get_price_bridges_to(
+            target, self._is_priced_or_pending_pair, max_bridge_size, excluded_pairs
+        ):
+            # a bridge will be available when pending pairs prices are available
+            raise errors.PendingPriceDataError
         # no bridge found
         self._save_missing_price_bridge(currency, target)
         return None
 
+    def _get_price_bridges_to(self, target, is_usable_pair, max_bridge_size, excluded_pairs) -> dict:
+        """
+        :return: the shortest price bridge from each reachable currency to target using pairs accepted by
+        is_usable_pair
+        """
+        assets_graph = self._get_assets_graph()
+        bridges = {target: []}
+        to_visit = collections.deque([target])
+        while to_visit:
+            asset = to_visit.popleft()
+            bridge = bridges[asset]
+            if len(bridge) >= max_bridge_size:
+                continue
+            for other_asset, symbols in assets_graph.get(asset, {}).items():
+                if (
+                    other_asset in bridges
+                    or (other_asset, asset) in excluded_pairs
+                    or not is_usable_pair(symbols)
+                ):
+                    continue
+                bridges[other_asset] = [(other_asset, asset)] + bridge
+                to_visit.append(other_asset)
+        return bridges
+
+    def _is_priced_pair(self, symbols) -> bool:
+        return any(self.last_prices_by_trading_pair.get(symbol) for symbol in symbols)
+
+    def _is_priced_or_pending_pair(self, symbols) -> bool:
+        return self._is_priced_pair(symbols) or any(symbol in self._pending_price_symbols for symbol in symbols)
+
+    def _get_assets_graph(self) -> dict:
+        """
+        :return: the {currency: {other_currency: [symbols]}} graph of currencies linked by the pairs from
+        _get_priced_pairs. The graph and saved price bridges are reset when pairs_version changes
+        """
+        if self.refresh_pairs_version() != self._assets_graph_version:
+            self._assets_graph = {}
+            for pair in self._get_priced_pairs():
+                base, quote = self._get_base_and_quote(pair)
+                self._assets_graph.setdefault(base, {}).setdefault(quote, []).append(pair)
+                self._assets_graph.setdefault(quote, {}).setdefault(base, []).append(pair)
+            self._pending_price_symbols = set(self._graph_traded_symbol_pairs).union(
+                self.initializing_symbol_prices_pairs if self.initializing_symbol_prices else ()
+            )
+            self._reset_price_bridges()
+            self._assets_graph_version = self.pairs_version
+        return self._assets_graph
+
     def _get_priced_pairs(self):
         for pair in self.last_prices_by_trading_pair:
             # first look into pairs with price
@@ -352,17 +455,13 @@ class ValueConverter:
                 # finally into initializing pairs
                 yield pair
 
-    def _ensure_no_pending_symbol_price(self, base, quote):
-        for symbol in (symbol_util.merge_currencies(base, quote), symbol_util.merge_currencies(quote, base)):
-            if symbol in self.portfolio_manager.exchange_manager.exchange_config.traded_symbol_pairs \
-                    or symbol in self.initializing_symbol_prices_pairs:
-                raise errors.PendingPriceDataError
-
     def get_saved_price_conversion_bridge(self, currency, target) -> list:
         return self._price_bridge_by_symbol[symbol_util.merge_currencies(currency, target)]
 
     def _save_price_bridge(self, currency, target, bridge):
         self._price_bridge_by_symbol[symbol_util.merge_currencies(currency, target)] = bridge
+        for pair in bridge:
+            self._bridged_currencies_by_pair.setdefault(pair, set()).add((currency, target))
 
     def convert_currency_value_from_saved_price_bridges(self, currency, target, quantity) -> decimal.Decimal:
         try:
@@ -376,6 +475,13 @@ class ValueConverter:
 
     def reset_missing_price_bridges(self):
         self._missing_price_bridges = set()
+        # shorter bridges might be available: saved bridges and values relying on them are outdated
+        self._reset_price_bridges()
+        self._on_pairs_update()
+
+    def _reset_price_bridges(self):
+        self._price_bridge_by_symbol = {}
+        self._bridged_currencies_by_pair = {}
 
     def _save_missing_price_bridge(self, base, quote):
         self._missing_price_bridges.add(symbol_util.merge_currencies(base, quote))
@@ -396,11 +502,144 @@ class ValueConverter:
         except KeyError:
             # a settlement asset or other symbol extra 
             # data might be different, try to ignore it
-            to_find_symbol = symbol_util.parse_symbol(symbol)
-            for symbol_key, last_prices in self.last_prices_by_trading_pair.items():
-                if symbol_util.parse_symbol(symbol_key).is_same_base_and_quote(to_find_symbol):
-                    return last_prices
+            if self._last_price_symbols_version != self.pairs_version:
+                # pairs have been added or removed without update_last_price
+                self._reindex_last_price_symbols()
+            try:
+                return self.last_prices_by_trading_pair[
+                    self._last_price_symbol_by_base_and_quote[self._get_base_and_quote(symbol)]
+                ]
+            except KeyError:
+                pass
         raise KeyError(symbol)
 
+    def _index_last_price_symbol(self, symbol):
+        # keep the first symbol of each base and quote
+        self._last_price_symbol_by_base_and_quote.setdefault(self._get_base_and_quote(symbol), symbol)
+        self._last_price_symbols_version = self.pairs_version
+
+    def _reindex_last_price_symbols(self):
+        self._last_price_symbol_by_base_and_quote = {}
+        for symbol in self.last_prices_by_trading_pair:
+            self._index_last_price_symbol(symbol)
+        self._last_price_symbols_version = self.pairs_version
+
+    def _get_base_and_quote(self, symbol) -> tuple:
+        try:
+            return self._parsed_pairs[symbol]
+        except KeyError:
+            base_and_quote = self._parsed_pairs[symbol] = symbol_util.parse_symbol(symbol).base_and_quote()
+            return base_and_quote
+
     def clear(self):
         self.portfolio_manager = None
+
+
+class LastPricesByTradingPair(dict):
+    """
+    Last price of each symbol, calls on_pairs_update when symbols are added or removed
+    """
+    def __init__(self, on_pairs_update, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_pairs_update = on_pairs_update
+
+    def __setitem__(self, symbol, price):
+        if symbol not in self:
+            self._on_pairs_update()
+        super().__setitem__(symbol, price)
+
+    def __delitem__(self, symbol):
+        super().__delitem__(symbol)
+        self._on_pairs_update()
+
+    def setdefault(self, symbol, default=None):
+        if symbol not in self:
+            self[symbol] = default
+        return self[symbol]
+
+    def update(self, *args, **kwargs):
+        for symbol, price in dict(*args, **kwargs).items():
+            self[symbol] = price
+
+    def pop(self, symbol, *default):
+        if symbol in self:
+            self._on_pairs_update()
+        return super().pop(symbol, *default)
+
+    def popitem(self):
+        item = super().popitem()
+        self._on_pairs_update()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._on_pairs_update()
+
+    def __reduce__(self):
+        return dict, (dict(self), )
+
+
+class MissingCurrencyData(set):
+    """
+    Currencies without price data, calls on_update when currencies are added or removed
+    """
+    def __init__(self, on_update, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._on_update = on_update
+
+    def add(self, currency):
+        if currency not in self:
+            super().add(currency)
+            self._on_update()
+
+    def remove(self, currency):
+        super().remove(currency)
+        self._on_update()
+
+    def discard(self, currency):
+        if currency in self:
+            self.remove(currency)
+
+    def pop(self):
+        currency = super().pop()
+        self._on_update()
+        return currency
+
+    def clear(self):
+        super().clear()
+        self._on_update()
+
+    def update(self, *others):
+        super().update(*others)
+        self._on_update()
+
+    def difference_update(self, *others):
+        super().difference_update(*others)
+        self._on_update()
+
+    def intersection_update(self, *others):
+        super().intersection_update(*others)
+        self._on_update()
+
+    def symmetric_difference_update(self, other):
+        super().symmetric_difference_update(other)
+        self._on_update()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __iand__(self, other):
+        self.intersection_update(other)
+        return self
+
+    def __isub__(self, other):
+        self.difference_update(other)
+        return self
+
+    def __ixor__(self, other):
+        self.symmetric_difference_update(other)
+        return self
+
+    def __reduce__(self):
+        return set, (set(self), )
@@ -14,14 +14,23 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 
+from octobot_trading.personal_data.trades import trades_index
 from octobot_trading.personal_data.trades import trades_manager
+from octobot_trading.personal_data.trades import trades_archive
 from octobot_trading.personal_data.trades import trade_factory
 from octobot_trading.personal_data.trades import channel
 from octobot_trading.personal_data.trades import trade
 
+from octobot_trading.personal_data.trades.trades_index import (
+    TradesIndex,
+    IndexedTrades,
+)
 from octobot_trading.personal_data.trades.trades_manager import (
     TradesManager,
 )
+from octobot_trading.personal_data.trades.trades_archive import (
+    TradesArchive,
+)
 from octobot_trading.personal_data.trades.trade_factory import (
     create_trade_instance_from_raw,
     create_closed_order_instance_from_raw_trade,
@@ -45,7 +54,10 @@ from octobot_trading.personal_data.trades.trades_util import (
 )
 
 __all__ = [
+    "TradesIndex",
+    "IndexedTrades",
     "TradesManager",
+    "TradesArchive",
     "TradesProducer",
     "TradesChannel",
     "create_trade_instance_from_raw",
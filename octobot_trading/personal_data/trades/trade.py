@@ -28,6 +28,9 @@ class Trade:
     def __init__(self, trader):
         self.trader = trader
         self.exchange_manager = trader.exchange_manager
+        # TradesIndex of the trades manager holding this trade, notified when an indexed attribute changes
+        self.trades_index = None
+        self._origin_order_id = self._exchange_order_id = self._fee = None
 
         self.status = enums.OrderStatus.OPEN
         self.creation_time = self.exchange_manager.exchange.get_exchange_current_time()
@@ -66,6 +69,36 @@ class Trade:
         # raw exchange trade type, used to create trade dict
         self.exchange_trade_type = None
 
+    @property
+    def origin_order_id(self):
+        return self._origin_order_id
+
+    @origin_order_id.setter
+    def origin_order_id(self, origin_order_id):
+        if self.trades_index is not None:
+            self.trades_index.update(self, "origin_order_id", self._origin_order_id, origin_order_id)
+        self._origin_order_id = origin_order_id
+
+    @property
+    def exchange_order_id(self):
+        return self._exchange_order_id
+
+    @exchange_order_id.setter
+    def exchange_order_id(self, exchange_order_id):
+        if self.trades_index is not None:
+            self.trades_index.update(self, "exchange_order_id", self._exchange_order_id, exchange_order_id)
+        self._exchange_order_id = exchange_order_id
+
+    @property
+    def fee(self):
+        return self._fee
+
+    @fee.setter
+    def fee(self, fee):
+        if self.trades_index is not None:
+            self.trades_index.update(self, "fee", self._fee, fee)
+        self._fee = fee
+
     def update_from_order(self, order, creation_time=0, canceled_time=0, executed_time=0, exchange_trade_id=None):
         self.currency = order.currency
         self.market = order.market
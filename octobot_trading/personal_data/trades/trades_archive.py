@@ -0,0 +1,296 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import typing
+
+import numpy as np
+
+import octobot_trading.enums as enums
+
+
+class TradesArchive:
+    """
+    Compact trades history storing the main values of each trade in contiguous columns.
+    Values are stored as floats: the archive is meant for history reports, not for exact accounting.
+    Cancelled trades are not archived.
+    """
+    INITIAL_CAPACITY = 1024
+    _NO_FEE_CURRENCY = -1
+    # remaining position ratio under which a sell is considered as closing the position
+    _CLOSED_POSITION_RATIO = 1e-12
+    _COLUMNS = (
+        "times", "prices", "quantities", "fees", "fee_currency_ids", "sides", "symbol_ids",
+        "trade_type_ids", "filled", "reduce_only",
+    )
+
+    def __init__(self, max_trades_count: int):
+        self.max_trades_count: int = max_trades_count
+        self.size: int = 0
+        self.times = None
+        self.prices = None
+        self.quantities = None
+        self.fees = None
+        # index of each trade fee currency in self.currencies, _NO_FEE_CURRENCY when trade has no fee
+        self.fee_currency_ids = None
+        # 1 for sell trades, -1 for buy trades: the sign of the quote amount variation
+        self.sides = None
+        # index of each trade symbol in self.symbols
+        self.symbol_ids = None
+        # index of each trade exchange_trade_type in self.trade_types
+        self.trade_type_ids = None
+        # True for filled trades
+        self.filled = None
+        self.reduce_only = None
+        self.symbols: list[str] = []
+        self.currencies: list[str] = []
+        self.trade_types: list[enums.TradeOrderType] = []
+        self._symbol_ids: dict[str, int] = {}
+        self._currency_ids: dict[str, int] = {}
+        self._trade_type_ids: dict[enums.TradeOrderType, int] = {}
+        self._total_paid_fees: typing.Optional[dict[str, float]] = None
+        self.reset()
+
+    def reset(self):
+        self.size = 0
+        self.times = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self.prices = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self.quantities = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self.fees = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self.fee_currency_ids = np.empty(self.INITIAL_CAPACITY, dtype=np.int32)
+        self.sides = np.empty(self.INITIAL_CAPACITY, dtype=np.int8)
+        self.symbol_ids = np.empty(self.INITIAL_CAPACITY, dtype=np.int32)
+        self.trade_type_ids = np.empty(self.INITIAL_CAPACITY, dtype=np.int32)
+        self.filled = np.empty(self.INITIAL_CAPACITY, dtype=bool)
+        self.reduce_only = np.empty(self.INITIAL_CAPACITY, dtype=bool)
+        self.symbols = []
+        self.currencies = []
+        self.trade_types = []
+        self._symbol_ids = {}
+        self._currency_ids = {}
+        self._trade_type_ids = {}
+        self._total_paid_fees = None
+
+    def __len__(self):
+        return self.size
+
+    def add_trades(self, trades: list):
+        """
+        Archive the given trades, they should be sorted from the oldest to the most recent one.
+        When max_trades_count is reached, the oldest archived trades are removed
+        """
+        trades = [trade for trade in trades if trade.status is not enums.OrderStatus.CANCELED]
+        if not trades:
+            return
+        self._ensure_capacity(self.size + len(trades))
+        end = self.size + len(trades)
+        self.times[self.size:end] = [trade.executed_time for trade in trades]
+        self.prices[self.size:end] = [float(trade.executed_price) for trade in trades]
+        self.quantities[self.size:end] = [float(trade.executed_quantity) for trade in trades]
+        self.fees[self.size:end] = [
+            0 if trade.fee is None else float(trade.fee[enums.FeePropertyColumns.COST.value])
+            for trade in trades
+        ]
+        self.fee_currency_ids[self.size:end] = [
+            self._NO_FEE_CURRENCY if trade.fee is None
+            else self._get_id(trade.fee[enums.FeePropertyColumns.CURRENCY.value], self._currency_ids, self.currencies)
+            for trade in trades
+        ]
+        self.sides[self.size:end] = [1 if trade.side is enums.TradeOrderSide.SELL else -1 for trade in trades]
+        self.symbol_ids[self.size:end] = [
+            self._get_id(trade.symbol, self._symbol_ids, self.symbols) for trade in trades
+        ]
+        self.trade_type_ids[self.size:end] = [
+            self._get_id(trade.exchange_trade_type, self._trade_type_ids, self.trade_types) for trade in trades
+        ]
+        self.filled[self.size:end] = [trade.status is enums.OrderStatus.FILLED for trade in trades]
+        self.reduce_only[self.size:end] = [bool(trade.reduce_only) for trade in trades]
+        self.size = end
+        self._total_paid_fees = None
+        if self.size > self.max_trades_count:
+            self._remove_oldest_trades(self.size - self.max_trades_count + self.max_trades_count // 10)
+
+    def get_paid_fees(self, symbol=None, since=None, until=None) -> dict[str, float]:
+        """
+        :return: the total paid fees of each currency for the selected trades
+        """
+        if symbol is None and since is None and until is None:
+            if self._total_paid_fees is None:
+                self._total_paid_fees = self._compute_paid_fees(None)
+            return dict(self._total_paid_fees)
+        return self._compute_paid_fees(self._get_selection(symbol, since, until))
+
+    def get_net_cash_flow(self, symbol: str, since=None, until=None) -> float:
+        """
+        :return: the quote amount received from the selected sell trades minus the quote amount spent
+        in the selected buy trades, fees excluded. This is not a PnL: bought amounts that are not sold yet
+        are counted as spent
+        """
+        selection = self._get_selection(symbol, since, until)
+        return float(np.sum(
+            (self.sides[:self.size] * self.prices[:self.size] * self.quantities[:self.size])[selection]
+        ))
+
+    def get_realized_pnl(self, symbol: str, since=None, until=None, recent_trades=None) -> float:
+        """
+        :param recent_trades: trades more recent than the archived ones, included in the computation
+        :return: the profit realized by the selected sell trades, fees excluded. Each sold amount is valued at
+        the average cost of the base amount held before the sell, computed from every previous buy of symbol.
+        Sold amounts exceeding the held amount have no known cost and are not accounted.
+        """
+        selection = self._get_selection(symbol, None, None)
+        times = self.times[:self.size][selection]
+        prices = self.prices[:self.size][selection]
+        quantities = self.quantities[:self.size][selection]
+        sides = self.sides[:self.size][selection]
+        if recent_trades:
+            recent_trades = [
+                trade
+                for trade in recent_trades
+                if trade.symbol == symbol and trade.status is not enums.OrderStatus.CANCELED
+            ]
+            times = np.concatenate((times, [trade.executed_time for trade in recent_trades]))
+            prices = np.concatenate((prices, [float(trade.executed_price) for trade in recent_trades]))
+            quantities = np.concatenate((quantities, [float(trade.executed_quantity) for trade in recent_trades]))
+            sides = np.concatenate(
+                (sides, [1 if trade.side is enums.TradeOrderSide.SELL else -1 for trade in recent_trades])
+            )
+        if not len(times):
+            return 0
+        realized_pnls = self._compute_realized_pnls(prices, quantities, sides)
+        selection = np.ones(len(times), dtype=bool)
+        if since is not None:
+            selection &= times >= since
+        if until is not None:
+            selection &= times <= until
+        return float(np.sum(realized_pnls[selection]))
+
+    def count_filled_trades(self, side=None, reduce_only=None, trade_types=None) -> int:
+        """
+        :param side: count only trades of this TradeOrderSide
+        :param reduce_only: count only trades with this reduce_only value
+        :param trade_types: count only trades of these exchange TradeOrderType
+        :return: the number of archived filled trades matching the given filters
+        """
+        selection = self.filled[:self.size].copy()
+        if side is not None:
+            selection &= self.sides[:self.size] == (1 if side is enums.TradeOrderSide.SELL else -1)
+        if reduce_only is not None:
+            selection &= self.reduce_only[:self.size] == reduce_only
+        if trade_types is not None:
+            selection &= np.isin(
+                self.trade_type_ids[:self.size],
+                [self._trade_type_ids[trade_type] for trade_type in trade_types if trade_type in self._trade_type_ids]
+            )
+        return int(np.count_nonzero(selection))
+
+    def get_traded_quantity(self, symbol: str, since=None, until=None) -> float:
+        """
+        :return: the base amount bought in the selected trades minus the base amount sold in the selected trades
+        """
+        selection = self._get_selection(symbol, since, until)
+        return float(-np.sum((self.sides[:self.size] * self.quantities[:self.size])[selection]))
+
+    def get_trades_count(self, symbol=None, since=None, until=None) -> int:
+        return int(np.count_nonzero(self._get_selection(symbol, since, until)))
+
+    def _compute_paid_fees(self, selection) -> dict[str, float]:
+        currency_ids = self.fee_currency_ids[:self.size]
+        fees = self.fees[:self.size]
+        with_fees = currency_ids != self._NO_FEE_CURRENCY
+        if selection is not None:
+            with_fees &= selection
+        counts = np.bincount(currency_ids[with_fees], minlength=len(self.currencies))
+        totals = np.bincount(currency_ids[with_fees], weights=fees[with_fees], minlength=len(self.currencies))
+        return {
+            currency: float(totals[currency_id])
+            for currency_id, currency in enumerate(self.currencies)
+            if counts[currency_id]
+        }
+
+    @classmethod
+    def _compute_realized_pnls(cls, prices, quantities, sides) -> np.ndarray:
+        """
+        :return: the realized profit of each trade of a symbol using the average cost method, 0 for buys
+        """
+        is_sell = sides == 1
+        # held base amounts after each trade, sells can't make it negative
+        cumulated_quantities = np.cumsum(-sides * quantities)
+        positions = cumulated_quantities - np.minimum(np.minimum.accumulate(cumulated_quantities), 0)
+        previous_positions = np.concatenate(([0.], positions[:-1]))
+        sold_quantities = np.where(is_sell, previous_positions - positions, 0)
+        # held cost after each trade: costs[i] = remaining_ratios[i] * costs[i - 1] + bought_costs[i]
+        # where sells keep the average cost, solved by cumulated sums between positions closings
+        with np.errstate(divide="ignore", invalid="ignore"):
+            remaining_ratios = np.where(is_sell & (previous_positions > 0), positions / previous_positions, 1)
+        closings = remaining_ratios < cls._CLOSED_POSITION_RATIO
+        bought_costs = np.where(is_sell, 0, prices * quantities)
+        # each closing starts a new cost group from the next trade
+        group_ids = np.concatenate(([0], np.cumsum(closings)[:-1]))
+        group_starts = np.flatnonzero(np.diff(group_ids, prepend=-1))
+        log_ratios = np.log(np.where(closings, 1, remaining_ratios))
+        log_products = np.cumsum(log_ratios)
+        log_products -= (log_products - log_ratios)[group_starts][group_ids]
+        scaled_costs = bought_costs * np.exp(-log_products)
+        # cumulated by group: subtracting the previous groups sums would lose precision
+        cumulated_scaled_costs = np.concatenate([
+            np.cumsum(group_scaled_costs) for group_scaled_costs in np.split(scaled_costs, group_starts[1:])
+        ])
+        costs = np.exp(log_products) * cumulated_scaled_costs
+        previous_costs = np.concatenate(([0.], costs[:-1]))
+        previous_costs[group_starts] = 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            average_costs = np.where(previous_positions > 0, previous_costs / previous_positions, 0)
+        return sold_quantities * (prices - average_costs)
+
+    def _get_selection(self, symbol, since, until) -> np.ndarray:
+        selection = np.ones(self.size, dtype=bool)
+        if symbol is not None:
+            if symbol not in self._symbol_ids:
+                return np.zeros(self.size, dtype=bool)
+            selection &= self.symbol_ids[:self.size] == self._symbol_ids[symbol]
+        if since is not None:
+            selection &= self.times[:self.size] >= since
+        if until is not None:
+            selection &= self.times[:self.size] <= until
+        return selection
+
+    def _ensure_capacity(self, required_size: int):
+        capacity = len(self.times)
+        if required_size <= capacity:
+            return
+        while capacity < required_size:
+            capacity *= 2
+        for column in self._COLUMNS:
+            values = getattr(self, column)
+            resized = np.empty(capacity, dtype=values.dtype)
+            resized[:self.size] = values[:self.size]
+            setattr(self, column, resized)
+
+    def _remove_oldest_trades(self, count: int):
+        kept = self.size - count
+        for column in self._COLUMNS:
+            values = getattr(self, column)
+            values[:kept] = values[count:self.size]
+        self.size = kept
+        self._total_paid_fees = None
+
+    @staticmethod
+    def _get_id(value: str, ids: dict[str, int], values: list[str]) -> int:
+        try:
+            return ids[value]
+        except KeyError:
+            ids[value] = len(values)
+            values.append(value)
+            return ids[value]
@@ -0,0 +1,194 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import collections
+import typing
+
+import octobot_trading.enums as enums
+
+ORIGIN_ORDER_ID = "origin_order_id"
+EXCHANGE_ORDER_ID = "exchange_order_id"
+FEE = "fee"
+INDEXED_ATTRIBUTES = (ORIGIN_ORDER_ID, EXCHANGE_ORDER_ID)
+
+
+class TradesIndex:
+    """
+    Incremental order ids indexes and paid fees totals of the trades registered in a TradesManager.
+    Registered trades notify their indexed attributes and fee changes through update().
+    """
+
+    def __init__(self):
+        # trade -> trade id it is registered with
+        self._trade_ids: dict = {}
+        # trade -> (fee cost, fee currency) included in paid fees totals
+        self._fees: dict = {}
+        # indexed value: {trade id: trade}
+        self._indexes: dict[str, dict[typing.Hashable, dict]] = {
+            attribute: {}
+            for attribute in INDEXED_ATTRIBUTES
+        }
+        # running paid fees totals and count of trades with fees in each currency
+        self._paid_fees_by_currency: dict = {}
+        self._fee_trades_count_by_currency: dict[str, int] = {}
+
+    def add(self, trade_id: str, trade):
+        """
+        Registers the given trade and binds it to this index to be notified of its indexed attributes changes.
+        Raises when the trade fee can't be parsed, in which case nothing is registered.
+        """
+        fee = _parse_fee(trade.fee)
+        if trade in self._trade_ids:
+            self.remove(trade)
+        self._trade_ids[trade] = trade_id
+        for attribute in INDEXED_ATTRIBUTES:
+            self._add_to_bucket(attribute, getattr(trade, attribute), trade_id, trade)
+        self._add_fee(trade, fee)
+        trade.trades_index = self
+
+    def remove(self, trade):
+        trade_id = self._trade_ids.pop(trade, None)
+        if trade_id is None:
+            return
+        for attribute in INDEXED_ATTRIBUTES:
+            self._remove_from_bucket(attribute, getattr(trade, attribute), trade_id)
+        self._remove_fee(trade)
+        if trade.trades_index is self:
+            trade.trades_index = None
+
+    def update(self, trade, attribute, previous_value, new_value):
+        """
+        Called by trades before changing one of their indexed attributes or their fee.
+        Raises when the new fee can't be parsed, in which case the index is unchanged.
+        """
+        trade_id = self._trade_ids.get(trade)
+        if trade_id is None:
+            return
+        if attribute == FEE:
+            fee = _parse_fee(new_value)
+            self._remove_fee(trade)
+            self._add_fee(trade, fee)
+        elif previous_value != new_value:
+            self._remove_from_bucket(attribute, previous_value, trade_id)
+            self._add_to_bucket(attribute, new_value, trade_id, trade)
+
+    def get_trades(self, attribute, key) -> list:
+        """
+        :return: the registered trades having key as attribute value, in registration order
+        """
+        return list(self._indexes[attribute].get(key, {}).values())
+
+    def get_paid_fees(self) -> dict:
+        return dict(self._paid_fees_by_currency)
+
+    def clear(self):
+        for trade in self._trade_ids:
+            if trade.trades_index is self:
+                trade.trades_index = None
+        self._trade_ids = {}
+        self._fees = {}
+        for index in self._indexes.values():
+            index.clear()
+        self._paid_fees_by_currency = {}
+        self._fee_trades_count_by_currency = {}
+
+    def _add_to_bucket(self, attribute, key, trade_id, trade):
+        self._indexes[attribute].setdefault(key, {})[trade_id] = trade
+
+    def _remove_from_bucket(self, attribute, key, trade_id):
+        index = self._indexes[attribute]
+        if (bucket := index.get(key)) is not None:
+            bucket.pop(trade_id, None)
+            if not bucket:
+                index.pop(key)
+
+    def _add_fee(self, trade, fee):
+        if fee is None:
+            return
+        self._fees[trade] = fee
+        fee_cost, fee_currency = fee
+        if fee_currency in self._paid_fees_by_currency:
+            self._paid_fees_by_currency[fee_currency] += fee_cost
+            self._fee_trades_count_by_currency[fee_currency] += 1
+        else:
+            self._paid_fees_by_currency[fee_currency] = fee_cost
+            self._fee_trades_count_by_currency[fee_currency] = 1
+
+    def _remove_fee(self, trade):
+        # use the registered fee: the trade fee dict might have been changed since
+        if (fee := self._fees.pop(trade, None)) is None:
+            return
+        fee_cost, fee_currency = fee
+        if self._fee_trades_count_by_currency.get(fee_currency, 0) > 1:
+            self._paid_fees_by_currency[fee_currency] -= fee_cost
+            self._fee_trades_count_by_currency[fee_currency] -= 1
+        else:
+            self._paid_fees_by_currency.pop(fee_currency, None)
+            self._fee_trades_count_by_currency.pop(fee_currency, None)
+
+
+class IndexedTrades(collections.OrderedDict):
+    """
+    Trade id: trade mapping keeping its TradesIndex in sync with its content
+    """
+
+    def __init__(self, trades_index=None, *args, **kwargs):
+        self.trades_index = TradesIndex() if trades_index is None else trades_index
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, trade_id, trade):
+        previous_trade = self.get(trade_id)
+        if previous_trade is not None and previous_trade is not trade:
+            self.trades_index.remove(previous_trade)
+        try:
+            # register first: the mapping is unchanged if the trade can't be indexed
+            self.trades_index.add(trade_id, trade)
+        except Exception:
+            if previous_trade is not None and previous_trade is not trade:
+                self.trades_index.add(trade_id, previous_trade)
+            raise
+        super().__setitem__(trade_id, trade)
+
+    def __delitem__(self, trade_id):
+        trade = self[trade_id]
+        super().__delitem__(trade_id)
+        self.trades_index.remove(trade)
+
+    def pop(self, trade_id, *default):
+        if trade_id not in self:
+            if default:
+                return default[0]
+            raise KeyError(trade_id)
+        trade = self[trade_id]
+        del self[trade_id]
+        return trade
+
+    def popitem(self, last=True):
+        trade_id, trade = super().popitem(last=last)
+        self.trades_index.remove(trade)
+        return trade_id, trade
+
+    def clear(self):
+        super().clear()
+        self.trades_index.clear()
+
+    def __reduce__(self):
+        return self.__class__, (None, list(self.items()))
+
+
+def _parse_fee(fee) -> typing.Optional[tuple]:
+    if fee is None:
+        return None
+    return fee[enums.FeePropertyColumns.COST.value], fee[enums.FeePropertyColumns.CURRENCY.value]
@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import collections
+import decimal
 import typing
 
 import octobot_commons.logging as logging
@@ -23,20 +24,40 @@ import octobot_commons.enums as commons_enums
 import octobot_trading.constants as constants
 import octobot_trading.enums as enums
 import octobot_trading.personal_data as personal_data
+import octobot_trading.personal_data.trades.trade as trade_class
 import octobot_trading.personal_data.trades.trade_pnl as trade_pnl
+import octobot_trading.personal_data.trades.trades_archive as trades_archive
+import octobot_trading.personal_data.trades.trades_index as trades_index
 import octobot_trading.util as util
 
 
 class TradesManager(util.Initializable):
     # memory usage for 100000 trades: approx 180 Mo
     MAX_TRADES_COUNT = constants.MAX_TRADES_COUNT
+    # older trades are moved to trades_archive when enabled
+    ENABLE_TRADES_ARCHIVE = constants.ENABLE_TRADES_ARCHIVE
 
     def __init__(self, trader):
         super().__init__()
         self.logger = logging.get_logger(self.__class__.__name__)
         self.trader = trader
         self.trades_initialized = False
-        self.trades: collections.OrderedDict[str, personal_data.Trade] = collections.OrderedDict()
+        # order ids indexes and paid fees totals of trades
+        self.trades_index = trades_index.TradesIndex()
+        self._trades = trades_index.IndexedTrades(self.trades_index)
+        self.trades_archive: typing.Optional[trades_archive.TradesArchive] = (
+            trades_archive.TradesArchive(constants.MAX_ARCHIVED_TRADES_COUNT) if self.ENABLE_TRADES_ARCHIVE else None
+        )
+
+    @property
+    def trades(self) -> collections.OrderedDict[str, trade_class.Trade]:
+        return self._trades
+
+    @trades.setter
+    def trades(self, trades):
+        # keep trades_index in sync with the new trades
+        self.trades_index.clear()
+        self._trades = trades_index.IndexedTrades(self.trades_index, trades)
 
     async def initialize_impl(self):
         await self.reload_history(False)
@@ -74,11 +95,14 @@ class TradesManager(util.Initializable):
                 f"{trade.symbol} at {trade.origin_price}"
             )
             return False
+        if trade.fee is None and trade.status is not enums.OrderStatus.CANCELED:
+            self.logger.warning(
+                f"Trade without any registered fee: {trade.symbol} trade {trade_id} from order {trade.origin_order_id}"
+            )
         self.trades[trade_id] = trade
         self._check_trades_size()
         return True
 
-
     def has_closing_trade_with_exchange_order_id(self, exchange_order_id) -> bool:
         for trade in self.get_trades(exchange_order_id=exchange_order_id):
             if trade.is_closing_order:
@@ -86,19 +110,24 @@ class TradesManager(util.Initializable):
         return False
 
     def get_total_paid_fees(self):
-        total_fees = {}
-        for trade in self.trades.values():
-            if trade.fee is not None:
-                fee_cost = trade.fee[enums.FeePropertyColumns.COST.value]
-                fee_currency = trade.fee[enums.FeePropertyColumns.CURRENCY.value]
-                if fee_currency in total_fees:
-                    total_fees[fee_currency] += fee_cost
-                else:
-                    total_fees[fee_currency] = fee_cost
-            elif trade.status is not enums.OrderStatus.CANCELED:
-                self.logger.warning(f"Trade without any registered fee: {trade.to_dict()}")
+        total_fees = self.trades_index.get_paid_fees()
+        if self.trades_archive is not None:
+            for fee_currency, fee_cost in self.trades_archive.get_paid_fees().items():
+                total_fees[fee_currency] = total_fees.get(fee_currency, constants.ZERO) + decimal.Decimal(str(fee_cost))
         return total_fees
 
+    def get_realized_pnl(self, symbol: str, since=None, until=None) -> decimal.Decimal:
+        """
+        :return: the profit realized by the symbol sell trades using the average cost method, fees excluded.
+        Archived trades are included: the result doesn't change when trades are archived
+        """
+        archive = self.trades_archive
+        if archive is None:
+            archive = trades_archive.TradesArchive(self.MAX_TRADES_COUNT)
+        return decimal.Decimal(str(
+            archive.get_realized_pnl(symbol, since=since, until=until, recent_trades=self.trades.values())
+        ))
+
     def get_completed_trade_pnl(
         self, trade_id: typing.Optional[str], order_id: typing.Optional[str]
     ) -> typing.Optional[trade_pnl.TradePnl]:
@@ -109,6 +138,10 @@ class TradesManager(util.Initializable):
         return pnls[0] if pnls else None
 
     def get_completed_trades_pnl(self, trades_history=None, selected_trades=None) -> list[trade_pnl.TradePnl]:
+        """
+        :return: the TradePnl of each exit trade associated to its entry trade. Archived trades are not
+        available as entries: use get_realized_pnl for profits including archived trades
+        """
         trades = trades_history or self.get_trades()
         trades_by_order_id = {
             trade.origin_order_id: trade
@@ -140,14 +173,15 @@ class TradesManager(util.Initializable):
         return None
 
     def get_trades(self, origin_order_id=None, exchange_order_id=None):
-        return [
-            trade
-            for trade in self.trades.values()
-            if (
-                (not origin_order_id or trade.origin_order_id == origin_order_id)
-                and (not exchange_order_id or trade.exchange_order_id == exchange_order_id)
-            )
-        ]
+        if origin_order_id:
+            return [
+                trade
+                for trade in self.trades_index.get_trades(trades_index.ORIGIN_ORDER_ID, origin_order_id)
+                if not exchange_order_id or trade.exchange_order_id == exchange_order_id
+            ]
+        if exchange_order_id:
+            return self.trades_index.get_trades(trades_index.EXCHANGE_ORDER_ID, exchange_order_id)
+        return list(self.trades.values())
 
     # private
     def _check_trades_size(self):
@@ -157,6 +191,8 @@ class TradesManager(util.Initializable):
     def _reset_trades(self):
         self.trades_initialized = False
         self.trades = collections.OrderedDict()
+        if self.trades_archive is not None:
+            self.trades_archive.reset()
 
     async def _load_trades_history(self, reset):
         if self.trader.exchange_manager.is_backtesting:
@@ -205,8 +241,11 @@ class TradesManager(util.Initializable):
         popped = []
         for _ in range(nb_to_remove):
             popped.append(self.trades.popitem(last=False)[1])
+        if self.trades_archive is not None:
+            self.trades_archive.add_trades(popped)
         self.logger.info(
-            f"Cleared the {len(popped)} {self.trader.exchange_manager.exchange_name} oldest historical trades: "
+            f"{'Archived' if self.trades_archive is not None else 'Cleared'} the {len(popped)} "
+            f"{self.trader.exchange_manager.exchange_name} oldest historical trades: "
             f"{dict(self._get_trades_count_by_symbols(trades=popped))}"
         )
 
@@ -30,6 +30,7 @@ def compute_win_rate(exchange_manager):
     lost_trades_count = constants.ZERO
     won_trades_count = constants.ZERO
     entries = constants.ZERO
+    archive = exchange_manager.exchange_personal_data.trades_manager.trades_archive
     if exchange_manager.is_future:
         for trade in exchange_manager.exchange_personal_data.trades_manager.trades.values():
             if trade.status is trading_enums.OrderStatus.FILLED:
@@ -40,6 +41,11 @@ def compute_win_rate(exchange_manager):
                         won_trades_count += constants.ONE
                 else:
                     entries += constants.ONE
+        if archive is not None:
+            archived_lost_trades_count = archive.count_filled_trades(reduce_only=True, trade_types=_LOSING_ORDER_TYPES)
+            lost_trades_count += archived_lost_trades_count
+            won_trades_count += archive.count_filled_trades(reduce_only=True) - archived_lost_trades_count
+            entries += archive.count_filled_trades(reduce_only=False)
         total_exits = lost_trades_count + won_trades_count
         if total_exits > entries:
             # multiple take profits and SL not handled yet
@@ -64,6 +70,14 @@ def compute_win_rate(exchange_manager):
                     lost_trades_count += constants.ONE
                 else:
                     won_trades_count += constants.ONE
+        if archive is not None:
+            archived_lost_trades_count = archive.count_filled_trades(
+                side=trading_enums.TradeOrderSide.SELL, trade_types=_LOSING_ORDER_TYPES
+            )
+            lost_trades_count += archived_lost_trades_count
+            won_trades_count += (
+                archive.count_filled_trades(side=trading_enums.TradeOrderSide.SELL) - archived_lost_trades_count
+            )
     total_counted_trades = won_trades_count + lost_trades_count
     if total_counted_trades > constants.ZERO:
         return won_trades_count / total_counted_trades
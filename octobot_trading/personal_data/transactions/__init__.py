@@ -17,6 +17,7 @@
 from octobot_trading.personal_data.transactions import transactions_manager
 from octobot_trading.personal_data.transactions import transaction_factory
 from octobot_trading.personal_data.transactions import transaction
+from octobot_trading.personal_data.transactions import equity_curve_tracker
 from octobot_trading.personal_data.transactions import types
 
 from octobot_trading.personal_data.transactions.transactions_manager import (
@@ -31,6 +32,9 @@ from octobot_trading.personal_data.transactions.transaction_factory import (
 from octobot_trading.personal_data.transactions.transaction import (
     Transaction,
 )
+from octobot_trading.personal_data.transactions.equity_curve_tracker import (
+    EquityCurveTracker,
+)
 from octobot_trading.personal_data.transactions.types import (
     BlockchainTransaction,
     FeeTransaction,
@@ -41,6 +45,7 @@ from octobot_trading.personal_data.transactions.types import (
 __all__ = [
     "TransactionsManager",
     "Transaction",
+    "EquityCurveTracker",
     "BlockchainTransaction",
     "FeeTransaction",
     "RealisedPnlTransaction",
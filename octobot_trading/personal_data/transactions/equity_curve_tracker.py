@@ -0,0 +1,44 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import octobot_trading.constants as constants
+
+
+class EquityCurveTracker:
+    """
+    EquityCurveTracker keeps the equity curve peak value and draw downs up to date from each realized pnl
+    """
+
+    def __init__(self, origin_value):
+        self.origin_value = origin_value
+        self.current_value = origin_value
+        self.peak_value = origin_value
+
+        # draw downs in % from peak_value
+        self.current_draw_down = constants.ZERO
+        self.max_draw_down = constants.ZERO
+
+    def update(self, pnl):
+        """
+        Add pnl to the equity curve
+        :param pnl: the realized pnl
+        """
+        self.current_value += pnl
+        if self.current_value > self.peak_value:
+            self.peak_value = self.current_value
+        self.current_draw_down = constants.ONE_HUNDRED - \
+            (self.current_value / (self.peak_value / constants.ONE_HUNDRED))
+        if self.current_draw_down > self.max_draw_down:
+            self.max_draw_down = self.current_draw_down
@@ -19,6 +19,7 @@ import octobot_commons.logging as logging
 
 import octobot_trading.errors as errors
 import octobot_trading.util as util
+import octobot_trading.personal_data.transactions.equity_curve_tracker as equity_curve_tracker
 
 
 class TransactionsManager(util.Initializable):
@@ -28,6 +29,8 @@ class TransactionsManager(util.Initializable):
         super().__init__()
         self.logger = logging.get_logger(self.__class__.__name__)
         self.transactions = collections.OrderedDict()
+        # equity curve of the realized pnl from transactions, created on the first get_equity_curve_tracker call
+        self.equity_curve_tracker = None
 
     async def initialize_impl(self):
         self._reset_transactions()
@@ -41,7 +44,9 @@ class TransactionsManager(util.Initializable):
         :param replace_if_exists: When True, replaces the transaction if a transaction has the same transaction_id
         """
         if transaction.transaction_id not in self.transactions or replace_if_exists:
+            is_new_transaction = transaction.transaction_id not in self.transactions
             self.transactions[transaction.transaction_id] = transaction
+            self._update_equity_curve_tracker(transaction, is_new_transaction)
             self._check_transactions_size()
         else:
             raise errors.DuplicateTransactionIdError(
@@ -70,21 +75,64 @@ class TransactionsManager(util.Initializable):
         try:
             self.insert_transaction_instance(transaction, replace_if_exists=replace_if_exists)
             self.transactions.pop(transaction_id)
+            # transactions order changed
+            self.equity_curve_tracker = None
         except errors.DuplicateTransactionIdError as e:
             transaction.set_transaction_id(transaction_id)
             raise errors.DuplicateTransactionIdError from e
 
+    def get_equity_curve_tracker(self, origin_value):
+        """
+        Return the equity curve tracker of the transactions realized pnl starting from :origin_value:
+        Can raise any error related to the transactions pnl
+        :param origin_value: the equity curve initial value
+        :return: the up to date EquityCurveTracker
+        """
+        if self.equity_curve_tracker is None or self.equity_curve_tracker.origin_value != origin_value:
+            # stays None when a transaction pnl can't be added
+            self.equity_curve_tracker = None
+            tracker = equity_curve_tracker.EquityCurveTracker(origin_value)
+            for transaction in self.transactions.values():
+                if (pnl := self._get_transaction_pnl(transaction)) is not None:
+                    tracker.update(pnl)
+            self.equity_curve_tracker = tracker
+        return self.equity_curve_tracker
+
     # private
+    def _update_equity_curve_tracker(self, transaction, is_new_transaction):
+        if self.equity_curve_tracker is None:
+            return
+        if not is_new_transaction:
+            # a previous transaction changed: recompute on the next get_equity_curve_tracker call
+            self.equity_curve_tracker = None
+            return
+        try:
+            if (pnl := self._get_transaction_pnl(transaction)) is not None:
+                self.equity_curve_tracker.update(pnl)
+        except Exception:
+            # errors are raised on the next get_equity_curve_tracker call
+            self.equity_curve_tracker = None
+
+    @staticmethod
+    def _get_transaction_pnl(transaction):
+        if hasattr(transaction, "quantity"):
+            return transaction.quantity
+        # None for transactions without pnl (ex: transfers): they are not part of the equity curve
+        return getattr(transaction, "realised_pnl", None)
+
     def _check_transactions_size(self):
         if len(self.transactions) > self.MAX_TRANSACTIONS_COUNT:
             self._remove_oldest_transactions(int(self.MAX_TRANSACTIONS_COUNT / 10))
 
     def _reset_transactions(self):
         self.transactions = collections.OrderedDict()
+        self.equity_curve_tracker = None
 
     def _remove_oldest_transactions(self, nb_to_remove):
         for _ in range(nb_to_remove):
             self.transactions.popitem(last=False)
+        # equity curve now starts from a more recent transaction
+        self.equity_curve_tracker = None
 
     def clear(self):
         self._reset_transactions()
@@ -39,6 +39,7 @@ from octobot_trading.signals.signal_creation import (
     should_emit_trading_signal,
     create_order,
     cancel_order,
+    cancel_orders,
     edit_order,
     set_leverage,
 )
@@ -57,6 +58,7 @@ __all__ = [
     "should_emit_trading_signal",
     "create_order",
     "cancel_order",
+    "cancel_orders",
     "edit_order",
     "set_leverage",
 ]
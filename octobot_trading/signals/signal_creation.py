@@ -115,6 +115,21 @@ async def cancel_order(exchange_manager, should_emit_signal, order, ignored_orde
     return cancelled
 
 
+async def cancel_orders(exchange_manager, should_emit_signal, symbol, orders, wait_for_cancelling=True,
+                        cancelling_timeout=constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT) -> (bool, list):
+    all_cancelled, cancelled_orders = await exchange_manager.trader.cancel_symbol_orders(
+        symbol, orders,
+        wait_for_cancelling=wait_for_cancelling,
+        cancelling_timeout=cancelling_timeout
+    )
+    if should_emit_signal:
+        for order in cancelled_orders:
+            signals.SignalPublisher.instance().get_signal_bundle_builder(order.symbol).add_cancelled_order(
+                order, exchange_manager
+            )
+    return all_cancelled, cancelled_orders
+
+
 async def edit_order(
     exchange_manager,
     should_emit_signal,
@@ -13,8 +13,30 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
-
+import numpy as np
 import pytest
 
+from octobot_commons.enums import PriceIndexes
+from octobot_trading.api.symbol_data import get_candles_as_list
+
 # All test coroutines will be treated as marked.
 pytestmark = pytest.mark.asyncio
+
+
+async def test_get_candles_as_list():
+    candles_arrays = {
+        PriceIndexes.IND_PRICE_TIME.value: np.array([1, 2], dtype=np.int64),
+        PriceIndexes.IND_PRICE_OPEN.value: np.array([10.0, 11.0]),
+        PriceIndexes.IND_PRICE_HIGH.value: np.array([12.0, 13.0]),
+        PriceIndexes.IND_PRICE_LOW.value: np.array([9.0, 10.0]),
+        PriceIndexes.IND_PRICE_CLOSE.value: np.array([11.0, 12.0]),
+        # longer array
+        PriceIndexes.IND_PRICE_VOL.value: np.array([100.0, 200.0, 300.0]),
+    }
+    candles = get_candles_as_list(candles_arrays)
+    assert candles == [
+        [1, 10.0, 12.0, 9.0, 11.0, 100.0],
+        [2, 11.0, 13.0, 10.0, 12.0, 200.0],
+    ]
+    # candles arrays value types are kept
+    assert all(isinstance(candle[PriceIndexes.IND_PRICE_TIME.value], np.int64) for candle in candles)
@@ -0,0 +1,51 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+from octobot_commons.enums import TimeFrames
+from octobot_trading.exchange_data.kline.channel.kline_updater import KlineUpdater
+from octobot_trading.exchange_data.ohlcv.candles_aggregator import CandlesAggregator
+
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager
+from tests.exchange_data.ohlcv.test_candles_aggregator import _aggregate, _gen_candles
+
+pytestmark = pytest.mark.asyncio
+
+SYMBOL = "BTC/USDT"
+
+
+async def test_get_aggregated_kline(simulated_exchange_manager):
+    updater = KlineUpdater(mock.Mock(exchange_manager=simulated_exchange_manager))
+    symbol_data = simulated_exchange_manager.get_symbol_data(SYMBOL)
+    candles = _gen_candles(0, 10)
+    # candles aggregation is disabled
+    assert updater._get_aggregated_kline(SYMBOL, TimeFrames.FIVE_MINUTES) is None
+
+    symbol_data.candles_aggregator = CandlesAggregator(TimeFrames.ONE_MINUTE, [TimeFrames.FIVE_MINUTES])
+    symbol_data.candles_aggregator.add_closed_candles(candles[0:3])
+    # no source time frame kline
+    assert updater._get_aggregated_kline(SYMBOL, TimeFrames.FIVE_MINUTES) is None
+    symbol_data.symbol_klines[TimeFrames.ONE_MINUTE] = mock.Mock(kline=candles[3])
+    assert updater._get_aggregated_kline(SYMBOL, TimeFrames.FIVE_MINUTES) == _aggregate(candles[0:4])
+    # not an aggregated time frame
+    assert updater._get_aggregated_kline(SYMBOL, TimeFrames.ONE_HOUR) is None
+
+    # incomplete candle in construction: the kline has to be fetched
+    symbol_data.candles_aggregator = CandlesAggregator(TimeFrames.ONE_MINUTE, [TimeFrames.FIVE_MINUTES])
+    symbol_data.candles_aggregator.add_closed_candles(candles[0:1] + candles[2:3])
+    assert updater._get_aggregated_kline(SYMBOL, TimeFrames.FIVE_MINUTES) is None
@@ -21,7 +21,7 @@ from octobot_commons.enums import PriceIndexes, TimeFrames
 from octobot_trading.api.symbol_data import get_symbol_candles_manager
 from octobot_trading.exchange_data.ohlcv.candles_adapter import get_symbol_close_candles, get_symbol_open_candles, \
     get_symbol_low_candles, get_symbol_high_candles, get_symbol_time_candles, get_symbol_volume_candles, \
-    get_candle_as_list
+    get_candle_as_list, get_candles_matrix
 from octobot_trading.exchange_data.ohlcv.candles_manager import CandlesManager
 from octobot_trading.exchange_data.kline.kline_manager import KlineManager
 from octobot_trading.exchange_data.exchange_symbol_data import ExchangeSymbolData
@@ -153,3 +153,11 @@ def _get_candles(count=10):
 
 def _get_candle(seed):
     return [seed * (i + 1) * 1 / 3 for i, _ in enumerate(PriceIndexes)]
+
+
+async def test_get_candles_matrix(symbol_data, time_frame):
+    row_candles = _get_candles()
+    candles = get_symbol_candles_manager(symbol_data, time_frame).get_symbol_prices()
+    assert np.array_equal(get_candles_matrix(candles), np.array(row_candles, dtype=np.float64))
+    candles_limit_2 = get_symbol_candles_manager(symbol_data, time_frame).get_symbol_prices(limit=2)
+    assert get_candles_matrix(candles_limit_2).tolist() == row_candles[-2:]
@@ -0,0 +1,133 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+from octobot_commons.enums import PriceIndexes, TimeFrames
+from octobot_trading.exchange_data.ohlcv.candles_aggregator import CandlesAggregator, get_aggregated_time_frames, \
+    can_aggregate
+
+MINUTE = 60
+
+
+def test_can_aggregate():
+    assert can_aggregate(TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES)
+    assert can_aggregate(TimeFrames.ONE_MINUTE, TimeFrames.ONE_DAY)
+    assert can_aggregate(TimeFrames.FIVE_MINUTES, TimeFrames.FOUR_HOURS)
+    assert not can_aggregate(TimeFrames.ONE_MINUTE, TimeFrames.ONE_MINUTE)
+    assert not can_aggregate(TimeFrames.FIVE_MINUTES, TimeFrames.ONE_MINUTE)
+    assert not can_aggregate(TimeFrames.FIVE_MINUTES, TimeFrames.THREE_MINUTES)
+    # not aligned on days
+    assert not can_aggregate(TimeFrames.ONE_MINUTE, TimeFrames.ONE_WEEK)
+    assert not can_aggregate(TimeFrames.ONE_MINUTE, TimeFrames.ONE_MONTH)
+
+
+def test_get_aggregated_time_frames():
+    assert get_aggregated_time_frames([]) == (None, [])
+    assert get_aggregated_time_frames([TimeFrames.ONE_HOUR]) == (TimeFrames.ONE_HOUR, [])
+    assert get_aggregated_time_frames(
+        [TimeFrames.ONE_HOUR, TimeFrames.ONE_WEEK, TimeFrames.FIVE_MINUTES, TimeFrames.ONE_DAY]
+    ) == (TimeFrames.FIVE_MINUTES, [TimeFrames.ONE_HOUR, TimeFrames.ONE_DAY])
+
+
+def test_add_closed_candles():
+    aggregator = CandlesAggregator(TimeFrames.ONE_MINUTE, [TimeFrames.FIVE_MINUTES, TimeFrames.FIFTEEN_MINUTES])
+    candles = _gen_candles(0, 30)
+    closed_candles = aggregator.add_closed_candles(candles[:4])
+    assert closed_candles == []
+    closed_candles = aggregator.add_closed_candles(candles[:5])
+    assert closed_candles == [(TimeFrames.FIVE_MINUTES, _aggregate(candles[0:5]), True)]
+    # already added candles are ignored
+    assert aggregator.add_closed_candles(candles[:5]) == []
+    closed_candles = aggregator.add_closed_candles(candles[5:15])
+    assert closed_candles == [
+        (TimeFrames.FIVE_MINUTES, _aggregate(candles[5:10]), True),
+        (TimeFrames.FIVE_MINUTES, _aggregate(candles[10:15]), True),
+        (TimeFrames.FIFTEEN_MINUTES, _aggregate(candles[0:15]), True),
+    ]
+
+
+def test_add_closed_candles_from_incomplete_candle():
+    aggregator = CandlesAggregator(TimeFrames.ONE_MINUTE, [TimeFrames.FIVE_MINUTES])
+    candles = _gen_candles(0, 10)
+    # started in the middle of a 5m candle
+    assert aggregator.add_closed_candles(candles[2:5]) == [
+        (TimeFrames.FIVE_MINUTES, _aggregate(candles[2:5], start_time=0), False)
+    ]
+    assert aggregator.add_closed_candles(candles[5:10]) == [
+        (TimeFrames.FIVE_MINUTES, _aggregate(candles[5:10]), True)
+    ]
+
+
+def test_add_closed_candles_with_missing_candles():
+    aggregator = CandlesAggregator(TimeFrames.ONE_MINUTE, [TimeFrames.FIVE_MINUTES])
+    candles = _gen_candles(0, 10)
+    # last candle of the first 5m candle is missing
+    assert aggregator.add_closed_candles(candles[0:4]) == []
+    assert aggregator.add_closed_candles(candles[5:7]) == [
+        (TimeFrames.FIVE_MINUTES, _aggregate(candles[0:4]), False)
+    ]
+    assert aggregator.add_closed_candles(candles[7:10]) == [
+        (TimeFrames.FIVE_MINUTES, _aggregate(candles[5:10]), True)
+    ]
+
+    aggregator = CandlesAggregator(TimeFrames.ONE_MINUTE, [TimeFrames.FIVE_MINUTES])
+    # a candle in the middle of the first 5m candle is missing
+    assert aggregator.add_closed_candles(candles[0:2] + candles[3:5]) == [
+        (TimeFrames.FIVE_MINUTES, _aggregate(candles[0:2] + candles[3:5]), False)
+    ]
+    assert aggregator.add_closed_candles(candles[5:10]) == [
+        (TimeFrames.FIVE_MINUTES, _aggregate(candles[5:10]), True)
+    ]
+
+
+def test_get_kline():
+    aggregator = CandlesAggregator(TimeFrames.ONE_MINUTE, [TimeFrames.FIVE_MINUTES])
+    candles = _gen_candles(0, 10)
+    # nothing added yet
+    assert aggregator.get_kline(TimeFrames.FIVE_MINUTES, candles[0]) is None
+    aggregator.add_closed_candles(candles[0:3])
+    assert aggregator.get_kline(TimeFrames.FIVE_MINUTES, candles[3]) == _aggregate(candles[0:4])
+    # source kline is not following added candles
+    assert aggregator.get_kline(TimeFrames.FIVE_MINUTES, candles[4]) is None
+    aggregator.add_closed_candles(candles[3:5])
+    # first candle of a new 5m candle
+    assert aggregator.get_kline(TimeFrames.FIVE_MINUTES, candles[5]) == _aggregate(candles[5:6])
+
+    # incomplete candle in construction
+    aggregator = CandlesAggregator(TimeFrames.ONE_MINUTE, [TimeFrames.FIVE_MINUTES])
+    aggregator.add_closed_candles(candles[1:3])
+    assert aggregator.get_kline(TimeFrames.FIVE_MINUTES, candles[3]) is None
+
+    # missing source candle in the candle in construction
+    aggregator = CandlesAggregator(TimeFrames.ONE_MINUTE, [TimeFrames.FIVE_MINUTES])
+    aggregator.add_closed_candles(candles[0:1] + candles[2:3])
+    assert aggregator.get_kline(TimeFrames.FIVE_MINUTES, candles[3]) is None
+
+
+def _aggregate(candles, start_time=None):
+    return [
+        candles[0][PriceIndexes.IND_PRICE_TIME.value] if start_time is None else start_time,
+        candles[0][PriceIndexes.IND_PRICE_OPEN.value],
+        max(candle[PriceIndexes.IND_PRICE_HIGH.value] for candle in candles),
+        min(candle[PriceIndexes.IND_PRICE_LOW.value] for candle in candles),
+        candles[-1][PriceIndexes.IND_PRICE_CLOSE.value],
+        sum(candle[PriceIndexes.IND_PRICE_VOL.value] for candle in candles),
+    ]
+
+
+def _gen_candles(start, size) -> list:
+    return [
+        [index * MINUTE, 100 + index % 7, 110 + index % 5, 90 - index % 3, 100 + index % 4, 10 + index]
+        for index in range(start, start + size)
+    ]
@@ -14,6 +14,7 @@
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
 import numpy as np
+import pytest
 
 from octobot_commons.enums import PriceIndexes
 from octobot_trading.exchange_data.ohlcv.candles_manager import CandlesManager
@@ -92,6 +93,35 @@ def test_get_symbol_prices():
     assert second_sym_price[PriceIndexes.IND_PRICE_TIME.value][-1] == second_candle[PriceIndexes.IND_PRICE_TIME.value]
 
 
+def test_get_candles_matrix():
+    candles_manager = CandlesManager()
+    assert candles_manager.get_candles_matrix().shape == (0, len(PriceIndexes))
+    assert candles_manager.get_candles() == []
+
+    candles = _gen_candles(10)
+    candles_manager.add_old_and_new_candles(candles)
+    matrix = candles_manager.get_candles_matrix()
+    assert matrix.shape == (10, len(PriceIndexes))
+    assert matrix.dtype == np.float64
+    assert np.array_equal(matrix, np.array(candles, dtype=np.float64))
+    assert np.array_equal(candles_manager.get_candles_matrix(3), np.array(candles[-3:], dtype=np.float64))
+    assert candles_manager.get_candles() == candles
+    assert candles_manager.get_candles(2) == candles[-2:]
+    # values are numpy values, as in candles arrays
+    assert all(isinstance(value, np.float64) for value in candles_manager.get_candles()[0])
+    # rows are not shared
+    candles_list = candles_manager.get_candles(2)
+    candles_list[0][0] = -1
+    assert candles_list[1][0] == candles[-1][0]
+
+    # when max candles count is reached
+    candles_manager = CandlesManager()
+    candles = _gen_candles(candles_manager.max_candles_count + 2)
+    candles_manager.add_old_and_new_candles(candles)
+    assert np.array_equal(candles_manager.get_candles_matrix(), np.array(candles[2:], dtype=np.float64))
+    assert candles_manager.get_candles(1) == candles[-1:]
+
+
 def test_get_symbol_candles_data():
     candles_manager = CandlesManager()
     _test_data(candles_manager.get_symbol_close_candles(), 0, np.nan)
@@ -111,6 +141,34 @@ def test_get_symbol_candles_data():
     _test_data(candles_manager.get_symbol_time_candles(), 2, new_candles[-1][PriceIndexes.IND_PRICE_TIME.value])
 
 
+def test_get_symbol_candles_data_as_view():
+    candles_manager = CandlesManager()
+    initial_version = candles_manager.candles_version
+    candles = _gen_candles(10)
+    candles_manager.add_old_and_new_candles(candles)
+    assert candles_manager.candles_version > initial_version
+
+    view = candles_manager.get_symbol_close_candles(3, as_view=True)
+    assert np.shares_memory(view, candles_manager.close_candles)
+    assert view.flags.writeable is False
+    with pytest.raises(ValueError):
+        view[0] = 1
+    assert np.array_equal(view, candles_manager.get_symbol_close_candles(3))
+    assert candles_manager.close_candles.flags.writeable is True
+    assert not np.shares_memory(candles_manager.get_symbol_close_candles(3), candles_manager.close_candles)
+
+    prices = candles_manager.get_symbol_prices(as_view=True)
+    assert all(values.flags.writeable is False and len(values) == 10 for values in prices.values())
+
+    # version only changes when candles change
+    version = candles_manager.candles_version
+    candles_manager.get_symbol_prices()
+    candles_manager.add_old_and_new_candles(candles)
+    assert candles_manager.candles_version == version
+    candles_manager.upsert_candle(candles[-1])
+    assert candles_manager.candles_version > version
+
+
 def test_reach_max_candles_count():
     candles_manager = CandlesManager()
     all_candles = _gen_candles(candles_manager.MAX_CANDLES_COUNT + 3)
@@ -155,6 +213,58 @@ def test_reach_max_candles_count_with_custom_candles_count():
                other_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value])
 
 
+def test_upsert_candle():
+    candles_manager = CandlesManager()
+    candles = _gen_candles(10)
+    candles_manager.add_old_and_new_candles(candles)
+
+    # current candle update
+    updated_candle = list(candles[-1])
+    updated_candle[PriceIndexes.IND_PRICE_HIGH.value] = 1
+    candles_manager.upsert_candle(updated_candle)
+    assert candles_manager.close_candles_index == 10
+    assert candles_manager.get_symbol_high_candles(1)[0] == 1
+
+    # older candle update
+    updated_candle = list(candles[2])
+    updated_candle[PriceIndexes.IND_PRICE_HIGH.value] = 2
+    candles_manager.upsert_candle(updated_candle)
+    assert candles_manager.close_candles_index == 10
+    assert candles_manager.high_candles[2] == 2
+
+    # new candle
+    new_candle = _gen_candles(11)[-1]
+    candles_manager.upsert_candle(new_candle)
+    assert candles_manager.close_candles_index == 11
+    assert candles_manager.get_symbol_close_candles(1)[0] == new_candle[PriceIndexes.IND_PRICE_CLOSE.value]
+
+    # already known candles are not added again
+    candles_manager.add_old_and_new_candles(_gen_candles(11))
+    assert candles_manager.close_candles_index == 11
+
+
+def test_reach_max_candles_count_keeps_candles_order():
+    candles_manager = CandlesManager()
+    all_candles = _gen_candles(candles_manager.max_candles_count + 5)
+    candles_manager.add_old_and_new_candles(all_candles)
+    expected_candles = all_candles[5:]
+    assert candles_manager.reached_max is True
+    assert np.array_equal(candles_manager.get_symbol_time_candles(),
+                          [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in expected_candles])
+    assert np.array_equal(candles_manager.get_symbol_close_candles(3),
+                          [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in expected_candles[-3:]])
+    assert candles_manager.close_candles[0] == expected_candles[0][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert candles_manager.close_candles[-1] == expected_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value]
+
+    # update a candle stored in a recycled slot
+    updated_candle = list(expected_candles[-2])
+    updated_candle[PriceIndexes.IND_PRICE_CLOSE.value] = 42
+    candles_manager.upsert_candle(updated_candle)
+    assert candles_manager.get_symbol_close_candles(2)[0] == 42
+    assert candles_manager.get_symbol_close_candles(2)[1] == expected_candles[-1][PriceIndexes.IND_PRICE_CLOSE.value]
+    assert len(candles_manager.get_symbol_close_candles()) == candles_manager.max_candles_count
+
+
 def _test_data(candles_data, expected_len, expected_last_val):
     assert len(candles_data) == expected_len
     if expected_len > 0:
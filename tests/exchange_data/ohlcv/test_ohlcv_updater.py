@@ -0,0 +1,124 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import mock
+import pytest
+
+from octobot_commons.enums import PriceIndexes, TimeFrames
+import octobot_trading.errors as errors
+from octobot_trading.exchange_data.ohlcv.channel.ohlcv_updater import OHLCVUpdater
+
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager
+from tests.exchange_data.ohlcv.test_candles_aggregator import _aggregate, _gen_candles
+
+pytestmark = pytest.mark.asyncio
+
+SYMBOL = "BTC/USDT"
+
+
+def _updater(exchange_manager, time_frames=(TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES)):
+    updater = OHLCVUpdater(mock.Mock(exchange_manager=exchange_manager))
+    with mock.patch.object(OHLCVUpdater, "ENABLE_CANDLES_AGGREGATION", True), \
+            mock.patch.object(updater, "_get_time_frames", mock.Mock(return_value=list(time_frames))), \
+            mock.patch.object(updater, "_get_traded_pairs", mock.Mock(return_value=[SYMBOL])), \
+            mock.patch.object(updater, "_should_maintain_candle", mock.Mock(return_value=True)):
+        updater._init_candles_aggregation()
+    for time_frame in time_frames:
+        updater._set_initialized(SYMBOL, time_frame, True)
+    return updater
+
+
+async def test_init_candles_aggregation(simulated_exchange_manager):
+    updater = OHLCVUpdater(mock.Mock(exchange_manager=simulated_exchange_manager))
+    time_frames = [TimeFrames.ONE_HOUR, TimeFrames.ONE_MINUTE, TimeFrames.FIVE_MINUTES, TimeFrames.ONE_WEEK]
+    with mock.patch.object(updater, "_get_time_frames", mock.Mock(return_value=time_frames)), \
+            mock.patch.object(updater, "_get_traded_pairs", mock.Mock(return_value=[SYMBOL])), \
+            mock.patch.object(updater, "_should_maintain_candle", mock.Mock(return_value=True)):
+        with mock.patch.object(OHLCVUpdater, "ENABLE_CANDLES_AGGREGATION", False):
+            updater._init_candles_aggregation()
+            assert updater.source_time_frame is None
+            assert updater.aggregated_time_frames == []
+        with mock.patch.object(OHLCVUpdater, "ENABLE_CANDLES_AGGREGATION", True):
+            updater._init_candles_aggregation()
+            assert updater.source_time_frame is TimeFrames.ONE_MINUTE
+            assert updater.aggregated_time_frames == [TimeFrames.ONE_HOUR, TimeFrames.FIVE_MINUTES]
+
+
+async def test_push_complete_candles_pushes_aggregated_candles(simulated_exchange_manager):
+    updater = _updater(simulated_exchange_manager)
+    candles = _gen_candles(0, 11)
+    with mock.patch.object(updater, "push", mock.AsyncMock()) as push_mock, \
+            mock.patch.object(simulated_exchange_manager.exchange, "get_symbol_prices", mock.AsyncMock()) \
+            as get_symbol_prices_mock:
+        # last candle is in construction
+        await updater._push_complete_candles(TimeFrames.ONE_MINUTE, SYMBOL, candles)
+        get_symbol_prices_mock.assert_not_called()
+        assert push_mock.mock_calls == [
+            mock.call(TimeFrames.ONE_MINUTE, SYMBOL, candles[:-1], partial=True),
+            mock.call(TimeFrames.FIVE_MINUTES, SYMBOL, [_aggregate(candles[0:5])], partial=True),
+            mock.call(TimeFrames.FIVE_MINUTES, SYMBOL, [_aggregate(candles[5:10])], partial=True),
+        ]
+
+
+async def test_push_complete_candles_fetches_incomplete_aggregated_candles(simulated_exchange_manager):
+    updater = _updater(simulated_exchange_manager)
+    candles = _gen_candles(0, 11)
+    fetched_candles = [_aggregate(candles[0:5]), _aggregate(candles[5:10]), _aggregate(candles[10:11])]
+    with mock.patch.object(updater, "push", mock.AsyncMock()) as push_mock, \
+            mock.patch.object(simulated_exchange_manager.exchange, "get_symbol_prices",
+                              mock.AsyncMock(return_value=fetched_candles)) as get_symbol_prices_mock:
+        # started in the middle of the first 5m candle
+        await updater._push_complete_candles(TimeFrames.ONE_MINUTE, SYMBOL, candles[2:6])
+        get_symbol_prices_mock.assert_awaited_once_with(SYMBOL, TimeFrames.FIVE_MINUTES, limit=updater.OHLCV_LIMIT)
+        assert push_mock.mock_calls == [
+            mock.call(TimeFrames.ONE_MINUTE, SYMBOL, candles[2:5], partial=True),
+            mock.call(TimeFrames.FIVE_MINUTES, SYMBOL, fetched_candles[:1], partial=True),
+        ]
+        get_symbol_prices_mock.reset_mock()
+        push_mock.reset_mock()
+        # 7th candle is missing: the aggregated candle is not pushed, it is fetched instead
+        await updater._push_complete_candles(TimeFrames.ONE_MINUTE, SYMBOL, candles[5:7])
+        await updater._push_complete_candles(TimeFrames.ONE_MINUTE, SYMBOL, candles[7:11])
+        get_symbol_prices_mock.assert_awaited_once_with(SYMBOL, TimeFrames.FIVE_MINUTES, limit=updater.OHLCV_LIMIT)
+        assert push_mock.mock_calls == [
+            mock.call(TimeFrames.ONE_MINUTE, SYMBOL, candles[5:6], partial=True),
+            mock.call(TimeFrames.ONE_MINUTE, SYMBOL, candles[7:10], partial=True),
+            mock.call(TimeFrames.FIVE_MINUTES, SYMBOL, fetched_candles[:2], partial=True),
+        ]
+        get_symbol_prices_mock.reset_mock()
+        push_mock.reset_mock()
+        # fetch error: incomplete candle is skipped
+        get_symbol_prices_mock.side_effect = errors.FailedRequest
+        await updater._push_complete_candles(TimeFrames.ONE_MINUTE, SYMBOL, candles[10:11] + _gen_candles(16, 2))
+        get_symbol_prices_mock.assert_awaited_once()
+        assert push_mock.mock_calls == [
+            mock.call(TimeFrames.ONE_MINUTE, SYMBOL, [candles[10], _gen_candles(16, 1)[0]], partial=True),
+        ]
+
+
+async def test_push_complete_candles_skips_uninitialized_aggregated_time_frames(simulated_exchange_manager):
+    updater = _updater(simulated_exchange_manager)
+    updater._set_initialized(SYMBOL, TimeFrames.FIVE_MINUTES, False)
+    candles = _gen_candles(0, 6)
+    with mock.patch.object(updater, "push", mock.AsyncMock()) as push_mock, \
+            mock.patch.object(simulated_exchange_manager.exchange, "get_symbol_prices", mock.AsyncMock()) \
+            as get_symbol_prices_mock:
+        await updater._push_complete_candles(TimeFrames.ONE_MINUTE, SYMBOL, candles)
+        get_symbol_prices_mock.assert_not_called()
+        push_mock.assert_awaited_once_with(TimeFrames.ONE_MINUTE, SYMBOL, candles[:-1], partial=True)
+    # aggregated candles are still built
+    assert simulated_exchange_manager.get_symbol_data(SYMBOL).candles_aggregator.last_source_candle_time == \
+        candles[-2][PriceIndexes.IND_PRICE_TIME.value]
@@ -0,0 +1,97 @@
+#  Drakkar-Software OctoBot
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+import pytest
+
+from octobot_commons.enums import PriceIndexes
+from octobot_trading.exchange_data.ohlcv.preloaded_candles_manager import PreloadedCandlesManager
+from tests import event_loop
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+
+async def test_add_old_and_new_candles():
+    candles = _gen_candles(100)
+    candles_manager = await _get_preloaded_candles_manager(candles)
+    assert candles_manager.get_preloaded_symbol_candles_count() == 100
+    assert candles_manager.time_candles_index == 0
+
+    candles_manager.add_old_and_new_candles(candles[:1])
+    assert candles_manager.time_candles_index == 0
+    candles_manager.add_old_and_new_candles(candles[:2])
+    assert candles_manager.time_candles_index == 1
+    candles_manager.add_old_and_new_candles(candles[:3])
+    assert candles_manager.time_candles_index == 3
+    for index in range(3, 50):
+        candles_manager.add_old_and_new_candles(candles[:index + 1])
+        assert candles_manager.time_candles_index == index + 1
+        assert candles_manager.get_symbol_close_candles(1)[0] == candles[index][PriceIndexes.IND_PRICE_CLOSE.value]
+    # same candle again
+    candles_manager.add_old_and_new_candles(candles[:50])
+    assert candles_manager.time_candles_index == 50
+
+    # jump to a future candle
+    candles_manager.add_old_and_new_candles(candles[:81])
+    assert candles_manager.time_candles_index == 81
+    assert candles_manager.get_symbol_close_candles(1)[0] == candles[80][PriceIndexes.IND_PRICE_CLOSE.value]
+
+    # past candle
+    candles_manager.add_old_and_new_candles(candles[:11])
+    assert candles_manager.time_candles_index == 10
+
+    # unknown candle
+    candles_manager.add_old_and_new_candles([[0.5, 1, 1, 1, 1, 1]])
+    assert candles_manager.time_candles_index == 10
+
+
+async def test_add_old_and_new_candles_with_unsorted_candles():
+    candles = _gen_candles(10)
+    candles[3], candles[4] = candles[4], candles[3]
+    candles_manager = await _get_preloaded_candles_manager(candles)
+    candles_manager.add_old_and_new_candles([candles[8]])
+    assert candles_manager.time_candles_index == 8
+    candles_manager.add_old_and_new_candles([candles[3]])
+    assert candles_manager.time_candles_index == 3
+    assert candles_manager.get_symbol_close_candles(3).tolist() == \
+        [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in candles[:3]]
+
+
+async def test_get_symbol_candles_data():
+    candles = _gen_candles(20)
+    candles_manager = await _get_preloaded_candles_manager(candles)
+    candles_manager.add_old_and_new_candles(candles[:5])
+    candles_manager.add_old_and_new_candles(candles[:6])
+    assert candles_manager.time_candles_index == 6
+    assert np.array_equal(candles_manager.get_symbol_time_candles(),
+                          [candle[PriceIndexes.IND_PRICE_TIME.value] for candle in candles[:6]])
+    view = candles_manager.get_symbol_close_candles(2, as_view=True)
+    assert view.flags.writeable is False
+    assert view.tolist() == [candle[PriceIndexes.IND_PRICE_CLOSE.value] for candle in candles[4:6]]
+    assert candles_manager.get_candles(2) == candles[4:6]
+
+
+async def _get_preloaded_candles_manager(candles):
+    candles_manager = PreloadedCandlesManager()
+    await candles_manager.initialize()
+    candles_manager.replace_all_candles(candles)
+    return candles_manager
+
+
+def _gen_candles(size) -> list:
+    return [[float(seed), seed * 10., seed * 100., seed * 1000., seed * 10000., seed * 100000.]
+            for seed in range(1, size + 1)]
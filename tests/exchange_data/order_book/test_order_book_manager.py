@@ -13,11 +13,13 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import zlib
 from copy import deepcopy
 
 import pytest
 import pytest_asyncio
 
+import octobot_trading.errors as errors
 from octobot_trading.exchange_data.order_book.order_book_manager import OrderBookManager
 from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC
 from octobot_trading.enums import TradeOrderSide
@@ -35,6 +37,13 @@ async def order_book_manager():
     return ob_manager
 
 
+@pytest_asyncio.fixture()
+async def compact_order_book_manager():
+    ob_manager = OrderBookManager(compact_l2=True)
+    await ob_manager.initialize()
+    return ob_manager
+
+
 async def test_init(order_book_manager):
     assert not order_book_manager.order_book_initialized
     assert order_book_manager.ask_quantity == 0
@@ -197,6 +206,239 @@ async def test_handle_book_updates(order_book_manager):
     assert get_order_at_id_in_order_list("6", order_book_manager.asks)[ECOBIC.SIZE.value] == order_6_2[ECOBIC.SIZE.value]
 
 
+async def test_handle_book_orders_index(order_book_manager):
+    orders = [
+        get_test_order(TradeOrderSide.BUY.value, str(order_id), order_price=10, order_size=order_id)
+        for order_id in range(5)
+    ]
+    order_book_manager.handle_book_adds(orders + [get_test_order(TradeOrderSide.SELL.value, "5", order_price=11)])
+    assert [order[ECOBIC.ORDER_ID.value] for order in order_book_manager.get_bids(10)] == ["0", "1", "2", "3", "4"]
+    order_book_manager.handle_book_deletes([orders[1]])
+    # orders keep their arrival order
+    assert [order[ECOBIC.ORDER_ID.value] for order in order_book_manager.get_bids(10)] == ["0", "2", "3", "4"]
+    order_book_manager.handle_book_updates([
+        get_test_order(TradeOrderSide.BUY.value, "4", order_price=10, order_size=40),
+        # unknown order or side
+        get_test_order(TradeOrderSide.BUY.value, "1", order_price=10, order_size=10),
+        get_test_order(TradeOrderSide.SELL.value, "3", order_price=10, order_size=30),
+    ])
+    assert [order[ECOBIC.SIZE.value] for order in order_book_manager.get_bids(10)] == [0, 2, 3, 40]
+    # already deleted
+    order_book_manager.handle_book_deletes([orders[1], get_test_order(TradeOrderSide.SELL.value, "0")])
+    assert len(order_book_manager.get_bids(10)) == 4
+    order_book_manager.handle_book_deletes([orders[0], orders[2], orders[3], orders[4]])
+    assert order_book_manager.get_bids(10) is None
+    assert order_book_manager.get_asks(11)
+    # re-added order
+    order_book_manager.handle_book_adds([orders[0], get_test_order(TradeOrderSide.BUY.value, "0", order_price=9)])
+    assert order_book_manager.get_bids(10) is None
+    assert order_book_manager.get_bids(9)[0][ECOBIC.ORDER_ID.value] == "0"
+    # level replaced without order ids
+    order_book_manager.bids[9] = [get_test_order(TradeOrderSide.BUY.value, None, order_price=9, order_size=1)]
+    order_book_manager.handle_book_deletes([orders[0]])
+    assert order_book_manager.get_bids(9)[0][ECOBIC.SIZE.value] == 1
+    # orders with and without ids in the same level
+    level_orders = [
+        get_test_order(TradeOrderSide.BUY.value, str(order_id), order_price=9, order_size=order_id)
+        for order_id in range(6, 9)
+    ]
+    order_book_manager.handle_book_adds(level_orders[:2])
+    order_book_manager.handle_book_adds([get_test_order(TradeOrderSide.BUY.value, None, order_price=9, order_size=2)])
+    order_book_manager.handle_book_adds(level_orders[2:])
+    order_book_manager.handle_book_deletes([level_orders[1]])
+    order_book_manager.handle_book_updates([get_test_order(TradeOrderSide.BUY.value, "6", order_price=9, order_size=60)])
+    assert [(order[ECOBIC.ORDER_ID.value], order[ECOBIC.SIZE.value]) for order in order_book_manager.get_bids(9)] \
+        == [(None, 1), ("6", 60), (None, 2), ("8", 8)]
+    # level replaced without order ids: re-added order is not confused with the previous one
+    order_book_manager.bids[9] = [get_test_order(TradeOrderSide.BUY.value, None, order_price=9, order_size=5)]
+    order_book_manager.handle_book_adds([level_orders[0]])
+    assert [order[ECOBIC.ORDER_ID.value] for order in order_book_manager.get_bids(9)] == [None, "6"]
+    order_book_manager.handle_book_deletes([level_orders[0], level_orders[2]])
+    assert [order[ECOBIC.SIZE.value] for order in order_book_manager.get_bids(9)] == [5]
+    order_book_manager.reset_order_book()
+    assert not order_book_manager._bids_orders_index
+    assert not order_book_manager._asks_orders_index
+
+
+async def test_compact_l2_handle_new_books(compact_order_book_manager):
+    ts = random_timestamp()
+    compact_order_book_manager.handle_new_books(
+        [[12, 1], [10, 2], [11, 0], [13, 4, "extra"]],
+        [[8, 3], [9, 5], [7, 0.5]],
+        timestamp=ts
+    )
+    assert compact_order_book_manager.order_book_initialized
+    assert compact_order_book_manager.timestamp == ts
+    assert not compact_order_book_manager.asks
+    assert not compact_order_book_manager.bids
+    assert len(compact_order_book_manager.l2_asks) == 3
+    assert len(compact_order_book_manager.l2_bids) == 3
+    assert compact_order_book_manager.l2_asks.prices.tolist() == [10, 12, 13]
+    assert compact_order_book_manager.l2_asks.sizes.tolist() == [2, 1, 4]
+    assert compact_order_book_manager.l2_bids.prices.tolist() == [9, 8, 7]
+    assert compact_order_book_manager.l2_bids.sizes.tolist() == [5, 3, 0.5]
+    prices, sizes = compact_order_book_manager.l2_bids.get_levels(2)
+    assert prices.tolist() == [9, 8]
+    assert sizes.tolist() == [5, 3]
+    with pytest.raises(ValueError):
+        prices[0] = 1
+
+    price, orders = compact_order_book_manager.get_ask()
+    assert price == 10
+    assert orders[0][ECOBIC.SIZE.value] == 2
+    assert orders[0][ECOBIC.SIDE.value] == TradeOrderSide.SELL.value
+    price, orders = compact_order_book_manager.get_bid()
+    assert price == 9
+    assert orders[0][ECOBIC.SIZE.value] == 5
+    assert orders[0][ECOBIC.SIDE.value] == TradeOrderSide.BUY.value
+    assert compact_order_book_manager.get_asks(13)[0][ECOBIC.SIZE.value] == 4
+    assert compact_order_book_manager.get_asks(11) is None
+    assert compact_order_book_manager.get_bids(8)[0][ECOBIC.SIZE.value] == 3
+    assert compact_order_book_manager.get_bids(10) is None
+
+    compact_order_book_manager.handle_new_books([], [[8, 3]])
+    assert len(compact_order_book_manager.l2_asks) == 0
+    with pytest.raises(IndexError):
+        compact_order_book_manager.get_ask()
+    assert compact_order_book_manager.get_bid()[0] == 8
+
+    compact_order_book_manager.reset_order_book()
+    assert len(compact_order_book_manager.l2_bids) == 0
+
+
+async def test_compact_l2_handle_new_books_random(order_book_manager, compact_order_book_manager):
+    asks = random_order_book_side(count=100)
+    bids = random_order_book_side(count=100)
+    order_book_manager.handle_new_books(deepcopy(asks), deepcopy(bids))
+    compact_order_book_manager.handle_new_books(asks, bids)
+    assert compact_order_book_manager.get_ask()[0] == order_book_manager.get_ask()[0]
+    assert compact_order_book_manager.get_bid()[0] == order_book_manager.get_bid()[0]
+
+
+async def test_compact_l2_handle_book_orders(compact_order_book_manager):
+    with pytest.raises(errors.NotSupported):
+        compact_order_book_manager.handle_book_adds([get_test_order(TradeOrderSide.BUY.value, "1")])
+    with pytest.raises(errors.NotSupported):
+        compact_order_book_manager.handle_book_deletes([get_test_order(TradeOrderSide.BUY.value, "1")])
+    with pytest.raises(errors.NotSupported):
+        compact_order_book_manager.handle_book_updates([get_test_order(TradeOrderSide.BUY.value, "1")])
+
+
+async def test_handle_book_deltas(order_book_manager, compact_order_book_manager):
+    for manager in (order_book_manager, compact_order_book_manager):
+        assert manager.handle_book_deltas([[10, 1]], []) is False
+        manager.handle_new_books([[10, 2], [11, 1], [12, 3]], [[9, 5], [8, 3]], sequence=10)
+        assert manager.sequence == 10
+        assert manager.handle_book_deltas(
+            [[11, 0], [10, 4], [10.5, 1], [13, 0]], [[9.5, 2], [8, 0], [7, 1]], timestamp=1, sequence=11
+        ) is True
+        assert manager.sequence == 11
+        assert manager.timestamp == 1
+        assert manager.get_ask()[0] == 10
+        assert manager.get_ask()[1][0][ECOBIC.SIZE.value] == 4
+        assert manager.get_asks(10.5)[0][ECOBIC.SIZE.value] == 1
+        assert manager.get_asks(11) is None
+        assert manager.get_bid()[0] == 9.5
+        assert manager.get_bids(8) is None
+        assert manager.get_bids(7)[0][ECOBIC.SIZE.value] == 1
+        # already applied update
+        assert manager.handle_book_deltas([[10, 0]], [], sequence=11) is True
+        assert manager.get_ask()[0] == 10
+        # multiple updates
+        assert manager.handle_book_deltas([[10, 0]], [], sequence=14, first_sequence=12) is True
+        assert manager.get_ask()[0] == 10.5
+        assert manager.sequence == 14
+        # missed updates
+        assert manager.handle_book_deltas([[10, 0]], [], sequence=16) is False
+        assert not manager.order_book_initialized
+        assert manager.sequence is None
+        with pytest.raises(IndexError):
+            manager.get_ask()
+
+
+async def test_handle_book_deltas_random(order_book_manager, compact_order_book_manager):
+    asks = random_order_book_side(count=100)
+    bids = random_order_book_side(count=100)
+    order_book_manager.handle_new_books(deepcopy(asks), deepcopy(bids))
+    compact_order_book_manager.handle_new_books(asks, bids)
+    for _ in range(20):
+        ask_deltas = random_order_book_side(count=10) + [[asks[0][0], 0], [asks[1][0], random_quantity()]]
+        bid_deltas = random_order_book_side(count=10) + [[bids[0][0], 0], [bids[1][0], random_quantity()]]
+        assert order_book_manager.handle_book_deltas(ask_deltas, bid_deltas)
+        assert compact_order_book_manager.handle_book_deltas(ask_deltas, bid_deltas)
+        assert compact_order_book_manager.get_checksum() == order_book_manager.get_checksum()
+    assert compact_order_book_manager.l2_asks.prices.tolist() == list(order_book_manager.asks.keys())
+    assert compact_order_book_manager.l2_bids.prices.tolist() == list(reversed(order_book_manager.bids.keys()))
+    assert compact_order_book_manager.l2_asks.sizes.tolist() == [
+        orders[0][ECOBIC.SIZE.value] for orders in order_book_manager.asks.values()
+    ]
+
+
+async def test_handle_book_deltas_checksum(order_book_manager, compact_order_book_manager):
+    for manager in (order_book_manager, compact_order_book_manager):
+        manager.handle_new_books([[10.0, 2.0], [11.0, 1.0]], [[9.0, 5.0]])
+        assert manager.get_checksum() == zlib.crc32(b"9.0:5.0:10.0:2.0:11.0:1.0")
+        checksum = zlib.crc32(b"9.0:5.0:10.0:3.0:11.0:1.0")
+        assert manager.handle_book_deltas([[10.0, 3.0]], [], checksum=checksum) is True
+        assert manager.handle_book_deltas([[10.0, 4.0]], [], checksum=checksum) is False
+        assert not manager.order_book_initialized
+
+        # raw exchange strings
+        manager.handle_new_books([[10.0, 2.0, "10.00", "2"], [11.0, 1.0, "11.00", "1"]], [[9.0, 5.0, "9.00", "5"]])
+        assert manager.get_checksum() == zlib.crc32(b"9.00:5:10.00:2:11.00:1")
+        checksum = zlib.crc32(b"9.00:5:10.00:3.5:11.00:1")
+        assert manager.handle_book_deltas([[10.0, 3.5, "10.00", "3.5"]], [], checksum=checksum) is True
+        checksum = zlib.crc32(b"9.00:5:11.00:1")
+        assert manager.handle_book_deltas([[10.0, 0, "10.00", "0"]], [], checksum=checksum) is True
+        assert manager.get_checksum() == checksum
+
+
+async def test_get_book_levels(order_book_manager, compact_order_book_manager):
+    for manager in (order_book_manager, compact_order_book_manager):
+        assert manager.get_book_levels() == ([], [])
+        manager.handle_new_books([[11, 1], [10, 2]], [[8, 3], [9, 5]])
+        manager.handle_book_deltas([[10, 0], [12, 3]], [[9.5, 2]])
+        assert manager.get_book_levels() == ([[11, 1], [12, 3]], [[9.5, 2], [9, 5], [8, 3]])
+
+
+async def test_order_book_analytics(order_book_manager, compact_order_book_manager):
+    for manager in (order_book_manager, compact_order_book_manager):
+        assert manager.get_spread() is None
+        assert manager.get_imbalance() is None
+        assert manager.get_vwap(TradeOrderSide.BUY, 1) is None
+        manager.handle_new_books([[10, 2], [11, 1], [12, 3]], [[9, 5], [8, 3]])
+        prices, cumulative_sizes = manager.get_depth(TradeOrderSide.BUY)
+        assert prices.tolist() == [10, 11, 12]
+        assert cumulative_sizes.tolist() == [2, 3, 6]
+        with pytest.raises(ValueError):
+            cumulative_sizes[0] = 1
+        prices, cumulative_sizes = manager.get_depth(TradeOrderSide.SELL.value)
+        assert prices.tolist() == [9, 8]
+        assert cumulative_sizes.tolist() == [5, 8]
+        assert manager.get_vwap(TradeOrderSide.BUY, 1) == 10
+        assert manager.get_vwap(TradeOrderSide.BUY, 4) == (2 * 10 + 11 + 12) / 4
+        assert manager.get_vwap(TradeOrderSide.BUY, 7) is None
+        assert manager.get_vwap(TradeOrderSide.SELL, 6) == (5 * 9 + 8) / 6
+        assert manager.get_price_impact(TradeOrderSide.BUY, 10) == 0
+        assert manager.get_price_impact(TradeOrderSide.BUY, 31) == pytest.approx((31 / 3 - 10) / 10)
+        assert manager.get_price_impact(TradeOrderSide.SELL, 53) == pytest.approx((9 - 53 / 6) / 9)
+        assert manager.get_price_impact(TradeOrderSide.SELL, 100) is None
+        assert manager.get_spread() == 1
+        assert manager.get_imbalance() == (8 - 6) / 14
+        assert manager.get_imbalance(depth=1) == (5 - 2) / 7
+
+        # cached until the next update
+        book_version = manager.book_version
+        assert manager.get_depth(TradeOrderSide.BUY)[1] is manager.get_depth(TradeOrderSide.BUY)[1]
+        manager.handle_book_deltas([[10, 0]], [])
+        assert manager.book_version == book_version + 1
+        assert manager.get_depth(TradeOrderSide.BUY)[1].tolist() == [1, 4]
+        assert manager.get_vwap(TradeOrderSide.BUY, 1) == 11
+        assert manager.get_spread() == 2
+        manager.reset_order_book()
+        assert manager.get_spread() is None
+
+
 def get_test_order(order_side, order_id, order_price=None, order_size=None):
     return {
         ECOBIC.SIDE.value: order_side,
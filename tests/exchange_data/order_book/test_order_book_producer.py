@@ -0,0 +1,131 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import mock
+import pytest
+
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+from octobot_trading.exchange_data.order_book.channel.order_book import OrderBookProducer
+from octobot_trading.exchange_data.order_book.order_book_manager import OrderBookManager
+
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager
+
+pytestmark = pytest.mark.asyncio
+
+SYMBOL = "BTC/USDT"
+
+
+def _producer(exchange_manager):
+    consumer = mock.Mock(queue=asyncio.Queue())
+    channel = mock.Mock(exchange_manager=exchange_manager, get_filtered_consumers=mock.Mock(return_value=[consumer]))
+    return OrderBookProducer(channel), consumer
+
+
+def _snapshot(asks, bids, nonce):
+    return {
+        enums.ExchangeConstantsOrderBookInfoColumns.ASKS.value: asks,
+        enums.ExchangeConstantsOrderBookInfoColumns.BIDS.value: bids,
+        enums.ExchangeConstantsOrderBookInfoColumns.NONCE.value: nonce,
+    }
+
+
+async def test_push_deltas(simulated_exchange_manager):
+    producer, consumer = _producer(simulated_exchange_manager)
+    symbol_data = simulated_exchange_manager.get_symbol_data(SYMBOL)
+    symbol_data.handle_order_book_update([[101.0, 1.0]], [[99.0, 1.0]], sequence=10)
+    with mock.patch.object(simulated_exchange_manager.exchange, "get_order_book", mock.AsyncMock()) \
+            as get_order_book_mock:
+        await producer.push_deltas(SYMBOL, [[102.0, 2.0]], [[99.0, 0.0]], sequence=11)
+        get_order_book_mock.assert_not_called()
+    assert consumer.queue.get_nowait()["asks"] == [[101.0, 1.0], [102.0, 2.0]]
+    assert symbol_data.order_book_manager.sequence == 11
+    assert producer._buffered_deltas == producer._resync_tasks == {}
+
+
+async def test_sequence_gap_resync_replays_buffered_deltas(simulated_exchange_manager):
+    producer, consumer = _producer(simulated_exchange_manager)
+    symbol_data = simulated_exchange_manager.get_symbol_data(SYMBOL)
+    symbol_data.handle_order_book_update([[101.0, 1.0]], [[99.0, 1.0]], sequence=10)
+    fetched = asyncio.Event()
+
+    async def _get_order_book(*_, **__):
+        await fetched.wait()
+        return _snapshot([[101.0, 3.0]], [[99.0, 3.0]], 12)
+
+    with mock.patch.object(simulated_exchange_manager.exchange, "get_order_book",
+                           mock.AsyncMock(side_effect=_get_order_book)) as get_order_book_mock:
+        # 11 is missing
+        await producer.push_deltas(SYMBOL, [[103.0, 1.0]], [], sequence=12)
+        assert SYMBOL in producer._resync_tasks
+        await asyncio.sleep(0)
+        get_order_book_mock.assert_awaited_once_with(SYMBOL, limit=constants.CCXT_WATCH_ORDER_BOOK_LIMIT)
+        # received during the resync: buffered and not sent
+        await producer.push_deltas(SYMBOL, [[104.0, 1.0]], [[98.0, 2.0]], sequence=13)
+        assert len(producer._buffered_deltas[SYMBOL]) == 2
+        assert consumer.queue.empty()
+        fetched.set()
+        await producer._resync_tasks[SYMBOL]
+    # snapshot at 12 with the already included sequence 12 skipped and 13 applied
+    update = consumer.queue.get_nowait()
+    assert update["asks"] == [[101.0, 3.0], [104.0, 1.0]]
+    assert update["bids"] == [[99.0, 3.0], [98.0, 2.0]]
+    assert symbol_data.order_book_manager.sequence == 13
+    assert producer._buffered_deltas == producer._resync_tasks == {}
+
+
+async def test_checksum_mismatch_resync(simulated_exchange_manager):
+    producer, consumer = _producer(simulated_exchange_manager)
+    symbol_data = simulated_exchange_manager.get_symbol_data(SYMBOL)
+    # the local 101.0 ask size is outdated
+    symbol_data.handle_order_book_update([[101.0, 1.0]], [[99.0, 1.0]])
+    exchange_book = OrderBookManager()
+    exchange_book.handle_new_books([[101.0, 2.0], [102.0, 1.0]], [[99.0, 1.0]])
+    with mock.patch.object(simulated_exchange_manager.exchange, "get_order_book",
+                           mock.AsyncMock(return_value=_snapshot([[101.0, 2.0]], [[99.0, 1.0]], None))) \
+            as get_order_book_mock:
+        await producer.push_deltas(SYMBOL, [[102.0, 1.0]], [], checksum=exchange_book.get_checksum())
+        assert SYMBOL in producer._resync_tasks
+        assert consumer.queue.empty()
+        await producer._resync_tasks[SYMBOL]
+        get_order_book_mock.assert_awaited_once_with(SYMBOL, limit=constants.CCXT_WATCH_ORDER_BOOK_LIMIT)
+    # the rejected deltas are applied on the snapshot and now match the checksum
+    assert consumer.queue.get_nowait()["asks"] == [[101.0, 2.0], [102.0, 1.0]]
+    assert symbol_data.order_book_manager.order_book_initialized
+    assert producer._buffered_deltas == producer._resync_tasks == {}
+
+
+async def test_stop_during_resync(simulated_exchange_manager):
+    producer, consumer = _producer(simulated_exchange_manager)
+    symbol_data = simulated_exchange_manager.get_symbol_data(SYMBOL)
+    symbol_data.handle_order_book_update([[101.0, 1.0]], [[99.0, 1.0]], sequence=10)
+    never_fetched = asyncio.Event()
+
+    async def _get_order_book(*_, **__):
+        await never_fetched.wait()
+
+    with mock.patch.object(simulated_exchange_manager.exchange, "get_order_book",
+                           mock.AsyncMock(side_effect=_get_order_book)):
+        await producer.push_deltas(SYMBOL, [[103.0, 1.0]], [], sequence=12)
+        resync_task = producer._resync_tasks[SYMBOL]
+        await asyncio.sleep(0)
+        await producer.stop()
+        assert producer._buffered_deltas == producer._resync_tasks == {}
+        await asyncio.gather(resync_task, return_exceptions=True)
+        assert resync_task.done()
+    assert consumer.queue.empty()
+    assert not symbol_data.order_book_manager.order_book_initialized
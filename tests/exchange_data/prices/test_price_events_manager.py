@@ -15,11 +15,15 @@
 #  License along with this library.
 import decimal
 import os
+import random
 import pytest
 from asyncio import Event
 from mock import patch, Mock
 
+import octobot_commons.asyncio_tools as asyncio_tools
+
 import octobot_trading.constants as trading_constants
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
 
 from tests.exchange_data import price_events_manager
 from tests import event_loop
@@ -171,3 +175,110 @@ async def test_remove_event(price_events_manager):
         price_events_manager.remove_event(event_2)
         assert event_2 not in price_events_manager.events
         assert len(price_events_manager.events) == 0
+
+
+async def test_check_events_ordering(price_events_manager):
+    above_events = [price_events_manager.new_event(decimal.Decimal(price), 10, True) for price in (5, 3, 4, 3)]
+    below_events = [price_events_manager.new_event(decimal.Decimal(price), 10, False) for price in (1, 2, 2)]
+    future_event = price_events_manager.new_event(decimal.Decimal(1), 20, True)
+    assert price_events_manager._check_events(decimal.Decimal("2.5"), 10) == []
+    assert price_events_manager._check_events(decimal.Decimal(3), 9) == []
+    assert price_events_manager._check_events(decimal.Decimal(3), 10) == [above_events[1], above_events[3]]
+    # events are returned in creation order
+    assert price_events_manager._check_events(decimal.Decimal(4), 20) == \
+        [above_events[1], above_events[2], above_events[3], future_event]
+    assert price_events_manager._check_events(decimal.Decimal(2), 10) == [below_events[1], below_events[2]]
+    assert price_events_manager._check_events(decimal.Decimal("0.5"), 10) == below_events
+
+    price_events_manager.handle_price(decimal.Decimal(3), 15)
+    assert above_events[1].is_set() and above_events[3].is_set()
+    assert not above_events[0].is_set() and not above_events[2].is_set()
+    assert not future_event.is_set()
+    assert len(price_events_manager.events) == 6
+    price_events_manager.remove_event(above_events[0])
+    price_events_manager.handle_price(decimal.Decimal(1), 30)
+    assert future_event.is_set()
+    assert all(event.is_set() for event in below_events)
+    assert not above_events[0].is_set()
+    assert price_events_manager.events == [(decimal.Decimal(4), 10, above_events[2], True)]
+    price_events_manager.reset()
+    assert not price_events_manager._events_index
+    assert not price_events_manager._above_triggers
+    assert not price_events_manager._below_triggers
+    assert not price_events_manager._pending_triggers
+
+
+async def test_future_events(price_events_manager):
+    events = [price_events_manager.new_event(decimal.Decimal(1), timestamp, True) for timestamp in (10, 20, 30)]
+    price_events_manager.handle_price(decimal.Decimal(2), 15)
+    assert events[0].is_set()
+    assert not events[1].is_set() and not events[2].is_set()
+    # future events are not in trigger lists
+    assert not price_events_manager._above_triggers
+    assert len(price_events_manager._pending_triggers) == 2
+    price_events_manager.remove_event(events[2])
+    assert price_events_manager.events == [(decimal.Decimal(1), 20, events[1], True)]
+    price_events_manager.handle_price(decimal.Decimal(2), 40)
+    assert events[1].is_set()
+    assert not events[2].is_set()
+    assert price_events_manager.events == []
+    assert not price_events_manager._pending_triggers
+
+
+async def test_check_batch_events(price_events_manager):
+    for _ in range(20):
+        price_events_manager.reset()
+        events = [
+            price_events_manager.new_event(decimal.Decimal(random.randint(1, 20)), random.randint(0, 20),
+                                           random.random() > 0.5, allow_instant_fill=False)
+            for _ in range(50)
+        ]
+        prices = [decimal.Decimal(random.randint(1, 20)) for _ in range(10)]
+        timestamps = [random.randint(0, 20) for _ in range(10)]
+        # events set by checking each price one after the other
+        ordered_expected_events = []
+        for price, timestamp in zip(prices, timestamps):
+            ordered_expected_events.extend(
+                event
+                for event in price_events_manager._check_events(price, timestamp)
+                if event not in ordered_expected_events
+            )
+        expected_events = set(ordered_expected_events)
+        assert price_events_manager._check_batch_events(prices, timestamps) == ordered_expected_events
+        price_events_manager.handle_recent_trades([
+            {ECOC.PRICE.value: float(price), ECOC.TIMESTAMP.value: timestamp}
+            for price, timestamp in zip(prices, timestamps)
+        ])
+        assert {event for event in events if event.is_set()} == expected_events
+        assert len(price_events_manager.events) == len(events) - len(expected_events)
+        assert price_events_manager.get_min_and_max_prices() == (min(prices), max(prices))
+
+
+async def test_new_event_with_callback(price_events_manager):
+    calls = []
+
+    async def callback():
+        calls.append(1)
+
+    async def failing_callback():
+        raise ZeroDivisionError
+
+    price_events_manager.handle_price(decimal.Decimal(5), 1)
+    # instantly set event: no callback
+    assert price_events_manager.new_event(decimal.Decimal(5), 0, True, callback=callback).is_set()
+    event_1 = price_events_manager.new_event(decimal.Decimal(10), 0, True, callback=failing_callback)
+    event_2 = price_events_manager.new_event(decimal.Decimal(10), 0, True, callback=callback)
+    removed_event = price_events_manager.new_event(decimal.Decimal(10), 0, True, callback=callback)
+    price_events_manager.remove_event(removed_event)
+    price_events_manager.handle_price(decimal.Decimal(10), 2)
+    assert event_1.is_set() and event_2.is_set()
+    assert calls == []
+    await asyncio_tools.wait_asyncio_next_cycle()
+    # failing callback did not stop the worker
+    assert calls == [1]
+    assert not price_events_manager._event_callbacks
+    price_events_manager.dispatch_callback(callback)
+    await asyncio_tools.wait_asyncio_next_cycle()
+    assert calls == [1, 1]
+    price_events_manager.stop()
+    assert price_events_manager._callbacks_worker is None
@@ -0,0 +1,81 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import random
+
+import pytest
+
+from octobot_trading.exchange_data.prices.recent_prices_window import RecentPricesWindow
+
+
+def test_add_and_get_min_and_max():
+    window = RecentPricesWindow(3)
+    assert len(window) == 0
+    with pytest.raises(IndexError):
+        window.get_min_and_max()
+    window.add(5, 1)
+    assert window.get_min_and_max() == (5, 5)
+    window.add(3, 2)
+    window.add(4, 3)
+    assert len(window) == 3
+    assert window.get_min_and_max() == (3, 5)
+    # 5 leaves the window
+    window.add(2, 4)
+    assert len(window) == 3
+    assert list(window.prices) == [(3, 2), (4, 3), (2, 4)]
+    assert window.get_min_and_max() == (2, 4)
+    window.clear()
+    assert len(window) == 0
+    with pytest.raises(IndexError):
+        window.get_min_and_max()
+
+
+def test_is_reached():
+    window = RecentPricesWindow(10)
+    assert not window.is_reached(1, 0, True)
+    assert not window.is_reached(1, 0, False)
+    for price, time in ((5, 1), (3, 2), (4, 3), (2, 4)):
+        window.add(price, time)
+    assert window.is_reached(5, 1, True)
+    assert not window.is_reached(5, 2, True)
+    assert window.is_reached(4, 2, True)
+    assert not window.is_reached(4.5, 3, True)
+    assert not window.is_reached(4, 5, True)
+    assert window.is_reached(2, 0, False)
+    assert window.is_reached(3, 2, False)
+    assert not window.is_reached(1, 0, False)
+    assert not window.is_reached(2, 5, False)
+
+
+@pytest.mark.parametrize("ordered_times", [True, False])
+def test_random_prices(ordered_times):
+    window = RecentPricesWindow(20)
+    prices = []
+    for time in range(300):
+        price = random.randint(1, 50)
+        if not ordered_times:
+            time = random.randint(0, 300)
+        window.add(price, time)
+        prices = (prices + [(price, time)])[-20:]
+        assert window.get_min_and_max() == (min(price for price, _ in prices), max(price for price, _ in prices))
+        checked_price = random.randint(1, 50)
+        checked_time = random.randint(time - 25, time + 1)
+        for above in (True, False):
+            assert window.is_reached(checked_price, checked_time, above) == any(
+                recent_time >= checked_time and (
+                    recent_price >= checked_price if above else recent_price <= checked_price
+                )
+                for recent_price, recent_time in prices
+            )
@@ -161,6 +161,55 @@ async def test_get_ccxt_order_type(ccxt_connector):
     assert ccxt_connector.get_ccxt_order_type(enums.TraderOrderType.SELL_MARKET) == enums.TradeOrderType.MARKET.value
 
 
+async def test_create_orders(ccxt_connector):
+    orders = [
+        {"symbol": "BTC/USDT", "type": "limit", "side": "buy", "amount": 1.0, "price": 100.0, "params": {}},
+        {"symbol": "BTC/USDT", "type": "limit", "side": "buy", "amount": 2.0, "price": 90.0, "params": {}},
+        {"symbol": "ETH/USDT", "type": "limit", "side": "sell", "amount": 3.0, "price": 10.0, "params": {}},
+    ]
+    created_orders = [
+        {"id": "1", "status": "open"},
+        {"info": {"code": 1}, "status": "rejected"},
+        {"id": "3", "status": "open"},
+    ]
+    with mock.patch.object(ccxt_connector.client, "has", {"createOrders": True}), \
+            mock.patch.object(ccxt_connector.client, "create_orders", mock.AsyncMock(return_value=created_orders)) \
+            as create_orders_mock, \
+            mock.patch.object(ccxt_connector.adapter, "adapt_order", mock.Mock(side_effect=lambda order, **_: order)) \
+            as adapt_order_mock:
+        assert ccxt_connector.supports_bulk_order_creation() is True
+        assert await ccxt_connector.create_orders(orders) == [created_orders[0], None, created_orders[2]]
+        create_orders_mock.assert_called_once_with(orders, params={})
+        assert adapt_order_mock.mock_calls == [
+            mock.call(created_orders[0], symbol="BTC/USDT", quantity=1.0),
+            mock.call(created_orders[2], symbol="ETH/USDT", quantity=3.0),
+        ]
+    with mock.patch.object(ccxt_connector.client, "has", {"createOrders": False}):
+        assert ccxt_connector.supports_bulk_order_creation() is False
+
+
+async def test_cancel_orders(ccxt_connector):
+    cancelled_orders = [
+        {"id": "1", "status": "canceled"},
+        {"id": "2", "status": "open"},
+        {"id": "3", "status": None},
+    ]
+    with mock.patch.object(ccxt_connector.client, "has", {"cancelOrders": True}), \
+            mock.patch.object(ccxt_connector.client, "cancel_orders", mock.AsyncMock(return_value=cancelled_orders)) \
+            as cancel_orders_mock:
+        assert ccxt_connector.supports_bulk_order_cancellation() is True
+        # 3 and 4 are not in response with a status: their status is unknown
+        assert await ccxt_connector.cancel_orders(["1", "2", "3", "4"], "BTC/USDT") == [
+            enums.OrderStatus.CANCELED,
+            enums.OrderStatus.PENDING_CANCEL,
+            enums.OrderStatus.UNKNOWN,
+            enums.OrderStatus.UNKNOWN,
+        ]
+        cancel_orders_mock.assert_called_once_with(["1", "2", "3", "4"], symbol="BTC/USDT", params={})
+    with mock.patch.object(ccxt_connector.client, "has", {"cancelOrders": False}):
+        assert ccxt_connector.supports_bulk_order_cancellation() is False
+
+
 async def test_get_trade_fee(exchange_manager, future_trader_simulator_with_default_linear):
     spot_fees_value = 0.001
     future_symbol = "BTC/USDT:USDT"
@@ -14,7 +14,10 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import decimal
+import mock
 import octobot_trading.exchanges as exchanges
+import octobot_trading.enums as enums
 import octobot_commons.enums as commons_enums
 import pytest
 
@@ -52,3 +55,65 @@ async def test_start_request_data_and_stop(default_rest_exchange):
         assert book
     finally:
         await default_rest_exchange.stop()
+
+
+async def test_supports_bulk_order_creation(default_rest_exchange):
+    with mock.patch.object(default_rest_exchange.connector, "supports_bulk_order_creation",
+                           mock.Mock(return_value=True)):
+        # opt-in
+        assert default_rest_exchange.supports_bulk_order_creation() is False
+        with mock.patch.object(MockedRestExchange, "SUPPORTS_BULK_ORDER_CREATION", True):
+            assert default_rest_exchange.supports_bulk_order_creation() is True
+
+            class CustomLimitOrderRestExchange(MockedRestExchange):
+                async def _create_limit_buy_order(self, *args, **kwargs):
+                    pass
+
+            # custom limit order creation: orders are created one by one
+            default_rest_exchange.__class__ = CustomLimitOrderRestExchange
+            assert default_rest_exchange.supports_bulk_order_creation() is False
+
+
+async def test_create_orders(default_rest_exchange):
+    orders_details = [
+        {
+            "order_type": enums.TraderOrderType.BUY_LIMIT,
+            "symbol": "BTC/USDT",
+            "quantity": decimal.Decimal(1),
+            "price": decimal.Decimal(100),
+            "side": enums.TradeOrderSide.BUY,
+            "current_price": decimal.Decimal(110),
+            "reduce_only": reduce_only,
+            "params": {"a": 1},
+        }
+        for reduce_only in (False, True)
+    ]
+    with mock.patch.object(default_rest_exchange.connector, "create_orders",
+                           mock.AsyncMock(return_value=[None, None])) as create_orders_mock:
+        assert await default_rest_exchange.create_orders(orders_details) == [None, None]
+        assert [order["params"] for order in create_orders_mock.mock_calls[0].args[0]] == [
+            {"a": 1}, {"a": 1, "reduceOnly": True}
+        ]
+        # details params are not updated
+        assert all(details["params"] == {"a": 1} for details in orders_details)
+    with pytest.raises(ValueError):
+        await default_rest_exchange.create_orders(orders_details + [{**orders_details[0], "symbol": "ETH/USDT"}])
+
+
+async def test_cancel_orders(default_rest_exchange):
+    with mock.patch.object(default_rest_exchange.connector, "cancel_orders", mock.AsyncMock(return_value=[
+        enums.OrderStatus.CANCELED, enums.OrderStatus.UNKNOWN, enums.OrderStatus.UNKNOWN
+    ])) as cancel_orders_mock, \
+            mock.patch.object(default_rest_exchange, "get_open_orders", mock.AsyncMock(
+                return_value=[{enums.ExchangeConstantsOrderColumns.EXCHANGE_ID.value: "2"}]
+            )) as get_open_orders_mock:
+        # unknown status orders are looked up in a single open orders request: 3 might be cancelled or filled
+        assert await default_rest_exchange.cancel_orders(["1", "2", "3"], "BTC/USDT") == [
+            enums.OrderStatus.CANCELED, enums.OrderStatus.PENDING_CANCEL, enums.OrderStatus.UNKNOWN
+        ]
+        cancel_orders_mock.assert_called_once_with(["1", "2", "3"], "BTC/USDT")
+        get_open_orders_mock.assert_called_once_with(symbol="BTC/USDT")
+        get_open_orders_mock.reset_mock()
+        cancel_orders_mock.return_value = [enums.OrderStatus.CANCELED]
+        assert await default_rest_exchange.cancel_orders(["1"], "BTC/USDT") == [enums.OrderStatus.CANCELED]
+        get_open_orders_mock.assert_not_called()
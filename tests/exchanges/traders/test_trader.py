@@ -13,6 +13,7 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import asyncio
 import copy
 import os
 import ccxt.async_support
@@ -1184,6 +1185,257 @@ async def test_create_order(future_trader_simulator_with_default_linear):
             )
 
 
+
+async def test_create_orders(future_trader_simulator_with_default_linear):
+    _, exchange_manager_inst, trader_inst, default_contract = future_trader_simulator_with_default_linear
+    limit_orders = [mock.Mock(order_type=TraderOrderType.BUY_LIMIT, symbol="BTC/USDT",
+                              is_self_managed=mock.Mock(return_value=False))
+                    for _ in range(5)]
+    other_symbol_limit_orders = [mock.Mock(order_type=TraderOrderType.SELL_LIMIT, symbol="ETH/USDT",
+                                           is_self_managed=mock.Mock(return_value=False))
+                                 for _ in range(2)]
+    lonely_limit_order = mock.Mock(order_type=TraderOrderType.SELL_LIMIT, symbol="SOL/USDT",
+                                   is_self_managed=mock.Mock(return_value=False))
+    market_order = mock.Mock(order_type=TraderOrderType.SELL_MARKET, symbol="BTC/USDT",
+                             is_self_managed=mock.Mock(return_value=False))
+    orders = limit_orders[:2] + [market_order] + other_symbol_limit_orders[:1] + limit_orders[2:] + \
+        [lonely_limit_order] + other_symbol_limit_orders[1:]
+
+    async def _create_new_orders(new_orders, *_, **__):
+        return [f"created {new_order.order_type}" for new_order in new_orders]
+
+    # simulated trader: orders are created one by one
+    with mock.patch.object(trader_inst, "create_order", mock.AsyncMock(return_value="created")) as create_order_mock, \
+            mock.patch.object(trader_inst, "_create_new_orders", mock.AsyncMock()) as _create_new_orders_mock:
+        assert await trader_inst.create_orders(orders) == ["created"] * 9
+        assert create_order_mock.call_count == 9
+        assert create_order_mock.mock_calls[2].args == (market_order, )
+        _create_new_orders_mock.assert_not_called()
+
+    trader_inst.simulate = False
+    try:
+        # real trader without bulk order creation: orders are created concurrently
+        with mock.patch.object(exchange_manager_inst.exchange, "supports_bulk_order_creation",
+                               mock.Mock(return_value=False)), \
+                mock.patch.object(trader_inst, "create_order", mock.AsyncMock(return_value="created")) \
+                as create_order_mock, \
+                mock.patch.object(trader_inst, "_create_new_orders", mock.AsyncMock()) as _create_new_orders_mock:
+            assert await trader_inst.create_orders(orders) == ["created"] * 9
+            assert create_order_mock.call_count == 9
+            _create_new_orders_mock.assert_not_called()
+
+        # real trader with bulk order creation: limit orders are created in bulk requests of a single symbol
+        with mock.patch.object(exchange_manager_inst.exchange, "supports_bulk_order_creation",
+                               mock.Mock(return_value=True)), \
+                mock.patch.object(exchange_manager_inst.exchange, "MAX_ORDERS_PER_BULK_CREATION", 2), \
+                mock.patch.object(trader_inst, "create_order", mock.AsyncMock(return_value="created")) \
+                as create_order_mock, \
+                mock.patch.object(trader_inst, "_create_new_orders", mock.AsyncMock(side_effect=_create_new_orders)) \
+                as _create_new_orders_mock:
+            assert await trader_inst.create_orders(orders, params={"a": 1}) == [
+                f"created {TraderOrderType.BUY_LIMIT}", f"created {TraderOrderType.BUY_LIMIT}", "created",
+                f"created {TraderOrderType.SELL_LIMIT}",
+                f"created {TraderOrderType.BUY_LIMIT}", f"created {TraderOrderType.BUY_LIMIT}",
+                f"created {TraderOrderType.BUY_LIMIT}", "created", f"created {TraderOrderType.SELL_LIMIT}",
+            ]
+            assert create_order_mock.mock_calls == [
+                mock.call(
+                    order, params={"a": 1}, wait_for_creation=True, raise_all_creation_error=False,
+                    creation_timeout=constants.INDIVIDUAL_ORDER_SYNC_TIMEOUT
+                )
+                for order in (market_order, lonely_limit_order)
+            ]
+            assert [call.args[0] for call in _create_new_orders_mock.mock_calls] == [
+                limit_orders[:2], limit_orders[2:4], limit_orders[4:], other_symbol_limit_orders
+            ]
+
+            # errors requiring actions are raised once every order has been processed
+            create_order_mock.reset_mock()
+            _create_new_orders_mock.reset_mock()
+            _create_new_orders_mock.side_effect = errors.MissingFunds
+            with pytest.raises(errors.MissingFunds):
+                await trader_inst.create_orders(orders)
+            assert create_order_mock.call_count == 2
+            assert _create_new_orders_mock.call_count == 4
+
+            # other errors are not raised
+            _create_new_orders_mock.side_effect = ZeroDivisionError
+            assert await trader_inst.create_orders(orders) == [
+                None, None, "created", None, None, None, None, "created", None
+            ]
+    finally:
+        trader_inst.simulate = True
+
+
+async def test_cancel_orders(future_trader_simulator_with_default_linear):
+    _, exchange_manager_inst, trader_inst, default_contract = future_trader_simulator_with_default_linear
+    orders_manager = exchange_manager_inst.exchange_personal_data.orders_manager
+
+    def _order(order_id, symbol, order_group=None):
+        return mock.Mock(
+            order_id=order_id, exchange_order_id=f"exchange_{order_id}", symbol=symbol, order_group=order_group,
+            is_open=mock.Mock(return_value=True), is_cancelled=mock.Mock(return_value=False),
+            is_cancelling=mock.Mock(return_value=False),
+            is_closed=mock.Mock(return_value=False), is_self_managed=mock.Mock(return_value=False),
+            is_waiting_for_chained_trigger=False, lock=asyncio.Lock(), on_cancel=mock.AsyncMock(), state=None
+        )
+
+    btc_orders = [_order(str(i), "BTC/USDT") for i in range(3)]
+    eth_orders = [_order(str(i), "ETH/USDT") for i in range(3, 5)]
+    open_orders = btc_orders + eth_orders + [_order("5", "ETH/USDT")]
+
+    def _get_open_orders(symbol=None, **_):
+        return [order for order in open_orders if order.symbol == symbol]
+
+    def _synchronized_state(order, is_cancelled_on_exchange):
+        async def _synchronize(force_synchronization=False):
+            order.is_cancelled.return_value = is_cancelled_on_exchange
+        return mock.Mock(
+            is_refreshing=mock.Mock(return_value=False), synchronize=mock.AsyncMock(side_effect=_synchronize),
+            is_pending=mock.Mock(return_value=False)
+        )
+
+    with mock.patch.object(orders_manager, "get_open_orders", mock.Mock(side_effect=_get_open_orders)), \
+            mock.patch.object(exchange_manager_inst.exchange, "get_open_orders", mock.AsyncMock(return_value=[])) \
+            as exchange_get_open_orders_mock, \
+            mock.patch.object(trader_inst, "cancel_order", mock.AsyncMock(return_value=True)) as cancel_order_mock, \
+            mock.patch.object(exchange_manager_inst.exchange, "cancel_all_orders", mock.AsyncMock()) \
+            as cancel_all_orders_mock, \
+            mock.patch.object(exchange_manager_inst.exchange, "cancel_orders", mock.AsyncMock(
+                return_value=[OrderStatus.CANCELED, OrderStatus.PENDING_CANCEL]
+            )) as cancel_orders_mock:
+        # simulated trader: orders are cancelled one by one
+        assert await trader_inst.cancel_orders(btc_orders + eth_orders) == (True, btc_orders + eth_orders)
+        assert cancel_order_mock.call_count == 5
+        cancel_all_orders_mock.assert_not_called()
+        cancel_orders_mock.assert_not_called()
+        cancel_order_mock.reset_mock()
+
+        trader_inst.simulate = False
+        try:
+            # real trader: all BTC/USDT orders are cancelled at once, ETH/USDT orders in a single bulk request
+            for order in btc_orders:
+                order.state = _synchronized_state(order, True)
+            with mock.patch.object(exchange_manager_inst.exchange, "supports_bulk_order_cancellation",
+                                   mock.Mock(return_value=True)):
+                assert await trader_inst.cancel_orders(btc_orders + eth_orders) == (True, btc_orders + eth_orders)
+            cancel_order_mock.assert_not_called()
+            cancel_all_orders_mock.assert_called_once_with("BTC/USDT")
+            cancel_orders_mock.assert_called_once_with(["exchange_3", "exchange_4"], "ETH/USDT")
+            # cancel all orders statuses are unknown: orders are synchronized with the exchange
+            exchange_get_open_orders_mock.assert_called_once_with(symbol="BTC/USDT")
+            for order in btc_orders:
+                order.state.synchronize.assert_awaited_once_with(force_synchronization=True)
+                order.on_cancel.assert_not_called()
+            assert [order.status for order in eth_orders] == [OrderStatus.CANCELED, OrderStatus.PENDING_CANCEL]
+            eth_orders[0].on_cancel.assert_called_once_with(force_cancel=True, is_from_exchange_data=False)
+            eth_orders[1].on_cancel.assert_called_once_with(force_cancel=False, is_from_exchange_data=False)
+            assert not any(order.lock.locked() for order in open_orders)
+            cancel_all_orders_mock.reset_mock()
+            cancel_orders_mock.reset_mock()
+
+            # an order is filled before cancel all orders: it is not cancelled
+            for order in btc_orders:
+                order.is_cancelled.return_value = False
+                order.state = _synchronized_state(order, order is not btc_orders[1])
+            assert await trader_inst.cancel_orders(btc_orders) == (False, [btc_orders[0], btc_orders[2]])
+            cancel_all_orders_mock.assert_called_once_with("BTC/USDT")
+            cancel_order_mock.assert_not_called()
+            btc_orders[1].on_cancel.assert_not_called()
+            cancel_all_orders_mock.reset_mock()
+
+            # orders are being created: cancel all orders is not used
+            for order in btc_orders:
+                order.is_cancelled.return_value = False
+                order.state = None
+            orders_manager.pending_creation_orders.append(_order("6", "BTC/USDT"))
+            try:
+                with mock.patch.object(exchange_manager_inst.exchange, "supports_bulk_order_cancellation",
+                                       mock.Mock(return_value=True)):
+                    assert await trader_inst.cancel_orders(btc_orders[:2]) == (True, btc_orders[:2])
+                cancel_all_orders_mock.assert_not_called()
+                cancel_orders_mock.assert_called_once_with(["exchange_0", "exchange_1"], "BTC/USDT")
+            finally:
+                orders_manager.pending_creation_orders.clear()
+            with exchange_manager_inst.exchange.creating_order(None, "BTC/USDT", None, None), \
+                    mock.patch.object(exchange_manager_inst.exchange, "supports_bulk_order_cancellation",
+                                      mock.Mock(return_value=False)):
+                assert exchange_manager_inst.exchange.is_creating_symbol_orders("BTC/USDT")
+                assert not exchange_manager_inst.exchange.is_creating_symbol_orders("ETH/USDT")
+                assert await trader_inst.cancel_orders(btc_orders) == (True, btc_orders)
+            assert not exchange_manager_inst.exchange.is_creating_symbol_orders("BTC/USDT")
+            cancel_all_orders_mock.assert_not_called()
+            assert [call.args[0] for call in cancel_order_mock.mock_calls] == btc_orders
+            cancel_order_mock.reset_mock()
+            cancel_orders_mock.reset_mock()
+
+            # real trader without bulk cancel: orders are cancelled one by one
+            with mock.patch.object(exchange_manager_inst.exchange, "supports_bulk_order_cancellation",
+                                   mock.Mock(return_value=False)):
+                assert await trader_inst.cancel_orders(eth_orders) == (True, eth_orders)
+            assert [call.args[0] for call in cancel_order_mock.mock_calls] == eth_orders
+            cancel_orders_mock.assert_not_called()
+            cancel_order_mock.reset_mock()
+
+            # bulk request error: orders are cancelled one by one
+            cancel_orders_mock.side_effect = errors.FailedRequest
+            with mock.patch.object(exchange_manager_inst.exchange, "supports_bulk_order_cancellation",
+                                   mock.Mock(return_value=True)):
+                assert await trader_inst.cancel_orders(eth_orders) == (True, eth_orders)
+            cancel_orders_mock.assert_called_once()
+            assert [call.args[0] for call in cancel_order_mock.mock_calls] == eth_orders
+            assert not any(order.lock.locked() for order in open_orders)
+            cancel_order_mock.reset_mock()
+
+            # orders of unknown cancel status are synchronized with the exchange
+            cancel_orders_mock.side_effect = None
+            cancel_orders_mock.return_value = [OrderStatus.CANCELED, OrderStatus.UNKNOWN]
+            eth_orders[1].on_cancel.reset_mock()
+            eth_orders[1].state = mock.Mock(
+                is_refreshing=mock.Mock(return_value=False), synchronize=mock.AsyncMock(),
+                is_pending=mock.Mock(return_value=False)
+            )
+            with mock.patch.object(exchange_manager_inst.exchange, "supports_bulk_order_cancellation",
+                                   mock.Mock(return_value=True)):
+                # filled on exchange: not cancelled
+                assert await trader_inst.cancel_orders(eth_orders) == (False, [eth_orders[0]])
+                eth_orders[1].state.synchronize.assert_awaited_once_with(force_synchronization=True)
+                eth_orders[1].on_cancel.assert_not_called()
+                # cancelled on exchange
+                eth_orders[1].is_cancelled.return_value = True
+                assert await trader_inst.cancel_orders(eth_orders) == (True, eth_orders)
+            cancel_order_mock.assert_not_called()
+            eth_orders[1].state = None
+
+            # grouped orders are cancelled one by one, failed cancels are reported
+            btc_orders[0].order_group = mock.Mock()
+            cancel_order_mock.side_effect = [True, False]
+            assert await trader_inst.cancel_orders(btc_orders[:2]) == (False, [btc_orders[0]])
+            assert [call.args[0] for call in cancel_order_mock.mock_calls] == btc_orders[:2]
+            cancel_all_orders_mock.assert_not_called()
+        finally:
+            trader_inst.simulate = True
+
+
+async def test_create_new_orders(future_trader_simulator_with_default_linear):
+    _, exchange_manager_inst, trader_inst, default_contract = future_trader_simulator_with_default_linear
+    orders = [mock.Mock(order_type=TraderOrderType.BUY_LIMIT, exchange_creation_params={"b": 2}) for _ in range(3)]
+    created_order = mock.Mock()
+    with mock.patch.object(exchange_manager_inst.exchange, "create_orders",
+                           mock.AsyncMock(return_value=[{"id": 1}, None, {"id": 3}])) \
+            as create_orders_mock, \
+            mock.patch.object(trader_inst, "_get_created_order_instance",
+                              mock.Mock(return_value=(created_order, False))) as _get_created_order_instance_mock, \
+            mock.patch.object(trader_inst, "_initialize_created_order",
+                              mock.AsyncMock(return_value=created_order)) as _initialize_created_order_mock:
+        assert await trader_inst._create_new_orders(orders, {"a": 1}) == [created_order, None, created_order]
+        create_orders_mock.assert_called_once()
+        assert [details["params"] for details in create_orders_mock.mock_calls[0].args[0]] == [{"a": 1, "b": 2}] * 3
+        assert _get_created_order_instance_mock.mock_calls[0].args == (orders[0], {"id": 1})
+        assert _get_created_order_instance_mock.mock_calls[1].args == (orders[2], {"id": 3})
+        assert _initialize_created_order_mock.call_count == 2
+
+
 def make_coroutine(response):
     async def coroutine(*args, **kwargs):
         return response
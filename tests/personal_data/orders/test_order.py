@@ -713,3 +713,22 @@ async def test_update_from_order_storage(trader_simulator):
     assert order.associated_entry_ids == ["ABC", "2"] != origin_associated_entry_ids
     assert order.has_been_bundled is True is not origin_has_been_bundled
     assert order.update_with_triggering_order_fees is True is not origin_update_with_triggering_order_fees
+
+
+async def test_lazy_lock_and_containers(trader_simulator):
+    config, exchange_manager_inst, trader_inst = trader_simulator
+    order = personal_data.Order(trader_inst)
+    assert order._lock is None
+    assert order._chained_orders is None
+    assert order._exchange_creation_params is None
+    assert order._trader_creation_kwargs is None
+
+    lock = order.lock
+    assert lock is order.lock
+    chained_order = personal_data.Order(trader_inst)
+    order.add_chained_order(chained_order)
+    assert order.chained_orders == [chained_order]
+    order.exchange_creation_params["reduceOnly"] = True
+    assert order.exchange_creation_params == {"reduceOnly": True}
+    assert order.trader_creation_kwargs == {}
+
@@ -341,3 +341,82 @@ async def test_get_open_orders(order_and_exchange_managers):
     # )
     # assert len(tagged_order) == 1
     # assert tagged_order[0].order_id == "4"
+
+
+async def test_orders_index_follows_order_changes(order_and_exchange_managers):
+    orders_manager, exchange_manager = order_and_exchange_managers
+    await reset_orders_manager(orders_manager, enums.OrderStatus.OPEN.value)
+    order_2 = orders_manager.get_order("2")
+    order_3 = orders_manager.get_order("3")
+    order_2.exchange_order_id = "2"
+    order_3.exchange_order_id = "3"
+    assert orders_manager.get_order(None, exchange_order_id="2") is order_2
+    assert orders_manager.has_order(None, exchange_order_id="2")
+    assert not orders_manager.has_order(None, exchange_order_id="5")
+    with pytest.raises(KeyError):
+        orders_manager.get_order(None, exchange_order_id="5")
+
+    # status transitions
+    order_2.status = enums.OrderStatus.PENDING_CANCEL
+    assert orders_manager.get_pending_cancel_orders(symbol=DEFAULT_SYMBOL) == [order_2]
+    assert order_2 not in orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL)
+    order_2.status = enums.OrderStatus.OPEN
+    # registration order is kept when an order goes back to a previous status
+    assert [order.order_id for order in orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL)] == ["2", "3", "4"]
+
+    # exchange order id, symbol and tag updates
+    order_3.exchange_order_id = "5"
+    assert orders_manager.get_order(None, exchange_order_id="5") is order_3
+    assert not orders_manager.has_order(None, exchange_order_id="3")
+    order_3.symbol = "ETH/USDT"
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == [order_3]
+    assert order_3 not in orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL)
+    order_3.tag = "tag"
+    assert orders_manager.get_all_orders(tag="tag") == [order_3]
+
+    # groups
+    group = orders_manager.create_group(personal_data.OneCancelsTheOtherOrderGroup)
+    order_2.add_to_order_group(group)
+    order_3.add_to_order_group(group)
+    assert orders_manager.get_order_from_group(group.name) == [order_2, order_3]
+    assert orders_manager.get_order_from_group(None) == []
+
+    # removal
+    orders_manager.remove_order_instance(order_3)
+    assert order_3.orders_index is None
+    assert orders_manager.get_order_from_group(group.name) == [order_2]
+    assert not orders_manager.has_order(None, exchange_order_id="5")
+    assert orders_manager.get_open_orders(symbol="ETH/USDT") == []
+
+    orders_manager.clear()
+    assert order_2.orders_index is None
+    assert orders_manager.get_open_orders() == []
+
+
+async def test_orders_index_follows_orders_writes(order_and_exchange_managers):
+    orders_manager, exchange_manager = order_and_exchange_managers
+    await reset_orders_manager(orders_manager, enums.OrderStatus.OPEN.value)
+    order_2 = orders_manager.get_order("2")
+    order_3 = orders_manager.get_order("3")
+    # direct writes
+    orders_manager.orders.pop("2")
+    assert order_2.orders_index is None
+    assert order_2 not in orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL)
+    del orders_manager.orders["3"]
+    assert orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL) == [orders_manager.get_order("4")]
+    orders_manager.orders["3"] = order_3
+    orders_manager.orders["2"] = order_2
+    assert [order.order_id for order in orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL)] == ["4", "3", "2"]
+    # replaced order keeps its position
+    replacing_order = personal_data.create_order_instance_from_raw(
+        exchange_manager.trader, _get_raw_order(RAW_ORDERS[0], enums.OrderStatus.OPEN.value)
+    )
+    orders_manager.orders["3"] = replacing_order
+    assert order_3.orders_index is None
+    assert list(orders_manager.orders.values()) == \
+        orders_manager.get_open_orders() == \
+        [orders_manager.get_order("4"), replacing_order, order_2]
+    # assigned orders
+    orders_manager.orders = {"2": order_2}
+    assert orders_manager.get_open_orders(symbol=DEFAULT_SYMBOL) == [order_2]
+    assert replacing_order.orders_index is None
@@ -60,3 +60,33 @@ async def test_buy_limit_order_trigger(buy_limit_order):
 
     await wait_asyncio_next_cycle()
     assert buy_limit_order.is_filled()
+
+
+async def test_buy_limit_order_trigger_with_price_events_callbacks(buy_limit_order):
+    order_price = decimal_random_price()
+    buy_limit_order.update(
+        price=order_price,
+        quantity=decimal_random_quantity(max_value=DEFAULT_MARKET_QUANTITY / order_price),
+        symbol=DEFAULT_ORDER_SYMBOL,
+        order_type=TraderOrderType.BUY_LIMIT,
+    )
+    buy_limit_order.use_price_events_callbacks = True
+    buy_limit_order.exchange_manager.is_backtesting = True  # force update_order_status
+    await buy_limit_order.initialize()
+    await buy_limit_order.exchange_manager.exchange_personal_data.orders_manager.upsert_order_instance(
+        buy_limit_order
+    )
+    # no task waiting for the price hit
+    assert buy_limit_order.wait_for_hit_event_task is None
+    price_events_manager = buy_limit_order.exchange_manager.exchange_symbols_data.get_exchange_symbol_data(
+        DEFAULT_ORDER_SYMBOL).price_events_manager
+    price_events_manager.handle_recent_trades(
+        [decimal_random_recent_trade(price=decimal_random_price(min_value=order_price + trading_constants.ONE),
+                                     timestamp=buy_limit_order.timestamp)])
+    await wait_asyncio_next_cycle()
+    assert not buy_limit_order.is_filled()
+    price_events_manager.handle_recent_trades([decimal_random_recent_trade(price=order_price,
+                                                                           timestamp=buy_limit_order.timestamp)])
+
+    await wait_asyncio_next_cycle()
+    assert buy_limit_order.is_filled()
@@ -146,6 +146,39 @@ async def test_trailing_stop_with_new_price_inversed(trailing_stop_order):
     assert trailing_stop_order.is_filled()
 
 
+async def test_trailing_stop_with_price_events_callbacks(trailing_stop_order):
+    trailing_stop_order.use_price_events_callbacks = True
+    trailing_stop_order, order_price, price_events_manager = await initialize_trailing_stop(trailing_stop_order)
+    await trailing_stop_order.set_trailing_percent(decimal.Decimal(2))
+    # no task waiting for price hits
+    assert trailing_stop_order.wait_for_price_hit_event_task is None
+    assert trailing_stop_order.wait_for_stop_price_hit_event_task is None
+    new_trailing_price = order_price * decimal.Decimal("1.01")
+    set_mark_price(trailing_stop_order, new_trailing_price)
+
+    # trailing price hit: its callback is queued
+    price_events_manager.handle_recent_trades(
+        [decimal_random_recent_trade(price=new_trailing_price, timestamp=trailing_stop_order.timestamp)])
+    # events are reset by the status update before the queued callback is called
+    await trailing_stop_order.update_order_status()
+    trailing_price_hit_event = trailing_stop_order.trailing_price_hit_event
+    assert not trailing_price_hit_event.is_set()
+    await wait_asyncio_next_cycle()
+    # the queued callback did not handle the price hit again
+    assert trailing_stop_order.trailing_price_hit_event is trailing_price_hit_event
+    await trailing_stop_order._on_price_hit()
+    assert trailing_stop_order.trailing_price_hit_event is trailing_price_hit_event
+    assert not trailing_stop_order.is_filled()
+
+    # avoid decimal to float rounding issues
+    price_events_manager.handle_recent_trades(
+        [decimal_random_recent_trade(price=get_price_percent(order_price - decimal.Decimal("0.0001"),
+                                                             trailing_stop_order.trailing_percent),
+                                     timestamp=trailing_stop_order.timestamp)])
+    await wait_asyncio_next_cycle()
+    assert trailing_stop_order.is_filled()
+
+
 async def initialize_trailing_stop(order, side=TradeOrderSide.SELL) -> Tuple[
     TrailingStopOrder, decimal.Decimal, PriceEventsManager]:
     order_price = decimal_random_price()
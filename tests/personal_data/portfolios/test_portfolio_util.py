@@ -16,12 +16,17 @@
 import decimal
 import copy
 import mock
+import numpy as np
+import pytest
 
 import octobot_commons.constants
 import octobot_commons.logging
 import octobot_trading.enums as enums
 import octobot_trading.personal_data as personal_data
 import octobot_trading.api as trading_api
+import octobot_trading.personal_data.portfolios.portfolio_util as portfolio_util
+
+from tests import event_loop
 
 
 def test_resolve_sub_portfolios_no_filling_assets():
@@ -559,6 +564,95 @@ def _open_order(symbol: str, quantity: float, cost: float, side: str, fee_cost:
     )
     return order
 
+def test_get_transactions_pnl_and_times():
+    transactions = [
+        mock.Mock(spec=["quantity", "creation_time"], quantity=decimal.Decimal("1.5"), creation_time=1),
+        mock.Mock(spec=["realised_pnl", "creation_time"], realised_pnl=decimal.Decimal(-2), creation_time=2),
+        mock.Mock(spec=["creation_time"], creation_time=3),
+        {"quantity": None, "realised_pnl": 3, "x": 4},
+        {"quantity": 0, "realised_pnl": 0, "x": 5},
+    ]
+    pnls, pnl_times = personal_data.get_transactions_pnl_and_times(transactions)
+    assert pnls.tolist() == [1.5, -2, 3]
+    assert pnl_times.tolist() == [1, 2, 4]
+
+
+def test_get_coefficient_of_determination_curves():
+    pnls = np.array([10., -5., 20.])
+    pnl_times = np.array([1., 2., 3.])
+    # trade to trade basis
+    best_case, balances, times = personal_data.get_coefficient_of_determination_curves(pnls, pnl_times, 100)
+    assert balances.tolist() == [100, 110, 105, 125]
+    assert times.tolist() == [1, 1, 2, 3]
+    assert len(best_case) == 4
+    assert best_case[0] == pytest.approx(100)
+    assert best_case[-1] == pytest.approx(125)
+    assert list(best_case) == sorted(best_case)
+
+    # candle to candle basis
+    candle_times = np.array([0., 1., 1.5, 2., 2.5, 3., 4.])
+    best_case, balances, times = personal_data.get_coefficient_of_determination_curves(
+        pnls, pnl_times, 100, candle_times=candle_times
+    )
+    assert balances.tolist() == [100, 110, 110, 105, 105, 125, 125]
+    assert times.tolist() == candle_times.tolist()
+    assert len(best_case) == 7
+    assert best_case[0] == pytest.approx(100)
+    assert best_case[-1] == pytest.approx(125)
+
+    # highest or end balance
+    pnls = np.array([10., 20., -5.])
+    best_case, balances, _ = personal_data.get_coefficient_of_determination_curves(pnls, pnl_times, 100)
+    assert best_case[-1] == pytest.approx(130)
+    best_case, balances, _ = personal_data.get_coefficient_of_determination_curves(
+        pnls, pnl_times, 100, use_high_instead_of_end_balance=False
+    )
+    assert best_case[-1] == pytest.approx(125)
+
+    # losses
+    assert personal_data.get_coefficient_of_determination_curves(np.array([10., -20.]), pnl_times[:2], 100) \
+        == (None, None, None)
+
+
+def test_get_coefficient_of_determination_from_arrays():
+    pnls = np.array([10., -5., 20., 30.])
+    pnl_times = np.array([1., 2., 3., 4.])
+    best_case, balances, _ = personal_data.get_coefficient_of_determination_curves(pnls, pnl_times, 100)
+    assert personal_data.get_coefficient_of_determination_from_arrays(pnls, pnl_times, 100) == \
+        np.corrcoef(best_case, balances)[0, 1] ** 2
+    candle_times = np.arange(0., 5., 0.5)
+    coefficient_of_determination = personal_data.get_coefficient_of_determination_from_arrays(
+        pnls, pnl_times, 100, candle_times=candle_times
+    )
+    assert 0 < coefficient_of_determination < 1
+    assert personal_data.get_coefficient_of_determination_from_arrays(np.array([]), np.array([]), 100) == 0
+    assert personal_data.get_coefficient_of_determination_from_arrays(-pnls, pnl_times, 100) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_coefficient_of_determination_data():
+    transactions = [
+        {"quantity": None, "realised_pnl": 10, "x": 1},
+        {"quantity": 5, "realised_pnl": None, "x": 3},
+    ]
+    best_case, pnl_data, start_balance, end_balance, pnl_times = \
+        await portfolio_util.get_coefficient_of_determination_data(transactions, 100)
+    assert pnl_data == [100, 110, 115]
+    assert start_balance == 100
+    assert end_balance == 115
+    assert pnl_times == [1, 1, 3]
+    assert len(best_case) == 3
+    with pytest.raises(ValueError):
+        await portfolio_util.get_coefficient_of_determination_data(transactions, 100, x_as_trade_count=False)
+    best_case, pnl_data, start_balance, end_balance, pnl_times = \
+        await portfolio_util.get_coefficient_of_determination_data(
+            transactions, 100, x_as_trade_count=False, candle_times=np.array([0., 2., 4.])
+        )
+    assert pnl_data == [100, 110, 115]
+    assert pnl_times == [0, 2, 4]
+    assert await portfolio_util.get_coefficient_of_determination_data([], 100) == (None, None, None, None, None)
+
+
 def _locked_amounts_by_asset(amount_by_asset: dict[str, float]) -> dict[str, decimal.Decimal]:
     return {
         asset: decimal.Decimal(str(amount))
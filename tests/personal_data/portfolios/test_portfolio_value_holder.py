@@ -222,6 +222,104 @@ async def test_update_origin_crypto_currencies_values(backtesting_trader):
            is False
 
 
+async def test_incremental_portfolio_valuation(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    portfolio_value_holder = portfolio_manager.portfolio_value_holder
+    portfolio_value_holder.ENABLE_INCREMENTAL_PORTFOLIO_VALUATION = True
+    portfolio_value_holder.value_converter.track_updated_price_symbols = True
+    portfolio = portfolio_manager.portfolio.portfolio
+
+    def _check_portfolio_value():
+        # evaluate every currency without using stored values
+        assert portfolio_value_holder.portfolio_current_value == \
+               portfolio_value_holder._evaluate_portfolio_value(portfolio)
+
+    portfolio_manager.portfolio.update_portfolio_from_balance({
+        'BTC': {'available': decimal.Decimal(1), 'total': decimal.Decimal(1)},
+        'ETH': {'available': decimal.Decimal(10), 'total': decimal.Decimal(10)},
+        'DOT': {'available': decimal.Decimal(100), 'total': decimal.Decimal(100)},
+        'USDT': {'available': decimal.Decimal(1000), 'total': decimal.Decimal(1000)}
+    }, True)
+    portfolio = portfolio_manager.portfolio.portfolio
+    exchange_manager.client_symbols.extend(["ETH/BTC", "BTC/USDT", "DOT/ETH", "DOT/BTC"])
+    for symbol, price in (("ETH/BTC", "0.1"), ("BTC/USDT", "100"), ("DOT/ETH", "0.015")):
+        portfolio_manager.handle_mark_price_update(symbol, decimal.Decimal(price))
+    _check_portfolio_value()
+    assert portfolio_value_holder._currencies_holdings_values["DOT"] == \
+           decimal.Decimal(100) * decimal.Decimal("0.015") * decimal.Decimal("0.1")
+
+    with mock.patch.object(
+        portfolio_value_holder, "_evaluate_config_crypto_currencies_and_portfolio_values",
+        mock.Mock(wraps=portfolio_value_holder._evaluate_config_crypto_currencies_and_portfolio_values)
+    ) as _evaluate_config_crypto_currencies_and_portfolio_values_mock:
+        # ETH/BTC is used by ETH and by DOT price bridge
+        portfolio_manager.handle_mark_price_update("ETH/BTC", decimal.Decimal("0.2"))
+        _check_portfolio_value()
+        assert portfolio_value_holder.current_crypto_currencies_values["ETH"] == decimal.Decimal("0.2")
+        assert portfolio_value_holder.current_crypto_currencies_values["DOT"] == \
+               decimal.Decimal("0.015") * decimal.Decimal("0.2")
+        portfolio_manager.handle_mark_price_update("BTC/USDT", decimal.Decimal("200"))
+        _check_portfolio_value()
+        # holdings update
+        portfolio["ETH"].set(available=decimal.Decimal(1), total=decimal.Decimal(2))
+        portfolio_manager.handle_balance_updated()
+        _check_portfolio_value()
+        assert portfolio_value_holder._currencies_holdings_values["ETH"] == decimal.Decimal("0.4")
+        # direct holdings update
+        portfolio["DOT"].total = decimal.Decimal(50)
+        with mock.patch.object(personal_data.PortfolioAssets, "__iter__", mock.Mock(side_effect=AssertionError)), \
+                mock.patch.object(personal_data.PortfolioAssets, "items", mock.Mock(side_effect=AssertionError)), \
+                mock.patch.object(personal_data.PortfolioAssets, "keys", mock.Mock(side_effect=AssertionError)):
+            # updated currencies are notified: the portfolio is not iterated
+            portfolio_manager.handle_balance_updated()
+            portfolio_manager.handle_mark_price_update("BTC/USDT", decimal.Decimal("150"))
+        _check_portfolio_value()
+        # only updated currencies are evaluated: the portfolio is not fully evaluated
+        _evaluate_config_crypto_currencies_and_portfolio_values_mock.assert_not_called()
+
+        # currency without price data: full valuation
+        portfolio_value_holder.value_converter.missing_currency_data_in_exchange.add("XYZ")
+        portfolio_manager.handle_balance_updated()
+        _check_portfolio_value()
+        _evaluate_config_crypto_currencies_and_portfolio_values_mock.assert_called()
+        _evaluate_config_crypto_currencies_and_portfolio_values_mock.reset_mock()
+        portfolio_manager.handle_balance_updated()
+        _evaluate_config_crypto_currencies_and_portfolio_values_mock.assert_not_called()
+
+        # new priced symbol: full valuation
+        portfolio_manager.handle_mark_price_update("DOT/BTC", decimal.Decimal("0.004"))
+        _check_portfolio_value()
+        _evaluate_config_crypto_currencies_and_portfolio_values_mock.assert_called()
+        _evaluate_config_crypto_currencies_and_portfolio_values_mock.reset_mock()
+
+        # same priced symbols count with a different symbol: full valuation
+        del portfolio_value_holder.value_converter.last_prices_by_trading_pair["DOT/ETH"]
+        portfolio_manager.handle_mark_price_update("ETH/USDT", decimal.Decimal("25"))
+        _check_portfolio_value()
+        _evaluate_config_crypto_currencies_and_portfolio_values_mock.assert_called()
+        _evaluate_config_crypto_currencies_and_portfolio_values_mock.reset_mock()
+
+        # same currencies count with a different currency: full valuation
+        portfolio.pop("DOT")
+        portfolio["ADA"] = personal_data.SpotAsset(name="ADA", available=constants.ZERO, total=constants.ZERO)
+        portfolio_manager.handle_balance_updated()
+        _check_portfolio_value()
+        _evaluate_config_crypto_currencies_and_portfolio_values_mock.assert_called()
+        _evaluate_config_crypto_currencies_and_portfolio_values_mock.reset_mock()
+
+        # new portfolio: full valuation
+        portfolio_manager.portfolio.update_portfolio_from_balance({
+            'BTC': {'available': decimal.Decimal(2), 'total': decimal.Decimal(2)},
+            'ETH': {'available': decimal.Decimal(10), 'total': decimal.Decimal(10)},
+        }, True)
+        portfolio = portfolio_manager.portfolio.portfolio
+        portfolio_manager.handle_balance_updated()
+        _check_portfolio_value()
+        assert portfolio_value_holder.portfolio_current_value == decimal.Decimal(4)
+        _evaluate_config_crypto_currencies_and_portfolio_values_mock.assert_called()
+
+
 async def test_get_holdings_ratio(backtesting_trader):
     config, exchange_manager, trader = backtesting_trader
     portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
@@ -156,6 +156,133 @@ def test_try_convert_currency_value_using_multiple_pairs_with_nested_bridges(bac
         decimal.Decimal("0.1") / decimal.Decimal("0.0000001")
 
 
+def test_try_convert_currency_value_using_multiple_pairs_shortest_bridges(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    value_converter = portfolio_manager.portfolio_value_holder.value_converter
+
+    value_converter.update_last_price("ADA/ETH", decimal.Decimal("0.001"))
+    value_converter.update_last_price("ETH/BTC", decimal.Decimal("0.1"))
+    value_converter.update_last_price("BTC/USDT", decimal.Decimal("100"))
+    value_converter.update_last_price("DOT/BTC", decimal.Decimal("0.01"))
+    assets_graph = value_converter._get_assets_graph()
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ADA", "USDT", constants.ONE, []) == \
+           decimal.Decimal("0.001") * decimal.Decimal("0.1") * decimal.Decimal("100")
+    assert value_converter.get_saved_price_conversion_bridge("ADA", "USDT") == [
+        ("ADA", "ETH"), ("ETH", "BTC"), ("BTC", "USDT")
+    ]
+    # bridges of other currencies to USDT are saved as well
+    assert value_converter.get_saved_price_conversion_bridge("DOT", "USDT") == [("DOT", "BTC"), ("BTC", "USDT")]
+    assert value_converter.get_saved_price_conversion_bridge("ETH", "USDT") == [("ETH", "BTC"), ("BTC", "USDT")]
+    with pytest.raises(KeyError):
+        # direct pair
+        value_converter.get_saved_price_conversion_bridge("BTC", "USDT")
+
+    # price updates are not changing the assets graph
+    value_converter.update_last_price("ETH/BTC", decimal.Decimal("0.2"))
+    assert value_converter._get_assets_graph() is assets_graph
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ADA", "USDT", constants.ONE, []) == \
+           decimal.Decimal("0.001") * decimal.Decimal("0.2") * decimal.Decimal("100")
+
+    # new pairs are updating the assets graph and shorter bridges are used for new conversions
+    value_converter.update_last_price("ADA/BTC", decimal.Decimal("0.0003"))
+    assert value_converter._get_assets_graph() is not assets_graph
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ADA", "DOT", constants.ONE, []) == \
+           decimal.Decimal("0.0003") / decimal.Decimal("0.01")
+    assert value_converter.get_saved_price_conversion_bridge("ADA", "DOT") == [("ADA", "BTC"), ("BTC", "DOT")]
+
+    # max bridge size
+    value_converter.update_last_price("XRP/USDT", decimal.Decimal("1"))
+    assert value_converter.try_convert_currency_value_using_multiple_pairs(
+        "XRP", "ADA", constants.ONE, [("A", "B")] * value_converter.MAX_PRICE_BRIDGE_DEPTH
+    ) is None
+    assert value_converter.is_missing_price_bridge("XRP", "ADA")
+    value_converter.reset_missing_price_bridges()
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("XRP", "ADA", constants.ONE, []) == \
+        decimal.Decimal("1") / decimal.Decimal("100") / decimal.Decimal("0.0003")
+
+
+
+def test_assets_graph_invalidation(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    value_converter = portfolio_manager.portfolio_value_holder.value_converter
+
+    value_converter.update_last_price("ADA/ETH", decimal.Decimal("0.001"))
+    value_converter.update_last_price("ETH/BTC", decimal.Decimal("0.1"))
+    value_converter.update_last_price("BTC/USDT", decimal.Decimal("100"))
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ADA", "USDT", constants.ONE, []) == \
+           decimal.Decimal("0.001") * decimal.Decimal("0.1") * decimal.Decimal("100")
+    assets_graph = value_converter._get_assets_graph()
+    pairs_version = value_converter.pairs_version
+
+    # same pairs count, different pairs: graph and saved bridges are reset
+    del value_converter.last_prices_by_trading_pair["ADA/ETH"]
+    value_converter.last_prices_by_trading_pair["ADA/BTC"] = decimal.Decimal("0.0003")
+    assert value_converter.pairs_version > pairs_version
+    assert value_converter._get_assets_graph() is not assets_graph
+    with pytest.raises(KeyError):
+        value_converter.get_saved_price_conversion_bridge("ADA", "USDT")
+    assert value_converter.try_convert_currency_value_using_multiple_pairs("ADA", "USDT", constants.ONE, []) == \
+           decimal.Decimal("0.0003") * decimal.Decimal("100")
+    assert value_converter.get_saved_price_conversion_bridge("ADA", "USDT") == [("ADA", "BTC"), ("BTC", "USDT")]
+
+    # traded pairs are replaced by other pairs
+    traded_symbol_pairs = exchange_manager.exchange_config.traded_symbol_pairs
+    traded_symbol_pairs.append("DOT/BTC")
+    assets_graph = value_converter._get_assets_graph()
+    assert "DOT" in assets_graph
+    pairs_version = value_converter.pairs_version
+    traded_symbol_pairs[-1] = "XRP/ETH"
+    assert value_converter._get_assets_graph() is not assets_graph
+    assert value_converter.pairs_version > pairs_version
+    assert "DOT" not in value_converter._get_assets_graph()
+    assert value_converter._get_assets_graph()["XRP"]["ETH"] == ["XRP/ETH"]
+
+    # reset missing bridges also resets saved bridges
+    value_converter.reset_missing_price_bridges()
+    with pytest.raises(KeyError):
+        value_converter.get_saved_price_conversion_bridge("ADA", "USDT")
+
+
+def test_get_last_price_data(backtesting_trader):
+    config, exchange_manager, trader = backtesting_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    value_converter = portfolio_manager.portfolio_value_holder.value_converter
+
+    value_converter.update_last_price("BTC/USDT:USDT", decimal.Decimal("100"))
+    value_converter.update_last_price("BTC/USDT:BTC", decimal.Decimal("101"))
+    assert value_converter._get_last_price_data("BTC/USDT:BTC") == decimal.Decimal("101")
+    # first stored symbol is used when settlement asset is different
+    assert value_converter._get_last_price_data("BTC/USDT") == decimal.Decimal("100")
+    assert value_converter._get_last_price_data("BTC/USDT:ETH") == decimal.Decimal("100")
+    with pytest.raises(KeyError):
+        value_converter._get_last_price_data("USDT/BTC")
+    with pytest.raises(KeyError):
+        value_converter._get_last_price_data("ETH/USDT")
+
+    # prices set without update_last_price are found as well
+    value_converter.last_prices_by_trading_pair["ETH/USDT:USDT"] = decimal.Decimal("10")
+    assert value_converter._get_last_price_data("ETH/USDT") == decimal.Decimal("10")
+    value_converter.update_last_price("ETH/USDT:USDT", decimal.Decimal("11"))
+    value_converter.update_last_price("ADA/USDT:USDT", decimal.Decimal("1"))
+    assert value_converter._get_last_price_data("ETH/USDT") == decimal.Decimal("11")
+    assert value_converter._get_last_price_data("ADA/USDT") == decimal.Decimal("1")
+
+    # removed then added prices without update_last_price: same prices count
+    del value_converter.last_prices_by_trading_pair["ETH/USDT:USDT"]
+    value_converter.last_prices_by_trading_pair["SOL/USDT:USDT"] = decimal.Decimal("5")
+    with pytest.raises(KeyError):
+        value_converter._get_last_price_data("ETH/USDT")
+    assert value_converter._get_last_price_data("SOL/USDT") == decimal.Decimal("5")
+    # the next first stored symbol is used when the first one is removed
+    value_converter.last_prices_by_trading_pair.pop("BTC/USDT:USDT")
+    assert value_converter._get_last_price_data("BTC/USDT") == decimal.Decimal("101")
+    value_converter.last_prices_by_trading_pair.clear()
+    with pytest.raises(KeyError):
+        value_converter._get_last_price_data("BTC/USDT")
+
+
 def test_get_usd_like_value(backtesting_trader):
     config, exchange_manager, trader = backtesting_trader
     portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
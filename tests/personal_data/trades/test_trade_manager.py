@@ -13,11 +13,13 @@
 #
 #  You should have received a copy of the GNU Lesser General Public
 #  License along with this library.
+import decimal
+import mock
 import pytest
 
 from tests import event_loop
 from tests.exchanges import simulated_exchange_manager, simulated_trader
-from tests.personal_data.trades import create_trade
+from tests.personal_data.trades import create_trade, create_executed_trade
 
 import octobot_trading.personal_data as personal_data
 import octobot_trading.enums as enums
@@ -47,6 +49,90 @@ def test_has_closing_trade_with_exchange_order_id(trade_manager_and_trader):
     assert trade_manager.has_closing_trade_with_exchange_order_id("id") is True
 
 
+def test_get_trades_and_total_paid_fees(trade_manager_and_trader):
+    trade_manager, trader = trade_manager_and_trader
+    trade_manager.MAX_TRADES_COUNT = 20
+    assert trade_manager.get_trades() == []
+    assert trade_manager.get_total_paid_fees() == {}
+    trades = []
+    for index in range(20):
+        trade = create_trade(trader, f"exchange_{index // 2}", False, f"order_{index // 2}")
+        trade.fee = {
+            enums.FeePropertyColumns.COST.value: decimal.Decimal(index),
+            enums.FeePropertyColumns.CURRENCY.value: "BTC" if index < 10 else "USDT",
+        }
+        trade_manager._add_trade_if_relevant(str(index), trade)
+        trades.append(trade)
+    assert trade_manager.get_trades() == trades
+    assert trade_manager.get_trades(origin_order_id="order_1") == trades[2:4]
+    assert trade_manager.get_trades(exchange_order_id="exchange_2") == trades[4:6]
+    assert trade_manager.get_trades(origin_order_id="order_2", exchange_order_id="exchange_2") == trades[4:6]
+    assert trade_manager.get_trades(origin_order_id="order_2", exchange_order_id="exchange_1") == []
+    assert trade_manager.get_trades(origin_order_id="order_20") == []
+    assert trade_manager.get_trade_from_order_id("order_3") is trades[6]
+    assert trade_manager.get_total_paid_fees() == {
+        "BTC": decimal.Decimal(sum(range(10))), "USDT": decimal.Decimal(sum(range(10, 20)))
+    }
+
+    # oldest trades are removed from indexes and fees totals
+    trade = create_trade(trader, "exchange_10", False, "order_10")
+    trade.fee = {enums.FeePropertyColumns.COST.value: decimal.Decimal(1), enums.FeePropertyColumns.CURRENCY.value: "ETH"}
+    trade_manager._add_trade_if_relevant("20", trade)
+    assert len(trade_manager.trades) == 19
+    assert trade_manager.get_trades(origin_order_id="order_0") == []
+    assert trade_manager.get_trades(exchange_order_id="exchange_0") == []
+    assert trade_manager.get_trades(origin_order_id="order_1") == trades[2:4]
+    assert trade_manager.get_trades(origin_order_id="order_10") == [trade]
+    assert trade_manager.get_total_paid_fees() == {
+        "BTC": decimal.Decimal(sum(range(2, 10))), "USDT": decimal.Decimal(sum(range(10, 20))),
+        "ETH": decimal.Decimal(1),
+    }
+    trade_manager._reset_trades()
+    assert trade_manager.get_trades(origin_order_id="order_1") == []
+    assert trade_manager.get_total_paid_fees() == {}
+
+
+def test_trades_index_follows_direct_writes_and_mutations(trade_manager_and_trader):
+    trade_manager, trader = trade_manager_and_trader
+    trade = create_trade(trader, "exchange_1", False, "order_1")
+    trade.fee = {enums.FeePropertyColumns.COST.value: decimal.Decimal(1), enums.FeePropertyColumns.CURRENCY.value: "BTC"}
+    trade_manager.trades["1"] = trade
+    assert trade_manager.get_trades(origin_order_id="order_1") == [trade]
+    assert trade_manager.get_total_paid_fees() == {"BTC": decimal.Decimal(1)}
+    trade.origin_order_id = "order_2"
+    trade.exchange_order_id = "exchange_2"
+    trade.fee = {enums.FeePropertyColumns.COST.value: decimal.Decimal(2), enums.FeePropertyColumns.CURRENCY.value: "USDT"}
+    assert trade_manager.get_trades(origin_order_id="order_1") == []
+    assert trade_manager.get_trades(exchange_order_id="exchange_1") == []
+    assert trade_manager.get_trade_from_order_id("order_2") is trade
+    assert trade_manager.get_trades(exchange_order_id="exchange_2") == [trade]
+    assert trade_manager.get_total_paid_fees() == {"USDT": decimal.Decimal(2)}
+
+    # invalid fees are rejected without altering trades and their index
+    invalid_trade = create_trade(trader, "exchange_3", False, "order_3")
+    invalid_trade.fee = {enums.FeePropertyColumns.CURRENCY.value: "BTC"}
+    with pytest.raises(KeyError):
+        trade_manager.trades["1"] = invalid_trade
+    assert trade_manager.trades == {"1": trade}
+    assert trade_manager.get_trades(origin_order_id="order_3") == []
+    assert trade_manager.get_trade_from_order_id("order_2") is trade
+    with pytest.raises(KeyError):
+        trade.fee = invalid_trade.fee
+    assert trade_manager.get_total_paid_fees() == {"USDT": decimal.Decimal(2)}
+
+    del trade_manager.trades["1"]
+    assert trade_manager.get_trades(origin_order_id="order_2") == []
+    assert trade_manager.get_total_paid_fees() == {}
+    # removed trades are not indexed anymore
+    trade.origin_order_id = "order_1"
+    assert trade_manager.get_trades(origin_order_id="order_1") == []
+
+    trade_manager.trades = {"1": trade}
+    assert trade_manager.get_trades(origin_order_id="order_1") == [trade]
+    trade_manager.trades.clear()
+    assert trade_manager.get_trades(origin_order_id="order_1") == []
+
+
 def test_get_completed_trades_pnl(trade_manager_and_trader):
     trade_manager, trader = trade_manager_and_trader
     # no trades
@@ -95,3 +181,68 @@ def test_get_completed_trades_pnl(trade_manager_and_trader):
     # does not depend on trades_manager trades
     trade_manager.trades.clear()
     assert len(trade_manager.get_completed_trades_pnl(trades)) == 3
+
+
+def test_archive_oldest_trades(trade_manager_and_trader):
+    _, trader = trade_manager_and_trader
+    with mock.patch.object(personal_data.TradesManager, "ENABLE_TRADES_ARCHIVE", True):
+        trade_manager = personal_data.TradesManager(trader)
+    trade_manager.MAX_TRADES_COUNT = 20
+    for index in range(21):
+        trade = create_executed_trade(
+            trader, enums.TradeOrderSide.BUY, index, decimal.Decimal(1), decimal.Decimal(10), "BTC/USDT",
+            {enums.FeePropertyColumns.COST.value: decimal.Decimal("0.1"),
+             enums.FeePropertyColumns.CURRENCY.value: "USDT"}
+        )
+        trade_manager._add_trade_if_relevant(str(index), trade)
+    # 2 oldest trades are archived
+    assert len(trade_manager.trades) == 19
+    assert len(trade_manager.trades_archive) == 2
+    assert trade_manager.trades_archive.get_net_cash_flow("BTC/USDT") == -20
+    # archived trades fees are included
+    assert trade_manager.get_total_paid_fees() == {"USDT": decimal.Decimal("2.1")}
+    trade_manager._reset_trades()
+    assert len(trade_manager.trades_archive) == 0
+    assert trade_manager.get_total_paid_fees() == {}
+
+    # archive is disabled by default
+    assert personal_data.TradesManager(trader).trades_archive is None
+
+
+
+def test_archived_trades_totals(trade_manager_and_trader):
+    reference_trade_manager, trader = trade_manager_and_trader
+    with mock.patch.object(personal_data.TradesManager, "ENABLE_TRADES_ARCHIVE", True):
+        trade_manager = personal_data.TradesManager(trader)
+    trade_manager.MAX_TRADES_COUNT = 20
+    for index in range(40):
+        for manager in (reference_trade_manager, trade_manager):
+            side = enums.TradeOrderSide.SELL if index % 3 == 2 else enums.TradeOrderSide.BUY
+            trade = create_executed_trade(
+                trader, side, index, decimal.Decimal(1 + index % 2), decimal.Decimal(10 + index % 7), "BTC/USDT",
+                {enums.FeePropertyColumns.COST.value: decimal.Decimal("0.1"),
+                 enums.FeePropertyColumns.CURRENCY.value: "USDT"}
+            )
+            trade.status = enums.OrderStatus.FILLED
+            if index % 6 == 5:
+                trade.exchange_trade_type = enums.TradeOrderType.STOP_LOSS
+            manager._add_trade_if_relevant(str(index), trade)
+    # oldest trades are archived
+    assert len(trade_manager.trades) == 20
+    assert len(trade_manager.trades_archive) == 20
+    assert len(reference_trade_manager.trades) == 40
+
+    # archived trades are included in totals
+    realized_pnl = reference_trade_manager.get_realized_pnl("BTC/USDT")
+    assert realized_pnl != 0
+    assert trade_manager.get_realized_pnl("BTC/USDT") == pytest.approx(realized_pnl)
+    assert trade_manager.get_realized_pnl("BTC/USDT", since=10, until=30) == \
+        pytest.approx(reference_trade_manager.get_realized_pnl("BTC/USDT", since=10, until=30))
+    assert trade_manager.get_realized_pnl("ETH/USDT") == reference_trade_manager.get_realized_pnl("ETH/USDT") == 0
+    assert reference_trade_manager.get_total_paid_fees() == {"USDT": decimal.Decimal("4.0")}
+    assert trade_manager.get_total_paid_fees() == pytest.approx({"USDT": decimal.Decimal("4.0")})
+    exchange_personal_data = trader.exchange_manager.exchange_personal_data
+    with mock.patch.object(exchange_personal_data, "trades_manager", reference_trade_manager):
+        win_rate = personal_data.compute_win_rate(trader.exchange_manager)
+    with mock.patch.object(exchange_personal_data, "trades_manager", trade_manager):
+        assert personal_data.compute_win_rate(trader.exchange_manager) == win_rate == decimal.Decimal(7) / 13
@@ -0,0 +1,159 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import pytest
+
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+from tests.personal_data.trades import create_executed_trade
+
+import octobot_trading.personal_data as personal_data
+import octobot_trading.enums as enums
+
+
+def _fee(cost, currency):
+    return {
+        enums.FeePropertyColumns.COST.value: decimal.Decimal(str(cost)),
+        enums.FeePropertyColumns.CURRENCY.value: currency,
+    }
+
+
+@pytest.fixture
+def trader(simulated_trader):
+    _, _, trader_instance = simulated_trader
+    return trader_instance
+
+
+def test_add_trades_and_queries(trader):
+    archive = personal_data.TradesArchive(1000)
+    assert len(archive) == 0
+    assert archive.get_paid_fees() == {}
+    assert archive.get_net_cash_flow("BTC/USDT") == 0
+    cancelled_trade = create_executed_trade(
+        trader, enums.TradeOrderSide.BUY, 1, decimal.Decimal(1), decimal.Decimal(10), "BTC/USDT", None
+    )
+    cancelled_trade.status = enums.OrderStatus.CANCELED
+    archive.add_trades([
+        create_executed_trade(trader, enums.TradeOrderSide.BUY, 10, decimal.Decimal(2), decimal.Decimal(100),
+                              "BTC/USDT", _fee(0.1, "USDT")),
+        cancelled_trade,
+        create_executed_trade(trader, enums.TradeOrderSide.SELL, 20, decimal.Decimal("1.5"), decimal.Decimal(120),
+                              "BTC/USDT", _fee(0.2, "USDT")),
+        create_executed_trade(trader, enums.TradeOrderSide.BUY, 30, decimal.Decimal(3), decimal.Decimal(10),
+                              "ETH/USDT", _fee(0.01, "ETH")),
+        create_executed_trade(trader, enums.TradeOrderSide.SELL, 40, decimal.Decimal(1), decimal.Decimal(12),
+                              "ETH/USDT", None),
+    ])
+    # cancelled trade is not archived
+    assert len(archive) == 4
+    assert archive.symbols == ["BTC/USDT", "ETH/USDT"]
+    assert archive.get_trades_count() == 4
+    assert archive.get_trades_count(symbol="ETH/USDT") == 2
+    assert archive.get_trades_count(since=20, until=30) == 2
+    assert archive.get_trades_count(symbol="XRP/USDT") == 0
+
+    assert archive.get_paid_fees() == pytest.approx({"USDT": 0.3, "ETH": 0.01})
+    assert archive.get_paid_fees(symbol="ETH/USDT") == pytest.approx({"ETH": 0.01})
+    assert archive.get_paid_fees(since=20) == pytest.approx({"USDT": 0.2, "ETH": 0.01})
+    assert archive.get_paid_fees(symbol="XRP/USDT") == {}
+
+    assert archive.get_net_cash_flow("BTC/USDT") == pytest.approx(1.5 * 120 - 2 * 100)
+    assert archive.get_net_cash_flow("BTC/USDT", until=15) == pytest.approx(-200)
+    assert archive.get_net_cash_flow("ETH/USDT") == pytest.approx(12 - 30)
+    assert archive.get_traded_quantity("BTC/USDT") == pytest.approx(0.5)
+    assert archive.get_traded_quantity("ETH/USDT", since=35) == pytest.approx(-1)
+
+    archive.reset()
+    assert len(archive) == 0
+    assert archive.get_paid_fees() == {}
+    assert archive.get_trades_count(symbol="BTC/USDT") == 0
+
+
+def test_add_trades_capacity_and_max_size(trader):
+    archive = personal_data.TradesArchive(3000)
+    trades = [
+        create_executed_trade(trader, enums.TradeOrderSide.BUY, index, decimal.Decimal(1), decimal.Decimal(index),
+                              "BTC/USDT", _fee(1, "USDT"))
+        for index in range(2500)
+    ]
+    archive.add_trades(trades[:1000])
+    archive.add_trades(trades[1000:])
+    assert len(archive) == 2500
+    assert archive.get_paid_fees() == {"USDT": 2500}
+    assert archive.get_net_cash_flow("BTC/USDT") == -sum(range(2500))
+    # max size reached: oldest trades are removed
+    archive.add_trades(trades[:1000])
+    assert len(archive) == 3000 - 300
+    assert archive.get_paid_fees() == {"USDT": 2700}
+    assert list(archive.times[:3]) == [800, 801, 802]
+    assert archive.get_trades_count(until=999) == 200 + 1000
+
+
+def test_get_realized_pnl(trader):
+    archive = personal_data.TradesArchive(1000)
+    assert archive.get_realized_pnl("BTC/USDT") == 0
+    trades = [
+        create_executed_trade(trader, side, time, decimal.Decimal(str(quantity)), decimal.Decimal(str(price)),
+                              "BTC/USDT", None)
+        for side, time, quantity, price in (
+            (enums.TradeOrderSide.BUY, 1, 2, 100),
+            (enums.TradeOrderSide.BUY, 2, 2, 110),
+            # average cost: 105
+            (enums.TradeOrderSide.SELL, 3, 1, 120),
+            # only 3 are held
+            (enums.TradeOrderSide.SELL, 4, 4, 130),
+            (enums.TradeOrderSide.BUY, 5, 1, 90),
+            (enums.TradeOrderSide.SELL, 6, 1, 100),
+        )
+    ]
+    archive.add_trades(trades[:3])
+    assert archive.get_realized_pnl("BTC/USDT") == pytest.approx(15)
+    # not archived trades are included after archived ones
+    assert archive.get_realized_pnl("BTC/USDT", recent_trades=trades[3:]) == pytest.approx(15 + 75 + 10)
+    archive.add_trades(trades[3:])
+    assert archive.get_realized_pnl("BTC/USDT") == pytest.approx(15 + 75 + 10)
+    assert archive.get_realized_pnl("BTC/USDT", since=4) == pytest.approx(75 + 10)
+    assert archive.get_realized_pnl("BTC/USDT", since=4, until=5) == pytest.approx(75)
+    assert archive.get_realized_pnl("ETH/USDT") == 0
+
+
+def test_count_filled_trades(trader):
+    archive = personal_data.TradesArchive(1000)
+    assert archive.count_filled_trades() == 0
+    trades = []
+    for index, (side, trade_type, reduce_only) in enumerate((
+        (enums.TradeOrderSide.BUY, enums.TradeOrderType.LIMIT, False),
+        (enums.TradeOrderSide.SELL, enums.TradeOrderType.LIMIT, True),
+        (enums.TradeOrderSide.SELL, enums.TradeOrderType.STOP_LOSS, True),
+        (enums.TradeOrderSide.SELL, enums.TradeOrderType.LIMIT, False),
+    )):
+        trade = create_executed_trade(
+            trader, side, index, decimal.Decimal(1), decimal.Decimal(10), "BTC/USDT", None
+        )
+        trade.status = enums.OrderStatus.FILLED
+        trade.exchange_trade_type = trade_type
+        trade.reduce_only = reduce_only
+        trades.append(trade)
+    # not filled
+    trades[-1].status = enums.OrderStatus.OPEN
+    archive.add_trades(trades)
+    assert archive.count_filled_trades() == 3
+    assert archive.count_filled_trades(side=enums.TradeOrderSide.SELL) == 2
+    assert archive.count_filled_trades(reduce_only=False) == 1
+    assert archive.count_filled_trades(trade_types=[enums.TradeOrderType.STOP_LOSS]) == 1
+    assert archive.count_filled_trades(
+        side=enums.TradeOrderSide.SELL, trade_types=[enums.TradeOrderType.LIMIT, enums.TradeOrderType.MARKET]
+    ) == 1
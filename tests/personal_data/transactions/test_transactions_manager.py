@@ -22,6 +22,7 @@ import octobot_trading.enums as enums
 import octobot_trading.errors as errors
 import octobot_trading.constants as constants
 import octobot_trading.personal_data.transactions.types as transaction_types
+import octobot_trading.personal_data.transactions.transaction_factory as transaction_factory
 
 from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
 from tests import event_loop
@@ -248,3 +249,54 @@ async def test_update_transaction_id(backtesting_trader):
     transaction.set_transaction_id(t_id_4)
     exchange_manager.exchange_personal_data.transactions_manager.insert_transaction_instance(transaction)
     assert len(exchange_manager.exchange_personal_data.transactions_manager.transactions) == 2
+
+
+async def test_get_equity_curve_tracker(backtesting_trader):
+    _, exchange_manager, _ = backtesting_trader
+    transactions_manager = exchange_manager.exchange_personal_data.transactions_manager
+    assert transactions_manager.equity_curve_tracker is None
+    for pnl in (decimal.Decimal(10), decimal.Decimal(-22)):
+        transaction_factory.create_realised_pnl_transaction(exchange_manager, TRANSACTION_CURRENCY,
+                                                            TRANSACTION_SYMBOL, enums.PositionSide.LONG,
+                                                            realised_pnl=pnl)
+    # tracker is created on first call
+    assert transactions_manager.equity_curve_tracker is None
+    tracker = transactions_manager.get_equity_curve_tracker(decimal.Decimal(100))
+    assert tracker.peak_value == decimal.Decimal(110)
+    assert tracker.current_value == decimal.Decimal(88)
+    assert tracker.current_draw_down == tracker.max_draw_down == decimal.Decimal(20)
+
+    # new transactions update the tracker
+    transaction_factory.create_fee_transaction(exchange_manager, TRANSACTION_CURRENCY, TRANSACTION_SYMBOL,
+                                               quantity=decimal.Decimal(5))
+    assert transactions_manager.get_equity_curve_tracker(decimal.Decimal(100)) is tracker
+    assert tracker.current_value == decimal.Decimal(93)
+    assert tracker.current_draw_down == constants.ONE_HUNDRED - decimal.Decimal(93) / decimal.Decimal("1.1")
+    assert tracker.max_draw_down == decimal.Decimal(20)
+
+    # different origin value: recompute tracker
+    tracker = transactions_manager.get_equity_curve_tracker(decimal.Decimal(200))
+    assert tracker.peak_value == decimal.Decimal(210)
+    assert tracker.current_value == decimal.Decimal(193)
+    assert tracker.max_draw_down == constants.ONE_HUNDRED - decimal.Decimal(188) / decimal.Decimal("2.1")
+
+    # removed transactions: recompute tracker
+    transactions_manager._remove_oldest_transactions(1)
+    assert transactions_manager.equity_curve_tracker is None
+    tracker = transactions_manager.get_equity_curve_tracker(decimal.Decimal(200))
+    assert tracker.peak_value == decimal.Decimal(200)
+    assert tracker.current_value == decimal.Decimal(183)
+    assert tracker.max_draw_down == constants.ONE_HUNDRED - decimal.Decimal(178) / decimal.Decimal(2)
+
+    # transactions without pnl are skipped
+    transaction_factory.create_transfer_transaction(exchange_manager, TRANSACTION_CURRENCY, TRANSACTION_SYMBOL)
+    assert transactions_manager.equity_curve_tracker is tracker
+    assert tracker.current_value == decimal.Decimal(183)
+    transaction_factory.create_realised_pnl_transaction(exchange_manager, TRANSACTION_CURRENCY,
+                                                        TRANSACTION_SYMBOL, enums.PositionSide.LONG,
+                                                        realised_pnl=decimal.Decimal(-3))
+    transactions_manager.equity_curve_tracker = None
+    tracker = transactions_manager.get_equity_curve_tracker(decimal.Decimal(200))
+    assert transactions_manager.get_equity_curve_tracker(decimal.Decimal(200)) is tracker
+    assert tracker.current_value == decimal.Decimal(180)
+    assert tracker.max_draw_down == constants.ONE_HUNDRED - decimal.Decimal(178) / decimal.Decimal(2)
@@ -0,0 +1,58 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import time
+import tracemalloc
+
+
+def measure(callback, *args, repeat=1) -> float:
+    """
+    :return: the best elapsed time in seconds of repeat calls to callback(*args)
+    """
+    best_elapsed = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        callback(*args)
+        elapsed = time.perf_counter() - start
+        best_elapsed = elapsed if best_elapsed is None else min(best_elapsed, elapsed)
+    return best_elapsed
+
+
+def print_comparison(title, reference_elapsed, elapsed, operations_count):
+    print(
+        f"{title}: {operations_count / reference_elapsed:,.0f} ops/s -> {operations_count / elapsed:,.0f} ops/s "
+        f"(x{reference_elapsed / elapsed:.1f})"
+    )
+
+
+def measure_allocated_bytes(callback, *args) -> int:
+    """
+    :return: the memory size in bytes still allocated by callback(*args) when it returns, including its result
+    """
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        result = callback(*args)  # pylint: disable=unused-variable
+        allocated = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    return allocated
+
+
+def print_memory_comparison(title, reference_bytes, allocated_bytes, elements_count, element_name):
+    print(
+        f"{title}: {reference_bytes / elements_count:,.0f} bytes/{element_name} -> "
+        f"{allocated_bytes / elements_count:,.0f} bytes/{element_name} (x{reference_bytes / allocated_bytes:.1f})"
+    )
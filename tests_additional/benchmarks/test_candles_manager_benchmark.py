@@ -0,0 +1,125 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import numpy as np
+
+import octobot_commons.data_util as data_util
+import octobot_commons.enums as enums
+
+import octobot_trading.exchange_data as exchange_data
+import tests_additional.benchmarks as benchmarks
+
+
+class ShiftingCandlesManager(exchange_data.CandlesManager):
+    """
+    Previous candles storage: shifts every array when a new candle is added after reaching max_candles_count
+    and looks for candle times by scanning the time candles array
+    """
+    def upsert_candle(self, updated_candle):
+        updated_candle_time = updated_candle[enums.PriceIndexes.IND_PRICE_TIME.value]
+        for index, candle_time in enumerate(self.time_candles):
+            if candle_time == updated_candle_time:
+                self._set_candle(index, updated_candle)
+                return
+        self.add_new_candle(updated_candle)
+
+    def _should_add_new_candle(self, new_open_time):
+        return new_open_time not in self.time_candles
+
+    def _reset_candles(self):
+        super()._reset_candles()
+        self.close_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
+        self.open_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
+        self.high_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
+        self.low_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
+        self.time_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
+        self.volume_candles = np.full(self.max_candles_count, fill_value=np.nan, dtype=np.float64)
+
+    def _set_candle(self, index, candle_data):
+        self.close_candles[index] = candle_data[enums.PriceIndexes.IND_PRICE_CLOSE.value]
+        self.open_candles[index] = candle_data[enums.PriceIndexes.IND_PRICE_OPEN.value]
+        self.high_candles[index] = candle_data[enums.PriceIndexes.IND_PRICE_HIGH.value]
+        self.low_candles[index] = candle_data[enums.PriceIndexes.IND_PRICE_LOW.value]
+        self.time_candles[index] = float(candle_data[enums.PriceIndexes.IND_PRICE_TIME.value])
+        self.volume_candles[index] = candle_data[enums.PriceIndexes.IND_PRICE_VOL.value]
+
+    def _change_current_candle(self):
+        self.close_candles = data_util.shift_value_array(self.close_candles, -1, np.nan, np.float64)
+        self.open_candles = data_util.shift_value_array(self.open_candles, -1, np.nan, np.float64)
+        self.high_candles = data_util.shift_value_array(self.high_candles, -1, np.nan, np.float64)
+        self.low_candles = data_util.shift_value_array(self.low_candles, -1, np.nan, np.float64)
+        self.volume_candles = data_util.shift_value_array(self.volume_candles, -1, np.nan, np.float64)
+        self.time_candles = data_util.shift_value_array(self.time_candles, -1, np.nan, np.float64)
+
+
+def _upsert_candles(manager, candles):
+    for candle in candles:
+        manager.upsert_candle(candle)
+
+
+def _gen_candles(start, size) -> list:
+    return [
+        [float(seed * 60), seed * 1.1, seed * 1.2, seed * 0.9, float(seed), seed * 10.0]
+        for seed in range(start, start + size)
+    ]
+
+
+def _filled_manager(manager_class):
+    manager = manager_class()
+    manager.replace_all_candles(_gen_candles(0, manager.max_candles_count))
+    assert manager.reached_max is True
+    return manager
+
+
+def _add_candles(manager, candles):
+    for candle in candles:
+        manager.add_new_candle(candle)
+
+
+def test_add_new_candle_when_full():
+    new_candles_count = 2000
+    new_candles = _gen_candles(exchange_data.CandlesManager.MAX_CANDLES_COUNT, new_candles_count)
+    shifting_manager = _filled_manager(ShiftingCandlesManager)
+    ring_buffer_manager = _filled_manager(exchange_data.CandlesManager)
+
+    shifting_elapsed = benchmarks.measure(_add_candles, shifting_manager, new_candles)
+    ring_buffer_elapsed = benchmarks.measure(_add_candles, ring_buffer_manager, new_candles)
+    benchmarks.print_comparison("add_new_candle when full", shifting_elapsed, ring_buffer_elapsed, new_candles_count)
+
+    for limit in (-1, 1, 200):
+        assert np.array_equal(shifting_manager.get_symbol_close_candles(limit),
+                              ring_buffer_manager.get_symbol_close_candles(limit))
+        assert np.array_equal(shifting_manager.get_symbol_time_candles(limit),
+                              ring_buffer_manager.get_symbol_time_candles(limit))
+    assert ring_buffer_elapsed < shifting_elapsed
+
+
+def test_upsert_candle():
+    updates_count = 2000
+    shifting_manager = _filled_manager(ShiftingCandlesManager)
+    ring_buffer_manager = _filled_manager(exchange_data.CandlesManager)
+    last_candle = _gen_candles(exchange_data.CandlesManager.MAX_CANDLES_COUNT - 1, 1)[0]
+    current_candle_updates = [last_candle[:4] + [float(i), last_candle[5]] for i in range(updates_count)]
+    old_candle = _gen_candles(exchange_data.CandlesManager.MAX_CANDLES_COUNT // 2, 1)[0]
+    old_candle_updates = [old_candle[:4] + [float(i), old_candle[5]] for i in range(updates_count)]
+
+    for title, updates in (("upsert_candle on current candle", current_candle_updates),
+                           ("upsert_candle on older candle", old_candle_updates)):
+        shifting_elapsed = benchmarks.measure(_upsert_candles, shifting_manager, updates)
+        ring_buffer_elapsed = benchmarks.measure(_upsert_candles, ring_buffer_manager, updates)
+        benchmarks.print_comparison(title, shifting_elapsed, ring_buffer_elapsed, updates_count)
+        assert np.array_equal(shifting_manager.get_symbol_close_candles(),
+                              ring_buffer_manager.get_symbol_close_candles())
+        assert ring_buffer_elapsed < shifting_elapsed
@@ -0,0 +1,117 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import decimal
+
+import numpy as np
+import pytest
+
+import octobot_trading.personal_data as personal_data
+import tests_additional.benchmarks as benchmarks
+
+
+TRANSACTIONS_COUNT = 20000
+START_BALANCE = 1000.0
+
+
+class _Transaction:
+    def __init__(self, realised_pnl, creation_time):
+        self.realised_pnl = realised_pnl
+        self.creation_time = creation_time
+
+
+async def _get_legacy_coefficient_of_determination_data(transactions, start_balance):
+    """
+    Previous implementation (trade to trade basis, using the highest balance)
+    """
+    pnl_history = [start_balance]
+    pnl_history_times = []
+    for transaction in transactions:
+        current_pnl = None
+        if hasattr(transaction, "quantity"):
+            current_pnl = float(transaction.quantity)
+            pnl_history_times.append(transaction.creation_time)
+        elif hasattr(transaction, 'realised_pnl'):
+            current_pnl = float(transaction.realised_pnl)
+            pnl_history_times.append(transaction.creation_time)
+        if current_pnl is not None:
+            pnl_history.append(pnl_history[-1] + current_pnl)
+    start_time = pnl_history_times[0]
+    pnl_history_times.insert(0, start_time)
+    end_time = pnl_history_times[-1]
+    data_length = len(pnl_history)
+    end_value = max(pnl_history)
+    x = [start_time, end_time]
+    y = [start_balance, end_value]
+    pw = 15
+    A = np.exp(np.log(y[0] / y[1]) / pw)
+    a = (x[0] - x[1] * A) / (A - 1)
+    b = y[0] / (x[0] + a) ** pw
+    linear_growth = np.linspace(start_time, end_time, data_length)
+    best_case = ((linear_growth + a) ** pw) * b
+    return list(best_case), pnl_history
+
+
+def _get_legacy_coefficient_of_determination(transactions):
+    best_case, pnl_data = asyncio.run(_get_legacy_coefficient_of_determination_data(transactions, START_BALANCE))
+    return np.corrcoef(best_case, pnl_data)[0, 1] ** 2
+
+
+def _get_coefficient_of_determination(transactions):
+    pnls, pnl_times = personal_data.get_transactions_pnl_and_times(transactions)
+    return personal_data.get_coefficient_of_determination_from_arrays(pnls, pnl_times, START_BALANCE)
+
+
+def _get_transactions():
+    return [
+        _Transaction(decimal.Decimal(index % 11 - 4), 1600000000 + index * 60)
+        for index in range(TRANSACTIONS_COUNT)
+    ]
+
+
+def test_coefficient_of_determination():
+    transactions = _get_transactions()
+    elapsed_times = [
+        benchmarks.measure(get_coefficient_of_determination, transactions, repeat=3)
+        for get_coefficient_of_determination in (
+            _get_legacy_coefficient_of_determination, _get_coefficient_of_determination
+        )
+    ]
+    benchmarks.print_comparison(
+        f"coefficient of determination of {TRANSACTIONS_COUNT} transactions", *elapsed_times, TRANSACTIONS_COUNT
+    )
+    assert _get_legacy_coefficient_of_determination(transactions) == \
+        pytest.approx(_get_coefficient_of_determination(transactions))
+
+
+def test_coefficient_of_determination_from_arrays():
+    # optimizer runs: pnl arrays are already available
+    pnls, pnl_times = personal_data.get_transactions_pnl_and_times(_get_transactions())
+    transactions = _get_transactions()
+    elapsed_times = [
+        benchmarks.measure(_get_legacy_coefficient_of_determination, transactions, repeat=3),
+        benchmarks.measure(
+            personal_data.get_coefficient_of_determination_from_arrays, pnls, pnl_times, START_BALANCE, repeat=3
+        ),
+    ]
+    benchmarks.print_comparison(
+        f"coefficient of determination of {TRANSACTIONS_COUNT} pnl arrays", *elapsed_times, TRANSACTIONS_COUNT
+    )
+    # candle to candle basis
+    candle_times = np.arange(pnl_times[0], pnl_times[-1] + 60, 60)
+    assert 0 < personal_data.get_coefficient_of_determination_from_arrays(
+        pnls, pnl_times, START_BALANCE, candle_times=candle_times
+    ) <= 1
@@ -0,0 +1,214 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import random
+import tracemalloc
+
+import pytest
+
+import octobot_trading.enums as enums
+import octobot_trading.exchange_data as exchange_data
+from octobot_trading.enums import ExchangeConstantsOrderBookInfoColumns as ECOBIC
+import tests_additional.benchmarks as benchmarks
+from tests import event_loop
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+LEVELS_COUNT = 1000
+SNAPSHOTS_COUNT = 200
+DELTA_LEVELS_COUNT = 10
+CONSUMERS_COUNT = 10
+VWAP_QUANTITY = 1000
+L3_LEVELS_COUNT = 20
+L3_ORDERS_PER_LEVEL = 500
+
+
+def _get_snapshots():
+    snapshots = []
+    for _ in range(SNAPSHOTS_COUNT):
+        mid_price = random.uniform(20000, 30000)
+        snapshots.append((
+            [[mid_price + i * 0.5, random.uniform(0.01, 10)] for i in range(1, LEVELS_COUNT + 1)],
+            [[mid_price - i * 0.5, random.uniform(0.01, 10)] for i in range(1, LEVELS_COUNT + 1)],
+        ))
+    return snapshots
+
+
+def _handle_snapshots(manager, snapshots):
+    for asks, bids in snapshots:
+        manager.handle_new_books(asks, bids)
+        manager.get_ask()
+        manager.get_bid()
+
+
+def _handle_deltas(manager, deltas, is_snapshot):
+    for asks, bids in deltas:
+        if is_snapshot:
+            manager.handle_new_books(asks, bids)
+        else:
+            manager.handle_book_deltas(asks, bids)
+
+
+def _get_deltas(asks, bids):
+    deltas = []
+    for _ in range(SNAPSHOTS_COUNT):
+        updated_asks = random.sample(asks, DELTA_LEVELS_COUNT)
+        updated_bids = random.sample(bids, DELTA_LEVELS_COUNT)
+        deltas.append((
+            [[price, random.choice((0, random.uniform(0.01, 10)))] for price, _ in updated_asks],
+            [[price, random.choice((0, random.uniform(0.01, 10)))] for price, _ in updated_bids],
+        ))
+    return deltas
+
+
+def _get_book_allocated_size(manager, asks, bids) -> int:
+    tracemalloc.start()
+    manager.handle_new_books(asks, bids)
+    allocated_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated_size
+
+
+async def test_order_book_snapshots():
+    snapshots = _get_snapshots()
+    manager = exchange_data.OrderBookManager()
+    compact_manager = exchange_data.OrderBookManager(compact_l2=True)
+    reference_elapsed = benchmarks.measure(_handle_snapshots, manager, snapshots, repeat=3)
+    elapsed = benchmarks.measure(_handle_snapshots, compact_manager, snapshots, repeat=3)
+    benchmarks.print_comparison(
+        f"handle_new_books ({LEVELS_COUNT} levels per side)", reference_elapsed, elapsed, SNAPSHOTS_COUNT
+    )
+    asks, bids = snapshots[0]
+    reference_size = _get_book_allocated_size(exchange_data.OrderBookManager(), asks, bids)
+    size = _get_book_allocated_size(exchange_data.OrderBookManager(compact_l2=True), asks, bids)
+    print(f"order book memory: {reference_size:,} bytes -> {size:,} bytes (x{reference_size / size:.1f})")
+    assert compact_manager.get_ask()[0] == manager.get_ask()[0]
+    assert compact_manager.get_bid()[0] == manager.get_bid()[0]
+
+
+async def test_order_book_deltas():
+    asks, bids = _get_snapshots()[0]
+    deltas = _get_deltas(asks, bids)
+    for compact_l2 in (False, True):
+        snapshot_manager = exchange_data.OrderBookManager(compact_l2=compact_l2)
+        manager = exchange_data.OrderBookManager(compact_l2=compact_l2)
+        manager.handle_new_books(asks, bids)
+        reference_elapsed = benchmarks.measure(_handle_deltas, snapshot_manager, [(asks, bids)] * SNAPSHOTS_COUNT, True)
+        elapsed = benchmarks.measure(_handle_deltas, manager, deltas, False)
+        benchmarks.print_comparison(
+            f"snapshot -> {DELTA_LEVELS_COUNT} levels deltas ({LEVELS_COUNT} levels per side, compact_l2={compact_l2})",
+            reference_elapsed, elapsed, SNAPSHOTS_COUNT
+        )
+
+
+def _walk_vwap(manager, quantity):
+    # previous way: each consumer walks the order book levels
+    filled_quantity = filled_notional = 0
+    for price, orders in manager.asks.items():
+        size = min(sum(order[ECOBIC.SIZE.value] for order in orders), quantity - filled_quantity)
+        filled_quantity += size
+        filled_notional += size * price
+        if filled_quantity >= quantity:
+            return filled_notional / filled_quantity
+    return None
+
+
+def _read_analytics(manager, deltas, use_analytics):
+    for asks, bids in deltas:
+        manager.handle_book_deltas(asks, bids)
+        for _ in range(CONSUMERS_COUNT):
+            if use_analytics:
+                manager.get_vwap(enums.TradeOrderSide.BUY, VWAP_QUANTITY)
+            else:
+                _walk_vwap(manager, VWAP_QUANTITY)
+
+
+async def test_order_book_analytics():
+    asks, bids = _get_snapshots()[0]
+    deltas = _get_deltas(asks, bids)
+    elapsed_times = []
+    for use_analytics in (False, True):
+        manager = exchange_data.OrderBookManager()
+        manager.handle_new_books(asks, bids)
+        elapsed_times.append(benchmarks.measure(_read_analytics, manager, deltas, use_analytics))
+    benchmarks.print_comparison(
+        f"VWAP of {VWAP_QUANTITY} read by {CONSUMERS_COUNT} consumers after each delta", *elapsed_times,
+        SNAPSHOTS_COUNT
+    )
+    assert manager.get_vwap(enums.TradeOrderSide.BUY, VWAP_QUANTITY) == pytest.approx(
+        _walk_vwap(manager, VWAP_QUANTITY)
+    )
+
+
+class ScanningOrderBookManager(exchange_data.OrderBookManager):
+    """
+    Previous L3 order deletes and updates: scan the price level orders
+    """
+    def _handle_book_delete(self, order):
+        book_side, *_ = self._get_book_side(order[ECOBIC.SIDE.value])
+        price = decimal.Decimal(order[ECOBIC.PRICE.value])
+        orders = book_side.get(price)
+        if orders is not None:
+            orders = [book_order for book_order in orders
+                      if book_order[ECOBIC.ORDER_ID.value] != order[ECOBIC.ORDER_ID.value]]
+            if orders:
+                book_side[price] = orders
+            else:
+                del book_side[price]
+
+    def _handle_book_update(self, order):
+        book_side, *_ = self._get_book_side(order[ECOBIC.SIDE.value])
+        size = decimal.Decimal(order[ECOBIC.SIZE.value])
+        orders = book_side.get(decimal.Decimal(order[ECOBIC.PRICE.value]))
+        for book_order in orders or []:
+            if book_order[ECOBIC.ORDER_ID.value] == order[ECOBIC.ORDER_ID.value]:
+                book_order[ECOBIC.SIZE.value] = size
+                return
+
+
+def _get_l3_orders():
+    return [
+        {
+            ECOBIC.SIDE.value: enums.TradeOrderSide.BUY.value,
+            ECOBIC.PRICE.value: 100 + level,
+            ECOBIC.SIZE.value: random.uniform(0.01, 10),
+            ECOBIC.ORDER_ID.value: f"{level}-{index}",
+        }
+        for level in range(L3_LEVELS_COUNT)
+        for index in range(L3_ORDERS_PER_LEVEL)
+    ]
+
+
+def _update_and_delete_orders(manager, orders):
+    manager.handle_book_updates([{**order, ECOBIC.SIZE.value: 1} for order in orders])
+    manager.handle_book_deletes(orders)
+
+
+async def test_l3_order_book_updates():
+    elapsed_times = []
+    for manager_class in (ScanningOrderBookManager, exchange_data.OrderBookManager):
+        orders = _get_l3_orders()
+        manager = manager_class()
+        manager.handle_book_adds(orders)
+        random.shuffle(orders)
+        elapsed_times.append(benchmarks.measure(_update_and_delete_orders, manager, orders))
+        assert not manager.bids
+    benchmarks.print_comparison(
+        f"L3 order update + delete ({L3_ORDERS_PER_LEVEL} orders per level)", *elapsed_times,
+        L3_LEVELS_COUNT * L3_ORDERS_PER_LEVEL
+    )
@@ -0,0 +1,81 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import decimal
+
+import pytest
+
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+import tests_additional.benchmarks as benchmarks
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+ORDERS_COUNT = 10000
+
+
+class DictOrderLayout:
+    """
+    Previous order memory layout: every attribute is stored in the instance __dict__
+    and the lock and containers are created with the order
+    """
+    def __init__(self, order):
+        for cls in type(order).__mro__:
+            for attribute in getattr(cls, "__slots__", ()):
+                setattr(self, attribute.lstrip("_"), getattr(order, attribute))
+        self.__dict__.update(order.__dict__)
+        self.lock = asyncio.Lock()
+        self.chained_orders = []
+        self.exchange_creation_params = {}
+        self.trader_creation_kwargs = {}
+
+
+def _create_order(trader, index):
+    order = personal_data.BuyLimitOrder(trader)
+    order.update(
+        order_type=enums.TraderOrderType.BUY_LIMIT,
+        symbol="BTC/USDT",
+        order_id=f"order{index}",
+        exchange_order_id=f"exchange{index}",
+        current_price=decimal.Decimal(100),
+        quantity=decimal.Decimal(1),
+        price=decimal.Decimal(90),
+    )
+    return order
+
+
+def _create_orders(trader):
+    return [_create_order(trader, index) for index in range(ORDERS_COUNT)]
+
+
+def _create_dict_layout_orders(trader):
+    return [DictOrderLayout(_create_order(trader, index)) for index in range(ORDERS_COUNT)]
+
+
+async def test_order_memory(simulated_trader):
+    _, exchange_manager, trader = simulated_trader
+    # warm up caches (symbol markets, ids parsing, ...)
+    _create_orders(trader)
+    dict_layout_bytes = benchmarks.measure_allocated_bytes(_create_dict_layout_orders, trader)
+    order_bytes = benchmarks.measure_allocated_bytes(_create_orders, trader)
+    benchmarks.print_memory_comparison(
+        f"{ORDERS_COUNT} open orders", dict_layout_bytes, order_bytes, ORDERS_COUNT, "order"
+    )
+    assert order_bytes < dict_layout_bytes
@@ -0,0 +1,166 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import random
+
+import pytest
+
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+import tests_additional.benchmarks as benchmarks
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+ORDERS_COUNT = 6000
+SYMBOLS_COUNT = 60
+GROUPS_COUNT = 300
+# share of tracked orders that are still open, others are pending cancel or closed
+OPEN_ORDERS_RATIO = 0.2
+LOOKUPS_COUNT = 2000
+
+
+class ScanningOrdersManager(personal_data.OrdersManager):
+    """
+    Previous orders manager lookups: every tracked order is scanned on each call
+    """
+    def get_order(self, order_id, exchange_order_id=None):
+        if order_id is None:
+            for order in self.orders.values():
+                if order.exchange_order_id == exchange_order_id:
+                    return order
+            raise KeyError(exchange_order_id)
+        return self.orders[order_id]
+
+    def get_order_from_group(self, group_name):
+        return [
+            order
+            for order in self.orders.values()
+            if order.order_group is not None and order.order_group.name == group_name
+        ]
+
+    def has_order(self, order_id, exchange_order_id=None) -> bool:
+        if order_id is None:
+            try:
+                self.get_order(None, exchange_order_id=exchange_order_id)
+                return True
+            except KeyError:
+                return False
+        return order_id in set(self.orders.keys())
+
+    def _get_selection_candidates(self, state, symbol, tag):
+        return self.orders.values()
+
+
+def _create_orders(orders_manager, trader):
+    symbols = [f"COIN{index}/USDT" for index in range(SYMBOLS_COUNT)]
+    groups = [
+        orders_manager.create_group(personal_data.OneCancelsTheOtherOrderGroup, f"group{index}")
+        for index in range(GROUPS_COUNT)
+    ]
+    statuses = (enums.OrderStatus.PENDING_CANCEL, enums.OrderStatus.CLOSED)
+    for index in range(ORDERS_COUNT):
+        order = personal_data.BuyLimitOrder(trader)
+        order.update(
+            order_type=enums.TraderOrderType.BUY_LIMIT,
+            symbol=symbols[index % SYMBOLS_COUNT],
+            order_id=f"order{index}",
+            exchange_order_id=f"exchange{index}",
+            status=enums.OrderStatus.OPEN if random.random() < OPEN_ORDERS_RATIO else random.choice(statuses),
+            current_price=decimal.Decimal(100),
+            quantity=decimal.Decimal(1),
+            price=decimal.Decimal(90),
+            group=groups[index % GROUPS_COUNT],
+            tag="grid" if index % 10 else None,
+        )
+        orders_manager._add_order(order.order_id, order)
+    return symbols
+
+
+def _get_open_orders(orders_manager, symbols):
+    return [len(orders_manager.get_open_orders(symbol=symbol)) for symbol in symbols]
+
+
+def _get_orders_by_exchange_id(orders_manager, exchange_order_ids):
+    return [
+        orders_manager.get_order(None, exchange_order_id=exchange_order_id).order_id
+        for exchange_order_id in exchange_order_ids
+        if orders_manager.has_order(None, exchange_order_id=exchange_order_id)
+    ]
+
+
+def _has_orders(orders_manager, order_ids):
+    return [orders_manager.has_order(order_id) for order_id in order_ids]
+
+
+def _get_groups_orders(orders_manager, group_names):
+    return [len(orders_manager.get_order_from_group(group_name)) for group_name in group_names]
+
+
+async def test_orders_manager_lookups(simulated_trader):
+    _, exchange_manager, trader = simulated_trader
+    random.seed(42)
+    lookups = (
+        ("get_open_orders(symbol)", _get_open_orders,
+         lambda symbols: [symbols[index % SYMBOLS_COUNT] for index in range(LOOKUPS_COUNT)]),
+        ("get_order(exchange_order_id)", _get_orders_by_exchange_id,
+         lambda _: [f"exchange{random.randrange(ORDERS_COUNT)}" for _ in range(LOOKUPS_COUNT)]),
+        ("has_order(order_id)", _has_orders,
+         lambda _: [f"order{random.randrange(ORDERS_COUNT)}" for _ in range(LOOKUPS_COUNT)]),
+        ("get_order_from_group", _get_groups_orders,
+         lambda _: [f"group{random.randrange(GROUPS_COUNT)}" for _ in range(LOOKUPS_COUNT)]),
+    )
+    for title, lookup, get_lookup_args in lookups:
+        elapsed_times = []
+        results = []
+        for manager_class in (ScanningOrdersManager, personal_data.OrdersManager):
+            random.seed(42)
+            orders_manager = manager_class(trader)
+            symbols = _create_orders(orders_manager, trader)
+            args = get_lookup_args(symbols)
+            elapsed_times.append(benchmarks.measure(lookup, orders_manager, args))
+            results.append(lookup(orders_manager, args))
+            orders_manager.clear()
+        benchmarks.print_comparison(f"{title} with {ORDERS_COUNT} orders", *elapsed_times, LOOKUPS_COUNT)
+        assert results[0] == results[1]
+
+
+def _cycle_orders_status(orders_manager):
+    # open orders being cancelled then re-opened, as when a cancel request fails
+    for order in orders_manager.get_open_orders():
+        order.status = enums.OrderStatus.PENDING_CANCEL
+        order.status = enums.OrderStatus.OPEN
+    return orders_manager.get_open_orders(until=constants.NO_DATA_LIMIT)
+
+
+async def test_orders_status_transitions(simulated_trader):
+    _, exchange_manager, trader = simulated_trader
+    elapsed_times = []
+    results = []
+    for manager_class in (ScanningOrdersManager, personal_data.OrdersManager):
+        random.seed(42)
+        orders_manager = manager_class(trader)
+        _create_orders(orders_manager, trader)
+        operations_count = len(orders_manager.get_open_orders())
+        elapsed_times.append(benchmarks.measure(_cycle_orders_status, orders_manager))
+        results.append([order.order_id for order in _cycle_orders_status(orders_manager)])
+        orders_manager.clear()
+    benchmarks.print_comparison(f"status transitions with {ORDERS_COUNT} orders", *elapsed_times, operations_count)
+    assert results[0] == results[1]
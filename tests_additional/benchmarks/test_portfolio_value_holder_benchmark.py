@@ -0,0 +1,84 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import pytest
+
+import octobot_trading.personal_data as personal_data
+import tests_additional.benchmarks as benchmarks
+from tests import event_loop
+from tests.exchanges import backtesting_trader, backtesting_config, backtesting_exchange_manager, fake_backtesting
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+ASSETS_COUNT = 200
+TICKS_COUNT = 2000
+REFERENCE_MARKET = "BTC"
+
+
+def _get_symbols():
+    # every asset is priced directly or through ETH
+    return ["ETH/BTC"] + [
+        f"COIN{index}/{'BTC' if index % 2 else 'ETH'}"
+        for index in range(ASSETS_COUNT)
+    ]
+
+
+def _init_portfolio(exchange_manager, incremental_valuation):
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    portfolio_manager.portfolio_value_holder = personal_data.PortfolioValueHolder(portfolio_manager)
+    portfolio_manager.portfolio_profitability = personal_data.PortfolioProfitability(portfolio_manager)
+    portfolio_value_holder = portfolio_manager.portfolio_value_holder
+    portfolio_value_holder.ENABLE_INCREMENTAL_PORTFOLIO_VALUATION = incremental_valuation
+    portfolio_value_holder.value_converter.track_updated_price_symbols = incremental_valuation
+    for index, symbol in enumerate(_get_symbols()):
+        portfolio_value_holder.value_converter.update_last_price(symbol, decimal.Decimal(index + 1) / 1000)
+    portfolio_manager.portfolio.update_portfolio_from_balance({
+        currency: {"available": decimal.Decimal(10), "total": decimal.Decimal(10)}
+        for currency in ["BTC", "ETH"] + [f"COIN{index}" for index in range(ASSETS_COUNT)]
+    }, True)
+    portfolio_manager.handle_balance_updated()
+    return portfolio_manager
+
+
+def _update_prices(portfolio_manager):
+    symbols = _get_symbols()
+    for index in range(TICKS_COUNT):
+        portfolio_manager.handle_mark_price_update(
+            symbols[index % len(symbols)], decimal.Decimal(index % 100 + 1) / 1000
+        )
+    return portfolio_manager.portfolio_value_holder.portfolio_current_value
+
+
+async def test_portfolio_valuation_on_price_updates(backtesting_trader):
+    _, exchange_manager, trader = backtesting_trader
+    assert exchange_manager.exchange_personal_data.portfolio_manager.reference_market == REFERENCE_MARKET
+    elapsed_times = []
+    results = []
+    for incremental_valuation in (False, True):
+        portfolio_manager = _init_portfolio(exchange_manager, incremental_valuation)
+        elapsed_times.append(benchmarks.measure(_update_prices, portfolio_manager))
+        results.append(portfolio_manager.portfolio_value_holder.portfolio_current_value)
+    benchmarks.print_comparison(
+        f"portfolio value updates of {ASSETS_COUNT} assets on mark price updates", *elapsed_times, TICKS_COUNT
+    )
+    assert results[0] == results[1] == portfolio_manager.portfolio_value_holder._evaluate_portfolio_value(
+        portfolio_manager.portfolio.portfolio
+    )
+    # all assets are valued
+    assert not portfolio_manager.portfolio_value_holder.value_converter.missing_currency_data_in_exchange
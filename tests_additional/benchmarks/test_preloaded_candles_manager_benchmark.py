@@ -0,0 +1,86 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import random
+
+import numpy as np
+import pytest
+
+import octobot_commons.constants as commons_constants
+import octobot_commons.enums as enums
+
+import octobot_trading.exchange_data as exchange_data
+import tests_additional.benchmarks as benchmarks
+from tests import event_loop
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+# 2 years of 1m candles
+CANDLES_COUNT = 2 * 365 * 24 * 60
+
+
+class LinearScanPreloadedCandlesManager(exchange_data.PreloadedCandlesManager):
+    """
+    Previous candle lookup: enumerates time candles from the current candle then from the first candle
+    """
+    def _get_candle_index(self, candle):
+        select_index = 0 if self.time_candles_index == 0 else self.time_candles_index - 1
+        for delta_index, time_value in enumerate(self.time_candles[select_index:]):
+            if time_value == candle[enums.PriceIndexes.IND_PRICE_TIME.value]:
+                return self.time_candles_index + delta_index
+        for index, time_value in enumerate(self.time_candles[:select_index]):
+            if time_value == candle[enums.PriceIndexes.IND_PRICE_TIME.value]:
+                return index
+        return commons_constants.DEFAULT_IGNORED_VALUE
+
+
+async def _get_manager(manager_class, candles):
+    manager = manager_class()
+    await manager.initialize()
+    manager.replace_all_candles(candles)
+    return manager
+
+
+def _push_candles(manager, pushed_candles):
+    for pushed_candle in pushed_candles:
+        manager.add_old_and_new_candles(pushed_candle)
+
+
+async def test_backtesting_candles_throughput():
+    candles = [[float(index * 60), 1., 2., 0.5, 1.5, 10.] for index in range(CANDLES_COUNT)]
+    linear_manager = await _get_manager(LinearScanPreloadedCandlesManager, candles)
+    binary_search_manager = await _get_manager(exchange_data.PreloadedCandlesManager, candles)
+
+    # regular backtesting: each candle is pushed after the previous one
+    sequential_candles = [[candle] for candle in candles[:200000]]
+    linear_elapsed = benchmarks.measure(_push_candles, linear_manager, sequential_candles)
+    binary_search_elapsed = benchmarks.measure(_push_candles, binary_search_manager, sequential_candles)
+    benchmarks.print_comparison("sequential candles", linear_elapsed, binary_search_elapsed,
+                                len(sequential_candles))
+    assert linear_manager.time_candles_index == binary_search_manager.time_candles_index
+
+    # candles pushed out of the current position (backtesting restarts, higher time frames, gaps)
+    random.seed(42)
+    jumping_candles = [[candles[random.randrange(CANDLES_COUNT)]] for _ in range(20)]
+    linear_elapsed = benchmarks.measure(_push_candles, linear_manager, jumping_candles)
+    binary_search_elapsed = benchmarks.measure(_push_candles, binary_search_manager, jumping_candles)
+    benchmarks.print_comparison("random position candles", linear_elapsed, binary_search_elapsed,
+                                len(jumping_candles))
+    assert linear_manager.time_candles_index == binary_search_manager.time_candles_index
+    assert np.array_equal(linear_manager.get_symbol_close_candles(100),
+                          binary_search_manager.get_symbol_close_candles(100))
+    assert binary_search_elapsed < linear_elapsed
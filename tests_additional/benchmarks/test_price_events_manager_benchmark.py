@@ -0,0 +1,261 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import decimal
+import random
+import time
+
+import pytest
+
+import octobot_trading.exchange_data as exchange_data
+from octobot_trading.enums import ExchangeConstantsOrderColumns as ECOC
+import tests_additional.benchmarks as benchmarks
+from tests import event_loop
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+EVENTS_COUNT = 10000
+TICKS_COUNT = 1000
+RECENT_TRADES_BATCH_SIZE = 100
+
+
+class ScanningPriceEventsManager(exchange_data.PriceEventsManager):
+    """
+    Previous price events: every event is checked on each price
+    """
+    def __init__(self):
+        super().__init__()
+        self.events = []
+
+    def _add_event(self, price, timestamp, event, trigger_above):
+        self.events.append((price, timestamp, event, trigger_above))
+
+    def _remove_event(self, event_to_remove):
+        for price_event_data in self.events:
+            if event_to_remove in price_event_data:
+                return self.events.remove(price_event_data)
+
+    def _check_events(self, price, timestamp):
+        return [
+            event
+            for event_price, event_timestamp, event, trigger_above in self.events
+            if event_timestamp <= timestamp and
+            (
+                (trigger_above and event_price <= price) or
+                (not trigger_above and event_price >= price)
+            )
+        ]
+
+
+def _create_grid(manager):
+    # resting grid around 1000: sell orders above, buy orders below
+    return [
+        manager.new_event(
+            decimal.Decimal(str(1000 + (index // 2 + 1) * (1 if index % 2 else -1) * 0.01)), 0, bool(index % 2)
+        )
+        for index in range(EVENTS_COUNT)
+    ]
+
+
+def _handle_prices(manager, prices):
+    for timestamp, price in enumerate(prices):
+        manager.handle_price(price, timestamp)
+
+
+async def test_handle_price():
+    # a random walk slowly filling the grid orders
+    prices = []
+    price = 1000
+    for _ in range(TICKS_COUNT):
+        price += random.uniform(-0.05, 0.05)
+        prices.append(decimal.Decimal(str(round(price, 4))))
+    elapsed_times = []
+    remaining_events = []
+    for manager_class in (ScanningPriceEventsManager, exchange_data.PriceEventsManager):
+        manager = manager_class()
+        events = _create_grid(manager)
+        elapsed_times.append(benchmarks.measure(_handle_prices, manager, prices))
+        remaining_events.append([event.is_set() for event in events])
+    benchmarks.print_comparison(f"handle_price with {EVENTS_COUNT} events", *elapsed_times, TICKS_COUNT)
+    assert remaining_events[0] == remaining_events[1]
+
+
+async def test_remove_event():
+    elapsed_times = []
+    for manager_class in (ScanningPriceEventsManager, exchange_data.PriceEventsManager):
+        manager = manager_class()
+        events = _create_grid(manager)
+        random.shuffle(events)
+        elapsed_times.append(benchmarks.measure(lambda: [manager.remove_event(event) for event in events]))
+        assert not manager.events
+    benchmarks.print_comparison(f"remove_event with {EVENTS_COUNT} events", *elapsed_times, EVENTS_COUNT)
+
+
+class TradeByTradePriceEventsManager(exchange_data.PriceEventsManager):
+    """
+    Previous recent trades handling: events are checked after each trade
+    """
+    def handle_recent_trades(self, recent_trades):
+        self.clear_recent_prices()
+        for recent_trade in recent_trades:
+            price = decimal.Decimal(str(recent_trade[ECOC.PRICE.value]))
+            timestamp = recent_trade[ECOC.TIMESTAMP.value]
+            self._add_recent_price(price, timestamp)
+            for event_to_set in self._check_events(price, timestamp):
+                self._remove_and_set_event(event_to_set)
+
+
+class ScanningTradeByTradePriceEventsManager(ScanningPriceEventsManager, TradeByTradePriceEventsManager):
+    """
+    Previous price events and recent trades handling
+    """
+
+
+def _handle_recent_trades(manager, trade_batches):
+    for recent_trades in trade_batches:
+        manager.handle_recent_trades(recent_trades)
+
+
+async def test_handle_recent_trades():
+    trade_batches = []
+    price = 1000
+    for batch_index in range(TICKS_COUNT // 10):
+        recent_trades = []
+        for trade_index in range(RECENT_TRADES_BATCH_SIZE):
+            price += random.uniform(-0.005, 0.005)
+            recent_trades.append({
+                ECOC.PRICE.value: round(price, 4),
+                ECOC.TIMESTAMP.value: batch_index * RECENT_TRADES_BATCH_SIZE + trade_index
+            })
+        trade_batches.append(recent_trades)
+    for reference_class in (ScanningTradeByTradePriceEventsManager, TradeByTradePriceEventsManager):
+        elapsed_times = []
+        set_events = []
+        for manager_class in (reference_class, exchange_data.PriceEventsManager):
+            manager = manager_class()
+            events = _create_grid(manager)
+            elapsed_times.append(benchmarks.measure(_handle_recent_trades, manager, trade_batches))
+            set_events.append([event.is_set() for event in events])
+        benchmarks.print_comparison(
+            f"handle_recent_trades by {RECENT_TRADES_BATCH_SIZE} with {EVENTS_COUNT} events "
+            f"(reference: {reference_class.__name__})", *elapsed_times, len(trade_batches)
+        )
+        assert set_events[0] == set_events[1]
+
+
+class ListRecentPricesPriceEventsManager(exchange_data.PriceEventsManager):
+    """
+    Previous recent prices: a list of dicts sorted or scanned on each query
+    """
+    PRICE_KEY = "price"
+    TIME_KEY = "time"
+
+    def __init__(self):
+        super().__init__()
+        self._last_recent_prices = []
+
+    def get_min_and_max_prices(self) -> (float, float):
+        if len(self._last_recent_prices) < 2:
+            raise IndexError("Not enough data")
+        prices = sorted([element[self.PRICE_KEY] for element in self._last_recent_prices])
+        return prices[0], prices[-1]
+
+    def clear_recent_prices(self):
+        self._last_recent_prices = []
+
+    def _add_recent_price(self, price, timestamp):
+        self._last_recent_prices.append({
+            self.PRICE_KEY: price,
+            self.TIME_KEY: timestamp
+        })
+        if len(self._last_recent_prices) > self.MAX_LAST_RECENT_PRICES:
+            self._last_recent_prices = self._last_recent_prices[self.MAX_LAST_RECENT_PRICES // 2:]
+
+    def _is_triggered_by_last_recent_prices(self, price, timestamp, trigger_above):
+        for recent_price in self._last_recent_prices:
+            trade_price = recent_price[self.PRICE_KEY]
+            if timestamp <= recent_price[self.TIME_KEY] and (
+                (trigger_above and price <= trade_price) or
+                (not trigger_above and price >= trade_price)
+            ):
+                return True
+        return False
+
+
+def _use_recent_prices(manager, prices):
+    for timestamp, price in enumerate(prices):
+        manager.handle_price(price, timestamp)
+        if timestamp:
+            manager.get_min_and_max_prices()
+        # new orders out of the recent prices range
+        manager.remove_event(manager.new_event(price * 2, timestamp - 10, True))
+        manager.remove_event(manager.new_event(price / 2, timestamp - 10, False))
+
+
+async def test_recent_prices():
+    prices = [decimal.Decimal(str(round(random.uniform(900, 1100), 4))) for _ in range(TICKS_COUNT * 10)]
+    elapsed_times = []
+    for manager_class in (ListRecentPricesPriceEventsManager, exchange_data.PriceEventsManager):
+        manager = manager_class()
+        elapsed_times.append(benchmarks.measure(_use_recent_prices, manager, prices))
+    benchmarks.print_comparison(
+        "handle_price + get_min_and_max_prices + 2 new_event", *elapsed_times, len(prices)
+    )
+
+
+class _GridOrder:
+    def __init__(self):
+        self.fill_time = None
+
+    async def on_fill(self):
+        self.fill_time = time.perf_counter()
+
+    async def wait_for_price_hit(self, event):
+        # previous way: each order waits for its event in its own task
+        await asyncio.wait_for(event.wait(), timeout=None)
+        await self.on_fill()
+
+
+async def _fill_grid(use_callbacks):
+    manager = exchange_data.PriceEventsManager()
+    orders = [_GridOrder() for _ in range(EVENTS_COUNT)]
+    tasks = []
+    for index, order in enumerate(orders):
+        event = manager.new_event(
+            decimal.Decimal(1000 + index), 0, True, callback=order.on_fill if use_callbacks else None
+        )
+        if not use_callbacks:
+            tasks.append(asyncio.create_task(order.wait_for_price_hit(event)))
+    await asyncio.sleep(0)
+    tasks_count = len(asyncio.all_tasks())
+    start = time.perf_counter()
+    manager.handle_price(decimal.Decimal(1000 + EVENTS_COUNT), 1)
+    while any(order.fill_time is None for order in orders):
+        await asyncio.sleep(0)
+    fill_latencies = sorted(order.fill_time - start for order in orders)
+    manager.stop()
+    return tasks_count, fill_latencies[len(fill_latencies) // 2], fill_latencies[-1]
+
+
+async def test_fill_grid_orders():
+    for use_callbacks in (False, True):
+        tasks_count, median_latency, max_latency = await _fill_grid(use_callbacks)
+        print(
+            f"{EVENTS_COUNT} grid orders {'callbacks' if use_callbacks else 'waiting tasks'}: {tasks_count} tasks, "
+            f"fill latency: median {median_latency * 1000:.1f} ms, max {max_latency * 1000:.1f} ms"
+        )
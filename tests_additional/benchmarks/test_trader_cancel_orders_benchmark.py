@@ -0,0 +1,105 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import decimal
+import time
+
+import mock
+import pytest
+
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+import tests_additional.benchmarks as benchmarks
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+SYMBOLS = ["BTC/USDT", "ETH/USDT", "ETH/BTC", "LTC/BTC"]
+OPEN_ORDERS_PER_SYMBOL = 20
+CANCELLED_ORDERS_PER_SYMBOL = 15
+# simulated exchange request round trip time
+ROUND_TRIP_TIME = 0.02
+
+
+async def _cancel_order_request(*_, **__):
+    # cancel request and order fetch to check its status
+    await asyncio.sleep(ROUND_TRIP_TIME * 2)
+    return enums.OrderStatus.CANCELED
+
+
+async def _cancel_orders_request(exchange_order_ids, *_, **__):
+    # cancel request and open orders fetch to check orders statuses
+    await asyncio.sleep(ROUND_TRIP_TIME * 2)
+    return [enums.OrderStatus.CANCELED] * len(exchange_order_ids)
+
+
+async def _create_open_orders(trader):
+    orders_to_cancel = []
+    for symbol in SYMBOLS:
+        for index in range(OPEN_ORDERS_PER_SYMBOL):
+            order = personal_data.BuyLimitOrder(trader)
+            order.update(
+                order_type=enums.TraderOrderType.BUY_LIMIT,
+                symbol=symbol,
+                current_price=decimal.Decimal("0.01"),
+                quantity=decimal.Decimal("0.01"),
+                price=decimal.Decimal("0.001"),
+            )
+            await trader.create_order(order)
+            if index < CANCELLED_ORDERS_PER_SYMBOL:
+                orders_to_cancel.append(order)
+    return orders_to_cancel
+
+
+async def _cancel_orders_one_by_one(trader, orders):
+    return all([await trader.cancel_order(order) for order in orders])
+
+
+async def _cancel_orders_in_batch(trader, orders):
+    return (await trader.cancel_orders(orders))[0]
+
+
+async def test_cancel_orders(simulated_trader):
+    _, exchange_manager, trader = simulated_trader
+    cancelled_orders_count = len(SYMBOLS) * CANCELLED_ORDERS_PER_SYMBOL
+    elapsed_times = []
+    with mock.patch.object(exchange_manager.exchange, "cancel_order", mock.AsyncMock(
+            side_effect=_cancel_order_request)) as cancel_order_mock, \
+            mock.patch.object(exchange_manager.exchange, "cancel_orders", mock.AsyncMock(
+                side_effect=_cancel_orders_request)) as cancel_orders_mock, \
+            mock.patch.object(exchange_manager.exchange, "supports_bulk_order_cancellation",
+                              mock.Mock(return_value=True)):
+        for cancel_orders in (_cancel_orders_one_by_one, _cancel_orders_in_batch):
+            orders = await _create_open_orders(trader)
+            trader.simulate = False
+            try:
+                start = time.perf_counter()
+                assert await cancel_orders(trader, orders) is True
+                elapsed_times.append(time.perf_counter() - start)
+            finally:
+                trader.simulate = True
+            assert all(order.is_cancelled() for order in orders)
+            await trader.cancel_all_open_orders()
+        assert cancel_order_mock.call_count == cancelled_orders_count
+        assert cancel_orders_mock.call_count == len(SYMBOLS)
+    benchmarks.print_comparison(
+        f"cancel {cancelled_orders_count} orders on {len(SYMBOLS)} symbols with "
+        f"{ROUND_TRIP_TIME * 1000:.0f}ms round trips",
+        *elapsed_times, cancelled_orders_count
+    )
@@ -0,0 +1,100 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import asyncio
+import decimal
+import time
+
+import mock
+import pytest
+
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+import tests_additional.benchmarks as benchmarks
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+GRID_ORDERS_COUNT = 50
+# simulated exchange request round trip time
+ROUND_TRIP_TIME = 0.02
+
+
+async def _create_order_request(**_):
+    await asyncio.sleep(ROUND_TRIP_TIME)
+    return {}
+
+
+async def _create_orders_request(orders_details):
+    await asyncio.sleep(ROUND_TRIP_TIME)
+    return [{} for _ in orders_details]
+
+
+def _create_grid(trader):
+    orders = []
+    for index in range(GRID_ORDERS_COUNT):
+        order = personal_data.BuyLimitOrder(trader)
+        order.update(
+            order_type=enums.TraderOrderType.BUY_LIMIT,
+            symbol="BTC/USDT",
+            current_price=decimal.Decimal(100),
+            quantity=decimal.Decimal(1),
+            price=decimal.Decimal(90 - index * 0.1),
+        )
+        orders.append(order)
+    return orders
+
+
+async def _create_orders_one_by_one(trader, orders):
+    return [await trader.create_order(order) for order in orders]
+
+
+async def _create_orders_in_batch(trader, orders):
+    return await trader.create_orders(orders)
+
+
+async def test_create_grid_orders(simulated_trader):
+    _, exchange_manager, trader = simulated_trader
+    trader.simulate = False
+    try:
+        with mock.patch.object(exchange_manager.exchange, "create_order", mock.AsyncMock(
+                side_effect=_create_order_request)) as create_order_mock, \
+                mock.patch.object(exchange_manager.exchange, "create_orders", mock.AsyncMock(
+                    side_effect=_create_orders_request)) as create_orders_mock, \
+                mock.patch.object(exchange_manager.exchange, "supports_bulk_order_creation",
+                                  mock.Mock(return_value=True)), \
+                mock.patch.object(trader, "_get_created_order_instance",
+                                  mock.Mock(side_effect=lambda new_order, _: (new_order, False))), \
+                mock.patch.object(trader, "_initialize_created_order",
+                                  mock.AsyncMock(side_effect=lambda order, *_: order)):
+            elapsed_times = []
+            for create_orders in (_create_orders_one_by_one, _create_orders_in_batch):
+                orders = _create_grid(trader)
+                start = time.perf_counter()
+                created_orders = await create_orders(trader, orders)
+                elapsed_times.append(time.perf_counter() - start)
+                assert created_orders == orders
+            assert create_order_mock.call_count == GRID_ORDERS_COUNT
+            assert create_orders_mock.call_count == GRID_ORDERS_COUNT // exchange_manager.exchange.\
+                MAX_ORDERS_PER_BULK_CREATION
+    finally:
+        trader.simulate = True
+    benchmarks.print_comparison(
+        f"create {GRID_ORDERS_COUNT} grid orders with {ROUND_TRIP_TIME * 1000:.0f}ms round trips",
+        *elapsed_times, GRID_ORDERS_COUNT
+    )
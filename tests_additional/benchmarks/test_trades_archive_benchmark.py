@@ -0,0 +1,122 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import random
+import uuid
+
+import pytest
+
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+import tests_additional.benchmarks as benchmarks
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+TRADES_COUNT = 20000
+SYMBOLS = [f"COIN{index}/USDT" for index in range(20)]
+QUERIES_COUNT = 20
+
+
+def _create_trades(trader):
+    trades = []
+    for index in range(TRADES_COUNT):
+        trade = personal_data.Trade(trader)
+        trade.origin_order_id = str(uuid.uuid4())
+        trade.exchange_order_id = str(uuid.uuid4())
+        trade.exchange_trade_id = str(uuid.uuid4())
+        trade.status = enums.OrderStatus.FILLED
+        trade.symbol = random.choice(SYMBOLS)
+        trade.currency, trade.market = trade.symbol.split("/")
+        trade.side = random.choice((enums.TradeOrderSide.BUY, enums.TradeOrderSide.SELL))
+        trade.trade_type = enums.TraderOrderType.BUY_LIMIT
+        trade.exchange_trade_type = enums.TradeOrderType.LIMIT
+        trade.executed_time = 1700000000 + index * 60
+        trade.executed_price = trade.origin_price = decimal.Decimal(random.randrange(1000, 2000)) / 10
+        trade.executed_quantity = trade.origin_quantity = decimal.Decimal(random.randrange(1, 1000)) / 100
+        trade.total_cost = trade.executed_price * trade.executed_quantity
+        trade.fee = {
+            enums.FeePropertyColumns.COST.value: trade.total_cost / 1000,
+            enums.FeePropertyColumns.CURRENCY.value: trade.market,
+        }
+        trades.append(trade)
+    return trades
+
+
+def _create_archive(trades):
+    archive = personal_data.TradesArchive(TRADES_COUNT)
+    archive.add_trades(trades)
+    return archive
+
+
+def _get_trade_objects_reports(trades):
+    reports = []
+    for symbol in SYMBOLS[:QUERIES_COUNT]:
+        net_cash_flow = decimal.Decimal(0)
+        fees = decimal.Decimal(0)
+        # average cost realized pnl
+        realized_pnl = held_quantity = held_cost = decimal.Decimal(0)
+        for trade in trades:
+            if trade.symbol == symbol:
+                amount = trade.executed_price * trade.executed_quantity
+                net_cash_flow += amount if trade.side is enums.TradeOrderSide.SELL else -amount
+                fees += trade.fee[enums.FeePropertyColumns.COST.value]
+                if trade.side is enums.TradeOrderSide.SELL:
+                    sold_quantity = min(trade.executed_quantity, held_quantity)
+                    if sold_quantity:
+                        average_cost = held_cost / held_quantity
+                        realized_pnl += sold_quantity * (trade.executed_price - average_cost)
+                        held_cost -= sold_quantity * average_cost
+                        held_quantity -= sold_quantity
+                else:
+                    held_quantity += trade.executed_quantity
+                    held_cost += amount
+        reports.append((round(float(net_cash_flow), 4), round(float(fees), 4), round(float(realized_pnl), 4)))
+    return reports
+
+
+def _get_archive_reports(archive):
+    return [
+        (
+            round(archive.get_net_cash_flow(symbol), 4),
+            round(archive.get_paid_fees(symbol=symbol)["USDT"], 4),
+            round(archive.get_realized_pnl(symbol), 4),
+        )
+        for symbol in SYMBOLS[:QUERIES_COUNT]
+    ]
+
+
+async def test_trades_archive(simulated_trader):
+    _, exchange_manager, trader = simulated_trader
+    random.seed(42)
+    trades_bytes = benchmarks.measure_allocated_bytes(_create_trades, trader)
+    trades = _create_trades(trader)
+    archive_bytes = benchmarks.measure_allocated_bytes(_create_archive, trades)
+    benchmarks.print_memory_comparison(
+        f"{TRADES_COUNT} trades history", trades_bytes, archive_bytes, TRADES_COUNT, "trade"
+    )
+    archive = _create_archive(trades)
+    elapsed_times = [
+        benchmarks.measure(_get_trade_objects_reports, trades, repeat=3),
+        benchmarks.measure(_get_archive_reports, archive, repeat=3),
+    ]
+    benchmarks.print_comparison(
+        f"symbol net cash flow, fees and realized pnl reports on {TRADES_COUNT} trades", *elapsed_times, QUERIES_COUNT
+    )
+    assert _get_trade_objects_reports(trades) == _get_archive_reports(archive)
@@ -0,0 +1,116 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+import random
+
+import pytest
+
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+import tests_additional.benchmarks as benchmarks
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+TRADES_COUNT = 10000
+# trades from the same order: partially filled orders
+TRADES_PER_ORDER = 2
+FEE_CURRENCIES = ["BTC", "USDT", "BNB"]
+LOOKUPS_COUNT = 500
+
+
+class ScanningTradesManager(personal_data.TradesManager):
+    """
+    Previous trades manager lookups: every trade is scanned on each call
+    """
+    def get_total_paid_fees(self):
+        total_fees = {}
+        for trade in self.trades.values():
+            if trade.fee is not None:
+                fee_cost = trade.fee[enums.FeePropertyColumns.COST.value]
+                fee_currency = trade.fee[enums.FeePropertyColumns.CURRENCY.value]
+                if fee_currency in total_fees:
+                    total_fees[fee_currency] += fee_cost
+                else:
+                    total_fees[fee_currency] = fee_cost
+        return total_fees
+
+    def get_trades(self, origin_order_id=None, exchange_order_id=None):
+        return [
+            trade
+            for trade in self.trades.values()
+            if (
+                (not origin_order_id or trade.origin_order_id == origin_order_id)
+                and (not exchange_order_id or trade.exchange_order_id == exchange_order_id)
+            )
+        ]
+
+
+def _create_trades(trades_manager, trader):
+    for index in range(TRADES_COUNT):
+        trade = personal_data.Trade(trader)
+        trade.origin_order_id = f"order{index // TRADES_PER_ORDER}"
+        trade.exchange_order_id = f"exchange{index // TRADES_PER_ORDER}"
+        trade.is_closing_order = index % 5 == 0
+        trade.fee = {
+            enums.FeePropertyColumns.COST.value: decimal.Decimal(random.randrange(1, 1000)) / 1000,
+            enums.FeePropertyColumns.CURRENCY.value: random.choice(FEE_CURRENCIES),
+        }
+        trades_manager._add_trade_if_relevant(f"trade{index}", trade)
+
+
+def _get_trades_from_order_id(trades_manager, order_ids):
+    return [trades_manager.get_trade_from_order_id(order_id).fee for order_id in order_ids]
+
+
+def _has_closing_trades(trades_manager, exchange_order_ids):
+    return [
+        trades_manager.has_closing_trade_with_exchange_order_id(exchange_order_id)
+        for exchange_order_id in exchange_order_ids
+    ]
+
+
+def _get_total_paid_fees(trades_manager, calls):
+    return [trades_manager.get_total_paid_fees() for _ in calls]
+
+
+async def test_trades_manager_lookups(simulated_trader):
+    _, exchange_manager, trader = simulated_trader
+    orders_count = TRADES_COUNT // TRADES_PER_ORDER
+    lookups = (
+        ("get_trade_from_order_id", _get_trades_from_order_id,
+         lambda: [f"order{random.randrange(orders_count)}" for _ in range(LOOKUPS_COUNT)]),
+        ("has_closing_trade_with_exchange_order_id", _has_closing_trades,
+         lambda: [f"exchange{random.randrange(orders_count)}" for _ in range(LOOKUPS_COUNT)]),
+        ("get_total_paid_fees", _get_total_paid_fees,
+         lambda: range(LOOKUPS_COUNT)),
+    )
+    for title, lookup, get_lookup_args in lookups:
+        elapsed_times = []
+        results = []
+        for manager_class in (ScanningTradesManager, personal_data.TradesManager):
+            random.seed(42)
+            trades_manager = manager_class(trader)
+            _create_trades(trades_manager, trader)
+            args = get_lookup_args()
+            elapsed_times.append(benchmarks.measure(lookup, trades_manager, args))
+            results.append(lookup(trades_manager, args))
+            trades_manager.clear()
+        benchmarks.print_comparison(f"{title} with {TRADES_COUNT} trades", *elapsed_times, LOOKUPS_COUNT)
+        assert results[0] == results[1]
@@ -0,0 +1,74 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import pytest
+
+import octobot_trading.constants as constants
+import octobot_trading.enums as enums
+import octobot_trading.personal_data as personal_data
+import tests_additional.benchmarks as benchmarks
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+TRANSACTIONS_COUNT = 5000
+ORIGIN_VALUE = decimal.Decimal(1000)
+
+
+def _get_legacy_draw_down(transactions_manager, origin_value):
+    """
+    Previous draw down computation: the equity curve peak is computed again for each transaction
+    """
+    draw_down = constants.ZERO
+    portfolio_history = [origin_value]
+    for transaction in transactions_manager.transactions.values():
+        current_pnl = transaction.quantity if hasattr(transaction, "quantity") else transaction.realised_pnl
+        portfolio_history.append(portfolio_history[-1] + current_pnl)
+
+        current_draw_down = constants.ONE_HUNDRED - \
+            (portfolio_history[-1] / (max(portfolio_history) / constants.ONE_HUNDRED))
+
+        draw_down = current_draw_down if current_draw_down > draw_down else draw_down
+    return draw_down
+
+
+def _get_draw_down(transactions_manager, origin_value):
+    # compute the equity curve from scratch
+    transactions_manager.equity_curve_tracker = None
+    return transactions_manager.get_equity_curve_tracker(origin_value).max_draw_down
+
+
+async def test_draw_down(simulated_trader):
+    _, exchange_manager, trader = simulated_trader
+    transactions_manager = exchange_manager.exchange_personal_data.transactions_manager
+    for index in range(TRANSACTIONS_COUNT):
+        personal_data.create_realised_pnl_transaction(
+            exchange_manager, "USDT", "BTC/USDT:USDT", enums.PositionSide.LONG,
+            realised_pnl=decimal.Decimal(index % 7 - 3)
+        )
+    elapsed_times = [
+        benchmarks.measure(get_draw_down, transactions_manager, ORIGIN_VALUE)
+        for get_draw_down in (_get_legacy_draw_down, _get_draw_down)
+    ]
+    benchmarks.print_comparison(
+        f"draw down of {TRANSACTIONS_COUNT} transactions", *elapsed_times, TRANSACTIONS_COUNT
+    )
+    assert _get_legacy_draw_down(transactions_manager, ORIGIN_VALUE) \
+        == _get_draw_down(transactions_manager, ORIGIN_VALUE) > constants.ZERO
@@ -0,0 +1,220 @@
+#  Drakkar-Software OctoBot-Trading
+#  Copyright (c) Drakkar-Software, All rights reserved.
+#
+#  This library is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU Lesser General Public
+#  License as published by the Free Software Foundation; either
+#  version 3.0 of the License, or (at your option) any later version.
+#
+#  This library is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+#  Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public
+#  License along with this library.
+import decimal
+
+import mock
+import pytest
+
+import octobot_commons.symbols as symbol_util
+
+import octobot_trading.constants as constants
+import octobot_trading.errors as errors
+import octobot_trading.personal_data as personal_data
+import tests_additional.benchmarks as benchmarks
+from tests import event_loop
+from tests.exchanges import simulated_exchange_manager, simulated_trader
+
+
+# All test coroutines will be treated as marked.
+pytestmark = pytest.mark.asyncio
+
+ASSETS_COUNT = 300
+REFERENCE_MARKET = "USDT"
+
+
+class SearchingValueConverter(personal_data.ValueConverter):
+    """
+    Previous price bridges lookup: a recursive search parsing every available pair at each step
+    """
+    def try_convert_currency_value_using_multiple_pairs(
+            self, currency, target, quantity, base_bridge
+    ) -> decimal.Decimal:
+        # settlement_asset needs to be handled to add support for futures
+
+        # try with two pairs
+        # for example:
+        # currency: ETH - ref market: USDT
+        # ETH/USDT is not available. ETH/BTC and BTC/USDT are available though.
+        # first convert ETH -> BTC and then BTC -> USDT
+        #               | bridge part 1     | bridge part 2
+
+        try:
+            return self.convert_currency_value_from_saved_price_bridges(currency, target, quantity)
+        except errors.MissingPriceDataError:
+            if self.is_missing_price_bridge(currency, target):
+                return None
+            # try to find a bridge
+        if len(base_bridge) > self.MAX_PRICE_BRIDGE_DEPTH:
+            self._save_missing_price_bridge(currency, target)
+            return None
+        part_1_base = currency
+        part_2_quote = target
+        # look into available symbols to find pair bridges
+        for bridge_part_1_symbol in self._get_priced_pairs():
+            parsed_bridge_part_1_symbol = symbol_util.parse_symbol(bridge_part_1_symbol)
+            if (parsed_bridge_part_1_symbol.base, parsed_bridge_part_1_symbol.quote) in base_bridge\
+               or (parsed_bridge_part_1_symbol.quote, parsed_bridge_part_1_symbol.base) in base_bridge:
+                # avoid looping in symbols
+                continue
+            # part 1: check if bridge_part_1_symbol can be used as part 1 of the bridge
+            is_inverse_part_1 = False
+            if part_1_base == parsed_bridge_part_1_symbol.quote:
+                is_inverse_part_1 = True
+            elif part_1_base != parsed_bridge_part_1_symbol.base:
+                continue
+            part_1_quote = parsed_bridge_part_1_symbol.quote
+            if is_inverse_part_1:
+                part_1_quote = parsed_bridge_part_1_symbol.base
+                part_1_base = parsed_bridge_part_1_symbol.quote
+            try:
+                bridge_part_1_value = self.convert_currency_value_using_last_prices(
+                    quantity, part_1_base, part_1_quote
+                )
+                # check that bridge_part_1_value is really set
+                if not bridge_part_1_value:
+                    continue
+            except errors.MissingPriceDataError:
+                # first pair might not be initialized or is not available at all
+                # make sure it's not just initializing
+                self._ensure_no_pending_symbol_price(part_1_base, part_1_quote)
+                # try with other pairs
+                continue
+            # part 2: bridge part 1 is found and valued, try to get a compatible second part
+            # case 1: 2 parts bridge
+            try:
+                bridge_part_2_value = self.convert_currency_value_using_last_prices(
+                    constants.ONE,
+                    part_1_quote,
+                    part_2_quote,
+                )
+                if bridge_part_2_value:
+                    self._remove_from_missing_currency_data(currency)
+                    local_bridge = [(part_1_base, part_1_quote), (part_1_quote, part_2_quote)]
+                    self._save_price_bridge(currency, target, local_bridge)
+                    return bridge_part_1_value * bridge_part_2_value
+            except errors.MissingPriceDataError:
+                # conversion pairs might not be initialized or is not available at all
+                self._ensure_no_pending_symbol_price(part_1_quote, part_2_quote)
+                # otherwise continue with other pairs
+            bridge = base_bridge + [(part_1_base, part_1_quote)]
+            # case 2: X parts bridge
+            nested_value = self.try_convert_currency_value_using_multiple_pairs(
+                part_1_quote, target, constants.ONE, bridge
+            )
+            if nested_value:
+                try:
+                    extended_bridge = [(part_1_base, part_1_quote)] \
+                        + self.get_saved_price_conversion_bridge(part_1_quote, target)
+                    self._save_price_bridge(currency, target, extended_bridge)
+                except KeyError:
+                    # should not happen, however if it does, do not crash
+                    pass
+                return bridge_part_1_value * nested_value
+        # no bridge found
+        self._save_missing_price_bridge(currency, target)
+        return None
+
+    def _ensure_no_pending_symbol_price(self, base, quote):
+        for symbol in (symbol_util.merge_currencies(base, quote), symbol_util.merge_currencies(quote, base)):
+            if symbol in self.portfolio_manager.exchange_manager.exchange_config.traded_symbol_pairs \
+                    or symbol in self.initializing_symbol_prices_pairs:
+                raise errors.PendingPriceDataError
+
+
+class ParsingValueConverter(personal_data.ValueConverter):
+    """
+    Previous last price lookup: parse every stored symbol when the requested one is not stored as is
+    """
+    def _get_last_price_data(self, symbol):
+        try:
+            return self.last_prices_by_trading_pair[symbol]
+        except KeyError:
+            to_find_symbol = symbol_util.parse_symbol(symbol)
+            for symbol_key, last_prices in self.last_prices_by_trading_pair.items():
+                if symbol_util.parse_symbol(symbol_key).is_same_base_and_quote(to_find_symbol):
+                    return last_prices
+        raise KeyError(symbol)
+
+
+def _get_prices():
+    prices = {
+        "BTC/USDT": decimal.Decimal(50000),
+        "ETH/BTC": decimal.Decimal("0.05"),
+    }
+    for index in range(ASSETS_COUNT):
+        # 2 or 3 pairs bridges to the reference market
+        prices[f"COIN{index}/{'BTC' if index % 2 else 'ETH'}"] = decimal.Decimal(index + 1) / 100000
+    return prices
+
+
+def _create_value_converter(value_converter_class, portfolio_manager):
+    value_converter = value_converter_class(portfolio_manager)
+    for symbol, price in _get_prices().items():
+        value_converter.update_last_price(symbol, price)
+    return value_converter
+
+
+def _evaluate_assets(value_converter):
+    return [
+        value_converter.try_convert_currency_value_using_multiple_pairs(
+            f"COIN{index}", REFERENCE_MARKET, constants.ONE, []
+        )
+        for index in range(ASSETS_COUNT)
+    ]
+
+
+async def test_price_bridges_search(simulated_trader):
+    _, exchange_manager, trader = simulated_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    elapsed_times = []
+    results = []
+    # only use priced pairs
+    with mock.patch.object(exchange_manager.exchange_config, "traded_symbol_pairs", []):
+        for value_converter_class in (SearchingValueConverter, personal_data.ValueConverter):
+            # price bridges are not saved yet: search every bridge
+            elapsed_times.append(benchmarks.measure(
+                lambda: _evaluate_assets(_create_value_converter(value_converter_class, portfolio_manager)),
+                repeat=3
+            ))
+            results.append(_evaluate_assets(_create_value_converter(value_converter_class, portfolio_manager)))
+    benchmarks.print_comparison(
+        f"find price bridges of {ASSETS_COUNT} assets to {REFERENCE_MARKET}", *elapsed_times, ASSETS_COUNT
+    )
+    assert results[0] == results[1]
+    assert all(results[1])
+
+
+async def test_last_price_lookup(simulated_trader):
+    _, exchange_manager, trader = simulated_trader
+    portfolio_manager = exchange_manager.exchange_personal_data.portfolio_manager
+    # futures symbols: prices are looked up without settlement asset
+    symbols = [f"{symbol}:{REFERENCE_MARKET}" for symbol in _get_prices()]
+    lookup_symbols = list(_get_prices())
+    elapsed_times = []
+    results = []
+    for value_converter_class in (ParsingValueConverter, personal_data.ValueConverter):
+        value_converter = value_converter_class(portfolio_manager)
+        for symbol, price in zip(symbols, _get_prices().values()):
+            value_converter.update_last_price(symbol, price)
+        elapsed_times.append(benchmarks.measure(
+            lambda: [value_converter._get_last_price_data(symbol) for symbol in lookup_symbols],
+            repeat=3
+        ))
+        results.append([value_converter._get_last_price_data(symbol) for symbol in lookup_symbols])
+    benchmarks.print_comparison(
+        f"look up {len(lookup_symbols)} last prices without settlement asset", *elapsed_times, len(lookup_symbols)
+    )
+    assert results[0] == results[1] == list(_get_prices().values())